@@ -0,0 +1,64 @@
+import os
+import sys
+from logging.config import fileConfig
+from pathlib import Path
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+# alembic.ini 없이 (테스트 등에서) 실행될 때도 src 를 찾도록 추가
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.append(_SRC)
+
+from domain.common.base import Base  # noqa: E402
+import domain.identity.entities  # noqa: E402,F401  (메타데이터에 테이블 등록)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def _url() -> str:
+    return config.get_main_option("sqlalchemy.url") or os.environ["DATABASE_URL"]
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트를 출력합니다 (alembic upgrade head --sql)."""
+    context.configure(
+        url=_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    connectable = config.attributes.get("connection")
+    if connectable is not None:
+        _run(connectable)
+        return
+
+    engine = engine_from_config(
+        {"sqlalchemy.url": _url()},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool
+    )
+    with engine.connect() as connection:
+        _run(connection)
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,243 @@
+"""identity baseline
+
+Identity 도메인 테이블 (인덱스는 0002 에서 추가)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 13:08:02.183049
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table('company',
+    sa.Column('business_registration_number', sa.String(length=20), nullable=False, comment='사업자등록번호'),
+    sa.Column('name', sa.String(length=100), nullable=False, comment='기업명'),
+    sa.Column('eng_name', sa.String(length=100), nullable=False, comment='영문 기업명'),
+    sa.Column('address', sa.String(length=255), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('ceo_name', sa.String(length=100), nullable=False, comment='대표자 성명'),
+    sa.Column('homepage_url', sa.String(length=255), nullable=True, comment='회사 홈페이지'),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('business_registration_number')
+    )
+    op.create_table('department',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('position',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('responsibility',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('team',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_department',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('department_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_position',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('position_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['position_id'], ['position.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_responsibility',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('responsibility_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['responsibility_id'], ['responsibility.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_team',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('team_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['team_id'], ['team.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('user',
+    sa.Column('emp_no', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False, comment='USER / TEAM_MANAGER / ORG_ADMIN / SYS_ADMIN'),
+    sa.Column('company_id', sa.Uuid(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    op.create_table('company_registration_request',
+    sa.Column('business_registration_number', sa.String(length=20), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('eng_name', sa.String(length=100), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('ceo_name', sa.String(length=100), nullable=False),
+    sa.Column('homepage_url', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False, comment='PENDING / APPROVED / REJECTED'),
+    sa.Column('requested_by', sa.Uuid(), nullable=False),
+    sa.Column('approved_by', sa.Uuid(), nullable=True),
+    sa.Column('approved_at', sa.DateTime(), nullable=True),
+    sa.Column('rejected_at', sa.DateTime(), nullable=True),
+    sa.Column('reject_reason', sa.Text(), nullable=True),
+    sa.Column('approved_company_id', sa.Uuid(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['approved_by'], ['user.id'], ),
+    sa.ForeignKeyConstraint(['approved_company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['requested_by'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('company_user',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('emp_no', sa.String(length=50), nullable=False),
+    sa.Column('department_id', sa.Uuid(), nullable=True),
+    sa.Column('team_id', sa.Uuid(), nullable=True),
+    sa.Column('responsibility_id', sa.Uuid(), nullable=True),
+    sa.Column('position_id', sa.Uuid(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.ForeignKeyConstraint(['position_id'], ['position.id'], ),
+    sa.ForeignKeyConstraint(['responsibility_id'], ['responsibility.id'], ),
+    sa.ForeignKeyConstraint(['team_id'], ['team.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+def downgrade() -> None:
+    op.drop_table('company_user')
+    op.drop_table('company_registration_request')
+    op.drop_table('user')
+    op.drop_table('company_team')
+    op.drop_table('company_responsibility')
+    op.drop_table('company_position')
+    op.drop_table('company_department')
+    op.drop_table('team')
+    op.drop_table('responsibility')
+    op.drop_table('position')
+    op.drop_table('department')
+    op.drop_table('company')
@@ -0,0 +1,56 @@
+"""active row indexes
+
+활성 행(use_yn = 'Y' AND delete_yn = 'N')만 담는 부분 인덱스와
+매핑 테이블의 (company_id, <대상>_id) 복합 인덱스
+
+PostgreSQL 에서는 운영 중 테이블 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY 로
+만듭니다 (트랜잭션 밖에서 실행).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 13:20:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ROW_CONDITION = "use_yn = 'Y' AND delete_yn = 'N'"
+
+# 인덱스 이름, 테이블, 컬럼
+INDEXES = (
+    ('ix_user_company_id_active', 'user', ['company_id']),
+    ('ix_company_user_company_id_user_id_active', 'company_user', ['company_id', 'user_id']),
+    ('ix_company_user_user_id_active', 'company_user', ['user_id']),
+    ('ix_company_department_company_id_department_id_active', 'company_department', ['company_id', 'department_id']),
+    ('ix_company_team_company_id_team_id_active', 'company_team', ['company_id', 'team_id']),
+    ('ix_company_position_company_id_position_id_active', 'company_position', ['company_id', 'position_id']),
+    (
+        'ix_company_responsibility_company_id_responsibility_id_active',
+        'company_responsibility',
+        ['company_id', 'responsibility_id']
+    )
+)
+
+def upgrade() -> None:
+    condition = sa.text(ACTIVE_ROW_CONDITION)
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=condition,
+                postgresql_concurrently=True,
+                sqlite_where=condition
+            )
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,50 @@
+"""user push tokens
+
+알림 발송용 사용자 기기 푸시 토큰
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 18:40:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ROW_CONDITION = "use_yn = 'Y' AND delete_yn = 'N'"
+
+def upgrade() -> None:
+    op.create_table('user_push_token',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('token', sa.String(length=512), nullable=False),
+    sa.Column('platform', sa.String(length=20), nullable=False, comment='ios / android / web'),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('use_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('delete_yn', sa.CHAR(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('updated_by', sa.Uuid(), nullable=True),
+    sa.Column('deleted_by', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token')
+    )
+    condition = sa.text(ACTIVE_ROW_CONDITION)
+    op.create_index(
+        'ix_user_push_token_user_id_active',
+        'user_push_token',
+        ['user_id'],
+        postgresql_where=condition,
+        sqlite_where=condition
+    )
+
+def downgrade() -> None:
+    op.drop_index('ix_user_push_token_user_id_active', table_name='user_push_token')
+    op.drop_table('user_push_token')
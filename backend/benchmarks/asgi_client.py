@@ -0,0 +1,49 @@
+"""
+벤치마크용 ASGI 호출 도우미
+
+HTTP 서버와 네트워크 비용 없이 ASGI 앱을 직접 호출합니다.
+"""
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+def make_scope(path: str, method: str = "GET", headers: List[Tuple[bytes, bytes]] = ()) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), *headers],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+
+async def _receive() -> Dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def _send(message: Dict[str, Any]) -> None:
+    pass
+
+async def drive(app: Callable, path: str, count: int, **scope_options: Any) -> float:
+    """ASGI 앱을 count 번 순차 호출하고 초당 요청 수를 반환"""
+    scope = make_scope(path, **scope_options)
+    started = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), _receive, _send)
+    return count / (time.perf_counter() - started)
+
+async def request(app: Callable, path: str, **scope_options: Any) -> int:
+    """ASGI 앱을 한 번 호출하고 응답 상태 코드를 반환"""
+    status = 0
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(make_scope(path, **scope_options), _receive, send)
+    return status
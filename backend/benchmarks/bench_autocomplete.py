@@ -0,0 +1,81 @@
+"""
+직원 자동완성 색인 벤치마크
+
+직원 EMPLOYEES 명(기본 5만 명), 팀 500개인 회사의 색인을 만들고 입력 중인 검색어
+(음절, 입력 중 음절, 초성, 이메일, 사번, 팀 이름)의 응답 시간과 직원 한 명 변경 반영
+시간을 측정합니다. DB 없이 만든 가짜 직원으로 실행합니다.
+
+    cd backend
+    python benchmarks/bench_autocomplete.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from infrastructure.search import DirectoryEntry, DirectoryIndex  # noqa: E402
+
+EMPLOYEES = int(os.environ.get("BENCH_EMPLOYEES", "50000"))
+TEAMS = 500
+LIMIT = 10
+QUERIES = ("김", "김민", "김ㅁ", "ㄱㅁㅅ", "ㅇ", "이서", "minsu", "user123", "e0012", "개발", "플랫폼 개발3")
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+SYLLABLES = "민서지현준우수영진은하도윤성예주호연재가나다라"
+
+def _employees():
+    random.seed(0)
+    teams = {f"team-{index}": f"{random.choice(['플랫폼', '인사', '영업', '재무'])} 개발{index}" for index in range(TEAMS)}
+    entries = []
+    for index in range(EMPLOYEES):
+        name = random.choice(SURNAMES) + "".join(random.choices(SYLLABLES, k=2))
+        entries.append(DirectoryEntry(
+            f"member-{index}",
+            f"user-{index}",
+            name,
+            f"user{index}@teamon.kr" if index % 3 else f"minsu{index}@teamon.kr",
+            f"E{index:06d}",
+            f"team-{index % TEAMS}"
+        ))
+    return entries, teams
+
+def _percentile(samples, percent):
+    return sorted(samples)[int(len(samples) * percent / 100) - 1]
+
+async def main() -> None:
+    entries, teams = _employees()
+
+    async def load(company_id):
+        return entries, teams
+
+    index = DirectoryIndex(load)
+    started = time.perf_counter()
+    directory = await index.get("company")
+    build_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{EMPLOYEES} employees, {TEAMS} teams: build {build_ms:.0f} ms, "
+          f"{len(directory._keys) + len(directory._initials)} keys")
+    print(f"{'query':<12} {'results':>7} {'p50 us':>8} {'p99 us':>8}")
+    for query in QUERIES:
+        samples = []
+        for _ in range(1000):
+            started = time.perf_counter()
+            results = await index.search("company", query, LIMIT)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+        print(f"{query:<12} {len(results):>7} {statistics.median(samples):>8.1f} {_percentile(samples, 99):>8.1f}")
+
+    samples = []
+    for number in range(200):
+        entry = entries[number]._replace(name=f"홍{number}")
+        started = time.perf_counter()
+        directory.put(entry)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    print(f"single update  p50 {statistics.median(samples):.0f} us  p99 {_percentile(samples, 99):.0f} us")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+분할 업로드 처리량 벤치마크
+
+256MB 파일을 8MB 조각으로 나눠 동시에 1/4/8 개씩 올릴 때의 처리량(MB/s)과 파이썬 힙
+최대 사용량, 완료(전체 sha256 계산 후 저장소로 이동)에 걸린 시간을 잽니다.
+조각은 제자리에 쓰고 완료 시 파일을 옮기기만 하므로 메모리는 조각 크기와 무관합니다.
+
+    cd backend
+    python benchmarks/bench_chunked_uploads.py
+"""
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from infrastructure.storage import ChunkedUploadStore, ContentStore  # noqa: E402
+
+FILE_SIZE = 256 * 1024 * 1024
+CHUNK_SIZE = 8 * 1024 * 1024
+BODY_PIECE = 64 * 1024  # 서버가 요청 본문을 받는 단위
+CONCURRENCY = (1, 4, 8)
+
+async def _body(chunk: bytes):
+    view = memoryview(chunk)
+    for start in range(0, len(chunk), BODY_PIECE):
+        yield bytes(view[start:start + BODY_PIECE])
+
+async def run(uploads: ChunkedUploadStore, chunks, concurrency: int):
+    session = await uploads.create("meeting.wav", FILE_SIZE, owner="bench")
+    pending = list(range(session.chunk_count))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def put(index: int) -> None:
+        async with semaphore:
+            chunk, checksum = chunks[index]
+            await uploads.write_chunk(session, index, _body(chunk), checksum)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(put(index) for index in pending))
+    uploaded = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    stored = await uploads.complete(session)
+    completed = time.perf_counter() - started
+    stored.path.unlink()
+    return FILE_SIZE / uploaded / 1024 / 1024, peak / 1024 / 1024, completed
+
+async def main() -> None:
+    block = b"RIFF\x00\x00\x00\x00WAVE" + os.urandom(CHUNK_SIZE - 12)
+    chunks = []
+    for index in range(FILE_SIZE // CHUNK_SIZE):
+        chunk = block if index == 0 else block[index:] + block[:index]
+        chunks.append((chunk, hashlib.sha256(chunk).digest()))
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ContentStore(root, max_size=0, allowed_extensions=[])
+        uploads = ChunkedUploadStore(store, max_size=FILE_SIZE, allowed_extensions=["wav"], chunk_size=CHUNK_SIZE)
+        print(f"{'concurrency':>12}{'MB/s':>10}{'peak heap MB':>14}{'complete s':>12}")
+        for concurrency in CONCURRENCY:
+            throughput, peak, completed = await run(uploads, chunks, concurrency)
+            print(f"{concurrency:>12}{throughput:>10.0f}{peak:>14.2f}{completed:>12.3f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+대용량 파일 동시 다운로드 처리량 벤치마크
+
+64MB 파일 하나를 여러 요청이 동시에 받을 때의 처리량(MB/s)과 파이썬 힙 최대
+사용량을 비교합니다.
+
+- chunked: 서버 확장이 없을 때 (uvicorn) pread 로 읽어 조각을 보내는 경로
+- zerocopysend: 서버가 받은 파일 디스크립터 구간을 os.sendfile 로 /dev/null 에 복사
+
+    cd backend
+    python benchmarks/bench_downloads.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+
+from infrastructure.storage import ContentStore  # noqa: E402
+from presentation.api.dependencies import get_token_claims  # noqa: E402
+from presentation.api.downloads import ZERO_COPY_SEND  # noqa: E402
+from presentation.api.v1.files import router  # noqa: E402
+from asgi_client import make_scope  # noqa: E402
+
+FILE_SIZE = 64 * 1024 * 1024
+CONCURRENCY = (1, 8, 32)
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+def make_sender(sink: int):
+    """응답 본문을 /dev/null 에 쓰는 서버 흉내 (zerocopysend 는 sendfile 로)"""
+    received = 0
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+        elif message["type"] == ZERO_COPY_SEND:
+            descriptor = message["file"].fileno()
+            offset, count = message.get("offset", 0), message["count"]
+            loop = asyncio.get_running_loop()
+            while count > 0:
+                sent = await loop.run_in_executor(None, os.sendfile, sink, descriptor, offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+                received += sent
+
+    return send, lambda: received
+
+async def run(app, path: str, concurrency: int, zero_copy: bool, sink: int):
+    scope = make_scope(path)
+    if zero_copy:
+        scope["extensions"] = {ZERO_COPY_SEND: {}}
+    senders = [make_sender(sink) for _ in range(concurrency)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(app(dict(scope), _receive, send) for send, _ in senders))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(received() for _, received in senders)
+    assert total == FILE_SIZE * concurrency
+    return total / elapsed / 1024 / 1024, peak / 1024 / 1024
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        store = ContentStore(root, max_size=FILE_SIZE, allowed_extensions=["pdf"])
+
+        async def chunks():
+            yield b"%PDF-1.7\n"
+            block = os.urandom(1024 * 1024)
+            for _ in range(FILE_SIZE // len(block) - 1):
+                yield block
+            yield block[:len(block) - 9]
+
+        stored = await store.save(chunks(), "large.pdf")
+
+        app = FastAPI()
+        app.state.file_store = store
+        app.include_router(router, prefix="/api/v1/files")
+        app.dependency_overrides[get_token_claims] = lambda: {"sub": "bench"}
+        path = f"/api/v1/files/{stored.digest}"
+
+        sink = os.open(os.devnull, os.O_WRONLY)
+        try:
+            print(f"{'mode':<14}{'concurrency':>12}{'MB/s':>10}{'peak heap MB':>14}")
+            for zero_copy in (False, True):
+                for concurrency in CONCURRENCY:
+                    throughput, peak = await run(app, path, concurrency, zero_copy, sink)
+                    mode = "zerocopysend" if zero_copy else "chunked"
+                    print(f"{mode:<14}{concurrency:>12}{throughput:>10.0f}{peak:>14.2f}")
+        finally:
+            os.close(sink)
+
+if __name__ == "__main__":
+    asyncio.run(main())
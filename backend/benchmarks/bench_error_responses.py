@@ -0,0 +1,90 @@
+"""
+에러 응답 경로 ASGI 벤치마크
+
+HTTP 서버 없이 ASGI 앱을 직접 호출하여 에러 응답 처리량을 측정합니다.
+이전 JSONResponse 기반 핸들러와 사전 직렬화 본문(error_responses)을 비교합니다.
+
+    cd backend
+    python benchmarks/bench_error_responses.py
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from application.common.constants import ResponseCode  # noqa: E402
+from application.common.exceptions import (  # noqa: E402
+    ApplicationException,
+    InvalidTokenException,
+    ResourceNotFoundException
+)
+from presentation.api.error_handlers import setup_error_handlers  # noqa: E402
+from asgi_client import drive  # noqa: E402
+
+REQUESTS = 20000
+
+def setup_legacy_error_handlers(app: FastAPI) -> None:
+    """이전 구현 (비교용)"""
+    @app.exception_handler(ApplicationException)
+    async def application_exception_handler(request: Request, exc: ApplicationException):
+        exc.log_error(path=request.url.path)
+        response_code = ResponseCode(exc.code)
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "code": exc.code,
+                "message": response_code.format_message(**exc.additional_info) if exc.additional_info else response_code.message,
+                "data": exc.additional_info if exc.additional_info else None
+            }
+        )
+
+def build_app(setup) -> FastAPI:
+    app = FastAPI()
+    setup(app)
+
+    @app.get("/unauthorized")
+    async def unauthorized():
+        raise ApplicationException(code=ResponseCode.AUTH_INVALID_TOKEN, message="invalid token", status_code=401)
+
+    @app.get("/invalid-token")
+    async def invalid_token():
+        raise InvalidTokenException(reason="signature_invalid")
+
+    @app.get("/not-found")
+    async def not_found():
+        raise ResourceNotFoundException(message="not found", resource_type="User", resource_id="user123")
+
+    return app
+
+async def main() -> None:
+    # 로깅 비용은 측정 대상이 아니므로 레코드를 버림
+    app_logger = logging.getLogger("application")
+    app_logger.handlers = [logging.NullHandler()]
+    app_logger.propagate = False
+
+    legacy = build_app(setup_legacy_error_handlers)
+    current = build_app(setup_error_handlers)
+
+    print(f"{REQUESTS} requests per case")
+    for path, label in (
+        ("/unauthorized", "401 static message, no data"),
+        ("/invalid-token", "401 with data"),
+        ("/not-found", "404 with data"),
+    ):
+        await drive(legacy, path, 1000)
+        await drive(current, path, 1000)
+        legacy_rps = await drive(legacy, path, REQUESTS)
+        current_rps = await drive(current, path, REQUESTS)
+        print(
+            f"{label:<30} legacy {legacy_rps:9.0f} req/s"
+            f"  prerendered {current_rps:9.0f} req/s"
+            f"  -> {current_rps / legacy_rps:.2f}x"
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())
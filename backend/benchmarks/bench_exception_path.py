@@ -0,0 +1,85 @@
+"""
+예외 경로 마이크로 벤치마크
+
+생성 시점 로깅(이전 동작)과 에러 핸들러 지연 로깅(현재 동작)의 비용을 비교합니다.
+
+    cd backend
+    python benchmarks/bench_exception_path.py
+"""
+import logging
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.common.exceptions import EntityNotFoundException  # noqa: E402
+from application.common.constants import ResponseCode  # noqa: E402
+from application.common.exceptions import ApplicationException  # noqa: E402
+from application.common.exception_translators import ExceptionTranslator  # noqa: E402
+
+NUMBER = 20000
+RETRIES = 3
+
+def _setup_logging() -> None:
+    """운영 환경과 비슷하게 실제 포맷팅/쓰기가 일어나도록 devnull 핸들러 연결"""
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+    app_logger = logging.getLogger("application")
+    app_logger.handlers = [handler]
+    app_logger.setLevel(logging.ERROR)
+    app_logger.propagate = False
+
+def _new_exception() -> ApplicationException:
+    return ApplicationException(
+        code=ResponseCode.SERVICE_UNAVAILABLE,
+        message="외부 서비스 호출 실패",
+        additional_info={"service": "payment", "attempt": 1}
+    )
+
+def eager_retry_path() -> None:
+    """이전 동작: 재시도 중 생성된 모든 예외가 생성 시점에 로깅"""
+    for _ in range(RETRIES):
+        exc = _new_exception()
+        exc.log_error()
+
+def deferred_retry_path() -> None:
+    """현재 동작: 최종적으로 처리된 예외 하나만 로깅"""
+    exc = None
+    for _ in range(RETRIES):
+        exc = _new_exception()
+    exc.log_error(path="/bench")
+
+def eager_construct() -> None:
+    """이전 동작: 잡혀서 버려지는 예외도 uuid 생성 + 로깅"""
+    _new_exception().log_error()
+
+def translate_and_handle() -> None:
+    """도메인 예외 변환 후 핸들러에서 한 번 로깅"""
+    app_exc = ExceptionTranslator.translate(EntityNotFoundException("User", "user123"))
+    app_exc.log_error(path="/bench", exception_type="EntityNotFoundException")
+
+def construct_only() -> None:
+    """잡혀서 버려지는 예외: 로깅/uuid 생성 없음"""
+    _new_exception()
+
+def _report(name: str, func) -> float:
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=3))
+    per_op = seconds / NUMBER * 1e6
+    print(f"{name:<28} {per_op:8.2f} us/op")
+    return per_op
+
+def main() -> None:
+    _setup_logging()
+    print(f"{NUMBER} iterations, best of 3")
+    eager = _report("retry x3 (eager log)", eager_retry_path)
+    deferred = _report("retry x3 (deferred log)", deferred_retry_path)
+    print(f"  -> {eager / deferred:.1f}x")
+    eager = _report("caught (eager log)", eager_construct)
+    deferred = _report("caught (deferred log)", construct_only)
+    print(f"  -> {eager / deferred:.1f}x")
+    _report("translate + handler log", translate_and_handle)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+ExceptionTranslator 디스패치 벤치마크
+
+이전의 isinstance 체인과 MRO 캐시 레지스트리의 변환 함수 조회 비용을
+도메인 예외 종류 수에 따라 비교합니다. 예외 생성 비용을 빼기 위해
+변환 함수는 미리 만든 ApplicationException을 반환합니다.
+
+    cd backend
+    python benchmarks/bench_exception_translators.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.common.exceptions import DomainException  # noqa: E402
+from application.common.constants import ResponseCode  # noqa: E402
+from application.common.exceptions import ApplicationException  # noqa: E402
+from application.common.exception_translators import ExceptionTranslator  # noqa: E402
+
+NUMBER = 200000
+PREBUILT = ApplicationException(code=ResponseCode.INTERNAL_SERVER_ERROR, message="bench")
+
+def _translate(exc):
+    return PREBUILT
+
+def make_exception_types(count: int):
+    """바운디드 컨텍스트별 도메인 예외 계층 (컨텍스트 기본 예외 + 구체 예외)"""
+    types = []
+    for i in range(count):
+        context_base = type(f"Context{i}Exception", (DomainException,), {})
+        types.append(type(f"Context{i}SpecificException", (context_base,), {}))
+    return types
+
+def legacy_chain(types):
+    """이전 방식: 등록 순서대로 isinstance 검사"""
+    def translate(exc):
+        for exc_type in types:
+            if isinstance(exc, exc_type):
+                return _translate(exc)
+        if hasattr(exc, "to_dict"):
+            return _translate(exc)
+        return _translate(exc)
+    return translate
+
+def main() -> None:
+    print(f"{NUMBER} lookups, best of 3")
+    for count in (4, 16, 64):
+        types = make_exception_types(count)
+        for exc_type in types:
+            ExceptionTranslator.register(exc_type.__mro__[1], _translate)
+
+        # 가장 나중에 등록된 예외 (체인의 끝)
+        exc = types[-1]("bench")
+        chain = legacy_chain([t.__mro__[1] for t in types])
+
+        legacy = min(timeit.repeat(lambda: chain(exc), number=NUMBER, repeat=3))
+        registry = min(timeit.repeat(lambda: ExceptionTranslator.translate(exc), number=NUMBER, repeat=3))
+        print(
+            f"{count:>3} types  isinstance chain {legacy / NUMBER * 1e9:8.1f} ns"
+            f"  registry {registry / NUMBER * 1e9:8.1f} ns"
+            f"  -> {legacy / registry:.1f}x"
+        )
+
+        for exc_type in types:
+            ExceptionTranslator.unregister(exc_type.__mro__[1])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Prometheus 미들웨어 오버헤드 벤치마크
+
+HTTP 서버 없이 ASGI 앱을 직접 호출하여 PrometheusMiddleware 유무에 따른
+요청당 추가 비용을 측정합니다.
+
+    cd backend
+    python benchmarks/bench_metrics_middleware.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+from prometheus_client import CollectorRegistry  # noqa: E402
+
+from presentation.api.metrics import HttpMetrics, PrometheusMiddleware  # noqa: E402
+from asgi_client import drive  # noqa: E402
+
+REQUESTS = 20000
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+    if with_metrics:
+        app.add_middleware(PrometheusMiddleware, metrics=HttpMetrics(registry=CollectorRegistry()))
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: str):
+        return {"id": user_id}
+
+    return app
+
+async def main() -> None:
+    plain = build_app(with_metrics=False)
+    instrumented = build_app(with_metrics=True)
+
+    await drive(plain, "/users/1", 1000)
+    await drive(instrumented, "/users/1", 1000)
+    plain_rps = await drive(plain, "/users/1", REQUESTS)
+    instrumented_rps = await drive(instrumented, "/users/1", REQUESTS)
+
+    overhead_us = (1 / instrumented_rps - 1 / plain_rps) * 1e6
+    print(f"{REQUESTS} requests per case")
+    print(f"without middleware {plain_rps:9.0f} req/s")
+    print(f"with middleware    {instrumented_rps:9.0f} req/s")
+    print(f"overhead           {overhead_us:9.1f} us/request")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+알림 fan-out 벤치마크
+
+회사 전체 공지(RECIPIENTS 명)를 채널 2개로 펼칠 때 묶음 크기별 소요 시간과 Redis 왕복 수,
+같은 알림을 다시 보낼 때(중복 방지 키로 모두 걸러짐)의 소요 시간을 잽니다. 이어서 푸시
+전송을 transport 호출당 PROVIDER_LATENCY 초가 걸리는 가짜 발송 서비스로 보내며 동시 묶음
+수별 소요 시간을 비교합니다. 대상은 DB 대신 메모리에서 펼칩니다.
+로컬 redis-server 가 필요하며, 연결할 수 없으면 fakeredis 로 실행합니다.
+
+    cd backend
+    redis-server --port 6379 &
+    BENCH_REDIS_URL=redis://localhost:6379/15 python benchmarks/bench_notifications.py
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fakeredis import FakeAsyncRedis, FakeServer  # noqa: E402
+from redis.asyncio import Redis  # noqa: E402
+from redis.exceptions import ConnectionError  # noqa: E402
+
+from infrastructure.notifications import (  # noqa: E402
+    SENT,
+    Audience,
+    Notification,
+    NotificationEngine,
+    TransportChannel
+)
+
+REDIS_URL = os.environ.get("BENCH_REDIS_URL", "redis://localhost:6379/15")
+RECIPIENTS = int(os.environ.get("BENCH_RECIPIENTS", "20000"))
+BATCH_SIZES = (1, 100, 1000)
+PUSH_CONCURRENCY = (1, 4, 16)
+PROVIDER_LATENCY = 0.02
+
+class _Channel:
+    def __init__(self, name: str):
+        self.name = name
+
+async def _recipients(company_id, audience, batch_size):
+    for start in range(0, RECIPIENTS, batch_size):
+        yield [f"user-{index}" for index in range(start, min(start + batch_size, RECIPIENTS))]
+
+async def _redis():
+    try:
+        redis = Redis.from_url(REDIS_URL)
+        await redis.ping()
+        await redis.flushdb()
+        return redis, REDIS_URL
+    except (ConnectionError, OSError):
+        return FakeAsyncRedis(server=FakeServer()), "fakeredis (redis-server 에 연결할 수 없음)"
+
+async def bench_fan_out(redis) -> None:
+    print(f"{'batch size':>12}{'fan-out s':>12}{'round trips':>13}{'resend s':>10}")
+    for batch_size in BATCH_SIZES:
+        engine = NotificationEngine(
+            redis, _recipients, [_Channel("in_app"), _Channel("push")],
+            key_prefix=f"bench:{batch_size}:", fanout_batch_size=batch_size, max_stream_length=RECIPIENTS
+        )
+        notification = Notification.create(
+            "company", "announcement", "공지", "전체 공지입니다.", Audience(everyone=True), ("in_app", "push"),
+            coalesce_key="announcement:1"
+        )
+        started = time.perf_counter()
+        assert await engine.fan_out(notification) == RECIPIENTS
+        elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        assert await engine.fan_out(notification._replace(id="resend")) == 0
+        resent = time.perf_counter() - started
+        round_trips = -(-RECIPIENTS // batch_size)
+        print(f"{batch_size:>12}{elapsed:>12.3f}{round_trips:>13}{resent:>10.3f}")
+
+async def _transport(payload, tokens):
+    await asyncio.sleep(PROVIDER_LATENCY)
+    return {token: SENT for token in tokens}
+
+async def _tokens(user_ids):
+    return {user_id: [f"token-{user_id}"] for user_id in user_ids}
+
+async def bench_push() -> None:
+    user_ids = [f"user-{index}" for index in range(RECIPIENTS)]
+    notification = Notification.create("company", "announcement", "공지", "내용", Audience(everyone=True), ("push",))
+    print(f"\n{'concurrency':>12}{'push s':>10}{'tokens/s':>12}")
+    for concurrency in PUSH_CONCURRENCY:
+        channel = TransportChannel("push", _tokens, _transport, batch_size=500, concurrency=concurrency)
+        started = time.perf_counter()
+        await channel.send(notification, user_ids)
+        elapsed = time.perf_counter() - started
+        print(f"{concurrency:>12}{elapsed:>10.3f}{RECIPIENTS / elapsed:>12.0f}")
+
+async def main() -> None:
+    redis, target = await _redis()
+    print(f"Redis: {target}, 대상 {RECIPIENTS}명\n")
+    await bench_fan_out(redis)
+    await bench_push()
+    await redis.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
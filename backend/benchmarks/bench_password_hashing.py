@@ -0,0 +1,101 @@
+"""
+동시 로그인 중 다른 요청의 지연 시간 벤치마크
+
+bcrypt 검증을 이벤트 루프에서 직접 실행할 때와 PasswordHasher(프로세스 풀)로
+실행할 때, 로그인이 몰리는 동안 /ping 요청의 p50/p99 지연 시간과 로그인
+처리량을 비교합니다. 풀 한도를 넘는 로그인은 503 으로 바로 거절됩니다.
+
+    cd backend
+    python benchmarks/bench_password_hashing.py
+    BENCH_ROUNDS=10 BENCH_LOGINS=16 python benchmarks/bench_password_hashing.py
+"""
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+
+from infrastructure.security import PasswordHasher  # noqa: E402
+from infrastructure.security.passwords import _context  # noqa: E402
+from presentation.api.error_handlers import setup_error_handlers  # noqa: E402
+from asgi_client import request  # noqa: E402
+
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", "12"))
+LOGINS = int(os.environ.get("BENCH_LOGINS", "32"))  # 동시에 로그인하는 클라이언트 수
+DURATION = float(os.environ.get("BENCH_DURATION", "5"))
+PING_INTERVAL = 0.005
+
+def build_app(hasher: PasswordHasher, inline: bool, hashed: str) -> FastAPI:
+    app = FastAPI()
+    setup_error_handlers(app)
+    context = _context("bcrypt", ROUNDS)
+
+    @app.post("/login")
+    async def login():
+        if inline:
+            verified = context.verify("password", hashed)
+        else:
+            verified = await hasher.verify("password", hashed)
+        return {"verified": verified}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+async def run(app: FastAPI) -> dict:
+    deadline = time.perf_counter() + DURATION
+    statuses = []
+
+    async def login_client() -> None:
+        while time.perf_counter() < deadline:
+            statuses.append(await request(app, "/login", method="POST"))
+            # 503 을 받은 클라이언트는 잠시 쉬었다 재시도
+            if statuses[-1] == 503:
+                await asyncio.sleep(0.05)
+
+    async def pinger() -> list:
+        # 예정된 시각부터 잰다 (루프가 막혀 늦게 보낸 시간도 지연에 포함)
+        latencies = []
+        scheduled = time.perf_counter()
+        while scheduled < deadline:
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await request(app, "/ping")
+            latencies.append(time.perf_counter() - scheduled)
+            scheduled += PING_INTERVAL
+        return latencies
+
+    results = await asyncio.gather(pinger(), *(login_client() for _ in range(LOGINS)))
+    latencies = sorted(results[0])
+    return {
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "logins": statuses.count(200) / DURATION,
+        "rejected": statuses.count(503)
+    }
+
+async def main() -> None:
+    # 거절(503) 로그가 결과 출력을 가리지 않도록
+    logging.disable(logging.CRITICAL)
+    hasher = PasswordHasher(rounds=ROUNDS)
+    await hasher.warmup()
+    hashed = await hasher.hash("password")
+    print(f"bcrypt rounds={ROUNDS}, {LOGINS} concurrent logins, {DURATION:.0f}s per case, "
+          f"{hasher.max_workers} hash workers, max_pending={hasher.max_pending}")
+    try:
+        for name, inline in (("event loop", True), ("process pool", False)):
+            result = await run(build_app(hasher, inline, hashed))
+            print(f"{name:12}  /ping p50 {result['p50']:8.1f} ms  p99 {result['p99']:8.1f} ms  "
+                  f"logins {result['logins']:6.1f}/s  rejected {result['rejected']}")
+    finally:
+        hasher.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+레이트 리밋 미들웨어 처리량 벤치마크
+
+Redis 대신 프로세스 내 fakeredis 를 사용해, 리미터 없음 / 요청마다 Redis
+스크립트 호출(max_lease=1) / 로컬 토큰 임대(max_lease=8)의 초당 요청 수를
+비교합니다. 실제 Redis 에서는 요청마다 네트워크 왕복이 더해지므로 임대의
+효과가 더 커집니다.
+
+    cd backend
+    python benchmarks/bench_rate_limit.py
+"""
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fakeredis import FakeAsyncRedis, FakeServer  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from infrastructure.rate_limit import GcraRateLimiter, RateLimit  # noqa: E402
+from infrastructure.security import TokenVerifier  # noqa: E402
+from presentation.api.rate_limit import RateLimitMiddleware, token_rate_limit_keys  # noqa: E402
+from asgi_client import drive  # noqa: E402
+
+REQUESTS = 5000
+SECRET = "benchmark-secret-key-at-least-32-characters"
+
+def build_app(max_lease: int = 0):
+    app = FastAPI()
+    limiter = None
+    if max_lease:
+        limiter = GcraRateLimiter(FakeAsyncRedis(server=FakeServer()), max_lease=max_lease)
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=limiter,
+            keys=token_rate_limit_keys(
+                TokenVerifier(SECRET),
+                user_quota=RateLimit(10 ** 9),
+                company_quota=RateLimit(10 ** 9)
+            )
+        )
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app, limiter
+
+async def main() -> None:
+    token = jwt.encode(
+        {"sub": "user", "company_id": "company", "jti": uuid.uuid4().hex, "exp": int(time.time()) + 3600},
+        SECRET,
+        algorithm="HS256"
+    )
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    print(f"{REQUESTS} requests per case (user + company keys)")
+    baseline = None
+    for label, max_lease in (("no limiter", 0), ("redis per request", 1), ("local leases (8)", 8)):
+        app, limiter = build_app(max_lease)
+        await drive(app, "/ping", 200, headers=headers)
+        rps = await drive(app, "/ping", REQUESTS, headers=headers)
+        baseline = baseline or rps
+        calls = f"{limiter.stats['redis']:6d} redis calls" if limiter else ""
+        print(f"{label:18} {rps:9.0f} req/s  {(1 / rps - 1 / baseline) * 1e6:7.1f} us/request  {calls}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
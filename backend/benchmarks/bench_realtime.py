@@ -0,0 +1,178 @@
+"""
+실시간 알림 게이트웨이 벤치마크
+
+WebSocket 연결 CONNECTIONS 개를 열어 둔 채(보낼 것이 없는 상태) 연결당 메모리와
+Redis 구독 명령 수를 재고, 전체 공지 하나가 모든 연결에 도착하기까지의 지연(p50/p99/최대)을
+잽니다. 사용자 한 명에게 보낸 알림의 왕복 지연도 함께 잽니다.
+WebSocket 라이브러리 없이 ASGI 앱을 직접 호출하므로 서버(uvicorn)의 소켓/전송 버퍼 메모리는
+포함되지 않습니다 (연결당 게이트웨이 + hub + ASGI 태스크 비용만 잼).
+로컬 redis-server 가 필요하며, 연결할 수 없으면 fakeredis 로 실행합니다.
+
+    cd backend
+    redis-server --port 6379 &
+    BENCH_REDIS_URL=redis://localhost:6379/15 python benchmarks/bench_realtime.py
+"""
+import asyncio
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fakeredis import FakeAsyncRedis, FakeServer  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from jose import jwt  # noqa: E402
+from redis.asyncio import Redis  # noqa: E402
+from redis.exceptions import ConnectionError  # noqa: E402
+
+from infrastructure.notifications import RealtimeHub  # noqa: E402
+from infrastructure.security import TokenVerifier  # noqa: E402
+from presentation.api.realtime import RealtimeGateway  # noqa: E402
+from presentation.api.v1.notifications import router  # noqa: E402
+
+REDIS_URL = os.environ.get("BENCH_REDIS_URL", "redis://localhost:6379/15")
+CONNECTIONS = int(os.environ.get("BENCH_CONNECTIONS", "10000"))
+COMPANIES = 10
+WAVE = 1000
+SECRET = "bench-secret-key-at-least-32-characters"
+PATH = "/api/v1/notifications/ws"
+
+class _Socket:
+    """ASGI websocket scope 를 직접 호출하는 클라이언트"""
+
+    def __init__(self, app: FastAPI, token: str):
+        self.app = app
+        self.scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": PATH,
+            "raw_path": PATH.encode(),
+            "root_path": "",
+            "query_string": f"access_token={token}".encode(),
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 12345),
+            "server": ("bench", 80),
+            "subprotocols": [],
+        }
+        self.incoming: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self.accepted = asyncio.get_running_loop().create_future()
+        self.on_frame: Optional[Any] = None
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    async def open(self) -> None:
+        self.incoming.put_nowait({"type": "websocket.connect"})
+        self.task = asyncio.get_running_loop().create_task(self.app(self.scope, self.incoming.get, self._send))
+        await self.accepted
+
+    async def close(self) -> None:
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        await self.task
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        if message["type"] == "websocket.accept":
+            self.accepted.set_result(None)
+        elif message["type"] == "websocket.close" and not self.accepted.done():
+            self.accepted.set_exception(RuntimeError(f"rejected: {message.get('code')}"))
+        elif message["type"] == "websocket.send" and self.on_frame is not None:
+            self.on_frame(message["text"])
+
+def _token(index: int) -> str:
+    return jwt.encode(
+        {
+            "sub": f"user-{index}",
+            "company_id": f"company-{index % COMPANIES}",
+            "jti": uuid.uuid4().hex,
+            "exp": int(time.time()) + 3600,
+        },
+        SECRET,
+        algorithm="HS256"
+    )
+
+def _rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+async def _redis():
+    try:
+        redis = Redis.from_url(REDIS_URL)
+        await redis.ping()
+        return redis, REDIS_URL
+    except (ConnectionError, OSError):
+        return FakeAsyncRedis(server=FakeServer()), "fakeredis (redis-server 에 연결할 수 없음)"
+
+async def _deliver(hub: RealtimeHub, sockets: List[_Socket], **target: Any) -> List[float]:
+    """알림 하나를 발행하고 받은 연결마다 도착 지연(ms)을 돌려줍니다."""
+    expected = 1 if target else len(sockets)
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    def on_frame(text: str) -> None:
+        if text.startswith('{"type":"notification"'):
+            latencies.append((time.perf_counter() - started) * 1000)
+            if len(latencies) == expected:
+                done.set()
+
+    for socket in sockets:
+        socket.on_frame = on_frame
+    started = time.perf_counter()
+    await hub.publish('{"title":"공지"}', **target)
+    await asyncio.wait_for(done.wait(), 60)
+    return latencies
+
+async def main() -> None:
+    redis, target = await _redis()
+    hub = RealtimeHub(redis, key_prefix=f"bench:{uuid.uuid4().hex[:8]}:", max_connections=CONNECTIONS)
+    app = FastAPI()
+    app.state.realtime_gateway = RealtimeGateway(hub, TokenVerifier(SECRET), heartbeat_interval=3600)
+    app.include_router(router, prefix="/api/v1/notifications")
+    await hub.start()
+    print(f"Redis: {target}, 연결 {CONNECTIONS}개\n")
+
+    tokens = [_token(index) for index in range(CONNECTIONS)]
+    gc.collect()
+    rss_before = _rss()
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    sockets = [_Socket(app, token) for token in tokens]
+    started = time.perf_counter()
+    for start in range(0, CONNECTIONS, WAVE):
+        await asyncio.gather(*(socket.open() for socket in sockets[start:start + WAVE]))
+    opened = time.perf_counter() - started
+    gc.collect()
+    traced = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    rss_after = _rss()
+
+    print(f"{'open s':>10}{'SUBSCRIBE':>11}{'channels':>10}{'bytes/conn (traced)':>21}{'bytes/conn (RSS)':>18}")
+    rss = "-" if rss_before is None else f"{(rss_after - rss_before) / CONNECTIONS:.0f}"
+    print(
+        f"{opened:>10.2f}{hub.stats['subscribes']:>11}{len(hub._subscribed):>10}"
+        f"{traced / CONNECTIONS:>21.0f}{rss:>18}"
+    )
+
+    print(f"\n{'target':>10}{'received':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, options in (("broadcast", {}), ("user", {"user_id": f"user-{CONNECTIONS // 2}"})):
+        latencies = sorted(await _deliver(hub, sockets, **options))
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f"{name:>10}{len(latencies):>10}{statistics.median(latencies):>10.2f}"
+            f"{p99:>10.2f}{latencies[-1]:>10.2f}"
+        )
+
+    await asyncio.gather(*(socket.close() for socket in sockets))
+    assert hub.connections == 0
+    await hub.stop()
+    await redis.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Redis 자동 파이프라인 벤치마크
+
+동시 요청 CONCURRENCY 개가 각각 GET/INCR/HGET 을 보내는 부하에서 일반
+redis.asyncio 클라이언트와 BatchingRedis 의 처리량과 왕복 수를 비교합니다.
+로컬 redis-server 가 필요하며, 연결할 수 없으면 fakeredis 로 실행합니다
+(이 경우 왕복 수만 의미가 있음).
+
+    cd backend
+    redis-server --port 6379 &
+    BENCH_REDIS_URL=redis://localhost:6379/15 python benchmarks/bench_redis_batching.py
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fakeredis import FakeServer  # noqa: E402
+from fakeredis.aioredis import FakeConnection  # noqa: E402
+from redis.asyncio import BlockingConnectionPool, Redis  # noqa: E402
+from redis.exceptions import ConnectionError  # noqa: E402
+
+from infrastructure.redis import BatchingRedis, InstrumentedConnectionPool  # noqa: E402
+
+REDIS_URL = os.environ.get("BENCH_REDIS_URL", "redis://localhost:6379/15")
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "200"))
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", "50"))
+MAX_CONNECTIONS = 10
+
+def _pool(pool_class, fake_server):
+    if fake_server is not None:
+        return pool_class(connection_class=FakeConnection, server=fake_server, max_connections=MAX_CONNECTIONS)
+    return pool_class.from_url(REDIS_URL, max_connections=MAX_CONNECTIONS)
+
+async def _request(redis, index: int) -> None:
+    await redis.get(f"bench:user:{index}")
+    await redis.incr(f"bench:counter:{index % 10}")
+    await redis.hget("bench:company", str(index))
+
+async def run(redis) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(*(_request(redis, index) for index in range(CONCURRENCY)))
+    return CONCURRENCY * ROUNDS * 3 / (time.perf_counter() - started)
+
+async def main() -> None:
+    fake_server = None
+    try:
+        probe = Redis.from_url(REDIS_URL)
+        await probe.ping()
+        await probe.aclose()
+        target = REDIS_URL
+    except (ConnectionError, OSError):
+        fake_server = FakeServer()
+        target = "fakeredis (redis-server 에 연결할 수 없음)"
+
+    plain = Redis(connection_pool=_pool(BlockingConnectionPool, fake_server))
+    batching = BatchingRedis(connection_pool=_pool(InstrumentedConnectionPool, fake_server))
+
+    await run(plain)
+    await run(batching)
+    batching.stats.update(commands=0, roundtrips=0)
+    plain_ops = await run(plain)
+    batching_ops = await run(batching)
+
+    commands = batching.stats["commands"]
+    print(f"target: {target}")
+    print(f"{CONCURRENCY} concurrent requests x {ROUNDS} rounds x 3 commands, {MAX_CONNECTIONS} connections")
+    print(f"plain client     {plain_ops:9.0f} commands/s  {commands:7d} roundtrips")
+    print(f"batching client  {batching_ops:9.0f} commands/s  {batching.stats['roundtrips']:7d} roundtrips "
+          f"(avg batch {commands / batching.stats['roundtrips']:.1f})")
+    await plain.aclose()
+    await batching.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+예외 페이로드 직렬화 벤치마크
+
+이전의 재귀 isinstance 체인(_ensure_serializable)과 domain.common.serialization
+의 to_serializable 을 중첩 페이로드에 대해 비교합니다.
+
+    cd backend
+    python benchmarks/bench_serialization.py
+"""
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.common.serialization import to_serializable  # noqa: E402
+
+NUMBER = 2000
+
+def legacy_ensure_serializable(value):
+    """이전 구현 (비교용)"""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    elif isinstance(value, (datetime, UUID)):
+        return str(value)
+    elif isinstance(value, dict):
+        return {k: legacy_ensure_serializable(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [legacy_ensure_serializable(item) for item in value]
+    else:
+        return str(value)
+
+def small_payload():
+    return {"field": "email", "value": "invalid-email", "additional_info": {"pattern": ".+@.+"}}
+
+def nested_payload():
+    return {
+        "rule": "MaxTeamMembers",
+        "context": {
+            "team": {
+                "id": uuid4(),
+                "members": [
+                    {"id": uuid4(), "name": f"member-{i}", "joined_at": datetime.now(), "roles": ["USER"]}
+                    for i in range(50)
+                ]
+            },
+            "requested_at": datetime.now()
+        }
+    }
+
+def huge_payload():
+    """제한이 없으면 에러 응답을 부풀리는 페이로드"""
+    return {"rows": [{"index": i, "body": "x" * 10000} for i in range(5000)]}
+
+def _report(name: str, func) -> float:
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=7))
+    per_op = seconds / NUMBER * 1e6
+    print(f"{name:<28} {per_op:10.2f} us/op")
+    return per_op
+
+def main() -> None:
+    print(f"{NUMBER} iterations, best of 7")
+    for label, payload in (
+        ("small", small_payload()),
+        ("nested (50 members)", nested_payload()),
+        ("huge (5000 x 10KB)", huge_payload())
+    ):
+        legacy = _report(f"{label} legacy", lambda: legacy_ensure_serializable(payload))
+        current = _report(f"{label} to_serializable", lambda: to_serializable(payload))
+        print(f"  -> {legacy / current:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ from .exceptions import (
     AuthenticationException
 )
 
-from .response import ResponseModel
+from .response import ApiResponse
 from .constants import ResponseCode
 
 __all__ = [
@@ -24,6 +24,6 @@ __all__ = [
     'ValidationFailedException',
     'BusinessRuleViolationException',
     'AuthenticationException',
-    'ResponseModel',
+    'ApiResponse',
     'ResponseCode'
 ] 
\ No newline at end of file
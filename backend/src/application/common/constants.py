@@ -56,9 +56,11 @@ class ResponseCode(IntEnum):
     # File Domain (6xxx)
     FILE_NOT_FOUND = (6001, "파일을 찾을 수 없습니다.")               # 기본(0) - 찾기 실패(1)
     FILE_UPLOAD_FAILED = (6006, "파일 업로드에 실패했습니다.")         # 기본(0) - 외부 서비스 실패(6)
+    UPLOAD_INCOMPLETE = (6203, "아직 받지 못한 파일 조각이 있습니다.")   # 상태(2) - 유효하지 않은 상태(3)
     EXPORT_FAILED = (6106, "파일 내보내기에 실패했습니다.")            # 문서(1) - 외부 서비스 실패(6)
     FILE_TYPE_NOT_ALLOWED = (6403, "허용되지 않는 파일 형식입니다.")    # 데이터 검증(4) - 유효하지 않은 값(3)
     FILE_SIZE_EXCEEDED = (6405, "파일 크기가 허용된 최대 크기를 초과했습니다.") # 데이터 검증(4) - 제한/초과(5)
+    FILE_CHECKSUM_MISMATCH = (6413, "파일 조각의 체크섬이 일치하지 않습니다.")  # 데이터 검증(4) - 유효하지 않은 값(3)
 
     # Notification Domain (7xxx)
     PUSH_TOKEN_INVALID = (7503, "유효하지 않은 푸시 토큰입니다.")       # 외부 연동(5) - 유효하지 않은 값(3)
@@ -66,6 +68,7 @@ class ResponseCode(IntEnum):
     EMAIL_SEND_FAILED = (7506, "이메일 전송에 실패했습니다.")          # 외부 연동(5) - 외부 서비스 실패(6)
 
     # System Domain (9xxx)
+    RATE_LIMIT_EXCEEDED = (9705, "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.")  # 시스템/인프라(7) - 제한/초과(5)
     SERVICE_UNAVAILABLE = (9706, "서비스를 일시적으로 사용할 수 없습니다.")     # 시스템/인프라(7) - 외부 서비스 실패(6)
     INTERNAL_SERVER_ERROR = (9708, "내부 서버 오류가 발생했습니다.")           # 시스템/인프라(7) - 시스템 오류(8)
     DATABASE_ERROR = (9708, "데이터베이스 오류가 발생했습니다.")              # 시스템/인프라(7) - 시스템 오류(8)
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Type, Optional
+from typing import Dict, Any, Callable, Type, Optional
 
 from domain.common.exceptions import (
     DomainException,
@@ -14,25 +14,72 @@ from application.common.exceptions import (
     BusinessRuleViolationException
 )
 
+Translator = Callable[[Any], ApplicationException]
+
 class ExceptionTranslator:
-    """도메인 예외를 애플리케이션 예외로 변환"""
+    """도메인 예외를 애플리케이션 예외로 변환
+    
+    예외 클래스별 변환 함수를 레지스트리에 등록하고, 변환 시 예외 타입의
+    MRO를 따라 가장 가까운 변환 함수를 찾습니다. 찾은 결과는 구체 타입별로
+    캐시되므로 최초 이후 조회는 dict 조회 한 번입니다.
+    
+    각 바운디드 컨텍스트는 모듈 임포트 시점에 변환 함수를 등록합니다::
+    
+        @ExceptionTranslator.register(TaskAlreadyAssignedException)
+        def translate_task_already_assigned(exc) -> ApplicationException:
+            ...
+    """
+
+    _translators: Dict[type, Translator] = {}
+    _resolved: Dict[type, Translator] = {}
+
+    @classmethod
+    def register(
+        cls,
+        exc_type: Type[BaseException],
+        translator: Optional[Translator] = None
+    ) -> Any:
+        """예외 클래스에 대한 변환 함수를 등록합니다. 데코레이터로도 사용할 수 있습니다."""
+        if translator is None:
+            def decorator(func: Translator) -> Translator:
+                cls.register(exc_type, func)
+                return func
+            return decorator
+
+        cls._translators[exc_type] = translator
+        cls._resolved.clear()
+        return translator
+
+    @classmethod
+    def unregister(cls, exc_type: Type[BaseException]) -> None:
+        """등록된 변환 함수를 제거합니다."""
+        cls._translators.pop(exc_type, None)
+        cls._resolved.clear()
 
     @classmethod
     def translate(cls, domain_exc: Exception) -> ApplicationException:
         """도메인 예외를 애플리케이션 예외로 변환"""
-        if isinstance(domain_exc, EntityNotFoundException):
-            return cls._translate_entity_not_found(domain_exc)
-        elif isinstance(domain_exc, ValidationException):
-            return cls._translate_validation_exception(domain_exc)
-        elif isinstance(domain_exc, BusinessRuleException):
-            return cls._translate_business_rule_exception(domain_exc)
-        elif hasattr(domain_exc, "to_dict"):
-            return cls._translate_unknown_domain_exception(domain_exc)
-        else:
-            return ApplicationException(
-                code=ResponseCode.INTERNAL_SERVER_ERROR,
-                message=str(domain_exc)
+        exc_type = type(domain_exc)
+        translator = cls._resolved.get(exc_type)
+        if translator is None:
+            translator = cls._resolve(exc_type)
+        return translator(domain_exc)
+
+    @classmethod
+    def _resolve(cls, exc_type: type) -> Translator:
+        """MRO를 따라 변환 함수를 찾아 캐시합니다."""
+        translator = next(
+            (cls._translators[base] for base in exc_type.__mro__ if base in cls._translators),
+            None
+        )
+        if translator is None:
+            translator = (
+                cls._translate_unknown_domain_exception
+                if hasattr(exc_type, "to_dict")
+                else cls._translate_unexpected_exception
             )
+        cls._resolved[exc_type] = translator
+        return translator
 
     @classmethod
     def _translate_entity_not_found(
@@ -85,4 +132,20 @@ class ExceptionTranslator:
             code=ResponseCode.INTERNAL_SERVER_ERROR,
             message=message,
             additional_info=exc_dict
-        ) 
\ No newline at end of file
+        ) 
+
+    @classmethod
+    def _translate_unexpected_exception(
+        cls,
+        exc: Exception
+    ) -> ApplicationException:
+        """도메인 예외가 아닌 예외 변환"""
+        return ApplicationException(
+            code=ResponseCode.INTERNAL_SERVER_ERROR,
+            message=str(exc)
+        )
+
+ExceptionTranslator.register(EntityNotFoundException, ExceptionTranslator._translate_entity_not_found)
+ExceptionTranslator.register(ValidationException, ExceptionTranslator._translate_validation_exception)
+ExceptionTranslator.register(BusinessRuleException, ExceptionTranslator._translate_business_rule_exception)
+ExceptionTranslator.register(DomainException, ExceptionTranslator._translate_unknown_domain_exception)
@@ -1,10 +1,10 @@
-from typing import Dict, Any, Optional
-from datetime import datetime
-from uuid import UUID, uuid4
+from typing import Dict, Any, List, Optional
 from fastapi import status
 import logging
 import json
 
+from domain.common.identifiers import uuid7
+from domain.common.serialization import to_serializable
 from application.common.constants import ResponseCode
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,10 @@ class ApplicationException(Exception):
     
     모든 비즈니스 예외의 기본이 되는 클래스입니다.
     error_id를 통한 추적성과 구조화된 로깅을 제공합니다.
+    
+    생성 시점에는 로그를 남기지 않습니다. 잡혀서 재시도되는 예외까지
+    기록되지 않도록, 예외가 최종 처리되는 에러 핸들러에서 log_error()를
+    호출합니다.
     """
     
     def __init__(
@@ -41,25 +45,37 @@ class ApplicationException(Exception):
         self.message = message
         self.detail = message
         self.status_code = status_code
-        self.additional_info = self._ensure_serializable(additional_info) if additional_info is not None else {}
-        self.error_id = error_id or str(uuid4())
+        self.additional_info = to_serializable(additional_info) if additional_info is not None else {}
+        self._error_id = error_id
+        self._logged = False
         
-        self._log_error()
         super().__init__(message)
     
-    def _log_error(self):
-        """예외 발생 시 로그를 기록합니다.
+    @property
+    def error_id(self) -> str:
+        """에러 ID (처음 접근할 때 생성, 시간 순으로 정렬됨)"""
+        if self._error_id is None:
+            self._error_id = str(uuid7())
+        return self._error_id
+    
+    def log_error(self, **context: Any) -> None:
+        """예외 로그를 기록합니다. 같은 예외는 한 번만 기록됩니다.
         
         Python logging 시스템의 extra 매개변수를 사용하여
         LogRecord에 추가 필드를 포함시킵니다.
         """
+        if self._logged:
+            return
+        self._logged = True
         logger.error(
             f"[{self.error_id}] {self.message}",
             extra={
                 "error_code": str(self.code),
                 "error_id": self.error_id,
                 "error_message": self.message,
-                "additional_info": str(self.additional_info)
+                "additional_info": str(self.additional_info),
+                "exception_type": self.__class__.__name__,
+                **context
             }
         )
     
@@ -72,18 +88,6 @@ class ApplicationException(Exception):
             "error_id": self.error_id
         }
     
-    def _ensure_serializable(self, value: Any) -> Any:
-        """값이 JSON 직렬화 가능하도록 변환합니다."""
-        if isinstance(value, (str, int, float, bool, type(None))):
-            return value
-        elif isinstance(value, (datetime, UUID)):
-            return str(value)
-        elif isinstance(value, dict):
-            return {k: self._ensure_serializable(v) for k, v in value.items()}
-        elif isinstance(value, (list, tuple)):
-            return [self._ensure_serializable(item) for item in value]
-        else:
-            return str(value)
 
 class ResourceNotFoundException(ApplicationException):
     """리소스를 찾을 수 없을 때 발생하는 예외"""
@@ -125,7 +129,7 @@ class ValidationFailedException(ApplicationException):
             status_code=status.HTTP_400_BAD_REQUEST,
             additional_info={
                 "field": field,
-                "value": self._ensure_serializable(value),
+                "value": value,
                 "additional_info": additional_info or {}
             }
         )
@@ -145,7 +149,7 @@ class BusinessRuleViolationException(ApplicationException):
             status_code=status.HTTP_400_BAD_REQUEST,
             additional_info={
                 "rule": rule,
-                "context": self._ensure_serializable(context or {})
+                "context": context or {}
             }
         )
 
@@ -232,4 +236,140 @@ class AuthorizationException(ApplicationException):
                 "required_permissions": required_permissions,
                 **(additional_info or {})
             }
-        ) 
\ No newline at end of file
+        )
+
+class ServiceUnavailableException(ApplicationException):
+    """과부하 등으로 요청을 잠시 처리할 수 없을 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        resource: str,
+        retry_after: Optional[int] = None,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        self.retry_after = retry_after
+        super().__init__(
+            code=ResponseCode.SERVICE_UNAVAILABLE,
+            message=ResponseCode.SERVICE_UNAVAILABLE.message,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            additional_info={
+                "resource": resource,
+                "retry_after": retry_after,
+                **(additional_info or {})
+            }
+        )
+
+class FileSizeExceededException(ApplicationException):
+    """업로드 파일이 허용된 최대 크기를 넘을 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        max_size: int,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.FILE_SIZE_EXCEEDED,
+            message=ResponseCode.FILE_SIZE_EXCEEDED.message,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            additional_info={
+                "max_size": max_size,
+                **(additional_info or {})
+            }
+        )
+
+class FileTypeNotAllowedException(ApplicationException):
+    """업로드 파일의 확장자나 실제 형식(매직 바이트)이 허용되지 않을 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        extension: str,
+        allowed_extensions: list,
+        detected_type: Optional[str] = None,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.FILE_TYPE_NOT_ALLOWED,
+            message=ResponseCode.FILE_TYPE_NOT_ALLOWED.message,
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            additional_info={
+                "extension": extension,
+                "detected_type": detected_type,
+                "allowed_extensions": allowed_extensions,
+                **(additional_info or {})
+            }
+        )
+
+class FileUploadFailedException(ApplicationException):
+    """업로드 파일을 저장하지 못했을 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        reason: str,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.FILE_UPLOAD_FAILED,
+            message=ResponseCode.FILE_UPLOAD_FAILED.message,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            additional_info={
+                "reason": reason,
+                **(additional_info or {})
+            }
+        )
+
+class FileNotFoundException(ApplicationException):
+    """요청한 파일이 저장소에 없을 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        file_id: str,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.FILE_NOT_FOUND,
+            message=ResponseCode.FILE_NOT_FOUND.message,
+            status_code=status.HTTP_404_NOT_FOUND,
+            additional_info={
+                "file_id": file_id,
+                **(additional_info or {})
+            }
+        )
+
+class ChunkChecksumMismatchException(ApplicationException):
+    """나눠 올린 파일 조각의 체크섬이 받은 내용과 다를 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        index: int,
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.FILE_CHECKSUM_MISMATCH,
+            message=ResponseCode.FILE_CHECKSUM_MISMATCH.message,
+            status_code=status.HTTP_400_BAD_REQUEST,
+            additional_info={
+                "index": index,
+                **(additional_info or {})
+            }
+        )
+
+class UploadIncompleteException(ApplicationException):
+    """받지 못한 조각이 남은 업로드를 완료하려 할 때 발생하는 예외"""
+    
+    def __init__(
+        self,
+        upload_id: str,
+        missing_chunks: List[int],
+        additional_info: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            code=ResponseCode.UPLOAD_INCOMPLETE,
+            message=ResponseCode.UPLOAD_INCOMPLETE.message,
+            status_code=status.HTTP_409_CONFLICT,
+            additional_info={
+                "upload_id": upload_id,
+                "missing_chunks": missing_chunks[:100],
+                "missing_count": len(missing_chunks),
+                **(additional_info or {})
+            }
+        )
@@ -1,13 +1,133 @@
+import atexit
 import os
+import logging
 import logging.config
 from typing import Dict, Any
 
-def configure_logging(env: str = "development") -> None:
-    """환경별 로깅 설정"""
-    config = get_logging_config(env)
+from application.common.logging_filters import ErrorRateLimitFilter, QueryParamRedactionFilter
+from application.common.logging_handlers import FULL_POLICY_DROP, QueueLoggingPipeline
+
+# 큐 뒤로 옮길 로거 (파일/Sentry 등 블로킹 핸들러가 붙는 로거)
+QUEUED_LOGGERS = ("application",)
+
+# 요청 경로를 쿼리째 기록하는 로거 (WebSocket/SSE 의 access_token 쿼리를 가림)
+REDACTED_LOGGERS = ("uvicorn.access", "uvicorn.error")
+
+# 리스너가 window 가 지난 에러 로그 요약을 기록하는 주기(초)
+_SUMMARY_INTERVAL = 1.0
+
+_pipelines: Dict[str, QueueLoggingPipeline] = {}
+
+def configure_logging(
+    env: str = "development",
+    queue_enabled: bool = True,
+    queue_max_size: int = 10000,
+    queue_full_policy: str = FULL_POLICY_DROP,
+    queue_batch_size: int = 100,
+    queue_flush_interval: float = 0.5,
+    error_log_burst: int = 10,
+    error_log_window: float = 60.0,
+    error_log_sample_size: int = 5,
+    log_dir: str = "logs"
+) -> None:
+    """환경별 로깅 설정
+
+    로그 파일은 log_dir 에 쓰며, 없으면 만듭니다 (상대 경로는 현재 디렉터리 기준).
+    REDACTED_LOGGERS 에는 쿼리의 access_token 을 가리는 필터를 붙입니다.
+    queue_enabled 인 경우 QUEUED_LOGGERS 의 핸들러를 QueueHandler 뒤로 옮겨
+    이벤트 루프에서 디스크/네트워크 I/O가 일어나지 않도록 합니다.
+    error_log_* 는 동일 에러 로그의 샘플링/집계 기준입니다. 샘플링은 큐에 넣기 전에 하고,
+    요약 레코드는 리스너가 주기적으로 기록합니다.
+    """
+    shutdown_logging()
+    log_dir = os.path.abspath(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+    config = get_logging_config(
+        env,
+        error_log_burst=error_log_burst,
+        error_log_window=error_log_window,
+        error_log_sample_size=error_log_sample_size,
+        log_dir=log_dir
+    )
     logging.config.dictConfig(config)
+    for name in REDACTED_LOGGERS:
+        # uvicorn 이 설정한 핸들러는 그대로 두고 로거에만 필터를 붙임
+        target = logging.getLogger(name)
+        for f in list(target.filters):
+            if isinstance(f, QueryParamRedactionFilter):
+                target.removeFilter(f)
+        target.addFilter(QueryParamRedactionFilter())
+
+    if not queue_enabled:
+        return
+
+    for name in QUEUED_LOGGERS:
+        target = logging.getLogger(name)
+        handlers = list(target.handlers)
+        if not handlers:
+            continue
+        # 샘플링 필터는 큐 앞(QueueHandler)으로 옮김 (같은 인스턴스를 여러 핸들러가 공유)
+        rate_limit_filters = {}
+        for handler in handlers:
+            for f in list(handler.filters):
+                if isinstance(f, ErrorRateLimitFilter):
+                    handler.removeFilter(f)
+                    rate_limit_filters[id(f)] = f
+        pipeline = QueueLoggingPipeline(
+            handlers,
+            max_size=queue_max_size,
+            full_policy=queue_full_policy,
+            batch_size=queue_batch_size,
+            flush_interval=queue_flush_interval,
+            periodic=[f.expire for f in rate_limit_filters.values()],
+            periodic_interval=min(error_log_window, _SUMMARY_INTERVAL)
+        )
+        for f in rate_limit_filters.values():
+            pipeline.handler.addFilter(f)
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(pipeline.handler)
+        pipeline.start()
+        _pipelines[name] = pipeline
 
-def get_logging_config(env: str) -> Dict[str, Any]:
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 기록하고 리스너를 종료합니다."""
+    _flush_error_rate_limits()
+    while _pipelines:
+        name, pipeline = _pipelines.popitem()
+        logging.getLogger(name).removeHandler(pipeline.handler)
+        pipeline.stop()
+
+def get_logging_stats() -> Dict[str, Dict[str, Any]]:
+    """로거별 로그 큐 통계(적재/처리/유실 건수)를 반환합니다."""
+    return {name: pipeline.stats() for name, pipeline in _pipelines.items()}
+
+def _flush_error_rate_limits() -> None:
+    """집계 중인 에러 로그 요약을 기록합니다."""
+    handlers = list(logging.getLogger().handlers)
+    for name in QUEUED_LOGGERS:
+        handlers.extend(logging.getLogger(name).handlers)
+    for pipeline in _pipelines.values():
+        handlers.extend(pipeline.listener.handlers)
+
+    rate_limit_filters = {
+        id(f): f
+        for handler in handlers
+        for f in handler.filters
+        if isinstance(f, ErrorRateLimitFilter)
+    }
+    for rate_limit_filter in rate_limit_filters.values():
+        rate_limit_filter.flush()
+
+atexit.register(shutdown_logging)
+
+def get_logging_config(
+    env: str,
+    error_log_burst: int = 10,
+    error_log_window: float = 60.0,
+    error_log_sample_size: int = 5,
+    log_dir: str = "logs"
+) -> Dict[str, Any]:
     """환경별 로깅 설정 반환"""
     log_level = "DEBUG" if env == "development" else "INFO"
     
@@ -29,19 +149,26 @@ def get_logging_config(env: str) -> Dict[str, Any]:
         "filters": {
             "error_context": {
                 "()": "application.common.logging_filters.ErrorContextFilter"
+            },
+            "error_rate_limit": {
+                "()": "application.common.logging_filters.ErrorRateLimitFilter",
+                "burst": error_log_burst,
+                "window": error_log_window,
+                "sample_size": error_log_sample_size
             }
         },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
                 "formatter": "default",
+                "filters": ["error_rate_limit"],
                 "level": log_level,
             },
             "error_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "filename": os.path.join("logs", "errors.log"),
+                "class": "application.common.logging_handlers.BatchingRotatingFileHandler",
+                "filename": os.path.join(log_dir, "errors.log"),
                 "formatter": "detailed",
-                "filters": ["error_context"],
+                "filters": ["error_rate_limit", "error_context"],
                 "level": "ERROR",
                 "maxBytes": 10485760,  # 10MB
                 "backupCount": 10
@@ -65,6 +192,7 @@ def get_logging_config(env: str) -> Dict[str, Any]:
         # Sentry 핸들러 추가
         config["handlers"]["sentry"] = {
             "class": "raven.handlers.logging.SentryHandler",
+            "filters": ["error_rate_limit"],
             "level": "ERROR",
             "dsn": os.getenv("SENTRY_DSN", "")
         }
@@ -76,9 +204,10 @@ def get_logging_config(env: str) -> Dict[str, Any]:
             "fmt": "%(asctime)s %(name)s %(levelname)s %(message)s"
         }
         config["handlers"]["json_file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": os.path.join("logs", "application.json"),
+            "class": "application.common.logging_handlers.BatchingRotatingFileHandler",
+            "filename": os.path.join(log_dir, "application.json"),
             "formatter": "json",
+            "filters": ["error_rate_limit"],
             "level": "INFO",
             "maxBytes": 10485760,  # 10MB
             "backupCount": 10
@@ -1,5 +1,8 @@
 import logging
-from typing import Dict, Any
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 class ErrorContextFilter(logging.Filter):
     """에러 컨텍스트 정보를 로그 레코드에 추가하는 필터"""
@@ -19,4 +22,151 @@ class ErrorContextFilter(logging.Filter):
                 extra_fields.append(f"{key}={value}")
         record.extra_fields = " ".join(extra_fields)
         
-        return True 
\ No newline at end of file
+        return True 
+
+class QueryParamRedactionFilter(logging.Filter):
+    """로그 메시지의 URL 쿼리에서 민감한 값(access_token 등)을 가리는 필터
+
+    uvicorn 접근 로그처럼 경로를 쿼리 문자열째 기록하는 로거에 붙입니다.
+    """
+
+    def __init__(self, params: Iterable[str] = ("access_token",)):
+        super().__init__()
+        names = "|".join(re.escape(param) for param in params)
+        self._pattern = re.compile(rf"([?&](?:{names})=)[^&\s\"]*")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, str):
+            record.msg = self._redact(record.msg)
+        if isinstance(record.args, tuple):
+            record.args = tuple(self._redact(arg) if isinstance(arg, str) else arg for arg in record.args)
+        return True
+
+    def _redact(self, text: str) -> str:
+        return self._pattern.sub(r"\1[REDACTED]", text)
+
+class ErrorRateLimitFilter(logging.Filter):
+    """동일한 에러 로그를 샘플링/집계하는 필터
+
+    (error_code, exception_type, path) 키별로 window 동안 처음 burst 건만
+    그대로 기록하고, 나머지는 버린 뒤 window가 지나면 건수와 샘플 error_id를
+    담은 요약 레코드를 한 번 기록합니다.
+
+    여러 핸들러에 같은 인스턴스를 붙여도 레코드별 판정은 한 번만 합니다.
+    로그 큐를 쓰는 경우 큐에 넣기 전(QueueHandler)에 판정해 에러 폭주가 큐를 채우지 않도록 합니다.
+    """
+
+    summary_logger = logging.getLogger("application.common.logging_filters")
+
+    def __init__(
+        self,
+        burst: int = 10,
+        window: float = 60.0,
+        sample_size: int = 5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.sample_size = sample_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str, str], _ErrorBucket] = {}
+        self._next_sweep = clock() + window
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decision = getattr(record, "_rate_limit_allowed", None)
+        if decision is not None:
+            return decision
+
+        error_code = getattr(record, "error_code", None)
+        if error_code is None or getattr(record, "aggregated", False):
+            record._rate_limit_allowed = True
+            return True
+
+        key = (
+            str(error_code),
+            str(getattr(record, "exception_type", "-")),
+            str(getattr(record, "path", "-"))
+        )
+        now = self._clock()
+        with self._lock:
+            summaries = self._sweep(now) if now >= self._next_sweep else []
+            bucket = self._buckets.get(key)
+            if bucket is not None and now - bucket.started_at >= self.window:
+                del self._buckets[key]
+                if bucket.suppressed:
+                    summaries.append((key, bucket))
+                bucket = None
+            if bucket is None:
+                bucket = self._buckets[key] = _ErrorBucket(now)
+            allowed = bucket.add(getattr(record, "error_id", None), self.burst, self.sample_size)
+
+        record._rate_limit_allowed = allowed
+        self._emit(summaries)
+        return allowed
+
+    def expire(self) -> None:
+        """window가 지난 집계를 요약 레코드로 기록합니다 (로그 큐 리스너가 주기적으로 호출)."""
+        now = self._clock()
+        with self._lock:
+            summaries = self._sweep(now)
+        self._emit(summaries)
+
+    def flush(self) -> None:
+        """window와 상관없이 남아 있는 집계를 모두 요약 레코드로 기록합니다."""
+        with self._lock:
+            summaries = self._sweep(None)
+        self._emit(summaries)
+
+    def _sweep(self, now: Optional[float]) -> List[Tuple[Tuple[str, str, str], "_ErrorBucket"]]:
+        """window가 지난 버킷을 정리하고, 버려진 로그가 있던 버킷을 반환합니다."""
+        expired = [
+            key for key, bucket in self._buckets.items()
+            if now is None or now - bucket.started_at >= self.window
+        ]
+        summaries = []
+        for key in expired:
+            bucket = self._buckets.pop(key)
+            if bucket.suppressed:
+                summaries.append((key, bucket))
+        if now is not None:
+            self._next_sweep = now + self.window
+        return summaries
+
+    def _emit(self, summaries: List[Tuple[Tuple[str, str, str], "_ErrorBucket"]]) -> None:
+        for (error_code, exception_type, path), bucket in summaries:
+            self.summary_logger.error(
+                f"[{error_code}] {exception_type} at {path}: "
+                f"{bucket.count} occurrences, {bucket.suppressed} suppressed",
+                extra={
+                    "aggregated": True,
+                    "error_code": error_code,
+                    "exception_type": exception_type,
+                    "path": path,
+                    "count": bucket.count,
+                    "suppressed": bucket.suppressed,
+                    "sample_error_ids": bucket.samples
+                }
+            )
+
+
+class _ErrorBucket:
+    """키 하나에 대한 window 내 집계"""
+
+    __slots__ = ("started_at", "count", "suppressed", "samples")
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.count = 0
+        self.suppressed = 0
+        self.samples: List[str] = []
+
+    def add(self, error_id: Optional[str], burst: int, sample_size: int) -> bool:
+        self.count += 1
+        if self.count <= burst:
+            return True
+        self.suppressed += 1
+        if error_id is not None and len(self.samples) < sample_size:
+            self.samples.append(error_id)
+        return False
@@ -0,0 +1,244 @@
+import copy
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+FULL_POLICY_DROP = "drop"
+FULL_POLICY_BLOCK = "block"
+
+_SENTINEL = None
+
+
+class BoundedQueueHandler(QueueHandler):
+    """크기가 제한된 큐에 로그 레코드를 넣는 핸들러
+
+    큐가 가득 찬 경우 정책에 따라 레코드를 버리거나(drop),
+    지정된 시간 동안 대기(block)한 뒤 버립니다.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Optional[logging.LogRecord]]",
+        full_policy: str = FULL_POLICY_DROP,
+        block_timeout: float = 1.0
+    ):
+        if full_policy not in (FULL_POLICY_DROP, FULL_POLICY_BLOCK):
+            raise ValueError(f"Unknown full_policy: {full_policy}")
+        super().__init__(log_queue)
+        self.full_policy = full_policy
+        self.block_timeout = block_timeout
+        self.enqueued = 0
+        self.dropped = 0
+        self._counter_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """큐에 넣기 전에 메시지를 확정합니다.
+
+        리스너가 같은 프로세스의 스레드이므로 exc_info는 그대로 유지합니다.
+        (Sentry 등 하위 핸들러가 트레이스백을 사용)
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.full_policy == FULL_POLICY_BLOCK:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._counter_lock:
+                self.dropped += 1
+            return
+        with self._counter_lock:
+            self.enqueued += 1
+
+
+class BatchingQueueListener:
+    """큐에서 레코드를 배치 단위로 꺼내 실제 핸들러로 전달하는 리스너
+
+    배치 단위로 핸들러를 호출하고, 파일 핸들러는 배치마다
+    한 번만 flush 하여 디스크 I/O 횟수를 줄입니다.
+    periodic 함수(에러 로그 요약 등)는 로그가 없어도 periodic_interval 마다 호출합니다.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Optional[logging.LogRecord]]",
+        handlers: Sequence[logging.Handler],
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        periodic: Sequence[Callable[[], None]] = (),
+        periodic_interval: float = 1.0
+    ):
+        self.queue = log_queue
+        self.handlers = list(handlers)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.periodic = list(periodic)
+        self.periodic_interval = periodic_interval
+        self.processed = 0
+        self._next_periodic = time.monotonic() + periodic_interval
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """백그라운드 스레드를 시작합니다."""
+        self._thread = threading.Thread(
+            target=self._monitor,
+            name="log-queue-listener",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """남은 레코드를 모두 처리한 뒤 스레드를 종료합니다."""
+        if self._thread is None:
+            return
+        self.queue.put(_SENTINEL)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _monitor(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._dispatch(batch)
+            if stop:
+                return
+            self._run_periodic()
+
+    def _next_batch(self) -> Tuple[List[logging.LogRecord], bool]:
+        """첫 레코드를 기다린 뒤 batch_size 또는 flush_interval까지 모읍니다."""
+        while True:
+            timeout = max(self._next_periodic - time.monotonic(), 0) if self.periodic else None
+            try:
+                record = self.queue.get(timeout=timeout)
+                break
+            except queue.Empty:
+                self._run_periodic()
+        if record is _SENTINEL:
+            return [], True
+
+        batch = [record]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                record = (
+                    self.queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self.queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if record is _SENTINEL:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    def _dispatch(self, batch: List[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            deferred = isinstance(handler, BatchFlushMixin)
+            if deferred:
+                # 배치 처리 중에는 emit 마다의 flush를 생략
+                handler.batching = True
+            try:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                if deferred:
+                    handler.batching = False
+                handler.flush()
+        self.processed += len(batch)
+
+    def _run_periodic(self) -> None:
+        now = time.monotonic()
+        if not self.periodic or now < self._next_periodic:
+            return
+        self._next_periodic = now + self.periodic_interval
+        for function in self.periodic:
+            try:
+                function()
+            except Exception:
+                # 로깅 핸들러와 같이 리스너를 멈추지 않고 stderr 에만 남김
+                traceback.print_exc(file=sys.stderr)
+
+
+class BatchFlushMixin:
+    """batching 동안 flush 를 미루는 스트림 핸들러 믹스인
+
+    BatchingQueueListener 가 배치를 처리하는 동안 batching 을 켜고, 배치가 끝나면
+    한 번만 flush 합니다. 큐 없이 쓰면 일반 핸들러와 같이 레코드마다 flush 합니다.
+    """
+
+    batching = False
+
+    def flush(self) -> None:
+        if not self.batching:
+            super().flush()
+
+
+class BatchingRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    """배치 단위로 flush 하는 RotatingFileHandler"""
+
+
+class QueueLoggingPipeline:
+    """QueueHandler 와 배치 리스너를 묶은 비동기 로깅 파이프라인
+
+    이벤트 루프에서는 큐에 넣기만 하고, 파일/네트워크 I/O는
+    백그라운드 스레드에서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        max_size: int = 10000,
+        full_policy: str = FULL_POLICY_DROP,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        block_timeout: float = 1.0,
+        periodic: Sequence[Callable[[], None]] = (),
+        periodic_interval: float = 1.0
+    ):
+        self.queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(max_size)
+        self.handler = BoundedQueueHandler(
+            self.queue,
+            full_policy=full_policy,
+            block_timeout=block_timeout
+        )
+        self.listener = BatchingQueueListener(
+            self.queue,
+            handlers,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            periodic=periodic,
+            periodic_interval=periodic_interval
+        )
+
+    def start(self) -> None:
+        self.listener.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """큐를 비우고 하위 핸들러를 flush/close 합니다."""
+        self.listener.stop(timeout)
+        for handler in self.listener.handlers:
+            handler.flush()
+            handler.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 적재/처리/유실 카운터를 반환합니다."""
+        return {
+            "enqueued": self.handler.enqueued,
+            "dropped": self.handler.dropped,
+            "processed": self.listener.processed,
+            "queue_size": self.queue.qsize()
+        }
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseSettings, AnyHttpUrl, validator
 from enum import Enum
 
@@ -19,16 +19,41 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     PASSWORD_HASH_ALGORITHM: str = "bcrypt"
-    PASSWORD_SALT_ROUNDS: int = 12
+    PASSWORD_SALT_ROUNDS: int = 12  # 바꾸면 기존 해시는 다음 로그인 때 새 rounds 로 교체
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # 해시 프로세스 수 (기본: CPU 수)
+    PASSWORD_HASH_MAX_PENDING: Optional[int] = None  # 초과 시 503 (기본: 프로세스 수 x 4)
+    TOKEN_CLAIMS_CACHE_MAX_ENTRIES: int = 10000  # 디코드한 클레임 캐시 (토큰 만료 시각까지 유지)
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000  # 폐기 토큰 블룸 필터 크기 (예상 폐기 수)
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = 0.001  # 거짓 양성일 때만 Redis 조회
+    TOKEN_REVOCATION_RESYNC_SECONDS: float = 300.0  # 만료된 폐기 id 를 빼고 필터를 다시 만드는 주기
     
     # 데이터베이스 설정
     DATABASE_URL: str
     DATABASE_MAX_CONNECTIONS: int = 20
     DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0  # 풀이 가득 찼을 때 체크아웃 대기 한도
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800  # 이보다 오래된 커넥션은 새로 연결
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_WARMUP: bool = True  # 시작 시 DATABASE_POOL_SIZE 만큼 미리 연결
+    DATABASE_ECHO: bool = False
     
     # Redis 설정
     REDIS_URL: str
-    REDIS_MAX_CONNECTIONS: int = 10
+    REDIS_MAX_CONNECTIONS: int = 10  # 워커당 (pub/sub 구독, 알림 스트림 읽기(채널 수 + 1)도 하나씩 사용)
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0  # 풀이 가득 찼을 때 커넥션 대기 한도
+    REDIS_COMMAND_TIMEOUT_SECONDS: float = 1.0  # 명령별 응답 대기 한도 (초과 시 REDIS_ERROR)
+    REDIS_BATCH_WINDOW_SECONDS: float = 0.0005  # 동시 명령을 파이프라인 하나로 묶는 시간
+    REDIS_MAX_BATCH_SIZE: int = 128
+
+    # 조직도 읽기 모델
+    ORG_CHART_LOCAL_TTL_SECONDS: float = 5.0  # 워커 로컬 사본 유지 시간 (다른 워커 변경이 보이기까지의 최대 지연)
+    ORG_CHART_LOCAL_MAX_ENTRIES: int = 1024
+    ORG_CHART_REDIS_TTL_SECONDS: int = 24 * 60 * 60
+
+    # 사용자/회사 조회 캐시
+    IDENTITY_CACHE_LOCAL_TTL_SECONDS: float = 5.0  # 다른 워커 변경이 보이기까지의 최대 지연
+    IDENTITY_CACHE_LOCAL_MAX_ENTRIES: int = 10000
+    IDENTITY_CACHE_REDIS_TTL_SECONDS: int = 300
     
     # CORS 설정
     CORS_ORIGINS: List[str]
@@ -41,16 +66,55 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = True
     PROMETHEUS_METRICS_PATH: str = "/metrics"
     
+    # 로깅 설정
+    LOG_DIR: str = "logs"  # 파일 로그 디렉터리 (없으면 시작 시 생성)
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_QUEUE_MAX_SIZE: int = 10000
+    LOG_QUEUE_FULL_POLICY: str = "drop"  # drop / block
+    LOG_QUEUE_BATCH_SIZE: int = 100
+    LOG_QUEUE_FLUSH_INTERVAL: float = 0.5
+    ERROR_LOG_BURST: int = 10  # 키별 window 내 그대로 기록할 건수
+    ERROR_LOG_WINDOW_SECONDS: float = 60.0
+    ERROR_LOG_SAMPLE_SIZE: int = 5  # 요약 레코드에 담을 error_id 샘플 수
+
     # Elasticsearch 설정
     ELASTICSEARCH_URL: str
     ELASTICSEARCH_USERNAME: str = ""
     ELASTICSEARCH_PASSWORD: str = ""
     ELASTICSEARCH_VERIFY_CERTS: bool = True
+    ELASTICSEARCH_INDEX_PREFIX: str = "teamon-"
+    SEARCH_INDEX_BATCH_SIZE: int = 500  # bulk 요청 한 번에 보낼 문서 수
+    SEARCH_INDEX_FLUSH_INTERVAL_SECONDS: float = 1.0  # 덜 찬 배치도 이 시간이 지나면 전송
+    SEARCH_INDEX_MAX_PENDING: int = 50000  # 초과분은 dead letter 파일로
+    SEARCH_INDEX_MAX_RETRIES: int = 5
+    SEARCH_INDEX_DEAD_LETTER_PATH: str = "/app/logs/search_dead_letters.jsonl"
+    DIRECTORY_INDEX_TTL_SECONDS: float = 300.0  # 워커별 자동완성 색인을 다시 만드는 주기 (다른 워커 변경 반영)
+    DIRECTORY_INDEX_MAX_COMPANIES: int = 64
+    DIRECTORY_INDEX_REBUILD_THRESHOLD: int = 1000  # 한 커밋에서 이보다 많이 바뀐 회사는 다시 만듦
     
     # 파일 업로드 설정
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_UPLOAD_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "pdf"]
     UPLOAD_DIRECTORY: str = "/app/uploads"
+    UPLOAD_WRITE_BUFFER_SIZE: int = 1024 * 1024  # 업로드 한 건이 디스크에 쓰기 전에 모아 두는 최대 크기
+    CHUNKED_UPLOAD_MAX_SIZE: int = 2 * 1024 * 1024 * 1024  # 분할 업로드 (회의 녹음 등)
+    CHUNKED_UPLOAD_EXTENSIONS: List[str] = ["wav", "mp3", "m4a", "ogg", "webm"]
+    CHUNKED_UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # 클라이언트가 정하지 않을 때의 조각 크기
+    CHUNKED_UPLOAD_EXPIRE_SECONDS: int = 24 * 60 * 60  # 완료되지 않은 업로드를 지우기까지
+    AUDIO_PROCESSING_WORKERS: int = 2  # 워커 프로세스마다 동시에 처리하는 음성 파일 수
+
+    # 알림 (Redis Streams fan-out)
+    NOTIFICATION_FANOUT_BATCH_SIZE: int = 1000  # 대상을 펼치는 묶음 크기 (채널 스트림 항목 하나)
+    NOTIFICATION_COALESCE_WINDOW_SECONDS: int = 300  # 사용자마다 같은 알림을 한 번만 보내는 시간
+    NOTIFICATION_CHANNEL_CONCURRENCY: int = 4  # 워커 프로세스마다 채널별 동시 전송 묶음 수
+    NOTIFICATION_MAX_RETRIES: int = 3
+    NOTIFICATION_STREAM_MAX_LENGTH: int = 100000
+    NOTIFICATION_INBOX_SIZE: int = 100  # 사용자별 앱 안 알림함에 두는 최근 알림 수
+    REALTIME_MAX_CONNECTIONS: int = 10000  # 워커당 WebSocket/SSE 연결 수
+    REALTIME_MAX_PENDING_MESSAGES: int = 100  # 연결별로 쌓아 둘 메시지 수 (넘으면 느린 소비자로 끊음)
+    REALTIME_HEARTBEAT_SECONDS: float = 25.0  # 보낼 것이 없을 때 ping 간격 (프록시 idle timeout 보다 짧게)
+    REALTIME_HEARTBEAT_TIMEOUT_SECONDS: float = 60.0  # WebSocket 클라이언트 응답이 없으면 끊기까지
+    REALTIME_SEND_TIMEOUT_SECONDS: float = 10.0
     
     # 기능 플래그
     ENABLE_NOTIFICATIONS: bool = True
@@ -58,7 +122,10 @@ class Settings(BaseSettings):
     
     # 레이트 리미팅
     RATE_LIMIT_ENABLED: bool = True
-    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60  # 사용자별 (토큰이 없으면 IP 별)
+    RATE_LIMIT_COMPANY_REQUESTS_PER_MINUTE: int = 3000  # 회사(company_id)별
+    RATE_LIMIT_MAX_LEASE: int = 8  # 워커가 Redis 에서 한 번에 받아 두는 최대 토큰 수
+    RATE_LIMIT_LEASE_TTL_SECONDS: float = 1.0  # 받아 둔 토큰을 쓸 수 있는 시간
 
     @validator("CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
@@ -1,17 +1,22 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import Boolean, DateTime, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from domain.common.identifiers import uuid7
+
 class Base(DeclarativeBase):
     """모든 엔티티의 기본이 되는 베이스 클래스"""
     pass
 
 class IdMixin:
-    """UUID 기본키를 제공하는 Mixin"""
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    """UUID 기본키를 제공하는 Mixin
+
+    B-tree 인덱스에 순서대로 추가되도록 시간 순 UUID(UUIDv7)를 사용합니다.
+    """
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
 
 class StatusMixin:
     """상태 관리를 위한 Mixin"""
@@ -1,8 +1,8 @@
 # File: backend/src/domain/common/exceptions.py
 from typing import Any, Dict, Optional, Union
 from uuid import UUID
-import json
-from datetime import datetime
+
+from domain.common.serialization import to_serializable
 
 class DomainException(Exception):
     """도메인 계층의 기본 예외 클래스"""
@@ -17,19 +17,6 @@ class DomainException(Exception):
             "message": self.message
         }
 
-    def _ensure_serializable(self, value: Any) -> Any:
-        """값이 JSON 직렬화 가능하도록 변환"""
-        if isinstance(value, (str, int, float, bool, type(None))):
-            return value
-        elif isinstance(value, (datetime, UUID)):
-            return str(value)
-        elif isinstance(value, dict):
-            return {k: self._ensure_serializable(v) for k, v in value.items()}
-        elif isinstance(value, (list, tuple)):
-            return [self._ensure_serializable(item) for item in value]
-        else:
-            return str(value)
-
 class EntityNotFoundException(DomainException):
     """엔티티를 찾을 수 없을 때 발생하는 예외"""
     def __init__(
@@ -40,7 +27,7 @@ class EntityNotFoundException(DomainException):
     ):
         self.entity_type = entity_type
         self.entity_id = str(entity_id) if entity_id is not None else None
-        self.additional_info = self._ensure_serializable(additional_info or {})
+        self.additional_info = to_serializable(additional_info or {})
         
         message = f"{entity_type}을(를) 찾을 수 없습니다."
         if entity_id:
@@ -67,8 +54,8 @@ class ValidationException(DomainException):
         additional_info: Optional[Dict[str, Any]] = None
     ):
         self.field = field
-        self.invalid_value = self._ensure_serializable(value)
-        self.additional_info = self._ensure_serializable(additional_info or {})
+        self.invalid_value = to_serializable(value)
+        self.additional_info = to_serializable(additional_info or {})
         
         message_with_value = f"유효성 검사 실패: {field} - {message}"
         if value is not None:
@@ -95,7 +82,7 @@ class BusinessRuleException(DomainException):
     ):
         self.rule = rule
         self.detail = detail
-        self.context = self._ensure_serializable(context or {})
+        self.context = to_serializable(context or {})
         
         message = f"비즈니스 규칙 위반 ({rule}): {detail}"
         super().__init__(message)
@@ -111,4 +98,4 @@ class BusinessRuleException(DomainException):
 
     def add_context(self, key: str, value: Any) -> None:
         """예외 컨텍스트에 추가 정보를 더합니다."""
-        self.context[key] = self._ensure_serializable(value)
\ No newline at end of file
+        self.context[key] = to_serializable(value)
\ No newline at end of file
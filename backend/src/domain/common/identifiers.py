@@ -0,0 +1,60 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+# UUIDv7 (RFC 9562) 비트 배치
+#   unix_ts_ms(48) | ver(4)=0111 | rand_a(12) | var(2)=10 | rand_b(62)
+# rand_a + rand_b(74비트)를 한 정수로 다루어 같은 밀리초 안에서는 1씩 증가시킵니다.
+_RAND_BITS = 74
+_RAND_B_BITS = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+_RAND_LIMIT = 1 << _RAND_BITS
+_VERSION_AND_VARIANT = (0x7 << 76) | (0b10 << 62)
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_rand = 0
+
+def _seed() -> int:
+    # 최상위 비트를 비워 같은 밀리초 안에서 증가할 여유를 남김
+    return int.from_bytes(os.urandom(10), "big") >> (80 - _RAND_BITS + 1)
+
+def uuid7() -> UUID:
+    """시간 순으로 정렬되는 UUID(UUIDv7)를 생성합니다.
+
+    같은 프로세스 안에서는 단조 증가합니다. 같은 밀리초에 생성되면 난수
+    부분을 1씩 증가시키고, 시계가 뒤로 가면 마지막 타임스탬프를 이어 씁니다.
+    """
+    global _last_ms, _last_rand
+    now_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _last_rand = _seed()
+        else:
+            _last_rand += 1
+            if _last_rand >= _RAND_LIMIT:
+                _last_ms += 1
+                _last_rand = _seed()
+        ms, rand = _last_ms, _last_rand
+    return UUID(int=(
+        (ms << 80)
+        | _VERSION_AND_VARIANT
+        | ((rand >> _RAND_B_BITS) << 64)
+        | (rand & _RAND_B_MASK)
+    ))
+
+def uuid7_timestamp_ms(value: UUID) -> int:
+    """UUIDv7에 담긴 유닉스 타임스탬프(밀리초)를 반환합니다."""
+    return value.int >> 80
+
+def _reset_after_fork() -> None:
+    # fork 된 자식이 부모와 같은 카운터를 이어 쓰지 않도록 다시 시드
+    global _lock, _last_ms, _last_rand
+    _lock = threading.Lock()
+    _last_ms = 0
+    _last_rand = 0
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
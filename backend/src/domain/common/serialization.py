@@ -0,0 +1,155 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict
+from uuid import UUID
+
+DEFAULT_MAX_DEPTH = 16
+DEFAULT_MAX_ITEMS = 1000
+DEFAULT_MAX_STRING_LENGTH = 4096
+
+CIRCULAR_REFERENCE = "<circular reference>"
+MAX_DEPTH_EXCEEDED = "<max depth exceeded>"
+TRUNCATED_SUFFIX = "...(truncated)"
+
+# 값 종류
+_SCALAR = 0      # 그대로 사용
+_STRING = 1      # 길이 제한만 적용
+_STRINGIFY = 2   # str() 변환 후 길이 제한
+_MAPPING = 3
+_SEQUENCE = 4
+
+_KINDS: Dict[type, int] = {
+    type(None): _SCALAR,
+    bool: _SCALAR,
+    int: _SCALAR,
+    float: _SCALAR,
+    str: _STRING,
+    datetime: _STRINGIFY,
+    date: _STRINGIFY,
+    time: _STRINGIFY,
+    UUID: _STRINGIFY,
+    Decimal: _STRINGIFY,
+    dict: _MAPPING,
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+    set: _SEQUENCE,
+    frozenset: _SEQUENCE,
+}
+
+_EXIT = object()
+
+def _kind_of(value_type: type) -> int:
+    """타입의 값 종류를 반환합니다. 등록되지 않은 하위 타입은 MRO로 찾아 캐시합니다."""
+    kind = _KINDS.get(value_type)
+    if kind is None:
+        kind = next(
+            (_KINDS[base] for base in value_type.__mro__[1:] if base in _KINDS),
+            _STRINGIFY
+        )
+        _KINDS[value_type] = kind
+    return kind
+
+def _stringify(value: Any) -> str:
+    try:
+        return str(value)
+    except Exception:
+        return f"<unprintable {type(value).__name__}>"
+
+def _truncate(value: str, max_length: int) -> str:
+    if len(value) <= max_length:
+        return value
+    return value[:max_length] + TRUNCATED_SUFFIX
+
+def to_serializable(
+    value: Any,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    max_string_length: int = DEFAULT_MAX_STRING_LENGTH
+) -> Any:
+    """값을 JSON 직렬화 가능한 형태로 변환합니다.
+
+    재귀 대신 명시적 스택으로 순회하며, 다음 제한을 적용합니다.
+    - max_depth: 중첩 깊이. 초과한 컨테이너는 MAX_DEPTH_EXCEEDED 로 대체
+    - max_items: 전체 컨테이너 원소 수. 초과분은 생략 표시만 남김
+    - max_string_length: 문자열 길이. 초과분은 잘라냄
+    순환 참조는 CIRCULAR_REFERENCE 로 대체합니다.
+    """
+    kinds = _KINDS
+    kind = kinds.get(type(value))
+    if kind is None:
+        kind = _kind_of(type(value))
+    if kind < _MAPPING:
+        return _convert_leaf(value, kind, max_string_length)
+
+    budget = max_items
+    result = [None]
+    # (부모 컨테이너, 키/인덱스, 값, 깊이, 종류) - 컨테이너만 스택에 올림
+    stack: list = [(result, 0, value, 0, kind)]
+    path = set()
+
+    while stack:
+        parent, slot, item, depth, kind = stack.pop()
+        if parent is _EXIT:
+            path.discard(slot)
+            continue
+
+        item_id = id(item)
+        if item_id in path:
+            parent[slot] = CIRCULAR_REFERENCE
+            continue
+        if depth >= max_depth:
+            parent[slot] = MAX_DEPTH_EXCEEDED
+            continue
+
+        size = len(item)
+        allowed = size if size <= budget else budget
+        budget -= allowed
+        omitted = size - allowed
+        child_depth = depth + 1
+
+        path.add(item_id)
+        stack.append((_EXIT, item_id, None, depth, None))
+
+        if kind == _MAPPING:
+            out: Any = {}
+            entries = item.items()
+        else:
+            out = [None] * allowed
+            entries = enumerate(item)
+
+        index = 0
+        for key, child in entries:
+            if index >= allowed:
+                break
+            index += 1
+            if kind == _MAPPING and type(key) is not str:
+                key = _stringify(key)
+            child_kind = kinds.get(type(child))
+            if child_kind is None:
+                child_kind = _kind_of(type(child))
+            if child_kind == _SCALAR:
+                out[key] = child
+            elif child_kind == _STRING:
+                out[key] = child if len(child) <= max_string_length else _truncate(child, max_string_length)
+            elif child_kind == _STRINGIFY:
+                text = _stringify(child)
+                out[key] = text if len(text) <= max_string_length else _truncate(text, max_string_length)
+            else:
+                out[key] = None
+                stack.append((out, key, child, child_depth, child_kind))
+
+        if omitted:
+            if kind == _MAPPING:
+                out["..."] = f"({omitted} more items)"
+            else:
+                out.append(f"...({omitted} more items)")
+        parent[slot] = out
+
+    return result[0]
+
+def _convert_leaf(value: Any, kind: int, max_string_length: int) -> Any:
+    if kind == _SCALAR:
+        return value
+    if kind == _STRING:
+        return _truncate(value, max_string_length)
+    return _truncate(_stringify(value), max_string_length)
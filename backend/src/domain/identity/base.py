@@ -1,11 +1,22 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import String, CHAR
+from sqlalchemy import String, CHAR, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from domain.common.base import Base, IdMixin, TimestampMixin, AuditMixin
 
+# 활성 행(사용 중이고 삭제되지 않은 행) 조건
+ACTIVE_ROW_CONDITION = "use_yn = 'Y' AND delete_yn = 'N'"
+
+def active_index(name: str, *columns: str) -> Index:
+    """활성 행만 담는 부분 인덱스
+
+    조회 쿼리에 같은 조건이 리터럴로 들어가야 플래너가 사용할 수 있습니다.
+    """
+    condition = text(ACTIVE_ROW_CONDITION)
+    return Index(name, *columns, postgresql_where=condition, sqlite_where=condition)
+
 class IdentityStatusMixin:
     """상태 관리를 위한 Mixin - CHAR(1) 타입 사용"""
     use_yn: Mapped[str] = mapped_column(CHAR(1), default='Y', nullable=False)
@@ -15,6 +26,11 @@ class IdentityBaseEntity(Base, IdMixin, IdentityStatusMixin, TimestampMixin, Aud
     """Identity 도메인의 기본 엔티티"""
     __abstract__ = True
 
+    def update_audit_fields(self, updated_by: UUID) -> None:
+        """감사 필드를 업데이트합니다."""
+        self.updated_at = datetime.utcnow()
+        self.updated_by = updated_by
+
     def mark_deleted(self, deleted_by: UUID) -> None:
         """엔티티를 삭제 처리합니다."""
         self.delete_yn = 'Y'
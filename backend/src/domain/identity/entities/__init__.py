@@ -1,4 +1,5 @@
 from .user import User
+from .push_token import UserPushToken
 from .company import Company, CompanyRegistrationRequest
 from .organization import Department, Team, Position, Responsibility
 from .mappings import (
@@ -11,6 +12,7 @@ from .mappings import (
 
 __all__ = [
     'User',
+    'UserPushToken',
     'Company',
     'CompanyRegistrationRequest',
     'Department',
@@ -27,7 +27,6 @@ class Company(IdentityBaseEntity):
     company_positions = relationship("CompanyPosition", back_populates="company")
     company_responsibilities = relationship("CompanyResponsibility", back_populates="company")
     registration_requests = relationship("CompanyRegistrationRequest", back_populates="approved_company")
-    subscriptions = relationship("CompanySubscription", back_populates="company")
 
 class CompanyRegistrationRequest(IdentityBaseEntity):
     """회사 등록 요청 엔티티"""
@@ -2,11 +2,15 @@ from uuid import UUID
 from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ..base import IdentityBaseEntity
+from ..base import IdentityBaseEntity, active_index
 
 class CompanyUser(IdentityBaseEntity):
     """회사-사용자 매핑 엔티티"""
     __tablename__ = "company_user"
+    __table_args__ = (
+        active_index("ix_company_user_company_id_user_id_active", "company_id", "user_id"),
+        active_index("ix_company_user_user_id_active", "user_id"),
+    )
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("company.id"), nullable=False)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
@@ -19,14 +23,17 @@ class CompanyUser(IdentityBaseEntity):
     # Relationships
     company = relationship("Company", back_populates="company_users")
     user = relationship("User", back_populates="company_users")
-    department = relationship("Department", back_populates="company_departments")
-    team = relationship("Team", back_populates="company_teams")
-    responsibility = relationship("Responsibility", back_populates="company_responsibilities")
-    position = relationship("Position", back_populates="company_positions")
+    department = relationship("Department", back_populates="company_users")
+    team = relationship("Team", back_populates="company_users")
+    responsibility = relationship("Responsibility", back_populates="company_users")
+    position = relationship("Position", back_populates="company_users")
 
 class CompanyDepartment(IdentityBaseEntity):
     """회사-부서 매핑 엔티티"""
     __tablename__ = "company_department"
+    __table_args__ = (
+        active_index("ix_company_department_company_id_department_id_active", "company_id", "department_id"),
+    )
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("company.id"), nullable=False)
     department_id: Mapped[UUID] = mapped_column(ForeignKey("department.id"), nullable=False)
@@ -38,6 +45,9 @@ class CompanyDepartment(IdentityBaseEntity):
 class CompanyTeam(IdentityBaseEntity):
     """회사-팀 매핑 엔티티"""
     __tablename__ = "company_team"
+    __table_args__ = (
+        active_index("ix_company_team_company_id_team_id_active", "company_id", "team_id"),
+    )
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("company.id"), nullable=False)
     team_id: Mapped[UUID] = mapped_column(ForeignKey("team.id"), nullable=False)
@@ -49,6 +59,9 @@ class CompanyTeam(IdentityBaseEntity):
 class CompanyPosition(IdentityBaseEntity):
     """회사-직위 매핑 엔티티"""
     __tablename__ = "company_position"
+    __table_args__ = (
+        active_index("ix_company_position_company_id_position_id_active", "company_id", "position_id"),
+    )
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("company.id"), nullable=False)
     position_id: Mapped[UUID] = mapped_column(ForeignKey("position.id"), nullable=False)
@@ -60,6 +73,9 @@ class CompanyPosition(IdentityBaseEntity):
 class CompanyResponsibility(IdentityBaseEntity):
     """회사-직책 매핑 엔티티"""
     __tablename__ = "company_responsibility"
+    __table_args__ = (
+        active_index("ix_company_responsibility_company_id_responsibility_id_active", "company_id", "responsibility_id"),
+    )
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("company.id"), nullable=False)
     responsibility_id: Mapped[UUID] = mapped_column(ForeignKey("responsibility.id"), nullable=False)
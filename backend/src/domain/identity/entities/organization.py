@@ -15,6 +15,7 @@ class Department(OrganizationBaseEntity):
 
     # Relationships
     company_departments = relationship("CompanyDepartment", back_populates="department")
+    company_users = relationship("CompanyUser", back_populates="department")
 
 class Team(OrganizationBaseEntity):
     """팀 엔티티
@@ -27,6 +28,7 @@ class Team(OrganizationBaseEntity):
 
     # Relationships
     company_teams = relationship("CompanyTeam", back_populates="team")
+    company_users = relationship("CompanyUser", back_populates="team")
 
 class Position(OrganizationBaseEntity):
     """직위 엔티티
@@ -39,6 +41,7 @@ class Position(OrganizationBaseEntity):
 
     # Relationships
     company_positions = relationship("CompanyPosition", back_populates="position")
+    company_users = relationship("CompanyUser", back_populates="position")
 
 class Responsibility(OrganizationBaseEntity):
     """직책 엔티티
@@ -50,4 +53,5 @@ class Responsibility(OrganizationBaseEntity):
     __tablename__ = "responsibility"
 
     # Relationships
-    company_responsibilities = relationship("CompanyResponsibility", back_populates="responsibility") 
\ No newline at end of file
+    company_responsibilities = relationship("CompanyResponsibility", back_populates="responsibility")
+    company_users = relationship("CompanyUser", back_populates="responsibility") 
\ No newline at end of file
@@ -0,0 +1,16 @@
+from uuid import UUID
+from sqlalchemy import String, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import IdentityBaseEntity, active_index
+
+class UserPushToken(IdentityBaseEntity):
+    """사용자 기기의 푸시 토큰 (발송 중 무효로 확인된 토큰은 일괄 삭제 처리)"""
+    __tablename__ = "user_push_token"
+    __table_args__ = (
+        active_index("ix_user_push_token_user_id_active", "user_id"),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
+    token: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    platform: Mapped[str] = mapped_column(String(20), nullable=False, comment="ios / android / web")
@@ -3,11 +3,14 @@ from uuid import UUID
 from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ..base import IdentityBaseEntity
+from ..base import IdentityBaseEntity, active_index
 
 class User(IdentityBaseEntity):
     """사용자 엔티티"""
     __tablename__ = "user"
+    __table_args__ = (
+        active_index("ix_user_company_id_active", "company_id"),
+    )
 
     emp_no: Mapped[str] = mapped_column(String(50), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
@@ -20,5 +23,8 @@ class User(IdentityBaseEntity):
     # Relationships
     company = relationship("Company", back_populates="users")
     company_users = relationship("CompanyUser", back_populates="user")
-    auth_tokens = relationship("AuthTokenLog", back_populates="user")
-    role_logs = relationship("UserRoleLog", back_populates="user") 
\ No newline at end of file
+    requested_registrations = relationship(
+        "CompanyRegistrationRequest",
+        foreign_keys="CompanyRegistrationRequest.requested_by",
+        back_populates="requester"
+    )
@@ -0,0 +1,5 @@
+"""
+TeamOn 인프라스트럭처 계층
+
+이 패키지는 데이터베이스, 캐시 등 외부 시스템 연동을 제공합니다.
+"""
@@ -0,0 +1,22 @@
+"""
+음성 파일 처리 모듈
+
+- 업로드된 회의 녹음의 후처리 큐 (프로세스 풀, 동시 처리 수 제한)
+- 처리 단계: 파형 생성, 음성 인식용 Opus 변환 (ffmpeg 가 없으면 건너뜀)
+"""
+
+from .processing import (
+    AUDIO_STEPS,
+    AudioProcessor,
+    AudioToolNotFound,
+    generate_waveform,
+    transcode_speech
+)
+
+__all__ = [
+    'AUDIO_STEPS',
+    'AudioProcessor',
+    'AudioToolNotFound',
+    'generate_waveform',
+    'transcode_speech'
+]
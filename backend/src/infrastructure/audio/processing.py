@@ -0,0 +1,278 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import wave
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from infrastructure.storage import ContentStore, file_extension
+
+logger = logging.getLogger(__name__)
+
+WAVEFORM_POINTS = 1000
+WAVEFORM_BUCKETS_PER_SECOND = 20  # 먼저 이 간격으로 최댓값을 모은 뒤 WAVEFORM_POINTS 개로 줄임
+STEP_TIMEOUT_SECONDS = 30 * 60
+
+# 단계 함수: (원본 경로, 작업 디렉터리) -> JSON 으로 저장할 결과
+#   결과에 path 가 있으면 그 파일을 저장소로 옮기고 digest 로 바꿔 기록합니다.
+#   함수는 프로세스 풀에서 실행되므로 모듈 최상위 함수여야 합니다.
+ProcessingStep = Callable[[str, str], Dict[str, Any]]
+
+class AudioToolNotFound(RuntimeError):
+    """단계에 필요한 외부 도구(ffmpeg)가 없음 - 실패가 아니라 건너뜀으로 기록"""
+
+def _ffmpeg() -> str:
+    path = shutil.which("ffmpeg")
+    if path is None:
+        raise AudioToolNotFound("ffmpeg not found")
+    return path
+
+def _pcm_blocks(source: str, block_seconds: float) -> Iterator[Tuple[array, int]]:
+    """(16bit 샘플 블록, 초당 샘플 수) - 16bit PCM WAV 는 직접 읽고 나머지는 ffmpeg 로 디코드"""
+    try:
+        with wave.open(source, "rb") as reader:
+            if reader.getsampwidth() == 2:
+                rate = reader.getframerate() * reader.getnchannels()
+                frames = max(int(reader.getframerate() * block_seconds), 1)
+                while True:
+                    data = reader.readframes(frames)
+                    if not data:
+                        return
+                    yield _samples(data), rate
+    except (wave.Error, EOFError):
+        pass
+
+    rate = 8000  # 파형에는 충분
+    process = subprocess.Popen(
+        [_ffmpeg(), "-v", "error", "-i", source, "-ac", "1", "-ar", str(rate), "-f", "s16le", "-"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        block_bytes = max(int(rate * block_seconds), 1) * 2
+        while True:
+            data = process.stdout.read(block_bytes)
+            if not data:
+                break
+            yield _samples(data[:len(data) // 2 * 2]), rate
+    finally:
+        process.stdout.close()
+        if process.wait(timeout=STEP_TIMEOUT_SECONDS) != 0:
+            raise RuntimeError(f"ffmpeg exited with {process.returncode}")
+
+def _samples(data: bytes) -> array:
+    samples = array("h")
+    samples.frombytes(data)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+def generate_waveform(source: str, work_dir: str) -> Dict[str, Any]:
+    """재생 화면용 파형 (구간별 최대 진폭 0~1, WAVEFORM_POINTS 개)"""
+    peaks: List[int] = []
+    samples_read = 0
+    rate = 1
+    for samples, rate in _pcm_blocks(source, 1 / WAVEFORM_BUCKETS_PER_SECOND):
+        peaks.append(max(max(samples), -min(samples)) if samples else 0)
+        samples_read += len(samples)
+
+    group = max(-(-len(peaks) // WAVEFORM_POINTS), 1)
+    points = [max(peaks[start:start + group]) / 32768 for start in range(0, len(peaks), group)]
+    return {"duration": round(samples_read / rate, 3), "peaks": [round(point, 3) for point in points]}
+
+def transcode_speech(source: str, work_dir: str) -> Dict[str, Any]:
+    """음성 인식/요약용 16kHz 모노 Opus(ogg) 로 변환 (회의 1시간에 약 10MB)"""
+    output = os.path.join(work_dir, "speech.ogg")
+    subprocess.run(
+        [
+            _ffmpeg(), "-v", "error", "-y", "-i", source,
+            "-vn", "-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "24k", output
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=STEP_TIMEOUT_SECONDS
+    )
+    return {"path": output}
+
+AUDIO_STEPS: Tuple[Tuple[str, ProcessingStep], ...] = (
+    ("waveform", generate_waveform),
+    ("transcode", transcode_speech)
+)
+
+class AudioProcessor:
+    """업로드된 음성 파일의 후처리 큐
+
+    submit 은 digest 를 큐에 넣기만 하고, max_workers 개의 소비자가 단계 함수를 차례로
+    프로세스 풀에서 실행하므로 동시에 처리되는 파일 수는 max_workers 를 넘지 않습니다.
+    진행 상태와 단계별 결과는 processing/<digest>.json 에 기록해 어느 워커에서든 조회할
+    수 있고, 같은 내용을 다시 올리면 이미 끝난 단계는 건너뜁니다.
+    큐는 메모리에만 있으므로 start() 에서 상태 파일이 끝나지 않은(queued/processing) 파일을
+    다시 큐에 넣어, 재시작으로 중단된 작업을 이어서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        steps: Sequence[Tuple[str, ProcessingStep]] = AUDIO_STEPS,
+        max_workers: int = 2,
+        executor: Optional[Executor] = None
+    ):
+        self.store = store
+        self.steps = tuple(steps)
+        self.max_workers = max_workers
+        self.root = store.root / "processing"
+        # 스레드(로그 큐 등)가 있는 프로세스를 fork 하지 않도록 spawn 사용
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._active: Set[str] = set()
+        self._workers: List["asyncio.Task[None]"] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._active)
+
+    async def start(self) -> None:
+        """소비자를 시작하고, 이전 프로세스에서 끝나지 않은 작업을 다시 큐에 넣습니다."""
+        if self._workers:
+            return
+        loop = asyncio.get_running_loop()
+        self._workers = [loop.create_task(self._run()) for _ in range(self.max_workers)]
+        for digest in await loop.run_in_executor(None, self._unfinished):
+            await self.submit(digest)
+
+    def _unfinished(self) -> List[str]:
+        try:
+            entries = [entry.path for entry in os.scandir(self.root) if entry.name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+        digests = []
+        for path in entries:
+            try:
+                status = _read_json(path)
+            except (OSError, ValueError):
+                continue
+            if status.get("state") != "completed":
+                digests.append(status["digest"])
+        return digests
+
+    async def stop(self) -> None:
+        """처리 중인 작업은 중단합니다 (상태는 processing 으로 남고, 다음 start() 에서 이어서 처리)."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def join(self) -> None:
+        """큐에 넣은 작업이 모두 끝날 때까지 기다립니다."""
+        await self._queue.join()
+
+    def _status_path(self, digest: str) -> str:
+        return str(self.root / f"{digest}.json")
+
+    async def status(self, digest: str) -> Optional[Dict[str, Any]]:
+        """처리 상태 (state: queued/processing/completed, steps: 단계별 결과). 없으면 None"""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, _read_json, self._status_path(digest))
+        except (OSError, ValueError):
+            return None
+
+    async def submit(self, digest: str) -> Dict[str, Any]:
+        """처리를 예약하고 현재 상태를 반환합니다. 모든 단계가 끝난 파일은 다시 처리하지 않습니다."""
+        status = await self.status(digest) or {"digest": digest, "state": "queued", "steps": {}}
+        if digest in self._active or self._finished(status):
+            return status
+        status["state"] = "queued"
+        await self._save(status)
+        self._active.add(digest)
+        self._queue.put_nowait(digest)
+        return status
+
+    def _finished(self, status: Dict[str, Any]) -> bool:
+        return status["state"] == "completed" and all(
+            status["steps"].get(name, {}).get("status") == "completed" for name, _ in self.steps
+        )
+
+    async def _save(self, status: Dict[str, Any]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, _write_json, self._status_path(status["digest"]), status)
+
+    async def _run(self) -> None:
+        while True:
+            digest = await self._queue.get()
+            try:
+                await self._process(digest)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("음성 파일 처리 실패", extra={"digest": digest})
+            finally:
+                self._active.discard(digest)
+                self._queue.task_done()
+
+    async def _process(self, digest: str) -> None:
+        loop = asyncio.get_running_loop()
+        status = await self.status(digest) or {"digest": digest, "steps": {}}
+        status["state"] = "processing"
+        await self._save(status)
+
+        source = str(self.store.path(digest))
+        temp_root = self.store.root / "tmp"
+        await loop.run_in_executor(None, lambda: temp_root.mkdir(parents=True, exist_ok=True))
+        work_dir = await loop.run_in_executor(None, tempfile.mkdtemp, "", "audio-", str(temp_root))
+        try:
+            for name, step in self.steps:
+                if status["steps"].get(name, {}).get("status") == "completed":
+                    continue
+                status["steps"][name] = await self._run_step(name, step, digest, source, work_dir)
+                await self._save(status)
+        finally:
+            await loop.run_in_executor(None, shutil.rmtree, work_dir, True)
+        status["state"] = "completed"
+        await self._save(status)
+
+    async def _run_step(
+        self,
+        name: str,
+        step: ProcessingStep,
+        digest: str,
+        source: str,
+        work_dir: str
+    ) -> Dict[str, Any]:
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, step, source, work_dir)
+            if "path" in result:
+                path = result.pop("path")
+                stored = await self.store.adopt(path, file_extension(path))
+                # 원본을 내려받을 수 있는 owner 가 결과 파일도 내려받음
+                await self.store.share(digest, stored.digest)
+                result.update(digest=stored.digest, size=stored.size, content_type=stored.content_type)
+        except AudioToolNotFound as e:
+            return {"status": "skipped", "reason": str(e)}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("음성 파일 처리 단계 실패", extra={"step": name, "source": source, "error": str(e)})
+            return {"status": "failed", "error": str(e)}
+        return {"status": "completed", **result}
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def _write_json(path: str, value: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    descriptor, temp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with open(descriptor, "w", encoding="utf-8") as file:
+        json.dump(value, file, ensure_ascii=False)
+    os.replace(temp, path)
@@ -0,0 +1,30 @@
+"""
+캐시 모듈
+
+- 로컬 LRU/TTL -> Redis 2단계 캐시 (single-flight, 버전 기반 무효화)
+- 사용자/회사 조회 캐시와 커밋 후 무효화
+"""
+
+from .identity import (
+    CompanySnapshot,
+    IdentityCache,
+    IdentityCacheInvalidator,
+    UserSnapshot,
+    company_keys,
+    record_identity_cache_keys,
+    user_keys
+)
+from .two_tier import CacheMetrics, TwoTierCache, get_cache_metrics
+
+__all__ = [
+    'CacheMetrics',
+    'CompanySnapshot',
+    'IdentityCache',
+    'IdentityCacheInvalidator',
+    'TwoTierCache',
+    'UserSnapshot',
+    'company_keys',
+    'get_cache_metrics',
+    'record_identity_cache_keys',
+    'user_keys'
+]
@@ -0,0 +1,208 @@
+import json
+import logging
+from typing import Any, AsyncContextManager, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+from uuid import UUID
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from domain.identity.entities import Company, User
+from infrastructure.database import SessionChangeTracker
+
+from .two_tier import CacheMetrics, TwoTierCache
+
+logger = logging.getLogger(__name__)
+
+class UserSnapshot(NamedTuple):
+    """캐시용 사용자 정보 (비밀번호 해시는 캐시하지 않음)"""
+    id: UUID
+    company_id: Optional[UUID]
+    emp_no: str
+    email: str
+    name: str
+    role: str
+
+class CompanySnapshot(NamedTuple):
+    id: UUID
+    business_registration_number: str
+    name: str
+    eng_name: str
+
+# (캐시 이름, 키) - 캐시 이름은 "user" / "company" / "alias"
+CacheKey = Tuple[str, str]
+
+def _dumps(snapshot: NamedTuple) -> str:
+    return json.dumps([str(value) if isinstance(value, UUID) else value for value in snapshot], ensure_ascii=False)
+
+def _loads_for(snapshot_type: Type[NamedTuple]) -> Callable[[str], Any]:
+    uuid_fields = {
+        index for index, name in enumerate(snapshot_type._fields)
+        if snapshot_type.__annotations__[name] in (UUID, Optional[UUID])
+    }
+
+    def loads(data: Any) -> Any:
+        values = json.loads(data)
+        return snapshot_type(*(
+            UUID(value) if index in uuid_fields and value is not None else value
+            for index, value in enumerate(values)
+        ))
+
+    return loads
+
+def user_keys(user_id: Any, *emails: Optional[str]) -> List[CacheKey]:
+    return [("user", str(user_id))] + [("alias", f"email:{email}") for email in emails if email]
+
+def company_keys(company_id: Any, *registration_numbers: Optional[str]) -> List[CacheKey]:
+    return [("company", str(company_id))] + [
+        ("alias", f"brn:{number}") for number in registration_numbers if number
+    ]
+
+class IdentityCache:
+    """사용자/회사 조회 캐시
+
+    id 로 조회한 값은 user/company 캐시에, 이메일과 사업자등록번호는 id 만
+    alias 캐시에 저장합니다. 활성 행만 캐시합니다 (조회 세션의 활성 행 필터).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        redis: Optional[Any] = None,
+        local_ttl: float = 5.0,
+        local_max_entries: int = 10000,
+        redis_ttl: int = 300,
+        key_prefix: str = "cache",
+        metrics: Optional[CacheMetrics] = None
+    ):
+        self._session_factory = session_factory
+
+        def cache(name: str, **serializer: Any) -> TwoTierCache:
+            return TwoTierCache(
+                redis,
+                name=f"identity_{name}",
+                local_ttl=local_ttl,
+                local_max_entries=local_max_entries,
+                redis_ttl=redis_ttl,
+                key_prefix=key_prefix,
+                metrics=metrics,
+                **serializer
+            )
+
+        self.caches: Dict[str, TwoTierCache] = {
+            "user": cache("user", dumps=_dumps, loads=_loads_for(UserSnapshot)),
+            "company": cache("company", dumps=_dumps, loads=_loads_for(CompanySnapshot)),
+            "alias": cache("alias")
+        }
+
+    async def _first_row(self, statement: Any) -> Any:
+        async with self._session_factory() as session:
+            return (await session.execute(statement)).one_or_none()
+
+    async def get_user(self, user_id: Any) -> Optional[UserSnapshot]:
+        user_id = user_id if isinstance(user_id, UUID) else UUID(str(user_id))
+
+        async def load() -> Optional[UserSnapshot]:
+            row = await self._first_row(select(*(getattr(User, field) for field in UserSnapshot._fields)).where(
+                User.id == user_id
+            ))
+            return UserSnapshot(*row) if row is not None else None
+
+        return await self.caches["user"].get(str(user_id), load)
+
+    async def get_user_by_email(self, email: str) -> Optional[UserSnapshot]:
+        async def load_id() -> Optional[str]:
+            row = await self._first_row(select(User.id).where(User.email == email))
+            return str(row[0]) if row is not None else None
+
+        return await self._resolve_alias(f"email:{email}", load_id, self.get_user, "email", email)
+
+    async def get_company(self, company_id: Any) -> Optional[CompanySnapshot]:
+        company_id = company_id if isinstance(company_id, UUID) else UUID(str(company_id))
+
+        async def load() -> Optional[CompanySnapshot]:
+            row = await self._first_row(select(*(getattr(Company, field) for field in CompanySnapshot._fields)).where(
+                Company.id == company_id
+            ))
+            return CompanySnapshot(*row) if row is not None else None
+
+        return await self.caches["company"].get(str(company_id), load)
+
+    async def get_company_by_registration_number(self, number: str) -> Optional[CompanySnapshot]:
+        async def load_id() -> Optional[str]:
+            row = await self._first_row(select(Company.id).where(Company.business_registration_number == number))
+            return str(row[0]) if row is not None else None
+
+        return await self._resolve_alias(
+            f"brn:{number}", load_id, self.get_company, "business_registration_number", number
+        )
+
+    async def _resolve_alias(
+        self,
+        alias: str,
+        load_id: Callable[[], Any],
+        get: Callable[[Any], Any],
+        field: str,
+        expected: str
+    ) -> Any:
+        aliases = self.caches["alias"]
+        for _ in range(2):
+            entity_id = await aliases.get(alias, load_id)
+            if entity_id is None:
+                return None
+            snapshot = await get(entity_id)
+            if snapshot is not None and getattr(snapshot, field) == expected:
+                return snapshot
+            # 이메일 등이 바뀌어 다른 값을 가리키는 alias 는 버리고 다시 조회
+            await aliases.invalidate([alias])
+        return None
+
+    async def invalidate(self, keys: Iterable[CacheKey]) -> None:
+        grouped: Dict[str, List[str]] = {}
+        for name, key in keys:
+            grouped.setdefault(name, []).append(key)
+        for name, names in grouped.items():
+            await self.caches[name].invalidate(names)
+
+_INFO_KEY = "identity_cache_keys"
+
+def record_identity_cache_keys(session: Any, keys: Iterable[CacheKey]) -> None:
+    """ORM flush 를 거치지 않는 변경(벌크 쿼리 등)의 캐시 키를 커밋 후 무효화하도록 기록합니다."""
+    session.info.setdefault(_INFO_KEY, []).extend(keys)
+
+def _values(entity: Any, attribute: str) -> List[Any]:
+    """현재 값과 flush 전 값"""
+    history = inspect(entity).attrs[attribute].history
+    return [getattr(entity, attribute), *history.deleted]
+
+def collect_cache_keys(entity: Any) -> List[CacheKey]:
+    if isinstance(entity, User):
+        return user_keys(entity.id, *_values(entity, "email"))
+    if isinstance(entity, Company):
+        return company_keys(entity.id, *_values(entity, "business_registration_number"))
+    return []
+
+class IdentityCacheInvalidator(SessionChangeTracker):
+    """세션 이벤트로 변경/삭제된 User, Company 를 모아 커밋 후 캐시를 무효화합니다.
+
+    update_audit_fields/mark_deleted 를 포함한 모든 변경이 flush 되면
+    대상이 되고, 롤백되면 버립니다.
+    """
+
+    info_key = _INFO_KEY
+
+    def __init__(self, cache: IdentityCache):
+        super().__init__()
+        self.cache = cache
+
+    def collect(self, session: Session) -> None:
+        keys = [key for entity in (*session.dirty, *session.deleted) for key in collect_cache_keys(entity)]
+        if keys:
+            record_identity_cache_keys(session, keys)
+
+    async def apply(self, keys: List[CacheKey]) -> None:
+        try:
+            await self.cache.invalidate(keys)
+        except Exception:
+            # 무효화에 실패한 키는 redis_ttl 이 지나면 다시 읽음
+            logger.exception("캐시 무효화 실패", extra={"keys": len(keys)})
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Redis 해시 필드 (키마다 해시 하나)
+_VERSION_FIELD = "v"  # 무효화할 때마다 증가
+_DATA_FIELD = "d"  # 값 (무효화하면 삭제)
+
+# 읽을 때 본 버전이 그대로일 때만 값을 저장 (무효화 이후의 오래된 값 저장 방지)
+_SET_IF_VERSION = """
+if (redis.call('HGET', KEYS[1], ARGV[1]) or '0') ~= ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[3], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+class CacheMetrics:
+    """캐시 메트릭 모음
+
+    적중률은 cache_lookups_total 의 result 별 비율로 계산합니다.
+    예) sum(rate(cache_lookups_total{result!="miss"}[5m])) / sum(rate(cache_lookups_total[5m]))
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY):
+        self.lookups = Counter(
+            "cache_lookups_total",
+            "캐시 조회 수 (local_hit / redis_hit / miss)",
+            ["cache", "result"],
+            registry=registry
+        )
+        self.coalesced = Counter(
+            "cache_coalesced_total",
+            "진행 중인 로드에 합류한 조회 수 (single-flight)",
+            ["cache"],
+            registry=registry
+        )
+        self.errors = Counter(
+            "cache_redis_errors_total",
+            "Redis 오류로 원본에서 바로 읽은 횟수",
+            ["cache"],
+            registry=registry
+        )
+        self._children: Dict[Any, Any] = {}
+
+    def _child(self, metric: Any, *labels: str) -> Any:
+        key = (id(metric), labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*labels)
+        return child
+
+    def observe_lookup(self, cache: str, result: str) -> None:
+        self._child(self.lookups, cache, result).inc()
+
+    def observe_coalesced(self, cache: str) -> None:
+        self._child(self.coalesced, cache).inc()
+
+    def observe_error(self, cache: str) -> None:
+        self._child(self.errors, cache).inc()
+
+_default_metrics: Optional[CacheMetrics] = None
+
+def get_cache_metrics() -> CacheMetrics:
+    """기본 레지스트리에 등록된 캐시 메트릭 (프로세스당 한 번 생성)"""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = CacheMetrics()
+    return _default_metrics
+
+class TwoTierCache:
+    """로컬 LRU/TTL -> Redis 2단계 캐시
+
+    - 같은 키의 동시 미스는 로더를 한 번만 호출합니다 (워커 단위 single-flight).
+    - Redis 에는 키마다 버전과 값을 가진 해시를 저장합니다. 무효화하면 버전을
+      올리고 값을 지우며, 로드 중에 무효화된 값은 버전이 달라 저장되지 않습니다.
+    - 로컬 캐시는 워커별이므로 다른 워커의 무효화는 최대 local_ttl 만큼 늦게 보입니다.
+    - Redis 오류 시에는 로더로 바로 읽습니다.
+    - None 은 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        name: str = "default",
+        local_ttl: float = 5.0,
+        local_max_entries: int = 10000,
+        redis_ttl: int = 300,
+        key_prefix: str = "cache",
+        dumps: Callable[[Any], str] = json.dumps,
+        loads: Callable[[str], Any] = json.loads,
+        metrics: Optional[CacheMetrics] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._redis = redis
+        self.name = name
+        self._local_ttl = local_ttl
+        self._local_max_entries = local_max_entries
+        self._redis_ttl = redis_ttl
+        self._key_prefix = f"{key_prefix}:{name}"
+        self._dumps = dumps
+        self._loads = loads
+        self._metrics = metrics
+        self._clock = clock
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._invalidations = 0
+        self._set_if_version = redis.register_script(_SET_IF_VERSION) if redis is not None else None
+        self.stats = {"local_hit": 0, "redis_hit": 0, "miss": 0, "coalesced": 0}
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.stats["local_hit"] + self.stats["redis_hit"] + self.stats["miss"]
+        return (self.stats["local_hit"] + self.stats["redis_hit"]) / lookups if lookups else 0.0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._key_prefix}:{key}"
+
+    def _observe(self, result: str) -> None:
+        self.stats[result] += 1
+        if self._metrics is not None:
+            self._metrics.observe_lookup(self.name, result)
+
+    def _local_get(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _local_put(self, key: str, value: Any) -> None:
+        self._local[key] = (self._clock() + self._local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self._local_max_entries:
+            self._local.popitem(last=False)
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시된 값을 반환하고, 없으면 loader 로 읽어 저장합니다."""
+        value = self._local_get(key)
+        if value is not None:
+            self._observe("local_hit")
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            if self._metrics is not None:
+                self._metrics.observe_coalesced(self.name)
+        else:
+            # 별도 태스크로 로드해 먼저 요청한 쪽이 취소되어도 합류한 쪽은 결과를 받음
+            task = self._inflight[key] = asyncio.get_running_loop().create_task(self._fetch(key, loader))
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 기다리던 쪽이 모두 취소되어도 "exception was never retrieved" 경고가 나지 않도록
+            task.exception()
+
+    async def _fetch(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        invalidations = self._invalidations
+        seen_version = None
+        if self._redis is not None:
+            try:
+                seen_version, data = await self._redis.hmget(self._redis_key(key), [_VERSION_FIELD, _DATA_FIELD])
+            except RedisError:
+                logger.warning("캐시 조회 실패", exc_info=True, extra={"cache": self.name})
+                if self._metrics is not None:
+                    self._metrics.observe_error(self.name)
+            else:
+                if data is not None:
+                    value = self._loads(data)
+                    self._observe("redis_hit")
+                    self._local_put(key, value)
+                    return value
+
+        self._observe("miss")
+        value = await loader()
+        if value is None:
+            return None
+        if self._redis is not None:
+            await self._redis_put(key, value, seen_version)
+        # 로드하는 동안 이 워커에서 무효화가 있었다면 로컬에는 넣지 않음
+        if invalidations == self._invalidations:
+            self._local_put(key, value)
+        return value
+
+    async def _redis_put(self, key: str, value: Any, seen_version: Optional[Any]) -> bool:
+        """읽을 때 본 버전이 그대로일 때만 저장합니다."""
+        version = seen_version.decode() if isinstance(seen_version, bytes) else (seen_version or "0")
+        try:
+            stored = await self._set_if_version(
+                keys=[self._redis_key(key)],
+                args=[_VERSION_FIELD, version, _DATA_FIELD, self._dumps(value), self._redis_ttl]
+            )
+        except RedisError:
+            logger.warning("캐시 저장 실패", exc_info=True, extra={"cache": self.name})
+            if self._metrics is not None:
+                self._metrics.observe_error(self.name)
+            return False
+        return bool(stored)
+
+    async def invalidate(self, keys: Iterable[str]) -> None:
+        """키의 값을 버리고 Redis 버전을 올립니다."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        self._invalidations += 1
+        for key in keys:
+            self._local.pop(key, None)
+            # 무효화 전에 시작한 로드에 새 조회가 합류하지 않도록
+            self._inflight.pop(key, None)
+        if self._redis is None:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                redis_key = self._redis_key(key)
+                pipe.hincrby(redis_key, _VERSION_FIELD, 1)
+                pipe.hdel(redis_key, _DATA_FIELD)
+                pipe.expire(redis_key, self._redis_ttl)
+            await pipe.execute()
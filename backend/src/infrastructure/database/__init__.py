@@ -0,0 +1,35 @@
+"""
+데이터베이스 연동 모듈
+
+- 비동기 엔진/세션 팩토리 (Database)
+- 체크아웃 대기 시간을 기록하는 커넥션 풀
+- 요청 단위 배치 로더 (N+1 쿼리 방지)
+- Identity 엔티티 활성 행 자동 필터
+- 커밋된 변경을 모아 반영하는 세션 이벤트 추적기 기반 클래스
+- 쿼리 수/실행 계획 검사 도구
+"""
+
+from .diagnostics import QueryCounter, expect_max_queries, explain
+from .events import SessionChangeTracker
+from .filters import INCLUDE_INACTIVE, ActiveRowSession, active_criteria
+from .loaders import BatchLoader, EntityLoader, IdentityLoaders
+from .pool import InstrumentedAsyncQueuePool, PoolMetrics, get_pool_metrics
+from .session import Database, make_async_url
+
+__all__ = [
+    'ActiveRowSession',
+    'BatchLoader',
+    'Database',
+    'EntityLoader',
+    'INCLUDE_INACTIVE',
+    'IdentityLoaders',
+    'InstrumentedAsyncQueuePool',
+    'PoolMetrics',
+    'QueryCounter',
+    'SessionChangeTracker',
+    'active_criteria',
+    'expect_max_queries',
+    'explain',
+    'get_pool_metrics',
+    'make_async_url'
+]
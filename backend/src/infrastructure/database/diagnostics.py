@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Sequence, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문을 기록합니다."""
+
+    def __init__(self, engine: Union[Engine, AsyncEngine]):
+        self.engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.statements: List[str] = []
+        self.parameters: List[Any] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def executions(self) -> List[Tuple[str, Any]]:
+        """(SQL, DBAPI 파라미터) 목록"""
+        return list(zip(self.statements, self.parameters))
+
+    def _on_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any) -> None:
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+@contextmanager
+def expect_max_queries(engine: Union[Engine, AsyncEngine], limit: int) -> Iterator[QueryCounter]:
+    """블록 안에서 실행된 쿼리가 limit 을 넘으면 AssertionError 를 발생시킵니다.
+
+    목록 조회가 N+1 쿼리로 바뀌는 회귀를 테스트에서 잡을 때 사용합니다.
+    """
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        statements = "\n".join(f"  {statement}" for statement in counter.statements)
+        raise AssertionError(f"{counter.count}개 쿼리 실행 (허용 {limit}개):\n{statements}")
+
+async def explain(connection: AsyncConnection, statement: str, parameters: Sequence[Any] = ()) -> List[str]:
+    """DBAPI 수준 SQL 의 실행 계획을 줄 단위로 반환합니다.
+
+    PostgreSQL 은 EXPLAIN, SQLite 는 EXPLAIN QUERY PLAN 을 사용합니다.
+    QueryCounter 로 기록한 SQL 이 인덱스를 타는지 테스트에서 확인할 때 사용합니다.
+    """
+    prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+    result = await connection.exec_driver_sql(prefix + statement, parameters)
+    return [str(row[-1]) for row in result]
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+class SessionChangeTracker(ABC):
+    """세션 이벤트로 변경을 모아 커밋 후 반영하는 추적기의 기반 클래스
+
+    after_flush 에서 collect() 가 session.info[info_key] 에 변경을 모으고,
+    after_commit 에서 모인 변경을 committed() 로 넘깁니다 (기본은 apply() 를
+    이벤트 루프에 예약). 롤백되면 모은 변경을 버립니다.
+    이벤트 루프 밖의 동기 세션 커밋(마이그레이션, 스크립트 등)은 반영하지 않습니다.
+
+    하위 클래스는 info_key 와 collect(), apply() 를 구현합니다.
+    register() 에는 앱의 세션 클래스(Database.sync_session_class 등)를 넘기고,
+    종료 시 unregister() 로 리스너를 떼어 냅니다.
+    """
+
+    info_key: str
+
+    def __init__(self) -> None:
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._targets: List[Any] = []
+
+    def register(self, target: Any) -> None:
+        event.listen(target, "after_flush", self._after_flush)
+        event.listen(target, "after_commit", self._after_commit)
+        event.listen(target, "after_rollback", self._after_rollback)
+        self._targets.append(target)
+
+    def unregister(self) -> None:
+        for target in self._targets:
+            event.remove(target, "after_flush", self._after_flush)
+            event.remove(target, "after_commit", self._after_commit)
+            event.remove(target, "after_rollback", self._after_rollback)
+        self._targets.clear()
+
+    @abstractmethod
+    def collect(self, session: Session) -> None:
+        """flush 된 변경을 session.info[info_key] 에 기록합니다."""
+
+    def committed(self, pending: Any) -> None:
+        """커밋된 변경을 반영합니다 (이벤트 루프 안에서 호출)."""
+        task = asyncio.get_running_loop().create_task(self.apply(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @abstractmethod
+    async def apply(self, pending: Any) -> None:
+        """커밋된 변경을 반영합니다 (committed() 가 예약)."""
+
+    async def drain(self) -> None:
+        """예약된 반영 작업이 끝날 때까지 기다립니다."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        self.collect(session)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(self.info_key, None)
+        if not pending:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 이미 커밋된 뒤이므로 예외를 올리지 않음
+            logger.debug("이벤트 루프 밖의 커밋은 반영하지 않습니다", extra={"tracker": type(self).__name__})
+            return
+        self.committed(pending)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self.info_key, None)
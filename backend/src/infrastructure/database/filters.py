@@ -0,0 +1,41 @@
+from typing import Any
+
+from sqlalchemy import and_, event, literal_column
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from domain.identity.base import IdentityBaseEntity
+
+# 이 실행 옵션이 True 이면 비활성/삭제된 행도 조회
+INCLUDE_INACTIVE = "include_inactive"
+
+def active_criteria() -> Any:
+    """Identity 엔티티의 활성 행 조건 (관계 로드와 별칭에도 적용)
+
+    부분 인덱스 조건과 같은 리터럴로 렌더링합니다. 바인드 파라미터로 두면
+    PostgreSQL 의 generic plan 에서 인덱스 조건을 만족하는지 알 수 없어
+    부분 인덱스를 쓰지 못합니다.
+    """
+    return with_loader_criteria(
+        IdentityBaseEntity,
+        lambda cls: and_(cls.use_yn == literal_column("'Y'"), cls.delete_yn == literal_column("'N'")),
+        include_aliases=True
+    )
+
+def _apply_active_filter(execute_state: ORMExecuteState) -> None:
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get(INCLUDE_INACTIVE, False)
+    ):
+        execute_state.statement = execute_state.statement.options(active_criteria())
+
+class ActiveRowSession(Session):
+    """Identity 엔티티 조회에 활성 행 조건을 자동으로 붙이는 세션
+
+    비활성/삭제된 행이 필요하면 execution_options(include_inactive=True) 로
+    조회합니다. Core 테이블 쿼리(session.execute(table.select()) 등)에는
+    적용되지 않습니다.
+    """
+
+event.listen(ActiveRowSession, "do_orm_execute", _apply_active_filter)
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from domain.identity.entities import (
+    Company,
+    CompanyUser,
+    Department,
+    Position,
+    Responsibility,
+    Team,
+    User
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFunction = Callable[[List[K]], Awaitable[Dict[K, V]]]
+
+class BatchLoader(Generic[K, V]):
+    """DataLoader 방식의 배치 로더
+
+    같은 이벤트 루프 턴에 요청된 키를 모아 batch_fn 을 한 번 호출합니다.
+    결과는 로더 수명(요청 단위) 동안 캐시되며, 같은 키는 다시 조회하지 않습니다.
+    """
+
+    def __init__(self, batch_fn: BatchFunction, max_batch_size: int = 1000):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._pending: List[K] = []
+
+    def load(self, key: Optional[K]) -> "asyncio.Future[Optional[V]]":
+        """키에 해당하는 값을 반환하는 Future (없는 키는 None)"""
+        loop = asyncio.get_running_loop()
+        if key is None:
+            future = loop.create_future()
+            future.set_result(None)
+            return future
+
+        future = self._futures.get(key)
+        if future is None:
+            future = self._futures[key] = loop.create_future()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Optional[K]]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 조회한 값을 캐시에 넣습니다."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        for start in range(0, len(keys), self._max_batch_size):
+            asyncio.ensure_future(self._run(keys[start:start + self._max_batch_size]))
+
+    async def _run(self, keys: List[K]) -> None:
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as exc:
+            for key in keys:
+                # 실패한 키는 다음 요청에서 다시 조회할 수 있도록 캐시에서 제거
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(results.get(key))
+
+class EntityLoader(BatchLoader[Any, V]):
+    """기본키 IN 쿼리로 엔티티를 모아 조회하는 로더
+
+    AsyncSession 은 동시에 쿼리를 실행할 수 없으므로 같은 세션을 쓰는
+    로더끼리 lock 을 공유해 배치를 순서대로 실행합니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        entity: Type[V],
+        lock: Optional[asyncio.Lock] = None,
+        max_batch_size: int = 1000
+    ):
+        super().__init__(self._fetch, max_batch_size)
+        self.session = session
+        self.entity = entity
+        self._lock = lock or asyncio.Lock()
+
+    async def _fetch(self, ids: List[Any]) -> Dict[Any, V]:
+        async with self._lock:
+            result = await self.session.execute(select(self.entity).where(self.entity.id.in_(ids)))
+        return {row.id: row for row in result.scalars()}
+
+# CompanyUser 관계 속성, 외래키 속성, IdentityLoaders 로더 이름
+COMPANY_USER_RELATIONS = (
+    ("user", "user_id", "users"),
+    ("department", "department_id", "departments"),
+    ("team", "team_id", "teams"),
+    ("position", "position_id", "positions"),
+    ("responsibility", "responsibility_id", "responsibilities")
+)
+
+class IdentityLoaders:
+    """요청 단위 Identity 엔티티 로더 모음"""
+
+    def __init__(self, session: AsyncSession, max_batch_size: int = 1000):
+        lock = asyncio.Lock()
+        self.session = session
+        self.users: EntityLoader[User] = EntityLoader(session, User, lock, max_batch_size)
+        self.companies: EntityLoader[Company] = EntityLoader(session, Company, lock, max_batch_size)
+        self.departments: EntityLoader[Department] = EntityLoader(session, Department, lock, max_batch_size)
+        self.teams: EntityLoader[Team] = EntityLoader(session, Team, lock, max_batch_size)
+        self.positions: EntityLoader[Position] = EntityLoader(session, Position, lock, max_batch_size)
+        self.responsibilities: EntityLoader[Responsibility] = EntityLoader(
+            session, Responsibility, lock, max_batch_size
+        )
+
+    async def load_company_user_relations(
+        self,
+        company_users: Sequence[CompanyUser],
+        relations: Iterable[str] = tuple(name for name, _, _ in COMPANY_USER_RELATIONS)
+    ) -> None:
+        """CompanyUser 목록의 관계 속성을 엔티티 종류별 IN 쿼리 한 번으로 채웁니다.
+
+        조회한 엔티티는 관계 속성에 로드된 값으로 설정되므로 이후 접근 시
+        lazy load 쿼리가 발생하지 않습니다.
+        """
+        wanted = set(relations)
+        selected = [relation for relation in COMPANY_USER_RELATIONS if relation[0] in wanted]
+        values = await asyncio.gather(*(
+            getattr(self, loader_name).load_many([getattr(company_user, key) for company_user in company_users])
+            for _, key, loader_name in selected
+        ))
+        for (attribute, _, _), loaded in zip(selected, values):
+            for company_user, value in zip(company_users, loaded):
+                set_committed_value(company_user, attribute, value)
@@ -0,0 +1,105 @@
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from sqlalchemy import exc, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class PoolMetrics:
+    """커넥션 풀 메트릭 모음"""
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        buckets: Iterable[float] = CHECKOUT_BUCKETS
+    ):
+        self.checkout_wait = Histogram(
+            "db_pool_checkout_wait_seconds",
+            "커넥션 체크아웃 대기 시간(초)",
+            ["pool"],
+            buckets=tuple(buckets),
+            registry=registry
+        )
+        self.checkout_timeouts = Counter(
+            "db_pool_checkout_timeouts_total",
+            "풀 한도 초과로 체크아웃 대기 시간이 초과된 횟수",
+            ["pool"],
+            registry=registry
+        )
+        self.in_use = Gauge(
+            "db_pool_connections_in_use",
+            "체크아웃된 커넥션 수",
+            ["pool"],
+            multiprocess_mode="livesum",
+            registry=registry
+        )
+        self._children: Dict[Any, Any] = {}
+
+    def _child(self, metric: Any, pool: str) -> Any:
+        key = (id(metric), pool)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(pool)
+        return child
+
+    def observe_checkout(self, pool: str, seconds: float) -> None:
+        self._child(self.checkout_wait, pool).observe(seconds)
+
+    def observe_timeout(self, pool: str) -> None:
+        self._child(self.checkout_timeouts, pool).inc()
+
+    def in_use_for(self, pool: str) -> Any:
+        return self._child(self.in_use, pool)
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool
+
+    대기 시간은 애플리케이션이 사용 가능한 커넥션을 얻기까지의 시간으로,
+    풀 큐 대기, 새 커넥션 생성, pre-ping 을 모두 포함합니다.
+    """
+
+    pool_metrics: Optional[PoolMetrics] = None
+    pool_name: str = "default"
+
+    def connect(self):
+        metrics = self.pool_metrics
+        if metrics is None:
+            return super().connect()
+
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.observe_timeout(self.pool_name)
+            raise
+        finally:
+            metrics.observe_checkout(self.pool_name, time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # engine.dispose() 로 새로 만든 풀에도 메트릭 설정을 유지
+        pool = super().recreate()
+        pool.pool_metrics = self.pool_metrics
+        pool.pool_name = self.pool_name
+        return pool
+
+def instrument_pool(pool: InstrumentedAsyncQueuePool, metrics: PoolMetrics, name: str) -> None:
+    """풀에 메트릭을 연결하고 사용 중인 커넥션 수를 추적합니다."""
+    pool.pool_metrics = metrics
+    pool.pool_name = name
+    in_use = metrics.in_use_for(name)
+
+    # 풀 이벤트 리스너는 recreate() 된 풀에도 이어짐
+    event.listen(pool, "checkout", lambda *args: in_use.inc())
+    event.listen(pool, "checkin", lambda *args: in_use.dec())
+
+_pool_metrics: Optional[PoolMetrics] = None
+
+def get_pool_metrics() -> PoolMetrics:
+    """기본 레지스트리에 등록된 PoolMetrics 인스턴스를 반환합니다."""
+    global _pool_metrics
+    if _pool_metrics is None:
+        _pool_metrics = PoolMetrics()
+    return _pool_metrics
@@ -0,0 +1,101 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from .filters import ActiveRowSession
+from .pool import InstrumentedAsyncQueuePool, PoolMetrics, instrument_pool
+
+# 동기 드라이버 URL을 비동기 드라이버로 변환
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+def make_async_url(url: str) -> str:
+    """DATABASE_URL 을 비동기 드라이버 URL로 변환합니다."""
+    parsed = make_url(url)
+    drivername = _ASYNC_DRIVERS.get(parsed.drivername)
+    if drivername is None:
+        return url
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+class Database:
+    """비동기 엔진과 세션 팩토리
+
+    풀 크기는 DATABASE_POOL_SIZE, 최대 커넥션 수는 DATABASE_MAX_CONNECTIONS
+    (pool_size + max_overflow)를 따릅니다. 체크아웃 시 pre-ping 으로 끊어진
+    커넥션을 걸러내고, pool_recycle 초가 지난 커넥션은 새로 엽니다.
+    active_filter 가 켜져 있으면 Identity 엔티티 조회에 활성 행 조건이
+    자동으로 붙습니다 (ActiveRowSession).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_connections: int = 20,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        echo: bool = False,
+        metrics: Optional[PoolMetrics] = None,
+        name: str = "default",
+        active_filter: bool = True
+    ):
+        self.pool_size = pool_size
+        self.max_connections = max(max_connections, pool_size)
+        self.engine = create_async_engine(
+            make_async_url(url),
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=self.max_connections - pool_size,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            echo=echo
+        )
+        if metrics is not None:
+            instrument_pool(self.engine.sync_engine.pool, metrics, name)
+        # 세션 이벤트(변경 추적기 등)는 전역 Session 대신 이 클래스에 등록
+        self.sync_session_class = ActiveRowSession if active_filter else Session
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            expire_on_commit=False,
+            sync_session_class=self.sync_session_class
+        )
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """커넥션을 미리 열어 풀을 채웁니다.
+
+        첫 요청들이 커넥션 생성 비용을 부담하지 않도록 시작 시 호출합니다.
+        동시에 체크아웃해야 서로 다른 커넥션이 열리므로 한꺼번에 엽니다.
+        """
+        count = self.pool_size if connections is None else min(connections, self.max_connections)
+
+        async def _open() -> None:
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(_open() for _ in range(count)))
+        return count
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """작업 단위 세션 (정상 종료 시 커밋, 예외 시 롤백)"""
+        async with self.session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+
+    async def dispose(self) -> None:
+        """풀의 커넥션을 모두 닫습니다."""
+        await self.engine.dispose()
@@ -0,0 +1,18 @@
+"""
+일괄 가져오기 모듈
+
+- CSV/XLSX 스트리밍 읽기
+- 직원 일괄 가져오기 (조직 이름 일괄 변환, email 기준 upsert)
+"""
+
+from .employee_import import EmployeeImporter, EmployeeImportResult, EmployeeRow, parse_employee_row
+from .readers import detect_format, read_rows
+
+__all__ = [
+    'EmployeeImporter',
+    'EmployeeImportResult',
+    'EmployeeRow',
+    'detect_format',
+    'parse_employee_row',
+    'read_rows'
+]
@@ -0,0 +1,448 @@
+import asyncio
+import inspect
+import re
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.common.exceptions import ValidationFailedException
+from domain.common.identifiers import uuid7
+from domain.identity.entities import (
+    CompanyDepartment,
+    CompanyPosition,
+    CompanyResponsibility,
+    CompanyTeam,
+    CompanyUser,
+    Department,
+    Position,
+    Responsibility,
+    Team,
+    User
+)
+from infrastructure.cache.identity import record_identity_cache_keys, user_keys
+from infrastructure.read_models.org_chart import INVALIDATE, OrgChartChange, record_org_chart_changes
+from infrastructure.search.documents import DOCUMENT_FIELDS, INDEX, UPDATE, SearchAction, record_search_actions
+
+from .readers import Row, read_rows
+
+# 한글 헤더 별칭
+HEADER_ALIASES = {
+    "사번": "emp_no",
+    "이메일": "email",
+    "이름": "name",
+    "성명": "name",
+    "권한": "role",
+    "부서": "department",
+    "팀": "team",
+    "직위": "position",
+    "직책": "responsibility"
+}
+
+REQUIRED_COLUMNS = ("emp_no", "email", "name")
+IMPORTABLE_ROLES = ("USER", "TEAM_MANAGER", "ORG_ADMIN")
+
+# 비밀번호 미설정 표시 (초대 후 사용자가 설정, 어떤 해시와도 일치하지 않음)
+UNUSABLE_PASSWORD = "!"
+
+_EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# 조직 단위 컬럼, 엔티티, 회사 매핑 엔티티, 매핑의 외래키 컬럼
+_UNITS = (
+    ("department", Department, CompanyDepartment, "department_id"),
+    ("team", Team, CompanyTeam, "team_id"),
+    ("position", Position, CompanyPosition, "position_id"),
+    ("responsibility", Responsibility, CompanyResponsibility, "responsibility_id")
+)
+
+_MAX_LENGTHS = {
+    "emp_no": 50,
+    "email": 255,
+    "name": 100,
+    "department": 100,
+    "team": 100,
+    "position": 100,
+    "responsibility": 100
+}
+
+class EmployeeRow(NamedTuple):
+    row: int
+    emp_no: str
+    email: str
+    name: str
+    role: str
+    department: Optional[str]
+    team: Optional[str]
+    position: Optional[str]
+    responsibility: Optional[str]
+
+class EmployeeImportResult:
+    """가져오기 진행 상황과 행 단위 오류"""
+
+    __slots__ = ("processed", "inserted", "updated", "failed", "errors", "max_errors")
+
+    def __init__(self, max_errors: int = 100):
+        self.processed = 0
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.max_errors = max_errors
+
+    def add_error(self, row: int, field: str, message: str, value: Any = None) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "field": field, "message": message, "value": value})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": self.errors
+        }
+
+    def raise_for_errors(self) -> None:
+        """오류가 있는 행이 있으면 ValidationFailedException 을 발생시킵니다."""
+        if self.failed:
+            raise ValidationFailedException(
+                message=f"{self.failed}개 행을 가져오지 못했습니다.",
+                field="rows",
+                additional_info=self.to_dict()
+            )
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+def parse_employee_row(row: int, values: Dict[str, Any]) -> Tuple[Optional[EmployeeRow], List[Tuple[str, str, Any]]]:
+    """행 하나를 검증합니다. (EmployeeRow 또는 None, [(필드, 메시지, 값)])"""
+    cleaned = {field: _clean(values.get(field)) for field in (*_MAX_LENGTHS, "role")}
+    errors = []
+    for field in REQUIRED_COLUMNS:
+        if cleaned[field] is None:
+            errors.append((field, "필수 값입니다.", None))
+    for field, max_length in _MAX_LENGTHS.items():
+        if cleaned[field] is not None and len(cleaned[field]) > max_length:
+            errors.append((field, f"{max_length}자를 넘을 수 없습니다.", cleaned[field]))
+    if cleaned["email"] is not None:
+        cleaned["email"] = cleaned["email"].lower()
+        if not _EMAIL_PATTERN.match(cleaned["email"]):
+            errors.append(("email", "이메일 형식이 아닙니다.", cleaned["email"]))
+    role = (cleaned.pop("role") or "USER").upper()
+    if role not in IMPORTABLE_ROLES:
+        errors.append(("role", f"{'/'.join(IMPORTABLE_ROLES)} 중 하나여야 합니다.", role))
+    if errors:
+        return None, errors
+    return EmployeeRow(row=row, role=role, **cleaned), []
+
+def _search_action(entity: Any, entity_id: UUID, values: Dict[str, Any], updated: bool = False) -> SearchAction:
+    """벌크로 쓴 행의 검색 문서 변경 (갱신된 행은 쓴 컬럼만)"""
+    index, fields = DOCUMENT_FIELDS[entity]
+    doc = {field: str(values[field]) if isinstance(values[field], UUID) else values[field]
+           for field in fields if field in values}
+    if updated:
+        if entity is User:
+            # 기존 사용자의 비밀번호/권한은 바꾸지 않음
+            doc.pop("role", None)
+        return SearchAction(UPDATE, index, str(entity_id), doc)
+    return SearchAction(INDEX, index, str(entity_id), {"id": str(entity_id), **doc})
+
+def _take(rows: Iterator[Row], size: int) -> List[Row]:
+    return list(islice(rows, size))
+
+class EmployeeImporter:
+    """CSV/XLSX 직원 일괄 가져오기
+
+    파일을 chunk_size 행씩 읽어(파싱은 스레드 풀에서) 청크마다
+    - 부서/팀/직위/직책 이름을 종류별 IN 쿼리 한 번으로 id 로 바꾸고 (없으면 생성)
+    - user 를 email 충돌 시 갱신하는 다중 행 upsert 로,
+    - company_user 를 다중 행 insert/update 로 적재합니다.
+
+    다른 회사에 등록된 이메일, 파일 안의 중복 사번/이메일 등 오류 행은 건너뛰고
+    결과에 모읍니다. 트랜잭션은 호출자가 관리하며, 커밋되면 회사 조직도를 다시
+    만들도록 기록합니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        company_id: UUID,
+        imported_by: Optional[UUID] = None,
+        chunk_size: int = 1000,
+        create_missing_units: bool = True,
+        max_errors: int = 100,
+        on_progress: Optional[Callable[[EmployeeImportResult], Any]] = None
+    ):
+        self.session = session
+        self.company_id = company_id
+        self.imported_by = imported_by
+        self.chunk_size = chunk_size
+        self.create_missing_units = create_missing_units
+        self.on_progress = on_progress
+        self.result = EmployeeImportResult(max_errors)
+        self._unit_ids: Dict[str, Dict[str, UUID]] = {kind: {} for kind, _, _, _ in _UNITS}
+        self._unit_columns: Tuple[str, ...] = ()
+        self._seen_emails: Set[str] = set()
+        self._seen_emp_nos: Set[str] = set()
+
+    async def run(self, stream: BinaryIO, file_format: str) -> EmployeeImportResult:
+        headers, rows = await asyncio.to_thread(read_rows, stream, file_format, HEADER_ALIASES)
+        missing = [column for column in REQUIRED_COLUMNS if column not in headers]
+        if missing:
+            raise ValidationFailedException(
+                message="필수 컬럼이 없습니다.",
+                field="header",
+                value=missing,
+                additional_info={"required": list(REQUIRED_COLUMNS), "headers": [h for h in headers if h]}
+            )
+        # 파일에 없는 조직 단위 컬럼은 기존 값을 유지
+        self._unit_columns = tuple(kind for kind, _, _, _ in _UNITS if kind in headers)
+
+        while True:
+            chunk = await asyncio.to_thread(_take, rows, self.chunk_size)
+            if not chunk:
+                break
+            employees = self._validate(chunk)
+            if employees:
+                await self._load(employees)
+            await self._report_progress()
+
+        record_org_chart_changes(self.session, [OrgChartChange(str(self.company_id), INVALIDATE)])
+        return self.result
+
+    async def _report_progress(self) -> None:
+        if self.on_progress is not None:
+            outcome = self.on_progress(self.result)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    def _validate(self, chunk: List[Row]) -> List[EmployeeRow]:
+        employees = []
+        for row_number, values in chunk:
+            self.result.processed += 1
+            employee, errors = parse_employee_row(row_number, values)
+            if employee is not None:
+                if employee.email in self._seen_emails:
+                    errors.append(("email", "파일 안에 같은 이메일이 있습니다.", employee.email))
+                if employee.emp_no in self._seen_emp_nos:
+                    errors.append(("emp_no", "파일 안에 같은 사번이 있습니다.", employee.emp_no))
+            if errors:
+                field, message, value = errors[0]
+                self.result.add_error(row_number, field, message, value)
+                continue
+            self._seen_emails.add(employee.email)
+            self._seen_emp_nos.add(employee.emp_no)
+            employees.append(employee)
+        return employees
+
+    def _audit(self, now: datetime) -> Dict[str, Any]:
+        return {
+            "use_yn": "Y",
+            "delete_yn": "N",
+            "created_at": now,
+            "updated_at": now,
+            "created_by": self.imported_by,
+            "updated_by": self.imported_by
+        }
+
+    def _insert(self, table: Any) -> Any:
+        dialect = self.session.bind.dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(table)
+        if dialect == "sqlite":
+            return sqlite.insert(table)
+        raise NotImplementedError(f"{dialect} 에서는 upsert 를 지원하지 않습니다.")
+
+    async def _load(self, employees: List[EmployeeRow]) -> None:
+        now = datetime.utcnow()
+        unit_ids = {}
+        for kind, unit, mapping, key in _UNITS:
+            if kind in self._unit_columns:
+                names = {getattr(employee, kind) for employee in employees if getattr(employee, kind)}
+                unit_ids[kind] = await self._resolve_units(kind, names, unit, mapping, key, now)
+
+        employees = [employee for employee in employees if self._has_units(employee, unit_ids)]
+        user_ids = await self._upsert_users(employees, now)
+        employees = [employee for employee in employees if employee.email in user_ids]
+        if employees:
+            await self._upsert_company_users(employees, user_ids, unit_ids, now)
+
+    def _has_units(self, employee: EmployeeRow, unit_ids: Dict[str, Dict[str, UUID]]) -> bool:
+        for kind, ids in unit_ids.items():
+            name = getattr(employee, kind)
+            if name is not None and name not in ids:
+                self.result.add_error(employee.row, kind, "등록되지 않은 조직입니다.", name)
+                return False
+        return True
+
+    async def _resolve_units(
+        self,
+        kind: str,
+        names: Set[str],
+        unit: Any,
+        mapping: Any,
+        key: str,
+        now: datetime
+    ) -> Dict[str, UUID]:
+        """조직 단위 이름을 id 로 바꿉니다 (청크당 IN 쿼리 한 번, 결과는 가져오기 동안 캐시)."""
+        cache = self._unit_ids[kind]
+        missing = names - cache.keys()
+        if missing:
+            result = await self.session.execute(
+                select(unit.id, unit.name)
+                .join(mapping, getattr(mapping, key) == unit.id)
+                .where(
+                    mapping.company_id == self.company_id,
+                    unit.name.in_(missing),
+                    mapping.delete_yn == "N",
+                    unit.delete_yn == "N"
+                )
+            )
+            for unit_id, name in result.all():
+                cache.setdefault(name, unit_id)
+
+            missing -= cache.keys()
+            if missing and self.create_missing_units:
+                created = {name: uuid7() for name in sorted(missing)}
+                await self.session.execute(
+                    unit.__table__.insert(),
+                    [{"id": unit_id, "name": name, **self._audit(now)} for name, unit_id in created.items()]
+                )
+                await self.session.execute(
+                    mapping.__table__.insert(),
+                    [
+                        {"id": uuid7(), "company_id": self.company_id, key: unit_id, **self._audit(now)}
+                        for unit_id in created.values()
+                    ]
+                )
+                if unit in DOCUMENT_FIELDS:
+                    record_search_actions(self.session, [
+                        _search_action(unit, unit_id, {"name": name}) for name, unit_id in created.items()
+                    ])
+                cache.update(created)
+        return cache
+
+    async def _upsert_users(self, employees: List[EmployeeRow], now: datetime) -> Dict[str, UUID]:
+        """user 를 email 기준으로 upsert 하고 email -> user id 를 반환합니다."""
+        if not employees:
+            return {}
+        users = User.__table__
+        existing = {
+            email: company_id
+            for email, company_id in (await self.session.execute(
+                select(users.c.email, users.c.company_id).where(users.c.email.in_([e.email for e in employees]))
+            )).all()
+        }
+
+        rows = []
+        for employee in employees:
+            if employee.email in existing and existing[employee.email] not in (None, self.company_id):
+                self.result.add_error(employee.row, "email", "다른 회사에 등록된 이메일입니다.", employee.email)
+                continue
+            rows.append({
+                "id": uuid7(),
+                "emp_no": employee.emp_no,
+                "email": employee.email,
+                "password": UNUSABLE_PASSWORD,
+                "name": employee.name,
+                "role": employee.role,
+                "company_id": self.company_id,
+                **self._audit(now)
+            })
+        if not rows:
+            return {}
+
+        statement = self._insert(users)
+        excluded = statement.excluded
+        # 기존 사용자의 비밀번호/권한은 바꾸지 않음. 조회와 upsert 사이에 다른 회사로
+        # 등록된 이메일은 갱신하지 않고 RETURNING 에서 빠짐
+        statement = statement.on_conflict_do_update(
+            index_elements=[users.c.email],
+            set_={
+                "emp_no": excluded.emp_no,
+                "name": excluded.name,
+                "company_id": excluded.company_id,
+                "updated_at": excluded.updated_at,
+                "updated_by": excluded.updated_by
+            },
+            where=or_(users.c.company_id == self.company_id, users.c.company_id.is_(None))
+        ).returning(users.c.id, users.c.email)
+        user_ids = {email: user_id for user_id, email in (await self.session.execute(statement, rows)).all()}
+
+        for row in rows:
+            if row["email"] not in user_ids:
+                self.result.failed += 1
+            elif row["email"] in existing:
+                self.result.updated += 1
+            else:
+                self.result.inserted += 1
+        # Core upsert 는 ORM 이벤트를 거치지 않으므로 갱신된 사용자 캐시와 검색 문서를 직접 기록
+        record_identity_cache_keys(self.session, [
+            key for email, user_id in user_ids.items() if email in existing for key in user_keys(user_id)
+        ])
+        record_search_actions(self.session, [
+            _search_action(User, user_ids[row["email"]], row, updated=row["email"] in existing)
+            for row in rows if row["email"] in user_ids
+        ])
+        return user_ids
+
+    async def _upsert_company_users(
+        self,
+        employees: List[EmployeeRow],
+        user_ids: Dict[str, UUID],
+        unit_ids: Dict[str, Dict[str, UUID]],
+        now: datetime
+    ) -> None:
+        company_users = CompanyUser.__table__
+        existing = {
+            user_id: company_user_id
+            for company_user_id, user_id in (await self.session.execute(
+                select(company_users.c.id, company_users.c.user_id).where(
+                    company_users.c.company_id == self.company_id,
+                    company_users.c.user_id.in_(list(user_ids.values())),
+                    company_users.c.delete_yn == "N"
+                )
+            )).all()
+        }
+
+        inserts, updates = [], []
+        for employee in employees:
+            values = {"emp_no": employee.emp_no}
+            for kind, ids in unit_ids.items():
+                name = getattr(employee, kind)
+                values[f"{kind}_id"] = ids[name] if name is not None else None
+            user_id = user_ids[employee.email]
+            if user_id in existing:
+                updates.append({"_id": existing[user_id], **values, "updated_at": now, "updated_by": self.imported_by})
+            else:
+                inserts.append({
+                    "id": uuid7(),
+                    "company_id": self.company_id,
+                    "user_id": user_id,
+                    **{f"{kind}_id": None for kind, _, _, _ in _UNITS},
+                    **values,
+                    **self._audit(now)
+                })
+
+        record_search_actions(self.session, [
+            *(_search_action(CompanyUser, row["id"], row) for row in inserts),
+            *(_search_action(CompanyUser, row["_id"], row, updated=True) for row in updates)
+        ])
+        if inserts:
+            await self.session.execute(company_users.insert(), inserts)
+        if updates:
+            columns = [name for name in updates[0] if name != "_id"]
+            await self.session.execute(
+                update(company_users)
+                .where(company_users.c.id == bindparam("_id"))
+                .values({name: bindparam(name) for name in columns}),
+                updates
+            )
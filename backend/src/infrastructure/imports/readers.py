@@ -0,0 +1,113 @@
+import codecs
+import csv
+import io
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import status
+
+from application.common.constants import ResponseCode
+from application.common.exceptions import ApplicationException, ValidationFailedException
+
+SUPPORTED_FORMATS = ("csv", "xlsx")
+
+# 인코딩 판별에 사용할 앞부분 크기
+_SNIFF_SIZE = 64 * 1024
+
+Row = Tuple[int, Dict[str, Any]]
+RowSource = Tuple[List[Optional[str]], Iterator[Row]]
+
+def _unsupported_format(extension: str) -> ApplicationException:
+    return ApplicationException(
+        code=ResponseCode.FILE_TYPE_NOT_ALLOWED,
+        message=ResponseCode.FILE_TYPE_NOT_ALLOWED.message,
+        status_code=status.HTTP_400_BAD_REQUEST,
+        additional_info={"extension": extension, "allowed": list(SUPPORTED_FORMATS)}
+    )
+
+def _encoding_error(exc: UnicodeDecodeError) -> ValidationFailedException:
+    return ValidationFailedException(
+        message="파일 인코딩을 읽을 수 없습니다. UTF-8 또는 CP949 로 저장해 주세요.",
+        field="file",
+        additional_info={"reason": str(exc)}
+    )
+
+def detect_format(filename: str) -> str:
+    """파일 이름의 확장자로 형식을 판별합니다."""
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension not in SUPPORTED_FORMATS:
+        raise _unsupported_format(extension)
+    return extension
+
+def _sniff_encoding(stream: BinaryIO) -> str:
+    """UTF-8 로 읽을 수 없으면 엑셀 한글 CSV 기본값인 cp949 로 판단합니다."""
+    if not stream.seekable():
+        return "utf-8-sig"
+    position = stream.tell()
+    sample = stream.read(_SNIFF_SIZE)
+    stream.seek(position)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+def _normalize_header(header: Any, aliases: Dict[str, str]) -> Optional[str]:
+    if header is None:
+        return None
+    name = str(header).strip()
+    return aliases.get(name, aliases.get(name.lower(), name.lower()))
+
+def read_csv(stream: BinaryIO, aliases: Dict[str, str], encoding: Optional[str] = None) -> RowSource:
+    text = io.TextIOWrapper(stream, encoding=encoding or _sniff_encoding(stream), newline="")
+    reader = csv.reader(text)
+    try:
+        headers = [_normalize_header(header, aliases) for header in next(reader, [])]
+    except UnicodeDecodeError as exc:
+        text.detach()
+        raise _encoding_error(exc)
+
+    def rows() -> Iterator[Row]:
+        try:
+            for line_number, values in enumerate(reader, start=2):
+                if any(value.strip() for value in values):
+                    yield line_number, dict(zip(headers, values))
+        except UnicodeDecodeError as exc:
+            raise _encoding_error(exc)
+        finally:
+            # 호출자가 넘긴 스트림은 닫지 않음
+            text.detach()
+
+    return headers, rows()
+
+def read_xlsx(stream: BinaryIO, aliases: Dict[str, str]) -> RowSource:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:  # pragma: no cover - 선택 의존성
+        raise _unsupported_format("xlsx")
+
+    # read_only 모드는 시트 XML 을 행 단위로 읽음
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    sheet_rows = workbook.active.iter_rows(values_only=True)
+    headers = [_normalize_header(header, aliases) for header in next(sheet_rows, ())]
+
+    def rows() -> Iterator[Row]:
+        try:
+            for row_number, values in enumerate(sheet_rows, start=2):
+                if any(value is not None and str(value).strip() for value in values):
+                    yield row_number, dict(zip(headers, values))
+        finally:
+            workbook.close()
+
+    return headers, rows()
+
+def read_rows(stream: BinaryIO, file_format: str, aliases: Dict[str, str]) -> RowSource:
+    """파일을 행 단위로 읽습니다.
+
+    정규화된 헤더 목록과 (행 번호, {헤더: 값}) 이터레이터를 반환합니다.
+    행 번호는 스프레드시트 행 번호와 같으며 빈 행은 건너뜁니다.
+    """
+    if file_format == "csv":
+        return read_csv(stream, aliases)
+    if file_format == "xlsx":
+        return read_xlsx(stream, aliases)
+    raise _unsupported_format(file_format)
@@ -0,0 +1,42 @@
+"""
+알림 모듈
+
+- Redis Streams 기반 fan-out 엔진 (요청 -> 대상 묶음 -> 채널별 워커, 재시도, 멈춘 항목 회수)
+- 조직 구조(회사/부서/팀)에서 대상을 묶음 단위로 펼치기, 사용자별 중복 알림 합치기
+- 채널: 앱 안 알림함(+ 실시간 발행), 푸시(무효 토큰 일괄 정리), 이메일
+- 실시간 연결 허브 (워커당 pub/sub 구독 하나를 사용자/회사별 로컬 연결로 분배, 느린 소비자 끊기)
+"""
+
+from .channels import (
+    INVALID,
+    RETRY,
+    SENT,
+    EmailChannel,
+    InAppChannel,
+    PartialDelivery,
+    PushChannel,
+    TransportChannel
+)
+from .engine import NotificationEngine
+from .hub import LocalConnection, RealtimeHub
+from .models import Audience, Notification
+from .recipients import PushTokenStore, email_resolver, iter_recipient_batches
+
+__all__ = [
+    'Audience',
+    'EmailChannel',
+    'INVALID',
+    'InAppChannel',
+    'LocalConnection',
+    'Notification',
+    'NotificationEngine',
+    'PartialDelivery',
+    'PushChannel',
+    'PushTokenStore',
+    'RETRY',
+    'RealtimeHub',
+    'SENT',
+    'TransportChannel',
+    'email_resolver',
+    'iter_recipient_batches'
+]
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from redis.asyncio import Redis
+
+from application.common.constants import ResponseCode
+from .models import Notification
+from .recipients import PushTokenStore
+
+logger = logging.getLogger(__name__)
+
+# transport 가 주소(푸시 토큰, 이메일 주소)마다 돌려주는 결과
+SENT = "sent"
+INVALID = "invalid"  # 더는 유효하지 않은 주소 (만료/삭제된 토큰 등, 다시 보내지 않음)
+RETRY = "retry"  # 일시적 실패 (결과에 없는 주소도 재시도)
+
+# (알림 내용, 주소 목록 - batch_size 개 이하) -> 주소별 결과
+Transport = Callable[[Dict[str, Any], List[str]], Awaitable[Dict[str, str]]]
+# 사용자 id 목록 -> 사용자 id 별 주소 목록 (주소가 없는 사용자는 빠짐)
+AddressResolver = Callable[[List[str]], Awaitable[Dict[str, List[str]]]]
+
+class PartialDelivery(RuntimeError):
+    """일부 사용자에게 보낸 뒤 실패 - 다시 보낼 때는 remaining 사용자에게만 보냅니다."""
+
+    def __init__(self, remaining: List[str]):
+        super().__init__(f"{len(remaining)} recipients not delivered")
+        self.remaining = remaining
+
+class InAppChannel:
+    """앱 안 알림함
+
+    사용자마다 최근 inbox_size 개를 Redis 리스트에 두고, 접속 중인 기기에 바로 보내도록
+    {key_prefix}user:{user_id} 채널에 발행합니다. 묶음 하나를 파이프라인 한 번으로 보냅니다.
+    """
+    name = "in_app"
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_prefix: str = "notifications:",
+        inbox_size: int = 100,
+        inbox_ttl: int = 30 * 86400
+    ):
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self.inbox_size = inbox_size
+        self.inbox_ttl = inbox_ttl
+
+    def inbox_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}inbox:{user_id}"
+
+    def user_channel(self, user_id: str) -> str:
+        return f"{self.key_prefix}user:{user_id}"
+
+    async def send(self, notification: Notification, user_ids: List[str]) -> None:
+        message = json.dumps(notification.payload(), ensure_ascii=False)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                key = self.inbox_key(user_id)
+                pipe.lpush(key, message)
+                pipe.ltrim(key, 0, self.inbox_size - 1)
+                pipe.expire(key, self.inbox_ttl)
+                pipe.publish(self.user_channel(user_id), message)
+            await pipe.execute()
+
+    async def inbox(self, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 알림 (최신순)"""
+        return [json.loads(item) for item in await self.redis.lrange(self.inbox_key(user_id), 0, limit - 1)]
+
+class TransportChannel:
+    """사용자를 주소로 바꿔 transport 로 batch_size 개씩 보내는 채널 (푸시, 이메일)
+
+    - 묶음은 concurrency 개까지 동시에 보냅니다.
+    - RETRY 인 주소만 지수 백오프로 max_retries 번까지 다시 보냅니다.
+    - INVALID 인 주소는 모았다가 알림 하나당 한 번 prune 으로 정리합니다 (정리 실패는 로그만 남김).
+    - 일부 묶음만 보낸 채 예외가 나면 보내지 못한 사용자만 담아 PartialDelivery 를 올립니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        resolve: AddressResolver,
+        transport: Transport,
+        batch_size: int = 500,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        prune: Optional[Callable[[List[str]], Awaitable[Any]]] = None,
+        failure_code: ResponseCode = ResponseCode.NOTIFICATION_SEND_FAILED
+    ):
+        self.name = name
+        self.resolve = resolve
+        self.transport = transport
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.prune = prune
+        self.failure_code = failure_code
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.stats = {"sent": 0, "invalid": 0, "retried": 0, "failed": 0}
+
+    async def send(self, notification: Notification, user_ids: List[str]) -> None:
+        owners = [(user_id, address) for user_id, values in (await self.resolve(user_ids)).items() for address in values]
+        if not owners:
+            return
+        payload = notification.payload()
+        batches = [owners[start:start + self.batch_size] for start in range(0, len(owners), self.batch_size)]
+        results = await asyncio.gather(
+            *(self._send_batch(payload, [address for _, address in batch]) for batch in batches),
+            return_exceptions=True
+        )
+        invalid = [address for batch in results if not isinstance(batch, BaseException) for address in batch]
+        if invalid and self.prune is not None:
+            try:
+                pruned = await self.prune(invalid)
+            except Exception as e:
+                # 이미 보낸 뒤이므로 다시 보내지 않음 (무효 주소는 다음 전송에서 다시 정리)
+                logger.warning(
+                    "무효 주소 정리 실패", extra={"channel": self.name, "addresses": len(invalid), "error": str(e)}
+                )
+            else:
+                logger.info("무효 주소 정리", extra={"channel": self.name, "addresses": len(invalid), "pruned": pruned})
+        failed = [batch for batch, result in zip(batches, results) if isinstance(result, BaseException)]
+        if failed:
+            remaining = list(dict.fromkeys(user_id for batch in failed for user_id, _ in batch))
+            raise PartialDelivery(remaining) from next(
+                result for result in results if isinstance(result, BaseException)
+            )
+
+    async def _send_batch(self, payload: Dict[str, Any], addresses: List[str]) -> List[str]:
+        """묶음 하나를 보내고 무효 주소를 돌려줍니다."""
+        invalid: List[str] = []
+        pending = addresses
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats["retried"] += len(pending)
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            async with self._semaphore:
+                try:
+                    outcomes = await self.transport(payload, pending)
+                except Exception as e:
+                    logger.warning(
+                        "알림 전송 실패", extra={"channel": self.name, "addresses": len(pending), "error": str(e)}
+                    )
+                    outcomes = {}
+            retry = []
+            for address in pending:
+                outcome = outcomes.get(address, RETRY)
+                if outcome == SENT:
+                    self.stats["sent"] += 1
+                elif outcome == INVALID:
+                    invalid.append(address)
+                else:
+                    retry.append(address)
+            pending = retry
+            if not pending:
+                break
+        self.stats["invalid"] += len(invalid)
+        if pending:
+            self.stats["failed"] += len(pending)
+            logger.error(
+                "알림 전송 포기", extra={"channel": self.name, "code": self.failure_code, "addresses": len(pending)}
+            )
+        return invalid
+
+class PushChannel(TransportChannel):
+    """기기 푸시 (FCM/APNs 등 transport 는 주입, 무효 토큰은 PushTokenStore 에서 정리)"""
+
+    def __init__(self, tokens: PushTokenStore, transport: Transport, batch_size: int = 500, **options: Any):
+        super().__init__("push", tokens.tokens_for, transport, batch_size, prune=tokens.prune, **options)
+
+class EmailChannel(TransportChannel):
+    """이메일 (SMTP/발송 서비스 transport 는 주입)"""
+
+    def __init__(self, resolve: AddressResolver, transport: Transport, batch_size: int = 100, **options: Any):
+        super().__init__(
+            "email", resolve, transport, batch_size, failure_code=ResponseCode.EMAIL_SEND_FAILED, **options
+        )
@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from application.common.constants import ResponseCode
+from .channels import PartialDelivery
+from .models import Audience, Notification
+
+logger = logging.getLogger(__name__)
+
+# (회사 id, 대상, 묶음 크기) -> 사용자 id 묶음
+RecipientSource = Callable[[str, Audience, int], AsyncIterator[List[str]]]
+
+# 사용자별 중복 방지 키를 처음 잡은 사용자만 모아 채널 스트림마다 묶음 항목 하나로 추가합니다.
+# 같은 요청을 다시 처리해도(재전달) 이미 보낸 사용자는 빠집니다.
+#   KEYS: 채널 스트림 n 개, 사용자별 중복 방지 키
+#   ARGV: n, 중복 방지 시간(초), 알림 JSON, 스트림 최대 길이, 사용자 id (키와 같은 순서)
+#   반환: 추가한 사용자 수
+_FAN_OUT = """
+local streams = tonumber(ARGV[1])
+local fresh = {}
+for i = streams + 1, #KEYS do
+    if redis.call('SET', KEYS[i], '1', 'NX', 'EX', ARGV[2]) then
+        fresh[#fresh + 1] = ARGV[i - streams + 4]
+    end
+end
+if #fresh > 0 then
+    local recipients = table.concat(fresh, ',')
+    for i = 1, streams do
+        redis.call('XADD', KEYS[i], 'MAXLEN', '~', ARGV[4], '*', 'notification', ARGV[3], 'recipients', recipients)
+    end
+end
+return #fresh
+"""
+
+Entry = Tuple[Any, Dict[bytes, bytes]]
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+class NotificationEngine:
+    """Redis Streams 기반 알림 fan-out
+
+    1. publish() 는 요청을 requests 스트림에 추가만 합니다 (요청 처리 시간과 무관).
+    2. fan-out: 요청을 읽어 대상을 조직 구조에서 fanout_batch_size 명씩 펼치고, 사용자마다
+       coalesce_window 초 안에 같은 알림(coalesce_key)을 한 번만 보내도록 걸러 채널 스트림에
+       묶음 하나로 추가합니다 (Lua 스크립트로 묶음당 왕복 한 번).
+    3. 채널마다 스트림 읽기 작업 하나가 묶음을 읽어 channel_concurrency 개의 워커에 나눠 주고,
+       채널 전송이 실패하면 지수 백오프로 max_retries 번까지 다시 보냅니다.
+
+    스트림은 consumer group 으로 읽고 처리한 뒤 XACK 합니다. 멈춘 프로세스가 읽고 처리하지 못한
+    항목은 reclaim_idle 초 뒤 다른 프로세스가 XAUTOCLAIM 으로 가져갑니다.
+    blocking 읽기는 스트림마다 하나라서 Redis 커넥션을 (채널 수 + 1) 개만 붙잡습니다.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        recipients: RecipientSource,
+        channels: Iterable[Any],
+        key_prefix: str = "notifications:",
+        fanout_batch_size: int = 1000,
+        coalesce_window: int = 300,
+        channel_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        max_stream_length: int = 100000,
+        block: float = 5.0,
+        reclaim_idle: float = 60.0,
+        consumer: Optional[str] = None
+    ):
+        self.redis = redis
+        self.recipients = recipients
+        self.channels = {channel.name: channel for channel in channels}
+        self.key_prefix = key_prefix
+        self.fanout_batch_size = fanout_batch_size
+        self.coalesce_window = coalesce_window
+        self.channel_concurrency = channel_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_stream_length = max_stream_length
+        self.block = block
+        self.reclaim_idle = reclaim_idle
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._fan_out = redis.register_script(_FAN_OUT)
+        self._readers: List["asyncio.Task[None]"] = []
+        self.stats = {"published": 0, "fanned_out": 0, "coalesced": 0, "delivered": 0, "retried": 0, "failed": 0}
+
+    @property
+    def requests_stream(self) -> str:
+        return f"{self.key_prefix}requests"
+
+    def channel_stream(self, channel: str) -> str:
+        return f"{self.key_prefix}channel:{channel}"
+
+    async def publish(self, notification: Notification) -> str:
+        entry_id = await self.redis.xadd(
+            self.requests_stream,
+            {"notification": notification.to_json()},
+            maxlen=self.max_stream_length,
+            approximate=True
+        )
+        self.stats["published"] += 1
+        return _text(entry_id)
+
+    async def fan_out(self, notification: Notification) -> int:
+        """대상을 펼쳐 채널 스트림에 추가하고, 추가한 사용자 수를 돌려줍니다."""
+        channels = [channel for channel in notification.channels if channel in self.channels]
+        if not channels:
+            logger.warning("보낼 채널 없음", extra={"notification": notification.id, "channels": notification.channels})
+            return 0
+        streams = [self.channel_stream(channel) for channel in channels]
+        coalesce_key = f"{self.key_prefix}sent:{notification.coalesce_key or notification.id}:"
+        # 묶음 항목에는 대상 정보를 뺀 알림만 담습니다 (사용자 id 대상이 길어도 묶음마다 복사하지 않음).
+        message = notification._replace(audience=Audience()).to_json()
+        fanned_out = 0
+        async for user_ids in self.recipients(notification.company_id, notification.audience, self.fanout_batch_size):
+            added = await self._fan_out(
+                keys=streams + [coalesce_key + user_id for user_id in user_ids],
+                args=[len(streams), self.coalesce_window, message, self.max_stream_length, *user_ids]
+            )
+            fanned_out += added
+            self.stats["coalesced"] += len(user_ids) - added
+        self.stats["fanned_out"] += fanned_out
+        return fanned_out
+
+    async def deliver(self, channel: Any, notification: Notification, user_ids: List[str]) -> bool:
+        """채널로 보냅니다. max_retries 번 다시 보내도 실패하면 False
+
+        채널이 PartialDelivery 를 올리면 다시 보낼 때 이미 받은 사용자는 뺍니다.
+        """
+        pending = user_ids
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats["retried"] += 1
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                await channel.send(notification, pending)
+            except Exception as e:
+                if isinstance(e, PartialDelivery):
+                    self.stats["delivered"] += len(pending) - len(e.remaining)
+                    pending = e.remaining
+                logger.warning(
+                    "알림 채널 전송 실패",
+                    extra={"channel": channel.name, "notification": notification.id, "attempt": attempt, "error": str(e)}
+                )
+                continue
+            self.stats["delivered"] += len(pending)
+            return True
+        self.stats["failed"] += len(pending)
+        logger.error(
+            "알림 전송 포기",
+            extra={
+                "channel": channel.name,
+                "code": ResponseCode.NOTIFICATION_SEND_FAILED,
+                "notification": notification.id,
+                "users": len(pending)
+            }
+        )
+        return False
+
+    async def start(self) -> None:
+        if self._readers:
+            return
+        loop = asyncio.get_running_loop()
+        await self._create_group(self.requests_stream, "fanout")
+        self._readers.append(loop.create_task(
+            self._read(self.requests_stream, "fanout", self._handle_request, self.channel_concurrency)
+        ))
+        for name, channel in self.channels.items():
+            stream = self.channel_stream(name)
+            await self._create_group(stream, "deliver")
+            self._readers.append(loop.create_task(
+                self._read(stream, "deliver", self._delivery_handler(channel), self.channel_concurrency)
+            ))
+
+    async def stop(self) -> None:
+        """읽기를 멈춥니다. 읽고 처리하지 못한 항목은 다른 프로세스가 reclaim_idle 뒤 가져갑니다."""
+        for reader in self._readers:
+            reader.cancel()
+        await asyncio.gather(*self._readers, return_exceptions=True)
+        self._readers = []
+
+    async def _create_group(self, stream: str, group: str) -> None:
+        try:
+            await self.redis.xgroup_create(stream, group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _handle_request(self, fields: Dict[bytes, bytes]) -> None:
+        notification = Notification.from_json(fields[b"notification"])
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                # 이미 채널 스트림에 추가한 사용자는 중복 방지 키 때문에 다시 추가하지 않음
+                await self.fan_out(notification)
+                return
+            except Exception as e:
+                logger.warning(
+                    "알림 fan-out 실패", extra={"notification": notification.id, "attempt": attempt, "error": str(e)}
+                )
+        logger.error("알림 fan-out 포기", extra={"notification": notification.id})
+
+    def _delivery_handler(self, channel: Any) -> Callable[[Dict[bytes, bytes]], Awaitable[None]]:
+        async def handle(fields: Dict[bytes, bytes]) -> None:
+            notification = Notification.from_json(fields[b"notification"])
+            await self.deliver(channel, notification, _text(fields[b"recipients"]).split(","))
+        return handle
+
+    async def _read(
+        self,
+        stream: str,
+        group: str,
+        handler: Callable[[Dict[bytes, bytes]], Awaitable[None]],
+        concurrency: int
+    ) -> None:
+        queue: "asyncio.Queue[Entry]" = asyncio.Queue(maxsize=concurrency)
+        loop = asyncio.get_running_loop()
+        workers = [loop.create_task(self._work(stream, group, handler, queue)) for _ in range(concurrency)]
+        next_reclaim = 0.0
+        failures = 0
+        try:
+            while True:
+                try:
+                    entries: List[Entry] = []
+                    if loop.time() >= next_reclaim:
+                        next_reclaim = loop.time() + self.reclaim_idle / 2
+                        entries = await self._reclaim(stream, group, concurrency)
+                    if not entries:
+                        response = await self.redis.xreadgroup(
+                            group, self.consumer, {stream: ">"}, count=concurrency, block=int(self.block * 1000)
+                        )
+                        entries = response[0][1] if response else []
+                    failures = 0
+                except RedisError as e:
+                    failures += 1
+                    logger.warning("알림 스트림 읽기 실패", extra={"stream": stream, "error": str(e)})
+                    await asyncio.sleep(min(self.retry_backoff * 2 ** (failures - 1), 30.0))
+                    continue
+                for entry in entries:
+                    # 워커가 모두 바쁘면 여기서 기다리므로 처리할 수 있는 만큼만 읽음
+                    await queue.put(entry)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _reclaim(self, stream: str, group: str, count: int) -> List[Entry]:
+        _, entries, *_ = await self.redis.xautoclaim(
+            stream, group, self.consumer, min_idle_time=int(self.reclaim_idle * 1000), start_id="0-0", count=count
+        )
+        # 그 사이 스트림 길이 제한으로 잘린 항목은 내용이 없으므로 ACK 만 함
+        trimmed = [entry_id for entry_id, fields in entries if not fields]
+        if trimmed:
+            await self.redis.xack(stream, group, *trimmed)
+        return [(entry_id, fields) for entry_id, fields in entries if fields]
+
+    async def _work(
+        self,
+        stream: str,
+        group: str,
+        handler: Callable[[Dict[bytes, bytes]], Awaitable[None]],
+        queue: "asyncio.Queue[Entry]"
+    ) -> None:
+        while True:
+            entry_id, fields = await queue.get()
+            try:
+                await handler(fields)
+            except Exception:
+                logger.exception("알림 처리 실패", extra={"stream": stream, "entry": _text(entry_id)})
+            try:
+                await self.redis.xack(stream, group, entry_id)
+            except RedisError as e:
+                # ACK 하지 못한 항목은 다시 전달되며, fan-out 은 중복 방지 키 때문에 다시 보내지 않음
+                logger.warning("알림 ACK 실패", extra={"stream": stream, "entry": _text(entry_id), "error": str(e)})
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional, Set
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# SUBSCRIBE/UNSUBSCRIBE 한 번에 보내는 채널 수
+_SUBSCRIBE_CHUNK = 1000
+
+class LocalConnection:
+    """워커에 붙은 실시간 연결 하나
+
+    보낼 메시지를 max_pending 개까지만 쌓아 두고, 넘치면 hub 가 느린 소비자로 보고 끊습니다.
+    (놓친 알림은 앱 안 알림함에 남아 있으므로 다시 연결해 읽으면 됩니다.)
+    """
+    __slots__ = ("user_id", "company_id", "close_reason", "_pending", "_max_pending", "_waiter")
+
+    def __init__(self, user_id: str, company_id: Optional[str], max_pending: int):
+        self.user_id = user_id
+        self.company_id = company_id
+        self.close_reason: Optional[str] = None
+        self._pending: Deque[str] = deque()
+        self._max_pending = max_pending
+        self._waiter: Optional["asyncio.Future[None]"] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.close_reason is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def push(self, message: str) -> bool:
+        """메시지를 쌓습니다. 닫혔거나 가득 차 있으면 False"""
+        if self.close_reason is not None or len(self._pending) >= self._max_pending:
+            return False
+        self._pending.append(message)
+        self._wake()
+        return True
+
+    def close(self, reason: str) -> None:
+        if self.close_reason is None:
+            self.close_reason = reason
+            self._pending.clear()
+            self._wake()
+
+    async def get(self, timeout: float) -> Optional[str]:
+        """다음 메시지 (timeout 초 동안 없거나 닫히면 None)"""
+        if not self._pending and self.close_reason is None:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(self._waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiter = None
+        return self._pending.popleft() if self._pending else None
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+class RealtimeHub:
+    """워커의 실시간 연결을 Redis pub/sub 구독 하나로 묶는 허브
+
+    - 로컬에 연결이 있는 사용자/회사 채널만 구독합니다 (연결이 몰리면 SUBSCRIBE 한 번에 묶음).
+      마지막 연결이 끊긴 채널은 sweep_interval 마다 한꺼번에 구독을 해제합니다.
+    - 받은 메시지는 그 채널의 로컬 연결에 나눠 주며, 쌓인 메시지가 max_pending 을 넘은
+      연결은 느린 소비자로 끊습니다 (Redis 읽기와 다른 연결이 느려지지 않음).
+    - 구독이 끊기면 재연결해 현재 채널을 모두 다시 구독합니다.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_prefix: str = "notifications:",
+        max_connections: int = 10000,
+        max_pending: int = 100,
+        sweep_interval: float = 1.0
+    ):
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self.max_connections = max_connections
+        self.max_pending = max_pending
+        self.sweep_interval = sweep_interval
+        # 채널 -> 로컬 연결 (전체 채널은 연결이 없어도 항상 구독)
+        self._subscribers: Dict[str, Set[LocalConnection]] = {self.broadcast_channel: set()}
+        self._subscribed: Set[str] = set()
+        self._pubsub: Any = None
+        self._lock = asyncio.Lock()
+        self._ready = asyncio.Event()
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self.connections = 0
+        self.stats = {"connected": 0, "delivered": 0, "slow_consumers": 0, "subscribes": 0}
+
+    @property
+    def broadcast_channel(self) -> str:
+        """워커의 모든 연결로 보내는 채널 (구독을 항상 유지하는 용도도 겸함)"""
+        return f"{self.key_prefix}broadcast"
+
+    def user_channel(self, user_id: str) -> str:
+        return f"{self.key_prefix}user:{user_id}"
+
+    def company_channel(self, company_id: str) -> str:
+        return f"{self.key_prefix}company:{company_id}"
+
+    async def publish(self, message: str, user_id: Optional[str] = None, company_id: Optional[str] = None) -> int:
+        """사용자나 회사의 연결(둘 다 없으면 전체)로 보냅니다. 받은 워커 수를 돌려줍니다."""
+        if user_id is not None:
+            channel = self.user_channel(user_id)
+        elif company_id is not None:
+            channel = self.company_channel(company_id)
+        else:
+            channel = self.broadcast_channel
+        return await self.redis.publish(channel, message)
+
+    async def start(self, timeout: float = 5.0) -> None:
+        """구독을 시작하고 연결될 때까지 (최대 timeout 초) 기다립니다."""
+        if self._listener is not None:
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("실시간 알림 구독을 연결하지 못한 채 시작합니다")
+
+    async def stop(self) -> None:
+        """구독을 멈추고 모든 연결을 닫습니다."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        for connection in list(self._subscribers[self.broadcast_channel]):
+            self.disconnect(connection, "shutdown")
+
+    async def connect(self, user_id: Any, company_id: Any = None) -> Optional[LocalConnection]:
+        """연결을 등록하고 구독이 반영된 뒤 돌려줍니다. 워커의 연결 수가 가득 차면 None"""
+        if self.connections >= self.max_connections:
+            return None
+        connection = LocalConnection(str(user_id), str(company_id) if company_id else None, self.max_pending)
+        self.connections += 1
+        self.stats["connected"] += 1
+        for channel in self._channels(connection):
+            self._subscribers.setdefault(channel, set()).add(connection)
+        await self._sync(unsubscribe=False)
+        return connection
+
+    def disconnect(self, connection: LocalConnection, reason: str = "disconnected") -> None:
+        """연결을 닫고 정리합니다 (이미 정리된 연결이면 아무것도 하지 않음)."""
+        connection.close(reason)
+        if connection not in self._subscribers.get(self.user_channel(connection.user_id), ()):
+            return
+        for channel in self._channels(connection):
+            connections = self._subscribers[channel]
+            connections.discard(connection)
+            if not connections and channel != self.broadcast_channel:
+                del self._subscribers[channel]
+        self.connections -= 1
+
+    def _channels(self, connection: LocalConnection) -> Iterator[str]:
+        yield self.broadcast_channel
+        yield self.user_channel(connection.user_id)
+        if connection.company_id:
+            yield self.company_channel(connection.company_id)
+
+    async def _sync(self, unsubscribe: bool = True) -> None:
+        """로컬 연결이 있는 채널과 실제 구독을 맞춥니다 (동시에 부르면 앞선 호출이 한꺼번에 처리)."""
+        # 같은 틱에 들어온 연결들이 먼저 등록되도록 한 번 양보해 SUBSCRIBE 를 묶음
+        await asyncio.sleep(0)
+        async with self._lock:
+            pubsub = self._pubsub
+            if pubsub is None:
+                # 재연결 중이면 연결된 뒤 모두 다시 구독함
+                return
+            subscribe = [channel for channel in self._subscribers if channel not in self._subscribed]
+            try:
+                for start in range(0, len(subscribe), _SUBSCRIBE_CHUNK):
+                    chunk = subscribe[start:start + _SUBSCRIBE_CHUNK]
+                    await pubsub.subscribe(*chunk)
+                    self._subscribed.update(chunk)
+                    self.stats["subscribes"] += 1
+                if unsubscribe:
+                    stale = [channel for channel in self._subscribed if channel not in self._subscribers]
+                    for start in range(0, len(stale), _SUBSCRIBE_CHUNK):
+                        chunk = stale[start:start + _SUBSCRIBE_CHUNK]
+                        await pubsub.unsubscribe(*chunk)
+                        self._subscribed.difference_update(chunk)
+            except (RedisError, OSError):
+                logger.warning("실시간 알림 구독 변경 실패", exc_info=True)
+
+    def _dispatch(self, channel: Any, data: Any) -> None:
+        connections = self._subscribers.get(channel.decode() if isinstance(channel, bytes) else channel)
+        if not connections:
+            return
+        message = data.decode() if isinstance(data, bytes) else data
+        for connection in list(connections):
+            if connection.push(message):
+                self.stats["delivered"] += 1
+            elif not connection.closed:
+                self.stats["slow_consumers"] += 1
+                logger.info(
+                    "느린 실시간 연결을 끊습니다", extra={"user_id": connection.user_id, "pending": connection.pending}
+                )
+                self.disconnect(connection, "slow_consumer")
+
+    async def _listen(self) -> None:
+        delay = 0.5
+        loop = asyncio.get_running_loop()
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                async with self._lock:
+                    await pubsub.subscribe(self.broadcast_channel)
+                    self._subscribed = {self.broadcast_channel}
+                    self._pubsub = pubsub
+                await self._sync()
+                self._ready.set()
+                delay = 0.5
+                next_sweep = loop.time() + self.sweep_interval
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.sweep_interval)
+                    if message is not None and message["type"] == "message":
+                        self._dispatch(message["channel"], message["data"])
+                    if loop.time() >= next_sweep:
+                        next_sweep = loop.time() + self.sweep_interval
+                        # 끊긴 채널 해제 + 실패했던 구독 재시도
+                        if self._subscribed != self._subscribers.keys():
+                            await self._sync()
+            except (RedisError, OSError):
+                logger.warning("실시간 알림 구독 실패, 재연결합니다", exc_info=True)
+                self._pubsub = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                self._pubsub = None
+                await pubsub.aclose()
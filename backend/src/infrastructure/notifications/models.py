@@ -0,0 +1,53 @@
+import json
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from domain.common.identifiers import uuid7
+
+class Audience(NamedTuple):
+    """알림 대상 (회사 안에서 아래 중 하나라도 해당하는 활성 구성원)"""
+    user_ids: Tuple[str, ...] = ()
+    team_ids: Tuple[str, ...] = ()
+    department_ids: Tuple[str, ...] = ()
+    everyone: bool = False  # 회사 전체 (공지 등)
+
+class Notification(NamedTuple):
+    id: str
+    company_id: str
+    category: str  # 예: announcement, task.assigned
+    title: str
+    body: str
+    audience: Audience
+    channels: Tuple[str, ...]
+    data: Optional[Dict[str, Any]] = None
+    # 같은 키의 알림은 사용자마다 coalesce_window 안에 한 번만 보냄 (없으면 id - 같은 알림의 중복 발행 방지)
+    coalesce_key: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls,
+        company_id: Any,
+        category: str,
+        title: str,
+        body: str,
+        audience: Audience,
+        channels: Tuple[str, ...],
+        data: Optional[Dict[str, Any]] = None,
+        coalesce_key: Optional[str] = None
+    ) -> "Notification":
+        return cls(
+            str(uuid7()), str(company_id), category, title, body, audience, tuple(channels), data, coalesce_key
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({**self._asdict(), "audience": self.audience._asdict()}, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, value: Any) -> "Notification":
+        fields = json.loads(value)
+        audience = Audience(**{key: tuple(item) if isinstance(item, list) else item
+                               for key, item in fields.pop("audience").items()})
+        return cls(**{**fields, "audience": audience, "channels": tuple(fields["channels"])})
+
+    def payload(self) -> Dict[str, Any]:
+        """채널로 보내는 내용 (대상 정보 제외)"""
+        return {"id": self.id, "category": self.category, "title": self.title, "body": self.body, "data": self.data or {}}
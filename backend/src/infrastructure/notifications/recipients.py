@@ -0,0 +1,143 @@
+from datetime import datetime
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, Iterable, List
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.identity.entities import CompanyUser, User, UserPushToken
+from .models import Audience
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+# 한 쿼리의 IN 목록 크기
+_IN_CLAUSE_SIZE = 1000
+
+def _uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+async def iter_recipient_batches(
+    session_factory: SessionFactory,
+    company_id: Any,
+    audience: Audience,
+    batch_size: int = 1000
+) -> AsyncIterator[List[str]]:
+    """대상 구성원의 사용자 id 를 batch_size 명씩
+
+    CompanyUser.id 순 keyset 페이지로 읽고 페이지마다 세션을 새로 열므로, 회사 전체
+    공지도 긴 트랜잭션이나 전체 목록을 메모리에 두지 않고 조직 구조에서 바로 펼칩니다.
+    """
+    conditions = [
+        CompanyUser.company_id == _uuid(company_id),
+        CompanyUser.use_yn == "Y", CompanyUser.delete_yn == "N",
+        User.use_yn == "Y", User.delete_yn == "N"
+    ]
+    if not audience.everyone:
+        targets = [
+            column.in_([_uuid(value) for value in values])
+            for column, values in (
+                (CompanyUser.user_id, audience.user_ids),
+                (CompanyUser.team_id, audience.team_ids),
+                (CompanyUser.department_id, audience.department_ids)
+            )
+            if values
+        ]
+        if not targets:
+            return
+        conditions.append(or_(*targets))
+
+    query = (
+        select(CompanyUser.id, CompanyUser.user_id)
+        .join(User, User.id == CompanyUser.user_id)
+        .where(*conditions)
+        .order_by(CompanyUser.id)
+        .limit(batch_size)
+    )
+    last_id = None
+    while True:
+        async with session_factory() as session:
+            page = (await session.execute(
+                query if last_id is None else query.where(CompanyUser.id > last_id)
+            )).all()
+        if not page:
+            return
+        yield [str(user_id) for _, user_id in page]
+        if len(page) < batch_size:
+            return
+        last_id = page[-1][0]
+
+class PushTokenStore:
+    """사용자 기기 푸시 토큰 (조회와 무효 토큰 정리를 묶음 단위로)"""
+
+    def __init__(self, session_factory: SessionFactory):
+        self._session_factory = session_factory
+
+    async def register(self, user_id: Any, token: str, platform: str) -> None:
+        """토큰을 등록합니다. 정리됐던 토큰이나 다른 사용자의 토큰이면 이 사용자로 다시 활성화합니다."""
+        async with self._session_factory() as session:
+            existing = (await session.execute(
+                select(UserPushToken).where(UserPushToken.token == token).execution_options(include_inactive=True)
+            )).scalar_one_or_none()
+            if existing is None:
+                session.add(UserPushToken(user_id=_uuid(user_id), token=token, platform=platform))
+                return
+            existing.user_id = _uuid(user_id)
+            existing.platform = platform
+            existing.use_yn, existing.delete_yn, existing.deleted_at = "Y", "N", None
+            existing.updated_at = datetime.utcnow()
+
+    async def tokens_for(self, user_ids: List[str]) -> Dict[str, List[str]]:
+        """사용자 id -> 활성 토큰 목록 (토큰이 없는 사용자는 빠짐)"""
+        tokens: Dict[str, List[str]] = {}
+        async with self._session_factory() as session:
+            for chunk in _chunks(list(user_ids), _IN_CLAUSE_SIZE):
+                rows = (await session.execute(
+                    select(UserPushToken.user_id, UserPushToken.token).where(
+                        UserPushToken.user_id.in_([_uuid(user_id) for user_id in chunk]),
+                        UserPushToken.use_yn == "Y", UserPushToken.delete_yn == "N"
+                    )
+                )).all()
+                for user_id, token in rows:
+                    tokens.setdefault(str(user_id), []).append(token)
+        return tokens
+
+    async def prune(self, tokens: Iterable[str]) -> int:
+        """무효 토큰을 한꺼번에 삭제 처리합니다 (IN 목록 _IN_CLAUSE_SIZE 개마다 UPDATE 한 번)."""
+        tokens = sorted(set(tokens))
+        if not tokens:
+            return 0
+        now = datetime.utcnow()
+        pruned = 0
+        async with self._session_factory() as session:
+            for chunk in _chunks(tokens, _IN_CLAUSE_SIZE):
+                result = await session.execute(
+                    update(UserPushToken)
+                    .where(UserPushToken.token.in_(chunk), UserPushToken.delete_yn == "N")
+                    .values(use_yn="N", delete_yn="Y", deleted_at=now, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                pruned += result.rowcount
+        return pruned
+
+def email_resolver(session_factory: SessionFactory) -> Callable[[List[str]], Awaitable[Dict[str, List[str]]]]:
+    """EmailChannel 용: 사용자 id 목록 -> 사용자 id 별 [이메일]"""
+
+    async def resolve(user_ids: List[str]) -> Dict[str, List[str]]:
+        addresses: Dict[str, List[str]] = {}
+        async with session_factory() as session:
+            for chunk in _chunks(list(user_ids), _IN_CLAUSE_SIZE):
+                rows = (await session.execute(
+                    select(User.id, User.email).where(
+                        User.id.in_([_uuid(user_id) for user_id in chunk]),
+                        User.use_yn == "Y", User.delete_yn == "N"
+                    )
+                )).all()
+                for user_id, email in rows:
+                    addresses[str(user_id)] = [email]
+        return addresses
+
+    return resolve
@@ -0,0 +1,13 @@
+"""
+레이트 리밋 모듈
+
+- Redis Lua 스크립트 기반 GCRA (레플리카 간 공유, 워커별 토큰 임대)
+"""
+
+from .gcra import GcraRateLimiter, RateLimit, RateLimitDecision
+
+__all__ = [
+    'GcraRateLimiter',
+    'RateLimit',
+    'RateLimitDecision'
+]
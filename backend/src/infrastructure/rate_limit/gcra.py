@@ -0,0 +1,226 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# GCRA: 키마다 TAT(다음 토큰이 정상적으로 도착할 시각, ms)만 저장합니다.
+# 요청한 토큰 수 중 지금 줄 수 있는 만큼만 주고 (로컬 임대), 하나도 없으면 거절합니다.
+# 여러 키는 모두 확인한 뒤에만 기록하므로, 한 키에서 거절되면 다른 키의 토큰도 쓰지 않습니다.
+# 시각은 Redis TIME 을 써서 레플리카 간 시계 차이의 영향을 받지 않습니다.
+#   ARGV: 키마다 (토큰 간격(ms), 버스트 허용치(ms), 요청 토큰 수)
+#   반환: 허용 시 키마다 {받은 토큰 수, 남은 토큰 수, 모두 회복까지(ms)}
+#         거절 시 {0, 거절된 키 번호, 모두 회복까지(ms), 재시도까지(ms)}
+_ACQUIRE = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+local tats = {}
+local result = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[i * 3 - 2])
+    local tolerance = tonumber(ARGV[i * 3 - 1])
+    local requested = tonumber(ARGV[i * 3])
+    local tat = tonumber(redis.call('GET', key) or '0')
+    if tat < now then
+        tat = now
+    end
+    local available = math.floor((now + tolerance + interval - tat) / interval)
+    local granted = math.min(requested, available)
+    if granted < 1 then
+        return {0, i, math.ceil(tat - now), math.ceil(tat - tolerance - now)}
+    end
+    tats[i] = tat + granted * interval
+    result[#result + 1] = granted
+    result[#result + 1] = available - granted
+    result[#result + 1] = math.ceil(tats[i] - now)
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, string.format('%.3f', tats[i]), 'PX', math.max(1, math.ceil(tats[i] - now)))
+end
+return result
+"""
+
+class RateLimit(NamedTuple):
+    """period 초에 limit 번 (burst 만큼은 한 번에 허용, 기본 limit)"""
+    limit: int
+    period: float = 60.0
+    burst: Optional[int] = None
+
+    @property
+    def interval_ms(self) -> float:
+        return self.period * 1000 / self.limit
+
+    @property
+    def tolerance_ms(self) -> float:
+        return self.interval_ms * ((self.burst or self.limit) - 1)
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # 한도가 모두 회복될 때까지(초)
+    retry_after: float  # 거절된 경우 다시 시도할 수 있을 때까지(초)
+
+class _Lease:
+    """키별로 Redis 에서 미리 받아 둔 토큰"""
+    __slots__ = ("tokens", "size", "remaining", "reset_at", "expires_at", "blocked_until")
+
+    def __init__(self, size: int):
+        self.tokens = 0
+        self.size = size
+        self.remaining = 0
+        self.reset_at = 0.0
+        self.expires_at = 0.0
+        self.blocked_until = 0.0
+
+class GcraRateLimiter:
+    """Redis Lua 스크립트 기반 GCRA 레이트 리미터 (워커별 토큰 임대)
+
+    - 모든 토큰은 Redis 에서 원자적으로 받으므로 레플리카/워커 수와 관계없이
+      한도를 넘지 않습니다.
+    - 요청마다 Redis 를 거치지 않도록 토큰을 몇 개씩 미리 받아 둡니다. 임대 크기는
+      1 에서 시작해 lease_ttl 안에 다 쓰는 (요청이 잦은) 키만 max_lease 까지 늘립니다.
+      lease_ttl 안에 쓰지 못한 토큰은 버리므로 실제 허용량은 한도보다 약간 적을 수 있습니다.
+    - 거절된 키는 재시도 시각까지 Redis 를 조회하지 않고 로컬에서 거절합니다.
+    - 여러 키(사용자, 회사 등)는 acquire_all() 로 한꺼번에 확인해, 거절된 요청이
+      다른 키의 한도를 쓰지 않도록 합니다.
+    - Redis 오류 시에는 요청을 허용합니다 (fail-open).
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        key_prefix: str = "ratelimit",
+        max_lease: int = 8,
+        lease_ttl: float = 1.0,
+        local_max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._acquire = redis.register_script(_ACQUIRE)
+        self._key_prefix = key_prefix
+        self._max_lease = max_lease
+        self._lease_ttl = lease_ttl
+        self._local_max_entries = local_max_entries
+        self._clock = clock
+        self._leases: "OrderedDict[str, _Lease]" = OrderedDict()
+        self.stats = {"local": 0, "redis": 0, "rejected": 0, "errors": 0}
+
+    def _lease(self, key: str) -> _Lease:
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease(1)
+            while len(self._leases) > self._local_max_entries:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
+
+    async def acquire(self, key: str, quota: RateLimit) -> RateLimitDecision:
+        """key 에서 토큰 하나를 사용합니다."""
+        return await self.acquire_all([(key, quota)])
+
+    async def acquire_all(self, limits: Sequence[Tuple[str, RateLimit]]) -> RateLimitDecision:
+        """모든 키에서 토큰을 하나씩 사용합니다.
+
+        한 키라도 거절되면 어느 키의 토큰도 쓰지 않고 그 키의 거절 결과를 돌려줍니다.
+        모두 허용되면 남은 토큰이 가장 적은 키의 결과를 돌려줍니다.
+        """
+        now = self._clock()
+        leases = [self._lease(key) for key, _ in limits]
+        for (_, quota), lease in zip(limits, leases):
+            if lease.blocked_until > now:
+                self.stats["rejected"] += 1
+                return RateLimitDecision(False, quota.limit, 0, lease.reset_at - now, lease.blocked_until - now)
+
+        # 로컬 임대가 있는 키는 Redis 를 기다리기 전에 토큰을 먼저 가져감
+        # (기다리는 동안 다른 요청이 같은 임대의 마지막 토큰을 쓰지 않도록)
+        refill = []
+        taken = []
+        for index, lease in enumerate(leases):
+            if lease.tokens > 0 and lease.expires_at > now:
+                lease.tokens -= 1
+                taken.append(lease)
+            else:
+                refill.append(index)
+        self.stats["local"] += len(taken)
+        if refill:
+            refilled = [leases[index] for index in refill]
+            try:
+                rejection = await self._refill([limits[index] for index in refill], refilled)
+            except BaseException:
+                self._give_back(taken)
+                raise
+            if rejection is not None:
+                if not rejection.allowed:
+                    self._give_back(taken)
+                return rejection
+            # _refill 이 돌아온 뒤 다른 요청이 끼어들 틈 없이 바로 가져감
+            for lease in refilled:
+                lease.tokens -= 1
+
+        now = self._clock()
+        decision = None
+        for (_, quota), lease in zip(limits, leases):
+            current = RateLimitDecision(True, quota.limit, lease.remaining + lease.tokens, lease.reset_at - now, 0.0)
+            if decision is None or current.remaining < decision.remaining:
+                decision = current
+        return decision
+
+    @staticmethod
+    def _give_back(leases: List[_Lease]) -> None:
+        for lease in leases:
+            lease.tokens += 1
+
+    async def _refill(
+        self,
+        limits: List[Tuple[str, RateLimit]],
+        leases: List[_Lease]
+    ) -> Optional[RateLimitDecision]:
+        """Redis 에서 임대를 받습니다. 거절되거나 Redis 오류면 돌려줄 결과, 받았으면 None"""
+        now = self._clock()
+        args: List[float] = []
+        for (_, quota), lease in zip(limits, leases):
+            # 임대가 유효한 동안 다 썼으면 늘리고, 남긴 채 만료되었으면 줄임
+            if lease.expires_at > now:
+                lease.size = min(lease.size * 2, self._max_lease, max(1, quota.limit // 10))
+            elif lease.tokens > 0:
+                lease.size = max(1, lease.size // 2)
+            if lease.expires_at <= now:
+                # 만료된 임대에 남은 토큰은 버림 (같은 키를 동시에 받는 요청의 토큰은 아래에서 더함)
+                lease.tokens = 0
+            args.extend((quota.interval_ms, quota.tolerance_ms, lease.size))
+
+        self.stats["redis"] += 1
+        try:
+            result = await self._acquire(keys=[f"{self._key_prefix}:{key}" for key, _ in limits], args=args)
+        except RedisError:
+            logger.warning(
+                "레이트 리밋 조회 실패, 요청을 허용합니다",
+                exc_info=True,
+                extra={"keys": [key for key, _ in limits]}
+            )
+            self.stats["errors"] += 1
+            quota = limits[0][1]
+            return RateLimitDecision(True, quota.limit, quota.limit, 0.0, 0.0)
+
+        now = self._clock()
+        if result[0] == 0:
+            _, index, reset_ms, retry_ms = result
+            quota, lease = limits[index - 1][1], leases[index - 1]
+            self.stats["rejected"] += 1
+            lease.tokens = 0
+            lease.reset_at = now + reset_ms / 1000
+            lease.blocked_until = now + retry_ms / 1000
+            return RateLimitDecision(False, quota.limit, 0, reset_ms / 1000, retry_ms / 1000)
+
+        for index, lease in enumerate(leases):
+            granted, remaining, reset_ms = result[index * 3:index * 3 + 3]
+            # 같은 키를 동시에 받은 경우 먼저 받은 토큰을 덮어쓰지 않음
+            lease.tokens += granted
+            lease.remaining = remaining
+            lease.reset_at = now + reset_ms / 1000
+            lease.expires_at = now + self._lease_ttl
+        return None
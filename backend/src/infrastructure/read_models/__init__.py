@@ -0,0 +1,25 @@
+"""
+읽기 모델 모듈
+
+- 회사 조직도 (로컬 메모리 + Redis, 변경분 반영)
+"""
+
+from .org_chart import (
+    OrgChart,
+    OrgChartChange,
+    OrgChartChangeTracker,
+    OrgMember,
+    load_org_chart,
+    record_org_chart_changes
+)
+from .org_chart_store import OrgChartStore
+
+__all__ = [
+    'OrgChart',
+    'OrgChartChange',
+    'OrgChartChangeTracker',
+    'OrgChartStore',
+    'OrgMember',
+    'load_org_chart',
+    'record_org_chart_changes'
+]
@@ -0,0 +1,304 @@
+import json
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import inspect, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from domain.identity.entities import (
+    Company,
+    CompanyDepartment,
+    CompanyPosition,
+    CompanyResponsibility,
+    CompanyTeam,
+    CompanyUser,
+    Department,
+    Position,
+    Responsibility,
+    Team,
+    User
+)
+from infrastructure.database import SessionChangeTracker
+
+logger = logging.getLogger(__name__)
+
+# 필드 이름 접두어 (Redis 해시 필드와 동일)
+#   d:/t:/p:/r:<unit_id> -> 조직 단위 이름
+#   u:<user_id>          -> 사용자 이름
+#   m:<company_user_id>  -> [user_id, emp_no, department_id, team_id, position_id, responsibility_id]
+UNIT_PREFIXES = {"department": "d", "team": "t", "position": "p", "responsibility": "r"}
+USER_PREFIX = "u"
+MEMBER_PREFIX = "m"
+
+# 조직 단위 엔티티, 회사 매핑 엔티티, 매핑의 외래키 속성
+_UNITS = (
+    ("department", Department, CompanyDepartment, "department_id"),
+    ("team", Team, CompanyTeam, "team_id"),
+    ("position", Position, CompanyPosition, "position_id"),
+    ("responsibility", Responsibility, CompanyResponsibility, "responsibility_id")
+)
+
+_MEMBER_ATTRIBUTES = ("user_id", "emp_no", "department_id", "team_id", "position_id", "responsibility_id")
+
+class OrgMember(NamedTuple):
+    id: str
+    user_id: str
+    emp_no: str
+    department_id: Optional[str]
+    team_id: Optional[str]
+    position_id: Optional[str]
+    responsibility_id: Optional[str]
+
+class OrgChart:
+    """회사 조직도 읽기 모델
+
+    조직 단위, 사용자 이름, 구성원을 필드 단위로 보관하므로 변경된 행만
+    set_field 로 반영할 수 있습니다.
+    """
+
+    __slots__ = ("company_id", "version", "units", "users", "members")
+
+    def __init__(self, company_id: str, version: int = 0):
+        self.company_id = company_id
+        self.version = version
+        self.units: Dict[str, Dict[str, str]] = {prefix: {} for prefix in UNIT_PREFIXES.values()}
+        self.users: Dict[str, str] = {}
+        self.members: Dict[str, OrgMember] = {}
+
+    def set_field(self, field: str, value: Optional[str]) -> None:
+        """필드 하나를 반영합니다 (value 가 None 이면 삭제)."""
+        prefix, _, key = field.partition(":")
+        if prefix == MEMBER_PREFIX:
+            if value is None:
+                self.members.pop(key, None)
+            else:
+                self.members[key] = OrgMember(key, *json.loads(value))
+            return
+        target = self.users if prefix == USER_PREFIX else self.units[prefix]
+        if value is None:
+            target.pop(key, None)
+        else:
+            target[key] = value
+
+    def to_fields(self) -> Dict[str, str]:
+        fields = {
+            f"{prefix}:{unit_id}": name
+            for prefix, units in self.units.items()
+            for unit_id, name in units.items()
+        }
+        fields.update((f"{USER_PREFIX}:{user_id}", name) for user_id, name in self.users.items())
+        fields.update(
+            (f"{MEMBER_PREFIX}:{member.id}", _member_value(member[1:]))
+            for member in self.members.values()
+        )
+        return fields
+
+    @classmethod
+    def from_fields(cls, company_id: str, fields: Dict[str, str], version: int = 0) -> "OrgChart":
+        chart = cls(company_id, version)
+        for field, value in fields.items():
+            chart.set_field(field, value)
+        return chart
+
+    def unit_ids(self) -> Iterable[str]:
+        for units in self.units.values():
+            yield from units
+
+    def members_of(self, kind: str, unit_id: str) -> List[OrgMember]:
+        """조직 단위(department/team/position/responsibility)에 속한 구성원"""
+        attribute = f"{kind}_id"
+        return [member for member in self.members.values() if getattr(member, attribute) == unit_id]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 표현"""
+        return {
+            "company_id": self.company_id,
+            "version": self.version,
+            **{
+                f"{kind}s" if kind != "responsibility" else "responsibilities": [
+                    {"id": unit_id, "name": name} for unit_id, name in self.units[prefix].items()
+                ]
+                for kind, prefix in UNIT_PREFIXES.items()
+            },
+            "members": [
+                {**member._asdict(), "name": self.users.get(member.user_id)}
+                for member in self.members.values()
+            ]
+        }
+
+def _member_value(values: Iterable[Any]) -> str:
+    return json.dumps([str(value) if value is not None else None for value in values], separators=(",", ":"))
+
+def _is_active(entity: Any) -> bool:
+    return entity.use_yn == "Y" and entity.delete_yn == "N"
+
+async def load_org_chart(session: AsyncSession, company_id: Any) -> OrgChart:
+    """DB에서 회사 조직도 전체를 만듭니다 (조직 단위 1회 + 구성원 1회 조회)."""
+    company_id = company_id if isinstance(company_id, UUID) else UUID(str(company_id))
+    unit_queries = [
+        select(literal(UNIT_PREFIXES[kind]).label("prefix"), entity.id, entity.name)
+        .join(mapping, getattr(mapping, key) == entity.id)
+        .where(
+            mapping.company_id == company_id,
+            mapping.use_yn == "Y", mapping.delete_yn == "N",
+            entity.use_yn == "Y", entity.delete_yn == "N"
+        )
+        for kind, entity, mapping, key in _UNITS
+    ]
+    member_query = (
+        select(CompanyUser.id, User.name, *(getattr(CompanyUser, name) for name in _MEMBER_ATTRIBUTES))
+        .join(User, User.id == CompanyUser.user_id)
+        .where(
+            CompanyUser.company_id == company_id,
+            CompanyUser.use_yn == "Y", CompanyUser.delete_yn == "N"
+        )
+    )
+
+    chart = OrgChart(str(company_id))
+    for prefix, unit_id, name in (await session.execute(union_all(*unit_queries))).all():
+        chart.units[prefix][str(unit_id)] = name
+    for member_id, user_name, *values in (await session.execute(member_query)).all():
+        member = OrgMember(str(member_id), *(str(value) if value is not None else None for value in values))
+        chart.members[member.id] = member
+        chart.users[member.user_id] = user_name
+    return chart
+
+class OrgChartChange(NamedTuple):
+    """조직도 필드 변경
+
+    company_id 가 None 이면 조직 단위 id 로 회사를 찾습니다 (단위 이름 변경).
+    field 가 INVALIDATE 이면 해당 회사 조직도를 버리고 다음 조회 때 다시 만듭니다.
+    """
+    company_id: Optional[str]
+    field: str
+    value: Optional[str] = None
+
+INVALIDATE = "*"
+
+_MAPPINGS = tuple(mapping for _, _, mapping, _ in _UNITS)
+_TRACKED = (CompanyUser, User, Company, *_MAPPINGS, *(unit for _, unit, _, _ in _UNITS))
+
+def _changed(entity: Any, *attributes: str) -> bool:
+    state = inspect(entity)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+def _moved_from(entity: Any) -> Optional[str]:
+    """company_id 가 바뀐 경우 이전 회사 id"""
+    previous = inspect(entity).attrs.company_id.history.deleted
+    return str(previous[0]) if previous and previous[0] is not None else None
+
+def _loaded(session: Session, entity: Any, primary_key: Any) -> Optional[Any]:
+    return session.identity_map.get(identity_key(entity, primary_key))
+
+def collect_changes(
+    session: Session,
+    entity: Any,
+    is_new: bool = False,
+    deleted: bool = False
+) -> List[OrgChartChange]:
+    """변경된 Identity 행을 조직도 필드 변경으로 바꿉니다.
+
+    flush 직전 상태(속성 history)를 기준으로 하므로 after_flush 에서 호출합니다.
+    필요한 값이 세션에 없으면 해당 회사 조직도를 무효화합니다.
+    """
+    if not isinstance(entity, _TRACKED):
+        return []
+    removed = deleted or not _is_active(entity)
+
+    if isinstance(entity, (CompanyUser, *_MAPPINGS)) and not is_new:
+        previous_company_id = _moved_from(entity)
+        if previous_company_id is not None:
+            # 다른 회사로 옮겨진 행은 양쪽 조직도를 다시 만듦
+            return [
+                OrgChartChange(previous_company_id, INVALIDATE),
+                OrgChartChange(str(entity.company_id), INVALIDATE)
+            ]
+
+    if isinstance(entity, CompanyUser):
+        company_id = str(entity.company_id)
+        field = f"{MEMBER_PREFIX}:{entity.id}"
+        if removed:
+            return [OrgChartChange(company_id, field, None)]
+        if not is_new and not _changed(entity, "use_yn", "delete_yn", *_MEMBER_ATTRIBUTES):
+            return []
+        user = _loaded(session, User, entity.user_id)
+        if user is None:
+            return [OrgChartChange(company_id, INVALIDATE)]
+        return [
+            OrgChartChange(company_id, f"{USER_PREFIX}:{entity.user_id}", user.name),
+            OrgChartChange(company_id, field, _member_value(getattr(entity, name) for name in _MEMBER_ATTRIBUTES))
+        ]
+
+    if isinstance(entity, User):
+        if removed or entity.company_id is None or not (is_new or _changed(entity, "name")):
+            return []
+        return [OrgChartChange(str(entity.company_id), f"{USER_PREFIX}:{entity.id}", entity.name)]
+
+    if isinstance(entity, Company):
+        return [OrgChartChange(str(entity.id), INVALIDATE)] if removed else []
+
+    for kind, unit, mapping, key in _UNITS:
+        prefix = UNIT_PREFIXES[kind]
+        if isinstance(entity, unit):
+            if is_new or (not removed and not _changed(entity, "name", "use_yn", "delete_yn")):
+                # 새 조직 단위는 회사 매핑 행이 추가될 때 반영
+                return []
+            return [OrgChartChange(None, f"{prefix}:{entity.id}", None if removed else entity.name)]
+        if isinstance(entity, mapping):
+            company_id = str(entity.company_id)
+            unit_id = getattr(entity, key)
+            if removed:
+                return [OrgChartChange(company_id, f"{prefix}:{unit_id}", None)]
+            if not is_new and not _changed(entity, "use_yn", "delete_yn", key):
+                return []
+            loaded = _loaded(session, unit, unit_id)
+            if loaded is None:
+                return [OrgChartChange(company_id, INVALIDATE)]
+            return [OrgChartChange(company_id, f"{prefix}:{unit_id}", loaded.name)]
+
+    return []
+
+_INFO_KEY = "org_chart_changes"
+
+def record_org_chart_changes(session: Any, changes: Iterable[OrgChartChange]) -> None:
+    """ORM flush 를 거치지 않는 변경(벌크 쿼리 등)을 커밋 후 반영하도록 기록합니다."""
+    session.info.setdefault(_INFO_KEY, []).extend(changes)
+
+class OrgChartChangeTracker(SessionChangeTracker):
+    """세션 이벤트로 Identity 변경을 모아 커밋 후 조직도 저장소에 반영합니다.
+
+    after_flush 에서 변경을 모으고, after_commit 에서 저장소 반영 작업을
+    이벤트 루프에 예약합니다. 롤백되면 모은 변경을 버립니다.
+    """
+
+    info_key = _INFO_KEY
+
+    def __init__(self, store: Any):
+        super().__init__()
+        self.store = store
+
+    def collect(self, session: Session) -> None:
+        changes = session.info.setdefault(_INFO_KEY, [])
+        for entity in session.new:
+            changes.extend(collect_changes(session, entity, is_new=True))
+        for entity in session.dirty:
+            changes.extend(collect_changes(session, entity))
+        for entity in session.deleted:
+            changes.extend(collect_changes(session, entity, deleted=True))
+
+    async def apply(self, changes: List[OrgChartChange]) -> None:
+        try:
+            await self.store.apply(changes)
+        except Exception:
+            # 반영에 실패한 회사는 TTL 이 지나거나 다음 변경 때 다시 만들어짐
+            logger.exception("조직도 변경 반영 실패", extra={"changes": len(changes)})
+            await self.store.invalidate_all(change.company_id for change in changes)
+
+def group_changes(changes: Iterable[OrgChartChange]) -> Dict[Optional[str], List[Tuple[str, Optional[str]]]]:
+    grouped: Dict[Optional[str], List[Tuple[str, Optional[str]]]] = {}
+    for change in changes:
+        grouped.setdefault(change.company_id, []).append((change.field, change.value))
+    return grouped
@@ -0,0 +1,218 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from redis.exceptions import WatchError
+
+from .org_chart import INVALIDATE, UNIT_PREFIXES, OrgChart, OrgChartChange, group_changes
+
+# Redis 해시의 메타 필드
+_BUILT_FIELD = "_built"  # 전체 조직도가 저장되었는지 (없으면 변경분만 쌓인 불완전한 해시)
+_VERSION_FIELD = "_v"  # 변경분을 반영할 때마다 증가
+
+_UNIT_FIELD_PREFIXES = tuple(f"{prefix}:" for prefix in UNIT_PREFIXES.values())
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+class OrgChartStore:
+    """회사별 조직도 저장소 (로컬 메모리 -> Redis -> DB)
+
+    Redis 에는 회사별 해시 하나에 필드 단위로 저장하므로 변경된 행만
+    HSET/HDEL 로 반영합니다. 로컬 캐시는 워커별 LRU 이며 local_ttl 동안만
+    사용하므로 다른 워커의 변경은 최대 local_ttl 만큼 늦게 보입니다.
+    부서/팀 등 조직 단위는 여러 회사가 함께 쓸 수 있으므로, 단위 이름 변경은
+    그 단위가 들어 있는 모든 회사 조직도에 반영합니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[OrgChart]],
+        redis: Optional[Any] = None,
+        local_ttl: float = 5.0,
+        local_max_entries: int = 1024,
+        redis_ttl: int = 24 * 60 * 60,
+        key_prefix: str = "org_chart",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._loader = loader
+        self._redis = redis
+        self._local_ttl = local_ttl
+        self._local_max_entries = local_max_entries
+        self._redis_ttl = redis_ttl
+        self._key_prefix = key_prefix
+        self._clock = clock
+        self._local: "OrderedDict[str, Tuple[float, OrgChart]]" = OrderedDict()
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+    def _key(self, company_id: str) -> str:
+        return f"{self._key_prefix}:{company_id}"
+
+    def _unit_key(self, unit_id: str) -> str:
+        # 조직 단위 id -> 그 단위가 들어 있는 조직도의 회사 id 집합 (단위 이름 변경 시 회사를 찾기 위함)
+        return f"{self._key_prefix}:unit:{unit_id}"
+
+    def _local_get(self, company_id: str) -> Optional[OrgChart]:
+        entry = self._local.get(company_id)
+        if entry is None:
+            return None
+        expires_at, chart = entry
+        if expires_at <= self._clock():
+            del self._local[company_id]
+            return None
+        self._local.move_to_end(company_id)
+        return chart
+
+    def _local_put(self, chart: OrgChart) -> None:
+        self._local[chart.company_id] = (self._clock() + self._local_ttl, chart)
+        self._local.move_to_end(chart.company_id)
+        while len(self._local) > self._local_max_entries:
+            self._local.popitem(last=False)
+
+    async def get(self, company_id: Any) -> OrgChart:
+        """조직도를 반환합니다 (캐시에 없을 때만 DB에서 만듦)."""
+        company_id = str(company_id)
+        chart = self._local_get(company_id)
+        if chart is not None:
+            self.stats["local_hits"] += 1
+            return chart
+
+        seen_version = None
+        if self._redis is not None:
+            fields = {_text(field): _text(value) for field, value in (await self._redis.hgetall(self._key(company_id))).items()}
+            seen_version = fields.pop(_VERSION_FIELD, None)
+            if fields.pop(_BUILT_FIELD, None) is not None:
+                chart = OrgChart.from_fields(company_id, fields, int(seen_version or 0))
+                self.stats["redis_hits"] += 1
+                self._local_put(chart)
+                return chart
+
+        self.stats["misses"] += 1
+        chart = await self._loader(company_id)
+        chart.version = int(seen_version or 0)
+        if await self._redis_put(chart, seen_version):
+            self._local_put(chart)
+        return chart
+
+    async def _redis_put(self, chart: OrgChart, seen_version: Optional[str]) -> bool:
+        """조직도 전체를 저장합니다.
+
+        DB에서 만드는 동안 변경분이 반영되었다면(버전이 바뀌었다면) 오래된
+        조직도로 덮어쓰지 않도록 저장하지 않습니다.
+        """
+        if self._redis is None:
+            return True
+        key = self._key(chart.company_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                current = await pipe.hget(key, _VERSION_FIELD)
+                if (_text(current) if current is not None else None) != seen_version:
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                pipe.hset(key, mapping={
+                    **chart.to_fields(),
+                    _BUILT_FIELD: "1",
+                    _VERSION_FIELD: str(chart.version)
+                })
+                pipe.expire(key, self._redis_ttl)
+                for unit_id in chart.unit_ids():
+                    self._index_unit(pipe, unit_id, chart.company_id)
+                await pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+    async def apply(self, changes: Iterable[OrgChartChange]) -> None:
+        """필드 변경을 로컬 캐시와 Redis 에 반영합니다."""
+        grouped = group_changes(changes)
+        for company_id, fields in (await self._resolve_companies(grouped.pop(None, []))).items():
+            grouped.setdefault(company_id, []).extend(fields)
+
+        for company_id, fields in grouped.items():
+            if any(field == INVALIDATE for field, _ in fields):
+                await self.invalidate(company_id)
+                continue
+
+            chart = self._local_get(company_id)
+            if chart is not None:
+                for field, value in fields:
+                    chart.set_field(field, value)
+                chart.version += 1
+
+            if self._redis is not None:
+                await self._redis_apply(company_id, fields)
+
+    async def _redis_apply(self, company_id: str, fields: List[Tuple[str, Optional[str]]]) -> None:
+        key = self._key(company_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for field, value in fields:
+                if value is None:
+                    pipe.hdel(key, field)
+                else:
+                    pipe.hset(key, field, value)
+                    if field.startswith(_UNIT_FIELD_PREFIXES):
+                        self._index_unit(pipe, field.partition(":")[2], company_id)
+            # 조직도가 없던 회사라면 _built 없는 불완전한 해시가 되어 다음 조회 때 다시 만듦
+            pipe.hincrby(key, _VERSION_FIELD, 1)
+            pipe.expire(key, self._redis_ttl)
+            await pipe.execute()
+
+    def _index_unit(self, pipe: Any, unit_id: str, company_id: str) -> None:
+        # 색인은 조직도와 같은 TTL 로 두어 조직도가 없어진 회사는 저절로 빠짐
+        key = self._unit_key(unit_id)
+        pipe.sadd(key, company_id)
+        pipe.expire(key, self._redis_ttl)
+
+    async def _resolve_companies(
+        self,
+        fields: List[Tuple[str, Optional[str]]]
+    ) -> Dict[str, List[Tuple[str, Optional[str]]]]:
+        """회사가 정해지지 않은 조직 단위 변경을 그 단위가 들어 있는 모든 회사에 나눕니다.
+
+        로컬 조직도와 Redis 색인에서 찾은 회사를 합칩니다.
+        """
+        companies: List[Set[str]] = []
+        for field, _ in fields:
+            prefix, _, unit_id = field.partition(":")
+            companies.append({
+                company_id for company_id, (_, chart) in self._local.items() if unit_id in chart.units[prefix]
+            })
+
+        if fields and self._redis is not None:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for field, _ in fields:
+                    pipe.smembers(self._unit_key(field.partition(":")[2]))
+                indexed = await pipe.execute()
+            # 색인은 회사에서 빠진 단위를 TTL 까지 남겨 두므로, 조직도에 아직 그 단위가 있는 회사만 씀
+            candidates = [
+                (index, company_id)
+                for index, members in enumerate(indexed)
+                for company_id in {_text(member) for member in members} - companies[index]
+            ]
+            if candidates:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for index, company_id in candidates:
+                        pipe.hexists(self._key(company_id), fields[index][0])
+                    exists = await pipe.execute()
+                for (index, company_id), found in zip(candidates, exists):
+                    if found:
+                        companies[index].add(company_id)
+
+        resolved: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+        for (field, value), company_ids in zip(fields, companies):
+            for company_id in company_ids:
+                resolved.setdefault(company_id, []).append((field, value))
+        return resolved
+
+    async def invalidate(self, company_id: Any) -> None:
+        """조직도를 버립니다 (다음 조회 때 DB에서 다시 만듦)."""
+        company_id = str(company_id)
+        self._local.pop(company_id, None)
+        if self._redis is not None:
+            await self._redis.delete(self._key(company_id))
+
+    async def invalidate_all(self, company_ids: Iterable[Optional[str]]) -> None:
+        for company_id in {company_id for company_id in company_ids if company_id is not None}:
+            await self.invalidate(company_id)
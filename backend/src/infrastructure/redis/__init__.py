@@ -0,0 +1,19 @@
+"""
+Redis 연동 모듈
+
+- 프로세스 공용 클라이언트 (REDIS_MAX_CONNECTIONS 크기의 블로킹 풀)
+- 동시 명령 자동 파이프라인 (micro-batching), 명령별 시간 제한
+- 풀/파이프라인 메트릭
+"""
+
+from .client import BLOCKING_COMMANDS, BatchingRedis, create_redis
+from .pool import InstrumentedConnectionPool, RedisMetrics, get_redis_metrics
+
+__all__ = [
+    'BLOCKING_COMMANDS',
+    'BatchingRedis',
+    'InstrumentedConnectionPool',
+    'RedisMetrics',
+    'create_redis',
+    'get_redis_metrics'
+]
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from typing import Any, List, Optional, Set, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from .pool import InstrumentedConnectionPool, RedisMetrics
+
+logger = logging.getLogger(__name__)
+
+# 서버에서 대기하는 명령은 다른 명령과 묶지 않고 자체 timeout 인자를 따름
+BLOCKING_COMMANDS = frozenset({
+    "BLPOP", "BRPOP", "BRPOPLPUSH", "BLMOVE", "BLMPOP", "BZPOPMIN", "BZPOPMAX", "BZMPOP",
+    "XREAD", "XREADGROUP", "WAIT", "WAITAOF"
+})
+
+_Pending = Tuple[Tuple[Any, ...], dict, "asyncio.Future[Any]"]
+
+class BatchingRedis(Redis):
+    """동시에 들어온 명령을 파이프라인 하나로 묶어 보내는 Redis 클라이언트
+
+    - 요청이 달라도 batch_window 초 안에 들어온 명령은 트랜잭션 없는 파이프라인
+      한 번(왕복 한 번)으로 보냅니다. max_batch_size 가 차면 바로 보냅니다.
+    - 명령마다 command_timeout 초 안에 응답이 없으면 redis TimeoutError 를
+      발생시킵니다 (API 에서는 REDIS_ERROR 로 응답).
+    - 명시적인 pipeline()/pubsub()/블로킹 명령은 묶지 않습니다.
+    - 명령 하나의 오류는 그 명령에만 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        command_timeout: Optional[float] = 1.0,
+        batch_window: float = 0.0005,
+        max_batch_size: int = 128,
+        metrics: Optional[RedisMetrics] = None,
+        name: str = "default",
+        **kwargs: Any
+    ):
+        super().__init__(**kwargs)
+        self.command_timeout = command_timeout
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.metrics = metrics
+        self.name = name
+        self._batch: List[_Pending] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._sending: Set["asyncio.Task[None]"] = set()
+        self.stats = {"commands": 0, "roundtrips": 0, "timeouts": 0}
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        if str(args[0]).upper() in BLOCKING_COMMANDS:
+            return await super().execute_command(*args, **options)
+
+        future = self._enqueue(args, options)
+        try:
+            # 시간 초과로 취소된 명령이 아직 보내지 않은 상태라면 배치에서 빠짐
+            return await asyncio.wait_for(future, self.command_timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            if self.metrics is not None:
+                self.metrics.observe_timeout(self.name)
+            raise RedisTimeoutError(f"Redis 명령 시간 초과 ({args[0]}, {self.command_timeout}초)")
+
+    def _enqueue(self, args: Tuple[Any, ...], options: dict) -> "asyncio.Future[Any]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((args, options, future))
+        if len(self._batch) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.batch_window > 0:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[_Pending]) -> None:
+        batch = [entry for entry in batch if not entry[2].done()]
+        if not batch:
+            return
+        self.stats["commands"] += len(batch)
+        self.stats["roundtrips"] += 1
+        if self.metrics is not None:
+            self.metrics.observe_batch(self.name, len(batch))
+
+        try:
+            if len(batch) == 1:
+                args, options, _ = batch[0]
+                try:
+                    results: List[Any] = [await super().execute_command(*args, **options)]
+                except Exception as e:
+                    results = [e]
+            else:
+                async with self.pipeline(transaction=False) as pipe:
+                    for args, options, _ in batch:
+                        pipe.execute_command(*args, **options)
+                    results = await pipe.execute(raise_on_error=False)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            # 연결 오류 등 파이프라인 전체 실패
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self, close_connection_pool: Optional[bool] = None) -> None:
+        self._flush()
+        if self._sending:
+            await asyncio.gather(*list(self._sending), return_exceptions=True)
+        await super().aclose(close_connection_pool)
+
+def create_redis(
+    url: str,
+    max_connections: int = 10,
+    pool_timeout: float = 5.0,
+    command_timeout: Optional[float] = 1.0,
+    batch_window: float = 0.0005,
+    max_batch_size: int = 128,
+    metrics: Optional[RedisMetrics] = None,
+    name: str = "default",
+    **connection_options: Any
+) -> BatchingRedis:
+    """프로세스에서 함께 쓰는 Redis 클라이언트를 만듭니다.
+
+    커넥션은 max_connections 개까지 만들고, 모두 사용 중이면 pool_timeout 초까지 기다립니다.
+    """
+    pool = InstrumentedConnectionPool.from_url(
+        url,
+        max_connections=max_connections,
+        timeout=pool_timeout,
+        **connection_options
+    )
+    pool.pool_metrics = metrics
+    pool.pool_name = name
+    client = BatchingRedis(
+        connection_pool=pool,
+        command_timeout=command_timeout,
+        batch_window=batch_window,
+        max_batch_size=max_batch_size,
+        metrics=metrics,
+        name=name
+    )
+    client.auto_close_connection_pool = True
+    return client
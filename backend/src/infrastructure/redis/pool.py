@@ -0,0 +1,133 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from redis.asyncio import BlockingConnectionPool
+from redis.exceptions import ConnectionError
+
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+class RedisMetrics:
+    """Redis 커넥션 풀/파이프라인 메트릭 모음
+
+    배치로 아낀 왕복 수는 redis_commands_total - redis_roundtrips_total 입니다.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        buckets: Iterable[float] = CHECKOUT_BUCKETS
+    ):
+        self.checkout_wait = Histogram(
+            "redis_pool_checkout_wait_seconds",
+            "Redis 커넥션 체크아웃 대기 시간(초)",
+            ["client"],
+            buckets=tuple(buckets),
+            registry=registry
+        )
+        self.checkout_timeouts = Counter(
+            "redis_pool_checkout_timeouts_total",
+            "풀 한도 초과로 체크아웃 대기 시간이 초과된 횟수",
+            ["client"],
+            registry=registry
+        )
+        self.in_use = Gauge(
+            "redis_pool_connections_in_use",
+            "체크아웃된 Redis 커넥션 수",
+            ["client"],
+            multiprocess_mode="livesum",
+            registry=registry
+        )
+        self.commands = Counter(
+            "redis_commands_total",
+            "Redis 명령 수",
+            ["client"],
+            registry=registry
+        )
+        self.roundtrips = Counter(
+            "redis_roundtrips_total",
+            "Redis 왕복 수 (파이프라인 하나가 한 번)",
+            ["client"],
+            registry=registry
+        )
+        self.batch_size = Histogram(
+            "redis_pipeline_batch_size",
+            "자동 파이프라인 한 번에 묶인 명령 수",
+            ["client"],
+            buckets=BATCH_SIZE_BUCKETS,
+            registry=registry
+        )
+        self.timeouts = Counter(
+            "redis_command_timeouts_total",
+            "시간 초과된 Redis 명령 수",
+            ["client"],
+            registry=registry
+        )
+        self._children: Dict[Any, Any] = {}
+
+    def _child(self, metric: Any, client: str) -> Any:
+        key = (id(metric), client)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(client)
+        return child
+
+    def observe_checkout(self, client: str, seconds: float) -> None:
+        self._child(self.checkout_wait, client).observe(seconds)
+
+    def observe_checkout_timeout(self, client: str) -> None:
+        self._child(self.checkout_timeouts, client).inc()
+
+    def in_use_for(self, client: str) -> Any:
+        return self._child(self.in_use, client)
+
+    def observe_batch(self, client: str, size: int) -> None:
+        self._child(self.commands, client).inc(size)
+        self._child(self.roundtrips, client).inc()
+        self._child(self.batch_size, client).observe(size)
+
+    def observe_timeout(self, client: str) -> None:
+        self._child(self.timeouts, client).inc()
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """체크아웃 대기 시간과 사용 중인 커넥션 수를 기록하는 BlockingConnectionPool
+
+    max_connections 를 넘으면 예외 대신 timeout 초까지 빈 커넥션을 기다립니다.
+    """
+
+    pool_metrics: Optional[RedisMetrics] = None
+    pool_name: str = "default"
+
+    async def get_connection(self, command_name: Any, *keys: Any, **options: Any) -> Any:
+        metrics = self.pool_metrics
+        if metrics is None:
+            return await super().get_connection(command_name, *keys, **options)
+
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(command_name, *keys, **options)
+        except ConnectionError as e:
+            # 풀 대기 시간 초과 (연결 실패와 구분)
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                metrics.observe_checkout_timeout(self.pool_name)
+            raise
+        finally:
+            metrics.observe_checkout(self.pool_name, time.perf_counter() - started)
+        metrics.in_use_for(self.pool_name).inc()
+        return connection
+
+    async def release(self, connection: Any) -> None:
+        await super().release(connection)
+        if self.pool_metrics is not None:
+            self.pool_metrics.in_use_for(self.pool_name).dec()
+
+_redis_metrics: Optional[RedisMetrics] = None
+
+def get_redis_metrics() -> RedisMetrics:
+    """기본 레지스트리에 등록된 RedisMetrics 인스턴스를 반환합니다."""
+    global _redis_metrics
+    if _redis_metrics is None:
+        _redis_metrics = RedisMetrics()
+    return _redis_metrics
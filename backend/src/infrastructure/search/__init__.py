@@ -0,0 +1,50 @@
+"""
+검색 색인 모듈
+
+- User/Company/CompanyUser/Team 변경을 세션 이벤트로 모아 커밋 후 색인 큐에 추가
+- Elasticsearch bulk 색인기 (크기/시간 기준 배치, 재시도, dead letter 파일)
+- 회사별 직원 자동완성 색인 (워커 메모리, 초성 검색, Elasticsearch fallback)
+"""
+
+from .autocomplete import (
+    CompanyDirectory,
+    DirectoryEntry,
+    DirectoryIndex,
+    PrefixIndex,
+    decompose,
+    elasticsearch_user_search,
+    initials,
+    load_company_directory,
+    normalize
+)
+from .bulk_indexer import BulkIndexer, load_dead_letters
+from .documents import (
+    DELETE,
+    INDEX,
+    UPDATE,
+    SearchAction,
+    SearchChangeTracker,
+    build_document,
+    record_search_actions
+)
+
+__all__ = [
+    'BulkIndexer',
+    'CompanyDirectory',
+    'DELETE',
+    'DirectoryEntry',
+    'DirectoryIndex',
+    'INDEX',
+    'PrefixIndex',
+    'SearchAction',
+    'SearchChangeTracker',
+    'UPDATE',
+    'build_document',
+    'decompose',
+    'elasticsearch_user_search',
+    'initials',
+    'load_company_directory',
+    'load_dead_letters',
+    'normalize',
+    'record_search_actions'
+]
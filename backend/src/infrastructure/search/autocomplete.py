@@ -0,0 +1,560 @@
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.identity.entities import CompanyTeam, CompanyUser, Team, User
+
+from .documents import DELETE, SearchAction
+
+logger = logging.getLogger(__name__)
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_COUNT = 11172
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 겹모음/겹받침은 입력 순서대로 나눔 ("고" 입력 중에도 "과"가 찾아지도록)
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ"
+}
+_CONSONANTS = frozenset(CHOSEONG)
+
+def normalize(text: str) -> str:
+    """NFC + 소문자 + 공백 정리 (NFKC 는 호환 자모를 조합용 자모로 바꾸므로 쓰지 않음)"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+def _decompose_syllable(code: int) -> str:
+    initial, rest = divmod(code - _SYLLABLE_BASE, 21 * 28)
+    medial, final = divmod(rest, 28)
+    jamo = CHOSEONG[initial] + JUNGSEONG[medial] + JONGSEONG[final]
+    return "".join(_COMPOUND_JAMO.get(char, char) for char in jamo)
+
+class _Initials(dict):
+    def __missing__(self, code: int) -> None:
+        return None  # 한글 음절이 아니면 버림
+
+# str.translate 용 표 (음절마다 계산하지 않도록 미리 만듦)
+_DECOMPOSE_TABLE = {
+    **{ord(char): jamo for char, jamo in _COMPOUND_JAMO.items()},
+    **{code: _decompose_syllable(code) for code in range(_SYLLABLE_BASE, _SYLLABLE_BASE + _SYLLABLE_COUNT)}
+}
+_INITIALS_TABLE = _Initials(
+    (code, CHOSEONG[(code - _SYLLABLE_BASE) // (21 * 28)])
+    for code in range(_SYLLABLE_BASE, _SYLLABLE_BASE + _SYLLABLE_COUNT)
+)
+_HANGUL_WORD = re.compile("[\uac00-\ud7a3]+")
+
+def decompose(text: str) -> str:
+    """한글 음절을 자모로 풉니다 ("김민" -> "ㄱㅣㅁㅁㅣㄴ"). 입력 중인 음절도 접두어로 맞출 수 있습니다."""
+    return text.translate(_DECOMPOSE_TABLE)
+
+def initials(text: str) -> str:
+    """한글 음절의 초성 ("김민수" -> "ㄱㅁㅅ"), 한글이 아닌 글자는 버림"""
+    return text.translate(_INITIALS_TABLE)
+
+def is_initials_query(text: str) -> bool:
+    return bool(text) and all(char in _CONSONANTS for char in text if char != " ")
+
+_SEPARATOR = "\0"
+
+class PrefixIndex:
+    """정렬 배열 접두어 색인 (key, value 쌍)
+
+    "key\0value" 문자열을 block_size 개 안팎의 정렬 블록으로 나눠 보관합니다. 찾기는
+    bisect 두 번과 연속 구간 읽기이고, 추가/삭제는 블록 하나 안에서만 원소를 옮깁니다.
+    같은 key 가 많아도 (팀 이름 등) 삭제할 쌍을 bisect 로 바로 찾습니다.
+    """
+
+    __slots__ = ("_block_size", "_blocks", "_firsts")
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]] = (), block_size: int = 512):
+        items = sorted(f"{key}{_SEPARATOR}{value}" for key, value in pairs)
+        self._block_size = block_size
+        self._blocks = [items[start:start + block_size] for start in range(0, len(items), block_size)]
+        self._firsts = [block[0] for block in self._blocks]  # 블록별 첫 원소
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def add(self, key: str, value: str) -> None:
+        item = f"{key}{_SEPARATOR}{value}"
+        if not self._blocks:
+            self._blocks.append([item])
+            self._firsts.append(item)
+            return
+        index = max(bisect_right(self._firsts, item) - 1, 0)
+        block = self._blocks[index]
+        insort(block, item)
+        self._firsts[index] = block[0]
+        if len(block) > 2 * self._block_size:
+            # 블록을 반으로 나눔
+            self._blocks.insert(index + 1, block[self._block_size:])
+            self._firsts.insert(index + 1, block[self._block_size])
+            del block[self._block_size:]
+
+    def discard(self, key: str, value: str) -> None:
+        item = f"{key}{_SEPARATOR}{value}"
+        index = bisect_right(self._firsts, item) - 1
+        if index < 0:
+            return
+        block = self._blocks[index]
+        position = bisect_left(block, item)
+        if position == len(block) or block[position] != item:
+            return
+        del block[position]
+        if block:
+            self._firsts[index] = block[0]
+        else:
+            del self._blocks[index], self._firsts[index]
+
+    def search(self, prefix: str) -> Iterator[str]:
+        """prefix 로 시작하는 key 의 value (key 순서, 중복 가능)"""
+        index = max(bisect_left(self._firsts, prefix) - 1, 0)
+        position = bisect_left(self._blocks[index], prefix) if self._blocks else 0
+        while index < len(self._blocks):
+            block = self._blocks[index]
+            while position < len(block):
+                item = block[position]
+                if not item.startswith(prefix):
+                    return
+                yield item[item.rindex(_SEPARATOR) + 1:]
+                position += 1
+            index += 1
+            position = 0
+
+class DirectoryEntry(NamedTuple):
+    id: str  # company_user id
+    user_id: str
+    name: str
+    email: str
+    emp_no: str
+    team_id: Optional[str] = None
+
+def entry_keys(entry: DirectoryEntry, team_name: Optional[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """(자모 key, 초성 key) — 이름/이름 단어/성을 뺀 이름, 이메일, 사번, 팀 이름"""
+    name = normalize(entry.name)
+    words = {name, *name.split()}
+    if len(name) > 2 and _HANGUL_WORD.fullmatch(name):
+        words.add(name[1:])  # "민수" 로도 "김민수" 를 찾도록
+    keys = {decompose(word) for word in words}
+    keys.update(normalize(value) for value in (entry.email, entry.emp_no) if value)
+    if team_name:
+        team = normalize(team_name)
+        keys.update(decompose(word) for word in {team, *team.split()})
+    keys.discard("")
+    initial_keys = {initials(word) for word in words}
+    initial_keys.discard("")
+    return tuple(sorted(keys)), tuple(sorted(initial_keys))
+
+class CompanyDirectory:
+    """회사 하나의 직원 자동완성 색인
+
+    자모로 푼 key 와 초성 key 를 각각 정렬 배열에 보관합니다. 팀 이름은
+    DirectoryIndex 의 모든 회사가 공유하는 team_names 에서 찾습니다.
+    """
+
+    __slots__ = ("company_id", "entries", "team_names", "_entry_keys", "_user_members", "_team_members",
+                 "_keys", "_initials")
+
+    def __init__(
+        self,
+        company_id: str,
+        entries: Iterable[DirectoryEntry] = (),
+        team_names: Optional[Dict[str, str]] = None
+    ):
+        self.company_id = company_id
+        self.entries: Dict[str, DirectoryEntry] = {}
+        self.team_names = team_names if team_names is not None else {}
+        self._entry_keys: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self._user_members: Dict[str, Set[str]] = {}
+        self._team_members: Dict[str, Set[str]] = {}
+        pairs: List[Tuple[str, str]] = []
+        initial_pairs: List[Tuple[str, str]] = []
+        for entry in entries:
+            keys, initial_keys = self._register(entry)
+            pairs.extend((key, entry.id) for key in keys)
+            initial_pairs.extend((key, entry.id) for key in initial_keys)
+        self._keys = PrefixIndex(pairs)
+        self._initials = PrefixIndex(initial_pairs)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _register(self, entry: DirectoryEntry) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        self.entries[entry.id] = entry
+        self._user_members.setdefault(entry.user_id, set()).add(entry.id)
+        if entry.team_id is not None:
+            self._team_members.setdefault(entry.team_id, set()).add(entry.id)
+        keys = self._entry_keys[entry.id] = entry_keys(entry, self.team_names.get(entry.team_id))
+        return keys
+
+    def put(self, entry: DirectoryEntry) -> None:
+        self.remove(entry.id)
+        keys, initial_keys = self._register(entry)
+        for key in keys:
+            self._keys.add(key, entry.id)
+        for key in initial_keys:
+            self._initials.add(key, entry.id)
+
+    def remove(self, member_id: str) -> Optional[DirectoryEntry]:
+        entry = self.entries.pop(member_id, None)
+        if entry is None:
+            return None
+        keys, initial_keys = self._entry_keys.pop(member_id)
+        for key in keys:
+            self._keys.discard(key, member_id)
+        for key in initial_keys:
+            self._initials.discard(key, member_id)
+        _discard(self._user_members, entry.user_id, member_id)
+        if entry.team_id is not None:
+            _discard(self._team_members, entry.team_id, member_id)
+        return entry
+
+    def members_of_user(self, user_id: str) -> List[DirectoryEntry]:
+        return [self.entries[member_id] for member_id in self._user_members.get(user_id, ())]
+
+    def has_team(self, team_id: str) -> bool:
+        return team_id in self._team_members
+
+    def reindex_team(self, team_id: str) -> None:
+        """팀 이름이 바뀐 뒤 팀 구성원의 key 를 다시 만듭니다."""
+        for member_id in list(self._team_members.get(team_id, ())):
+            self.put(self.entries[member_id])
+
+    def search(self, query: str, limit: int = 10) -> List[DirectoryEntry]:
+        text = normalize(query)
+        if not text:
+            return []
+        if is_initials_query(text):
+            matches = self._initials.search(text.replace(" ", ""))
+        else:
+            matches = self._keys.search(decompose(text))
+        results: List[DirectoryEntry] = []
+        seen: Set[str] = set()
+        for member_id in matches:
+            if member_id in seen:
+                continue
+            seen.add(member_id)
+            results.append(self.entries[member_id])
+            if len(results) >= limit:
+                break
+        return results
+
+    def to_dict(self, entry: DirectoryEntry) -> Dict[str, Any]:
+        """API 응답용 표현"""
+        return {**entry._asdict(), "team_name": self.team_names.get(entry.team_id)}
+
+def _discard(mapping: Dict[str, Set[str]], key: str, value: str) -> None:
+    values = mapping.get(key)
+    if values is not None:
+        values.discard(value)
+        if not values:
+            del mapping[key]
+
+def _text(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+async def load_company_directory(
+    session: AsyncSession,
+    company_id: Any
+) -> Tuple[List[DirectoryEntry], Dict[str, str]]:
+    """DB에서 회사의 활성 구성원과 팀 이름을 읽습니다 (구성원 1회 + 팀 1회 조회)."""
+    company_id = company_id if isinstance(company_id, UUID) else UUID(str(company_id))
+    member_query = (
+        select(CompanyUser.id, CompanyUser.user_id, User.name, User.email, CompanyUser.emp_no, CompanyUser.team_id)
+        .join(User, User.id == CompanyUser.user_id)
+        .where(
+            CompanyUser.company_id == company_id,
+            CompanyUser.use_yn == "Y", CompanyUser.delete_yn == "N",
+            User.use_yn == "Y", User.delete_yn == "N"
+        )
+    )
+    team_query = (
+        select(Team.id, Team.name)
+        .join(CompanyTeam, CompanyTeam.team_id == Team.id)
+        .where(
+            CompanyTeam.company_id == company_id,
+            CompanyTeam.use_yn == "Y", CompanyTeam.delete_yn == "N",
+            Team.use_yn == "Y", Team.delete_yn == "N"
+        )
+    )
+    entries = [
+        DirectoryEntry(str(member_id), str(user_id), name, email, emp_no, _text(team_id))
+        for member_id, user_id, name, email, emp_no, team_id in (await session.execute(member_query)).all()
+    ]
+    teams = {str(team_id): name for team_id, name in (await session.execute(team_query)).all()}
+    return entries, teams
+
+def elasticsearch_user_search(client: Any, index_prefix: str = "") -> Callable[[str, str, int], Awaitable[List[str]]]:
+    """Elasticsearch users 색인에서 오타를 허용해 찾은 사용자 id (DirectoryIndex fallback 용)"""
+
+    async def search(company_id: str, query: str, limit: int) -> List[str]:
+        response = await client.search(
+            index=f"{index_prefix}users",
+            query={
+                "bool": {
+                    "filter": [{"match": {"company_id": {"query": company_id, "operator": "and"}}}],
+                    "must": [{
+                        "multi_match": {"query": query, "fields": ["name^3", "email", "emp_no"], "fuzziness": "AUTO"}
+                    }]
+                }
+            },
+            size=limit,
+            source=False
+        )
+        return [hit["_id"] for hit in response["hits"]["hits"]]
+
+    return search
+
+# 회사별로 모은 변경: ("member", company_user id, 필드 또는 None=삭제), ("user", user id, 필드), ("team", team id, None)
+_Change = Tuple[str, str, Optional[Dict[str, Any]]]
+
+class DirectoryIndex:
+    """회사별 직원 자동완성 색인 (워커 메모리)
+
+    - 회사를 처음 검색할 때 DB에서 만들고, 커밋된 변경은 SearchChangeTracker 로 받아 바로 반영합니다.
+    - 다른 워커의 변경은 ttl 이 지나 다시 만들 때 반영됩니다 (만드는 동안은 기존 색인으로 응답).
+    - 한 번에 rebuild_threshold 개보다 많이 바뀐 회사(직원 가져오기 등)는 버리고 다시 만듭니다.
+    - 접두어로 찾지 못한 검색어(오타 등)는 fallback(Elasticsearch)으로 찾습니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[Tuple[List[DirectoryEntry], Dict[str, str]]]],
+        fallback: Optional[Callable[[str, str, int], Awaitable[List[str]]]] = None,
+        ttl: float = 300.0,
+        max_companies: int = 64,
+        rebuild_threshold: int = 1000,
+        fallback_min_length: int = 2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._loader = loader
+        self._fallback = fallback
+        self._ttl = ttl
+        self._max_companies = max_companies
+        self._rebuild_threshold = rebuild_threshold
+        self._fallback_min_length = fallback_min_length
+        self._clock = clock
+        self._directories: "OrderedDict[str, Tuple[float, CompanyDirectory]]" = OrderedDict()
+        self._loading: Dict[str, "asyncio.Task[CompanyDirectory]"] = {}
+        # 만드는 동안 들어온 변경 (다 만든 뒤 다시 반영)
+        self._replay: Dict[str, List[SearchAction]] = {}
+        self._team_names: Dict[str, str] = {}
+        self._member_company: Dict[str, str] = {}
+        self._user_companies: Dict[str, Set[str]] = {}
+        self.stats = {"searches": 0, "loads": 0, "fallbacks": 0}
+
+    async def get(self, company_id: Any) -> CompanyDirectory:
+        company_id = str(company_id)
+        cached = self._directories.get(company_id)
+        if cached is None:
+            return await asyncio.shield(self._load(company_id))
+        built_at, directory = cached
+        self._directories.move_to_end(company_id)
+        if self._clock() - built_at >= self._ttl:
+            self._load(company_id)
+        return directory
+
+    async def search(self, company_id: Any, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """이름/이메일/사번/팀 이름 접두어(초성 포함)로 구성원을 찾습니다."""
+        self.stats["searches"] += 1
+        directory = await self.get(company_id)
+        entries = directory.search(query, limit)
+        if entries or self._fallback is None or len(normalize(query)) < self._fallback_min_length:
+            return [directory.to_dict(entry) for entry in entries]
+
+        self.stats["fallbacks"] += 1
+        try:
+            user_ids = await self._fallback(directory.company_id, query, limit)
+        except Exception as e:
+            logger.warning("직원 검색 fallback 실패", extra={"company_id": directory.company_id, "error": str(e)})
+            return []
+        # 색인에 있는 (활성) 구성원만
+        results = [directory.to_dict(entry) for user_id in user_ids for entry in directory.members_of_user(user_id)]
+        return results[:limit]
+
+    def invalidate(self, company_id: Any) -> None:
+        """회사 색인을 버립니다 (다음 검색 때 DB에서 다시 만듦)."""
+        cached = self._directories.pop(str(company_id), None)
+        if cached is not None:
+            self._forget(cached[1])
+
+    def _load(self, company_id: str) -> "asyncio.Task[CompanyDirectory]":
+        task = self._loading.get(company_id)
+        if task is None:
+            self._replay[company_id] = []
+            task = asyncio.get_running_loop().create_task(self._build(company_id))
+            self._loading[company_id] = task
+            task.add_done_callback(lambda done: self._loaded(company_id, done))
+        return task
+
+    def _loaded(self, company_id: str, task: "asyncio.Task[CompanyDirectory]") -> None:
+        self._loading.pop(company_id, None)
+        self._replay.pop(company_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("직원 검색 색인 생성 실패", extra={"company_id": company_id, "error": str(task.exception())})
+
+    async def _build(self, company_id: str) -> CompanyDirectory:
+        self.stats["loads"] += 1
+        entries, team_names = await self._loader(company_id)
+        self._team_names.update(team_names)
+        # 5만 명 기준 1초 남짓 걸리므로 이벤트 루프를 막지 않도록 스레드에서 만듦
+        directory = await asyncio.get_running_loop().run_in_executor(
+            None, CompanyDirectory, company_id, entries, self._team_names
+        )
+
+        self.invalidate(company_id)
+        self._directories[company_id] = (self._clock(), directory)
+        for entry in directory.entries.values():
+            self._remember(company_id, entry)
+        while len(self._directories) > self._max_companies:
+            _, (_, evicted) = self._directories.popitem(last=False)
+            self._forget(evicted)
+
+        replay = self._replay.pop(company_id, [])
+        if replay:
+            self._apply(replay, only=company_id)
+        return directory
+
+    def _remember(self, company_id: str, entry: DirectoryEntry) -> None:
+        self._member_company[entry.id] = company_id
+        self._user_companies.setdefault(entry.user_id, set()).add(company_id)
+
+    def _forget(self, directory: CompanyDirectory) -> None:
+        for entry in directory.entries.values():
+            self._member_company.pop(entry.id, None)
+            _discard(self._user_companies, entry.user_id, directory.company_id)
+
+    def submit(self, actions: Iterable[SearchAction]) -> None:
+        """커밋된 검색 문서 변경을 반영합니다 (SearchChangeTracker 에서 호출)."""
+        actions = list(actions)
+        for pending in self._replay.values():
+            pending.extend(actions)
+        self._apply(actions)
+
+    def _apply(self, actions: List[SearchAction], only: Optional[str] = None) -> None:
+        # 팀 이름과 이번 변경의 사용자 정보를 먼저 모음 (같은 커밋의 새 사용자/팀을 구성원이 참조)
+        user_docs: Dict[str, Dict[str, Any]] = {}
+        grouped: Dict[str, List[_Change]] = {}
+        for action in actions:
+            if action.index == "teams":
+                if action.op == DELETE:
+                    self._team_names.pop(action.id, None)
+                elif "name" in action.doc:
+                    self._team_names[action.id] = action.doc["name"]
+                for company_id, (_, directory) in self._directories.items():
+                    if directory.has_team(action.id):
+                        grouped.setdefault(company_id, []).append(("team", action.id, None))
+            elif action.index == "users":
+                if action.op == DELETE:
+                    for company_id in self._user_companies.get(action.id, ()):
+                        directory = self._directories[company_id][1]
+                        grouped.setdefault(company_id, []).extend(
+                            ("member", entry.id, None) for entry in directory.members_of_user(action.id)
+                        )
+                    continue
+                fields = {field: action.doc[field] for field in ("name", "email") if field in action.doc}
+                user_docs[action.id] = {**user_docs.get(action.id, {}), **fields}
+                for company_id in self._user_companies.get(action.id, ()):
+                    grouped.setdefault(company_id, []).append(("user", action.id, fields))
+            elif action.index == "company_users":
+                self._route_member(action, grouped)
+
+        for company_id, changes in grouped.items():
+            if only is not None and company_id != only:
+                continue
+            cached = self._directories.get(company_id)
+            if cached is None:
+                continue
+            if len(changes) > self._rebuild_threshold:
+                self.invalidate(company_id)
+                continue
+            if not self._apply_changes(cached[1], changes, user_docs):
+                # 새 구성원의 사용자 정보를 알 수 없음
+                self.invalidate(company_id)
+
+    def _route_member(self, action: SearchAction, grouped: Dict[str, List[_Change]]) -> None:
+        current = self._member_company.get(action.id)
+        if action.op == DELETE:
+            if current is not None:
+                grouped.setdefault(current, []).append(("member", action.id, None))
+            return
+        fields = {**(action.upsert or {}), **action.doc}
+        company_id = _text(fields.get("company_id")) or current
+        if current is not None and company_id != current:
+            # 다른 회사로 옮겨진 구성원
+            grouped.setdefault(current, []).append(("member", action.id, None))
+        if company_id is not None:
+            grouped.setdefault(company_id, []).append(("member", action.id, fields))
+
+    def _apply_changes(
+        self,
+        directory: CompanyDirectory,
+        changes: List[_Change],
+        user_docs: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        company_id = directory.company_id
+        for kind, key, fields in changes:
+            if kind == "team":
+                directory.reindex_team(key)
+            elif kind == "user":
+                for entry in directory.members_of_user(key):
+                    directory.put(entry._replace(**fields))
+            elif fields is None:
+                removed = directory.remove(key)
+                if removed is not None:
+                    self._member_company.pop(key, None)
+                    if not directory.members_of_user(removed.user_id):
+                        _discard(self._user_companies, removed.user_id, company_id)
+            else:
+                entry = self._member_entry(directory, key, fields, user_docs)
+                if entry is None:
+                    return False
+                directory.put(entry)
+                self._remember(company_id, entry)
+        return True
+
+    def _member_entry(
+        self,
+        directory: CompanyDirectory,
+        member_id: str,
+        fields: Dict[str, Any],
+        user_docs: Dict[str, Dict[str, Any]]
+    ) -> Optional[DirectoryEntry]:
+        existing = directory.entries.get(member_id)
+        user_id = _text(fields.get("user_id")) or (existing.user_id if existing else None)
+        if user_id is None:
+            return None
+        user = dict(user_docs.get(user_id, {}))
+        if existing is not None and existing.user_id == user_id:
+            user = {"name": existing.name, "email": existing.email, **user}
+        elif "name" not in user or "email" not in user:
+            known = next(
+                (entry for company_id in self._user_companies.get(user_id, ())
+                 for entry in self._directories[company_id][1].members_of_user(user_id)),
+                None
+            )
+            if known is None:
+                return None
+            user = {"name": known.name, "email": known.email, **user}
+        return DirectoryEntry(
+            member_id,
+            user_id,
+            user["name"],
+            user["email"],
+            fields["emp_no"] if "emp_no" in fields else existing.emp_no if existing else "",
+            _text(fields["team_id"]) if "team_id" in fields else existing.team_id if existing else None
+        )
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .documents import DELETE, INDEX, SearchAction, merge_actions
+
+logger = logging.getLogger(__name__)
+
+# 다시 보내면 성공할 수 있는 항목 상태 코드
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class BulkIndexer:
+    """검색 문서 변경을 모아 Elasticsearch bulk API 로 보내는 백그라운드 색인기
+
+    - 같은 문서의 변경은 큐에서 하나로 합칩니다 (나중 변경 우선).
+    - batch_size 개가 모이거나 flush_interval 초가 지나면 보냅니다.
+    - 실패한 문서는 지수 백오프로 max_retries 번까지 다시 보내고, 그래도 실패하거나
+      재시도해도 소용없는 오류(매핑 오류 등)는 dead letter 파일(JSON lines)에 남깁니다.
+    - submit() 은 큐에 넣기만 하며 기다리지 않습니다. 큐가 max_pending 을 넘으면
+      새 문서는 dead letter 로 보내고, 배치 작업은 wait_for_capacity() 로 속도를 맞춥니다.
+    - dead letter 파일은 백그라운드 작업이 executor 에서 씁니다 (요청 경로에서 파일 I/O 없음).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        index_prefix: str = "",
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 50000,
+        max_retries: int = 5,
+        retry_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        dead_letter_path: Optional[Union[str, Path]] = None
+    ):
+        self.client = client
+        self.index_prefix = index_prefix
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.dead_letter_path = Path(dead_letter_path) if dead_letter_path else None
+        self._pending: Dict[Tuple[str, str], SearchAction] = {}
+        self._dead_letters: List[Tuple[SearchAction, str, str]] = []
+        self._wakeup = asyncio.Event()
+        self._capacity = asyncio.Event()
+        self._capacity.set()
+        self._failures = 0
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self.stats = {"submitted": 0, "indexed": 0, "retried": 0, "dead_lettered": 0}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, actions: Iterable[SearchAction]) -> None:
+        overflow = []
+        for action in actions:
+            self.stats["submitted"] += 1
+            previous = self._pending.get(action.key)
+            if previous is not None:
+                self._pending[action.key] = merge_actions(previous, action)
+            elif len(self._pending) >= self.max_pending:
+                overflow.append((action, "queue_full"))
+            else:
+                self._pending[action.key] = action
+        if overflow:
+            self._dead_letter(overflow)
+        if len(self._pending) >= self.max_pending:
+            self._capacity.clear()
+        if len(self._pending) >= self.batch_size or overflow:
+            self._wakeup.set()
+
+    async def wait_for_capacity(self) -> None:
+        """큐에 여유가 생길 때까지 기다립니다 (대량 색인 작업용)."""
+        await self._capacity.wait()
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """남은 문서를 보내고 멈춥니다. timeout 안에 보내지 못한 문서는 dead letter 로 남깁니다."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        try:
+            await asyncio.wait_for(self._flush_all(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        if self._pending:
+            self._dead_letter([(action, "shutdown") for action in self._pending.values()])
+            self._pending.clear()
+        await self.write_dead_letters()
+
+    async def _flush_all(self) -> None:
+        while self._pending:
+            if not await self.flush():
+                break
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.write_dead_letters()
+            while self._pending:
+                if not await self.flush():
+                    # Elasticsearch 장애: 백오프 후 다시 시도
+                    await asyncio.sleep(min(self.retry_backoff * 2 ** (self._failures - 1), self.max_backoff))
+                    break
+                if len(self._pending) < self.batch_size:
+                    break
+
+    def _take(self) -> List[SearchAction]:
+        batch = []
+        for key in list(self._pending)[:self.batch_size]:
+            batch.append(self._pending.pop(key))
+        if len(self._pending) < self.max_pending:
+            self._capacity.set()
+        return batch
+
+    def _operations(self, batch: List[SearchAction]) -> List[Dict[str, Any]]:
+        operations: List[Dict[str, Any]] = []
+        for action in batch:
+            meta = {"_index": f"{self.index_prefix}{action.index}", "_id": action.id}
+            operations.append({action.op: meta})
+            if action.op == INDEX:
+                operations.append(action.doc)
+            elif action.op != DELETE:
+                body: Dict[str, Any] = {"doc": action.doc}
+                if action.upsert is not None:
+                    body["upsert"] = action.upsert
+                operations.append(body)
+        return operations
+
+    async def flush(self) -> bool:
+        """큐에서 한 배치를 보냅니다. 요청이 실패했거나 재시도할 항목이 있으면 False"""
+        batch = self._take()
+        if not batch:
+            return True
+        try:
+            response = await self.client.bulk(operations=self._operations(batch))
+        except Exception as e:
+            self._failures += 1
+            logger.warning("검색 색인 요청 실패", extra={"documents": len(batch), "error": str(e)})
+            self._retry([(action, str(e)) for action in batch])
+            await self.write_dead_letters()
+            return False
+
+        failed = []
+        for action, item in zip(batch, response["items"]):
+            result = item[action.op]
+            status = result.get("status", 200)
+            if status < 300 or (status == 404 and action.op == DELETE):
+                self.stats["indexed"] += 1
+            elif status in RETRYABLE_STATUSES:
+                failed.append((action, json.dumps(result.get("error"), ensure_ascii=False)))
+            else:
+                self._dead_letter([(action, json.dumps(result.get("error"), ensure_ascii=False))])
+        if failed:
+            # 과부하(429 등)로 실패한 항목이 있으면 백오프
+            self._failures += 1
+            self._retry(failed)
+        await self.write_dead_letters()
+        if failed:
+            return False
+        self._failures = 0
+        return True
+
+    def _retry(self, failed: List[Tuple[SearchAction, str]]) -> None:
+        exhausted = []
+        for action, error in failed:
+            action = action._replace(attempts=action.attempts + 1)
+            if action.attempts > self.max_retries:
+                exhausted.append((action, error))
+                continue
+            self.stats["retried"] += 1
+            # 재시도하는 동안 들어온 더 새로운 변경이 우선
+            newer = self._pending.pop(action.key, None)
+            self._pending[action.key] = action if newer is None else merge_actions(action, newer)
+        if exhausted:
+            self._dead_letter(exhausted)
+
+    def _dead_letter(self, entries: List[Tuple[SearchAction, str]]) -> None:
+        """포기한 문서를 모아 둡니다 (파일에는 write_dead_letters() 가 씀)."""
+        self.stats["dead_lettered"] += len(entries)
+        logger.error("검색 색인 포기", extra={"documents": len(entries), "reason": entries[0][1]})
+        if self.dead_letter_path is not None:
+            failed_at = datetime.utcnow().isoformat()
+            self._dead_letters.extend((action, error, failed_at) for action, error in entries)
+
+    async def write_dead_letters(self) -> None:
+        """모아 둔 dead letter 를 파일에 덧붙입니다 (executor 에서 씀)."""
+        if not self._dead_letters:
+            return
+        entries, self._dead_letters = self._dead_letters, []
+        lines = "".join(
+            json.dumps({**action._asdict(), "error": error, "failed_at": failed_at}, ensure_ascii=False) + "\n"
+            for action, error, failed_at in entries
+        )
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, _append, self.dead_letter_path, lines)
+        except OSError:
+            logger.exception("dead letter 기록 실패", extra={"path": str(self.dead_letter_path)})
+
+def _append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as file:
+        file.write(text)
+
+def load_dead_letters(path: Union[str, Path]) -> List[SearchAction]:
+    """dead letter 파일의 문서 변경 (다시 submit 할 때 사용)"""
+    actions = []
+    with Path(path).open(encoding="utf-8") as file:
+        for line in file:
+            entry = json.loads(line)
+            actions.append(SearchAction(**{field: entry[field] for field in SearchAction._fields})._replace(attempts=0))
+    return actions
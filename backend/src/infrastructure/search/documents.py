@@ -0,0 +1,122 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from domain.identity.entities import Company, CompanyUser, Team, User
+from infrastructure.database import SessionChangeTracker
+
+INDEX = "index"  # 문서 전체
+UPDATE = "update"  # 바뀐 필드만 (문서가 없으면 upsert 로 생성)
+DELETE = "delete"
+
+# 엔티티 -> (인덱스 이름, 문서 필드)
+DOCUMENT_FIELDS = {
+    User: ("users", ("company_id", "emp_no", "email", "name", "role")),
+    Company: ("companies", ("business_registration_number", "name", "eng_name", "ceo_name")),
+    CompanyUser: (
+        "company_users",
+        ("company_id", "user_id", "emp_no", "department_id", "team_id", "position_id", "responsibility_id")
+    ),
+    Team: ("teams", ("name",))
+}
+
+class SearchAction(NamedTuple):
+    op: str
+    index: str
+    id: str
+    doc: Optional[Dict[str, Any]] = None  # INDEX: 전체 문서, UPDATE: 바뀐 필드
+    upsert: Optional[Dict[str, Any]] = None  # UPDATE 대상 문서가 없을 때 만들 전체 문서
+    attempts: int = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.index, self.id
+
+def merge_actions(older: SearchAction, newer: SearchAction) -> SearchAction:
+    """같은 문서의 두 변경을 하나로 합칩니다 (나중 변경이 우선)."""
+    if newer.op != UPDATE:
+        return newer._replace(attempts=max(older.attempts, newer.attempts))
+    if older.op == INDEX:
+        return older._replace(doc={**older.doc, **newer.doc})
+    if older.op == UPDATE:
+        return newer._replace(
+            doc={**older.doc, **newer.doc},
+            upsert=newer.upsert or older.upsert,
+            attempts=max(older.attempts, newer.attempts)
+        )
+    return newer
+
+def _value(value: Any) -> Any:
+    return str(value) if isinstance(value, UUID) else value
+
+def build_document(entity: Any) -> Dict[str, Any]:
+    _, fields = DOCUMENT_FIELDS[type(entity)]
+    return {"id": str(entity.id), **{field: _value(getattr(entity, field)) for field in fields}}
+
+def _is_active(entity: Any) -> bool:
+    return entity.use_yn == "Y" and entity.delete_yn == "N"
+
+def collect_search_actions(entity: Any, is_new: bool = False, deleted: bool = False) -> List[SearchAction]:
+    """flush 된 User/Company/CompanyUser/Team 을 검색 문서 변경으로 바꿉니다 (after_flush 에서 호출)."""
+    if type(entity) not in DOCUMENT_FIELDS:
+        return []
+    index, fields = DOCUMENT_FIELDS[type(entity)]
+    entity_id = str(entity.id)
+    if deleted or not _is_active(entity):
+        return [] if is_new else [SearchAction(DELETE, index, entity_id)]
+
+    state = inspect(entity)
+    if is_new or any(state.attrs[name].history.deleted for name in ("use_yn", "delete_yn")):
+        # 새 행, 다시 활성화된 행은 문서 전체
+        return [SearchAction(INDEX, index, entity_id, build_document(entity))]
+    changed = {field: _value(getattr(entity, field)) for field in fields if state.attrs[field].history.deleted}
+    if not changed:
+        return []
+    return [SearchAction(UPDATE, index, entity_id, changed, upsert=build_document(entity))]
+
+_INFO_KEY = "search_actions"
+
+def record_search_actions(session: Any, actions: Iterable[SearchAction]) -> None:
+    """ORM flush 를 거치지 않는 변경(벌크 쿼리 등)을 커밋 후 색인하도록 기록합니다."""
+    pending: Dict[Tuple[str, str], SearchAction] = session.info.setdefault(_INFO_KEY, {})
+    for action in actions:
+        previous = pending.get(action.key)
+        pending[action.key] = action if previous is None else merge_actions(previous, action)
+
+class SearchChangeTracker(SessionChangeTracker):
+    """세션 이벤트로 User/Company/CompanyUser/Team 변경을 모아 커밋 후 색인 큐에 넣습니다.
+
+    커밋 후에는 큐에 넣기만 하므로 요청 지연은 Elasticsearch 상태와 무관합니다.
+    롤백되면 모은 변경을 버립니다. 색인기가 여럿이면 (Elasticsearch, 자동완성 색인 등)
+    같은 변경을 모두에 넣습니다.
+    """
+
+    info_key = _INFO_KEY
+
+    def __init__(self, *indexers: Any):
+        super().__init__()
+        self.indexers = indexers
+
+    def collect(self, session: Session) -> None:
+        actions: List[SearchAction] = []
+        for entity in session.new:
+            actions.extend(collect_search_actions(entity, is_new=True))
+        for entity in session.dirty:
+            actions.extend(collect_search_actions(entity))
+        for entity in session.deleted:
+            actions.extend(collect_search_actions(entity, deleted=True))
+        if actions:
+            record_search_actions(session, actions)
+
+    def committed(self, pending: Dict[Tuple[str, str], SearchAction]) -> None:
+        # 색인기의 submit 은 큐에 넣기만 하므로 작업을 예약하지 않고 바로 넘김
+        self._submit(pending)
+
+    async def apply(self, pending: Dict[Tuple[str, str], SearchAction]) -> None:
+        self._submit(pending)
+
+    def _submit(self, pending: Dict[Tuple[str, str], SearchAction]) -> None:
+        for indexer in self.indexers:
+            indexer.submit(list(pending.values()))
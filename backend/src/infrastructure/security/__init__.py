@@ -0,0 +1,16 @@
+"""
+보안 모듈
+
+- 프로세스 풀 기반 비밀번호 해시/검증 (과부하 시 SERVICE_UNAVAILABLE)
+- JWT 검증 (디코드 결과 캐시, 워커별 폐기 토큰 블룸 필터)
+"""
+
+from .passwords import PasswordHasher
+from .tokens import BloomFilter, RevokedTokenStore, TokenVerifier
+
+__all__ = [
+    'BloomFilter',
+    'PasswordHasher',
+    'RevokedTokenStore',
+    'TokenVerifier'
+]
@@ -0,0 +1,108 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from passlib.context import CryptContext
+from passlib.exc import UnknownHashError
+
+from application.common.exceptions import ServiceUnavailableException
+
+SUPPORTED_ALGORITHMS = ("bcrypt",)
+
+@lru_cache(maxsize=None)
+def _context(algorithm: str, rounds: int) -> CryptContext:
+    return CryptContext(schemes=[algorithm], **{f"{algorithm}__rounds": rounds})
+
+def _hash(algorithm: str, rounds: int, password: str) -> str:
+    return _context(algorithm, rounds).hash(password)
+
+def _verify_and_update(algorithm: str, rounds: int, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    try:
+        return _context(algorithm, rounds).verify_and_update(password, hashed)
+    except (UnknownHashError, ValueError):
+        # 비밀번호 미설정("!") 등 해시가 아닌 값
+        return False, None
+
+def _noop() -> None:
+    pass
+
+class PasswordHasher:
+    """비밀번호 해시/검증을 프로세스 풀에서 실행합니다.
+
+    bcrypt 는 해시 한 번에 수백 ms 의 CPU 를 쓰므로 이벤트 루프에서 실행하면
+    그동안 워커의 다른 요청이 모두 멈춥니다. 대기 중인 작업이 max_pending 을
+    넘으면 큐에 쌓지 않고 바로 ServiceUnavailableException 을 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "bcrypt",
+        rounds: int = 12,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retry_after: int = 1
+    ):
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"지원하지 않는 비밀번호 해시 알고리즘: {algorithm}")
+        self.algorithm = algorithm
+        self.rounds = rounds
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending if max_pending is not None else self.max_workers * 4
+        self.retry_after = retry_after
+        # 스레드(로그 큐 등)가 있는 프로세스를 fork 하지 않도록 spawn 사용
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _submit(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableException(
+                resource="password_hasher",
+                retry_after=self.retry_after,
+                additional_info={"pending": self._pending}
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        finally:
+            self._pending -= 1
+
+    async def warmup(self) -> None:
+        """워커 프로세스를 미리 띄웁니다 (첫 로그인이 프로세스 생성 비용을 부담하지 않도록)."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._executor, _noop) for _ in range(self.max_workers)))
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, self.algorithm, self.rounds, password)
+
+    async def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, 새 해시) - 해시의 rounds 가 설정과 다르면 새 해시를 함께 반환"""
+        return await self._submit(_verify_and_update, self.algorithm, self.rounds, password, hashed)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        verified, _ = await self.verify_and_update(password, hashed)
+        return verified
+
+    async def verify_user(self, user: Any, password: str) -> bool:
+        """사용자 비밀번호를 검증하고, 설정이 바뀌었다면 새 해시로 교체합니다.
+
+        교체된 해시는 세션이 커밋될 때 저장됩니다.
+        """
+        verified, new_hash = await self.verify_and_update(password, user.password)
+        if verified and new_hash is not None:
+            user.password = new_hash
+            user.update_audit_fields(user.id)
+        return verified
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from jose import ExpiredSignatureError, JWTError, jwt
+from redis.exceptions import RedisError
+
+from application.common.exceptions import InvalidTokenException, TokenExpiredException
+
+logger = logging.getLogger(__name__)
+
+class BloomFilter:
+    """폐기된 토큰 id 용 블룸 필터 (거짓 양성만 있고 거짓 음성은 없음)"""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> Iterable[int]:
+        digest = hashlib.sha256(value.encode()).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        return ((first + index * second) % self.size for index in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+class RevokedTokenStore:
+    """폐기된 토큰 id 의 원본 저장소 (Redis sorted set, 점수는 토큰 만료 시각)
+
+    폐기하면 채널로 id 를 알려 각 워커가 블룸 필터에 추가합니다.
+    만료 시각이 지난 id 는 스냅샷을 읽을 때 정리합니다.
+    """
+
+    def __init__(self, redis: Any, key: str = "auth:revoked_tokens", channel: str = "auth:revoked_tokens"):
+        self.redis = redis
+        self.key = key
+        self.channel = channel
+
+    async def revoke(self, token_id: str, expires_at: float) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.key, {token_id: expires_at})
+            pipe.publish(self.channel, token_id)
+            await pipe.execute()
+
+    async def is_revoked(self, token_id: str) -> bool:
+        return await self.redis.zscore(self.key, token_id) is not None
+
+    async def active_ids(self, now: float) -> List[str]:
+        """아직 만료되지 않은 폐기 id 전체"""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self.key, "-inf", now)
+            pipe.zrange(self.key, 0, -1)
+            _, token_ids = await pipe.execute()
+        return [token_id.decode() if isinstance(token_id, bytes) else token_id for token_id in token_ids]
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+class TokenVerifier:
+    """JWT 검증 (디코드 결과 캐시 + 워커별 폐기 토큰 블룸 필터)
+
+    - 디코드한 클레임은 토큰 해시를 키로 만료 시각까지 로컬 LRU 에 보관합니다.
+    - 폐기 여부는 블룸 필터로 먼저 거르고, 필터에 걸린 경우에만 원본 저장소를 조회합니다.
+      저장소 조회에 실패하면 폐기된 것으로 처리합니다.
+    - 필터는 start() 에서 구독 후 스냅샷으로 채우고, 이후 폐기 알림으로 갱신하며
+      resync_interval 마다 만료된 id 를 빼고 다시 만듭니다. 구독이 끊기면 재연결 후 다시 만듭니다.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        revocations: Optional[RevokedTokenStore] = None,
+        cache_max_entries: int = 10000,
+        bloom_capacity: int = 100000,
+        bloom_error_rate: float = 0.001,
+        resync_interval: float = 300.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self._secret_key = secret_key
+        self.algorithm = algorithm
+        self.revocations = revocations
+        self._cache_max_entries = cache_max_entries
+        self._bloom_capacity = bloom_capacity
+        self._bloom_error_rate = bloom_error_rate
+        self._resync_interval = resync_interval
+        self._clock = clock
+        self._claims: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._ready = asyncio.Event()
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self.stats = {"cache_hit": 0, "decoded": 0, "bloom_hit": 0, "revoked": 0}
+
+    async def start(self, timeout: float = 5.0) -> None:
+        """폐기 알림 구독을 시작하고 첫 스냅샷을 읽을 때까지 (최대 timeout 초) 기다립니다."""
+        if self.revocations is None or self._listener is not None:
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("폐기 토큰 목록을 읽지 못한 채 시작합니다")
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def _rebuild(self) -> None:
+        token_ids = await self.revocations.active_ids(self._clock())
+        bloom = BloomFilter(max(self._bloom_capacity, len(token_ids) * 2), self._bloom_error_rate)
+        for token_id in token_ids:
+            bloom.add(token_id)
+        self._bloom = bloom
+        self._ready.set()
+
+    async def _listen(self) -> None:
+        delay = 0.5
+        while True:
+            pubsub = self.revocations.redis.pubsub()
+            try:
+                # 구독한 뒤 스냅샷을 읽어야 그 사이의 폐기를 놓치지 않음
+                await pubsub.subscribe(self.revocations.channel)
+                await self._rebuild()
+                delay = 0.5
+                next_resync = time.monotonic() + self._resync_interval
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        data = message["data"]
+                        self._bloom.add(data.decode() if isinstance(data, bytes) else data)
+                    if time.monotonic() >= next_resync:
+                        await self._rebuild()
+                        next_resync = time.monotonic() + self._resync_interval
+            except (RedisError, OSError):
+                logger.warning("폐기 토큰 구독 실패, 재연결합니다", exc_info=True)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                await pubsub.aclose()
+
+    def _decode(self, token: str, token_type: str) -> Dict[str, Any]:
+        try:
+            claims = jwt.decode(
+                token,
+                self._secret_key,
+                algorithms=[self.algorithm],
+                options={"require_exp": True, "require_jti": True}
+            )
+        except ExpiredSignatureError:
+            raise TokenExpiredException(token_type)
+        except JWTError as e:
+            raise InvalidTokenException(reason=str(e))
+        if claims.get("type", token_type) != token_type:
+            raise InvalidTokenException(reason="token_type", additional_info={"expected": token_type})
+        return claims
+
+    def _cached_claims(self, token: str, token_type: str) -> Dict[str, Any]:
+        key = _token_key(token)
+        entry = self._claims.get(key)
+        if entry is not None:
+            expires_at, claims = entry
+            if expires_at <= self._clock():
+                del self._claims[key]
+                raise TokenExpiredException(token_type)
+            if claims.get("type", token_type) != token_type:
+                raise InvalidTokenException(reason="token_type", additional_info={"expected": token_type})
+            self._claims.move_to_end(key)
+            self.stats["cache_hit"] += 1
+            return claims
+
+        claims = self._decode(token, token_type)
+        self.stats["decoded"] += 1
+        self._claims[key] = (float(claims["exp"]), claims)
+        while len(self._claims) > self._cache_max_entries:
+            self._claims.popitem(last=False)
+        return claims
+
+    async def verify(self, token: str, token_type: str = "access") -> Dict[str, Any]:
+        """토큰을 검증하고 클레임을 반환합니다.
+
+        만료되었으면 TokenExpiredException, 서명/형식이 잘못되었거나
+        폐기된 토큰이면 InvalidTokenException 을 발생시킵니다.
+        """
+        claims = self._cached_claims(token, token_type)
+        if await self.is_revoked(claims):
+            raise InvalidTokenException(reason="revoked")
+        return claims
+
+    async def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        """검증한 토큰이 그 뒤 폐기되었는지 (블룸 필터에 없으면 저장소를 조회하지 않음)"""
+        token_id = str(claims["jti"])
+        if self.revocations is None or token_id not in self._bloom:
+            return False
+        self.stats["bloom_hit"] += 1
+        if await self._is_revoked(token_id):
+            self.stats["revoked"] += 1
+            return True
+        return False
+
+    async def _is_revoked(self, token_id: str) -> bool:
+        try:
+            return await self.revocations.is_revoked(token_id)
+        except RedisError:
+            logger.warning("폐기 토큰 조회 실패", exc_info=True)
+            return True
+
+    async def revoke(self, claims: Dict[str, Any]) -> None:
+        """토큰을 폐기합니다 (이 워커에는 알림을 기다리지 않고 바로 반영)."""
+        if self.revocations is None:
+            raise RuntimeError("폐기 토큰 저장소가 설정되지 않았습니다")
+        token_id = str(claims["jti"])
+        self._bloom.add(token_id)
+        await self.revocations.revoke(token_id, float(claims["exp"]))
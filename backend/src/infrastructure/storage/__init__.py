@@ -0,0 +1,32 @@
+"""
+파일 저장소 모듈
+
+- 내용 주소(sha256) 기반 업로드 저장소 (스트리밍 저장, 크기 제한, 매직 바이트 검사, 중복 제거)
+- 다운로드용 파일 열기 (digest 검증, 형식 판별)
+- 이어 올리기가 가능한 분할 업로드 (조각별 sha256, 병렬 업로드, 디스크에서 바로 조립)
+"""
+
+from .chunked_uploads import ChunkedUploadStore, UploadSession
+from .content_store import (
+    FILE_TYPES,
+    ContentStore,
+    StoredFile,
+    StoredObject,
+    detect_content_type,
+    file_extension,
+    is_digest,
+    sniff_content_type
+)
+
+__all__ = [
+    'ChunkedUploadStore',
+    'ContentStore',
+    'FILE_TYPES',
+    'StoredFile',
+    'StoredObject',
+    'UploadSession',
+    'detect_content_type',
+    'file_extension',
+    'is_digest',
+    'sniff_content_type'
+]
@@ -0,0 +1,342 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, AsyncIterable, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from application.common.exceptions import (
+    ChunkChecksumMismatchException,
+    FileNotFoundException,
+    FileSizeExceededException,
+    FileTypeNotAllowedException,
+    FileUploadFailedException,
+    UploadIncompleteException,
+    ValidationFailedException
+)
+from domain.common.identifiers import uuid7
+from .content_store import (
+    FILE_TYPES,
+    SNIFF_BYTES,
+    ContentStore,
+    StoredFile,
+    detect_content_type,
+    file_extension,
+    sniff_content_type
+)
+
+# 세션 디렉터리의 파일
+_SESSION = "session.json"
+_DATA = "data"
+_RECEIVED = "received"  # 조각마다 1바이트 (받았으면 1)
+_ASSEMBLED = "assembled"  # 완료 처리 중인 data (동시에 두 번 완료하지 않도록 이름을 바꿔 선점)
+
+_UPLOAD_ID_LENGTH = 32
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_PURGE_INTERVAL = 600.0
+
+class UploadSession(NamedTuple):
+    id: str
+    owner: str
+    filename: str
+    extension: str
+    size: int
+    chunk_size: int
+    created_at: float
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-self.size // self.chunk_size)
+
+    def chunk_range(self, index: int) -> Tuple[int, int]:
+        """조각의 (시작 위치, 길이) - 마지막 조각만 짧을 수 있음"""
+        offset = index * self.chunk_size
+        return offset, min(self.chunk_size, self.size - offset)
+
+class ChunkedUploadStore:
+    """이어 올리기가 가능한 분할 업로드
+
+    세션마다 uploads/<id>/ 에 전체 크기의 data 파일과 조각별 수신 표시(1바이트씩)를 두고,
+    조각은 받는 대로 자기 위치에 pwrite 합니다. 조각끼리 겹치지 않으므로 여러 요청(워커)이
+    동시에 올려도 되고, 끊기면 받지 못한 조각만 다시 올리면 됩니다. 조각은 sha256 이 맞고
+    디스크에 기록된 뒤에만 받은 것으로 표시합니다.
+    다 받으면 data 파일을 그대로 ContentStore 로 옮기므로 조각을 다시 읽어 합치지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        max_size: int,
+        allowed_extensions: Iterable[str],
+        chunk_size: int = 8 * 1024 * 1024,
+        min_chunk_size: int = 256 * 1024,
+        max_chunk_size: int = 64 * 1024 * 1024,
+        expires_after: float = 24 * 60 * 60,
+        clock: Callable[[], float] = time.time
+    ):
+        self.store = store
+        self.max_size = max_size
+        self.allowed_extensions = sorted({extension.lower().lstrip(".") for extension in allowed_extensions})
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.expires_after = expires_after
+        self.root = store.root / "uploads"
+        self._clock = clock
+        self._next_purge = 0.0
+
+    def _directory(self, upload_id: str) -> Path:
+        return self.root / upload_id
+
+    async def create(self, filename: str, size: int, owner: str, chunk_size: Optional[int] = None) -> UploadSession:
+        """업로드 세션을 만듭니다. chunk_size 를 주지 않으면 기본 크기로 나눕니다.
+
+        Raises:
+            FileTypeNotAllowedException: 확장자가 허용되지 않을 때
+            FileSizeExceededException: size 가 max_size 를 넘을 때
+            ValidationFailedException: size 나 chunk_size 가 올바르지 않을 때
+        """
+        extension = file_extension(filename)
+        if extension not in self.allowed_extensions or extension not in FILE_TYPES:
+            raise FileTypeNotAllowedException(extension, self.allowed_extensions)
+        if size <= 0:
+            raise ValidationFailedException("파일 크기가 올바르지 않습니다.", field="size", value=size)
+        if size > self.max_size:
+            raise FileSizeExceededException(self.max_size)
+        chunk_size = chunk_size or self.chunk_size
+        if not self.min_chunk_size <= chunk_size <= self.max_chunk_size:
+            raise ValidationFailedException(
+                "조각 크기가 허용 범위를 벗어났습니다.",
+                field="chunk_size",
+                value=chunk_size,
+                additional_info={"min": self.min_chunk_size, "max": self.max_chunk_size}
+            )
+
+        session = UploadSession(uuid7().hex, owner, filename, extension, size, chunk_size, self._clock())
+        loop = asyncio.get_running_loop()
+        try:
+            if session.created_at >= self._next_purge:
+                self._next_purge = session.created_at + _PURGE_INTERVAL
+                await loop.run_in_executor(None, self._purge_expired, session.created_at)
+            await loop.run_in_executor(None, self._create, session)
+        except OSError as e:
+            raise FileUploadFailedException(str(e)) from e
+        return session
+
+    def _create(self, session: UploadSession) -> None:
+        directory = self._directory(session.id)
+        directory.mkdir(parents=True)
+        # 조각이 오는 대로 자기 위치에 쓰도록 전체 크기로 만들어 둠 (sparse)
+        with open(directory / _DATA, "wb") as file:
+            file.truncate(session.size)
+        (directory / _RECEIVED).write_bytes(bytes(session.chunk_count))
+        # 세션 정보는 마지막에 원자적으로 기록 (이 파일이 있어야 세션이 있는 것)
+        temp = directory / f"{_SESSION}.tmp"
+        temp.write_text(json.dumps(session._asdict(), ensure_ascii=False))
+        os.replace(temp, directory / _SESSION)
+
+    async def get(self, upload_id: str, owner: str) -> UploadSession:
+        """세션을 찾습니다. 다른 사용자의 세션이나 만료된 세션은 없는 것으로 봅니다.
+
+        Raises:
+            FileNotFoundException: 세션이 없을 때
+        """
+        if len(upload_id) != _UPLOAD_ID_LENGTH or not _HEX_DIGITS.issuperset(upload_id):
+            raise FileNotFoundException(upload_id)
+        try:
+            session = await asyncio.get_running_loop().run_in_executor(None, self._load, upload_id)
+        except (OSError, ValueError) as e:
+            raise FileNotFoundException(upload_id) from e
+        if session.owner != owner or self._expired(session, self._clock()):
+            raise FileNotFoundException(upload_id)
+        return session
+
+    def _load(self, upload_id: str) -> UploadSession:
+        return UploadSession(**json.loads((self._directory(upload_id) / _SESSION).read_text()))
+
+    def _expired(self, session: UploadSession, now: float) -> bool:
+        return session.created_at + self.expires_after <= now
+
+    async def received_chunks(self, session: UploadSession) -> List[int]:
+        """받은 조각 번호 (이어 올릴 때 나머지만 보내도록)"""
+        try:
+            received = await asyncio.get_running_loop().run_in_executor(
+                None, (self._directory(session.id) / _RECEIVED).read_bytes
+            )
+        except FileNotFoundError as e:
+            raise FileNotFoundException(session.id) from e
+        return [index for index, flag in enumerate(received) if flag]
+
+    async def write_chunk(
+        self,
+        session: UploadSession,
+        index: int,
+        chunks: AsyncIterable[bytes],
+        checksum: bytes
+    ) -> None:
+        """조각 하나를 받아 자기 위치에 씁니다. 이미 받은 조각을 다시 보내도 됩니다.
+
+        본문은 write_buffer_size 씩 모아 쓰므로 조각 크기와 무관하게 메모리를 적게 씁니다.
+        첫 조각은 앞부분의 매직 바이트도 검사합니다.
+
+        Raises:
+            ValidationFailedException: 조각 번호나 길이가 맞지 않을 때
+            ChunkChecksumMismatchException: 받은 내용의 sha256 이 checksum 과 다를 때
+            FileTypeNotAllowedException: 첫 조각이 확장자 형식과 다를 때
+            FileNotFoundException: 세션이 사라졌을 때 (완료, 취소, 만료)
+            FileUploadFailedException: 디스크 쓰기 실패
+        """
+        if not 0 <= index < session.chunk_count:
+            raise ValidationFailedException(
+                "조각 번호가 범위를 벗어났습니다.",
+                field="index",
+                value=index,
+                additional_info={"chunk_count": session.chunk_count}
+            )
+        offset, length = session.chunk_range(index)
+        loop = asyncio.get_running_loop()
+        try:
+            descriptors = await loop.run_in_executor(None, self._open_chunk, session, index)
+        except FileNotFoundError as e:
+            raise FileNotFoundException(session.id) from e
+        except OSError as e:
+            raise FileUploadFailedException(str(e)) from e
+
+        hasher = hashlib.sha256()
+        written = 0
+        head = b"" if index == 0 else None
+        buffer: List[bytes] = []
+        buffered = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if written + buffered + len(chunk) > length:
+                    raise ValidationFailedException(
+                        "조각 길이가 올바르지 않습니다.", field="chunk", value=index, additional_info={"length": length}
+                    )
+                if head is not None:
+                    head += chunk[:SNIFF_BYTES - len(head)]
+                    if len(head) >= SNIFF_BYTES:
+                        self._check_type(session, head)
+                        head = None
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.store.write_buffer_size:
+                    await loop.run_in_executor(None, _write_at, descriptors[0], hasher, buffer, offset + written)
+                    written += buffered
+                    buffer, buffered = [], 0
+            await loop.run_in_executor(None, _write_at, descriptors[0], hasher, buffer, offset + written)
+            written += buffered
+            if written != length:
+                raise ValidationFailedException(
+                    "조각 길이가 올바르지 않습니다.", field="chunk", value=index, additional_info={"length": length}
+                )
+            if head is not None:
+                self._check_type(session, head)
+            if hasher.digest() != checksum:
+                raise ChunkChecksumMismatchException(index)
+            await loop.run_in_executor(None, _mark_received, descriptors, index)
+        except OSError as e:
+            raise FileUploadFailedException(str(e)) from e
+        finally:
+            for descriptor in descriptors:
+                os.close(descriptor)
+
+    def _open_chunk(self, session: UploadSession, index: int) -> Tuple[int, int]:
+        directory = self._directory(session.id)
+        data = os.open(directory / _DATA, os.O_WRONLY)
+        try:
+            received = os.open(directory / _RECEIVED, os.O_WRONLY)
+            # 다시 보내는 조각이 중간에 실패하면 받지 않은 것으로 남도록 먼저 지움
+            os.pwrite(received, b"\x00", index)
+        except BaseException:
+            os.close(data)
+            raise
+        return data, received
+
+    def _check_type(self, session: UploadSession, head: bytes) -> None:
+        if sniff_content_type(session.extension, head) is None:
+            raise FileTypeNotAllowedException(
+                session.extension, self.allowed_extensions, detected_type=detect_content_type(head)
+            )
+
+    async def complete(self, session: UploadSession, owner: Optional[str] = None) -> StoredFile:
+        """모든 조각을 받았으면 파일을 ContentStore 로 옮기고(owner 기록) 세션을 지웁니다.
+
+        Raises:
+            UploadIncompleteException: 받지 못한 조각이 있을 때
+            FileNotFoundException: 세션이 사라졌거나 이미 완료 중일 때
+            FileTypeNotAllowedException: 내용이 확장자 형식과 다를 때 (세션도 지움)
+            FileUploadFailedException: 디스크 실패 (세션은 남으므로 다시 완료할 수 있음)
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            missing = await loop.run_in_executor(None, self._claim, session)
+        except FileNotFoundError as e:
+            raise FileNotFoundException(session.id) from e
+        if missing:
+            raise UploadIncompleteException(session.id, missing)
+
+        directory = self._directory(session.id)
+        try:
+            stored = await self.store.adopt(directory / _ASSEMBLED, session.extension, owner)
+        except FileTypeNotAllowedException:
+            await loop.run_in_executor(None, shutil.rmtree, directory, True)
+            raise
+        except BaseException:
+            # 다시 완료할 수 있도록 되돌림 (이름만 바꾸므로 바로 끝남)
+            try:
+                os.replace(directory / _ASSEMBLED, directory / _DATA)
+            except OSError:
+                pass
+            raise
+        await loop.run_in_executor(None, shutil.rmtree, directory, True)
+        return stored
+
+    def _claim(self, session: UploadSession) -> List[int]:
+        """받지 못한 조각 번호. 모두 받았으면 data 의 이름을 바꿔 선점합니다."""
+        directory = self._directory(session.id)
+        received = (directory / _RECEIVED).read_bytes()
+        missing = [index for index, flag in enumerate(received) if not flag]
+        if not missing:
+            os.rename(directory / _DATA, directory / _ASSEMBLED)
+        return missing
+
+    async def abort(self, session: UploadSession) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, shutil.rmtree, self._directory(session.id), True)
+
+    def _purge_expired(self, now: float) -> int:
+        """만료된 세션을 지웁니다. 세션 정보가 없는(만들다 만) 디렉터리는 수정 시각으로 판단합니다."""
+        if not self.root.is_dir():
+            return 0
+        purged = 0
+        for directory in self.root.iterdir():
+            try:
+                created_at = json.loads((directory / _SESSION).read_text())["created_at"]
+            except (OSError, ValueError, KeyError):
+                try:
+                    created_at = directory.stat().st_mtime
+                except OSError:
+                    continue
+            if created_at + self.expires_after <= now:
+                shutil.rmtree(directory, ignore_errors=True)
+                purged += 1
+        return purged
+
+def _write_at(descriptor: int, hasher: Any, chunks: List[bytes], offset: int) -> None:
+    for chunk in chunks:
+        hasher.update(chunk)
+        view = memoryview(chunk)
+        while view:
+            written = os.pwrite(descriptor, view, offset)
+            offset += written
+            view = view[written:]
+
+def _mark_received(descriptors: Tuple[int, int], index: int) -> None:
+    data, received = descriptors
+    # 내용이 디스크에 기록된 뒤에 받은 것으로 표시 (1바이트 pwrite 라 조각끼리 겹치지 않음)
+    os.fdatasync(data)
+    os.pwrite(received, b"\x01", index)
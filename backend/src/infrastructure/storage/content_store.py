@@ -0,0 +1,284 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, AsyncIterable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from application.common.exceptions import (
+    FileNotFoundException,
+    FileSizeExceededException,
+    FileTypeNotAllowedException,
+    FileUploadFailedException
+)
+
+# 확장자 -> (Content-Type, 매직 바이트 검사)
+#   검사는 파일 앞부분 SNIFF_BYTES 바이트를 받습니다.
+FILE_TYPES: Dict[str, Tuple[str, Callable[[bytes], bool]]] = {
+    "jpg": ("image/jpeg", lambda head: head.startswith(b"\xff\xd8\xff")),
+    "jpeg": ("image/jpeg", lambda head: head.startswith(b"\xff\xd8\xff")),
+    "png": ("image/png", lambda head: head.startswith(b"\x89PNG\r\n\x1a\n")),
+    "gif": ("image/gif", lambda head: head[:6] in (b"GIF87a", b"GIF89a")),
+    "webp": ("image/webp", lambda head: head[:4] == b"RIFF" and head[8:12] == b"WEBP"),
+    "pdf": ("application/pdf", lambda head: head.startswith(b"%PDF-")),
+    "wav": ("audio/wav", lambda head: head[:4] == b"RIFF" and head[8:12] == b"WAVE"),
+    # ID3 태그 또는 MPEG 프레임 동기 비트
+    "mp3": ("audio/mpeg", lambda head: head.startswith(b"ID3") or (head[:1] == b"\xff" and head[1:2] >= b"\xe0")),
+    "m4a": ("audio/mp4", lambda head: head[4:8] == b"ftyp"),
+    "ogg": ("audio/ogg", lambda head: head.startswith(b"OggS")),
+    "webm": ("audio/webm", lambda head: head.startswith(b"\x1a\x45\xdf\xa3"))
+}
+SNIFF_BYTES = 16
+
+_DIGEST_LENGTH = 64
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+def file_extension(filename: str) -> str:
+    """파일 이름의 확장자 (소문자, 점 제외). 클라이언트 경로가 붙어 와도 마지막 이름만 봅니다."""
+    return PurePosixPath(filename.replace("\\", "/")).suffix.lstrip(".").lower()
+
+def sniff_content_type(extension: str, head: bytes) -> Optional[str]:
+    """파일 앞부분이 확장자의 형식과 맞으면 Content-Type, 아니면 None"""
+    file_type = FILE_TYPES.get(extension)
+    if file_type is None or not file_type[1](head):
+        return None
+    return file_type[0]
+
+class StoredFile(NamedTuple):
+    digest: str  # sha256 (hex)
+    size: int
+    content_type: str
+    extension: str
+    path: Path
+    # 같은 내용의 파일이 이미 있었는지 (저장소는 회사 간에 공유되므로 API 응답에 넣지 않음)
+    deduplicated: bool
+
+class StoredObject(NamedTuple):
+    """다운로드용으로 연 파일 (닫는 것은 받은 쪽 책임)"""
+    file: IO[bytes]
+    digest: str
+    size: int
+    content_type: str
+
+def detect_content_type(head: bytes) -> Optional[str]:
+    """파일 앞부분의 매직 바이트로 찾은 형식"""
+    return next((content_type for content_type, matches in FILE_TYPES.values() if matches(head)), None)
+
+def is_digest(value: str) -> bool:
+    return len(value) == _DIGEST_LENGTH and _HEX_DIGITS.issuperset(value)
+
+class ContentStore:
+    """내용 주소 기반 파일 저장소
+
+    업로드는 청크 단위로 임시 파일에 쓰면서 크기 제한, 매직 바이트 검사, sha256 계산을
+    함께 하므로 메모리 사용량은 파일 크기와 무관합니다 (최대 write_buffer_size).
+    다 받은 파일은 objects/<sha256 앞 2자리>/<다음 2자리>/<sha256> 로 옮기며, 같은 내용이
+    이미 있으면 임시 파일을 지우고 기존 파일을 씁니다.
+    저장소는 회사 간에 공유되므로, 저장할 때 owner(회사 등)를 refs/<sha256 앞 2자리>/<sha256>/ 에
+    기록하고 내려받을 때 owner 가 기록된 파일만 엽니다.
+    파일 쓰기와 해시 계산은 이벤트 루프를 막지 않도록 스레드에서 합니다.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_size: int,
+        allowed_extensions: Iterable[str],
+        write_buffer_size: int = 1024 * 1024
+    ):
+        self.root = Path(root)
+        self.max_size = max_size
+        self.allowed_extensions = sorted({extension.lower().lstrip(".") for extension in allowed_extensions})
+        self.write_buffer_size = write_buffer_size
+        self._objects = self.root / "objects"
+        self._refs = self.root / "refs"
+        self._temp = self.root / "tmp"
+
+    def path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return is_digest(digest) and self.path(digest).is_file()
+
+    def _ref(self, digest: str, owner: str) -> Path:
+        # owner 에 경로 문자가 있어도 안전하도록 해시를 파일 이름으로 씀
+        return self._refs / digest[:2] / digest / hashlib.sha256(owner.encode()).hexdigest()
+
+    def _add_owner(self, digest: str, owner: Optional[str]) -> None:
+        if owner is None:
+            return
+        ref = self._ref(digest, owner)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.touch()
+
+    async def is_owner(self, digest: str, owner: str) -> bool:
+        """owner 가 저장한(또는 공유받은) 파일인지"""
+        if not is_digest(digest):
+            return False
+        return await asyncio.get_running_loop().run_in_executor(None, self._ref(digest, owner).is_file)
+
+    async def share(self, source: str, digest: str) -> None:
+        """source 파일의 owner 를 digest 파일에도 기록합니다 (원본에서 만든 파생 파일 등)."""
+        await asyncio.get_running_loop().run_in_executor(None, self._share, source, digest)
+
+    def _share(self, source: str, digest: str) -> None:
+        source_refs = self._refs / source[:2] / source
+        target_refs = self._refs / digest[:2] / digest
+        names = [entry.name for entry in os.scandir(source_refs)] if source_refs.is_dir() else []
+        if names:
+            target_refs.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            (target_refs / name).touch()
+
+    async def open(self, digest: str, owner: Optional[str] = None) -> StoredObject:
+        """저장된 파일을 엽니다. 크기는 연 파일 기준이므로 열고 난 뒤 바뀌지 않습니다.
+
+        owner 를 주면 그 owner 가 저장한 파일만 엽니다 (아니면 파일이 없는 것과 같게 응답).
+
+        Raises:
+            FileNotFoundException: digest 형식이 틀렸거나 파일이 없거나 owner 의 파일이 아닐 때
+        """
+        if not is_digest(digest) or (owner is not None and not await self.is_owner(digest, owner)):
+            raise FileNotFoundException(digest)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, self._open, digest)
+        except FileNotFoundError as e:
+            raise FileNotFoundException(digest) from e
+
+    def _open(self, digest: str) -> StoredObject:
+        file = open(self.path(digest), "rb")
+        try:
+            size = os.fstat(file.fileno()).st_size
+            content_type = detect_content_type(os.pread(file.fileno(), SNIFF_BYTES, 0)) or "application/octet-stream"
+        except BaseException:
+            file.close()
+            raise
+        return StoredObject(file, digest, size, content_type)
+
+    def check_extension(self, filename: str) -> str:
+        extension = file_extension(filename)
+        if extension not in self.allowed_extensions or extension not in FILE_TYPES:
+            raise FileTypeNotAllowedException(extension, self.allowed_extensions)
+        return extension
+
+    async def save(self, chunks: AsyncIterable[bytes], filename: str, owner: Optional[str] = None) -> StoredFile:
+        """청크 스트림을 저장하고 owner 를 기록합니다.
+
+        Raises:
+            FileTypeNotAllowedException: 확장자가 허용되지 않거나 내용이 확장자 형식과 다를 때
+            FileSizeExceededException: max_size 를 넘을 때 (넘는 순간 읽기를 멈춤)
+            FileUploadFailedException: 디스크 쓰기 실패
+        """
+        extension = self.check_extension(filename)
+        loop = asyncio.get_running_loop()
+        try:
+            file = await loop.run_in_executor(None, self._open_temp)
+        except OSError as e:
+            raise FileUploadFailedException(str(e)) from e
+
+        hasher = hashlib.sha256()
+        size = 0
+        head = b""
+        content_type = None
+        buffer: List[bytes] = []
+        buffered = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > self.max_size:
+                    raise FileSizeExceededException(self.max_size)
+                if content_type is None:
+                    head += chunk[:SNIFF_BYTES - len(head)]
+                    if len(head) >= SNIFF_BYTES:
+                        content_type = self._check_type(extension, head)
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.write_buffer_size:
+                    await loop.run_in_executor(None, _write, file, hasher, buffer)
+                    buffer, buffered = [], 0
+            if content_type is None:
+                content_type = self._check_type(extension, head)
+            await loop.run_in_executor(None, _write, file, hasher, buffer)
+            await loop.run_in_executor(None, file.close)
+            path, deduplicated = await loop.run_in_executor(None, self._commit, file.name, hasher.hexdigest(), owner)
+        except OSError as e:
+            _discard(file)
+            raise FileUploadFailedException(str(e)) from e
+        except BaseException:
+            _discard(file)
+            raise
+        return StoredFile(hasher.hexdigest(), size, content_type, extension, path, deduplicated)
+
+    async def adopt(self, source: Union[str, Path], extension: str, owner: Optional[str] = None) -> StoredFile:
+        """디스크에 이미 있는 파일을 복사하지 않고 저장소로 옮기고 owner 를 기록합니다.
+
+        나눠 받은 업로드나 처리 결과처럼 파일로 만들어진 내용을 저장할 때 쓰며, source 는
+        root 와 같은 파일 시스템에 있어야 합니다. 크기 제한은 검사하지 않습니다.
+        성공하면 source 는 옮겨지거나(중복이면) 지워지고, 실패하면 그대로 남습니다.
+
+        Raises:
+            FileTypeNotAllowedException: 내용이 확장자 형식과 다를 때
+            FileUploadFailedException: 디스크 읽기/이동 실패
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            digest, size, head = await loop.run_in_executor(None, _hash_file, str(source), self.write_buffer_size)
+            content_type = self._check_type(extension, head)
+            path, deduplicated = await loop.run_in_executor(None, self._commit, str(source), digest, owner)
+        except OSError as e:
+            raise FileUploadFailedException(str(e)) from e
+        return StoredFile(digest, size, content_type, extension, path, deduplicated)
+
+    def _check_type(self, extension: str, head: bytes) -> str:
+        content_type = sniff_content_type(extension, head)
+        if content_type is None:
+            raise FileTypeNotAllowedException(
+                extension, self.allowed_extensions, detected_type=detect_content_type(head)
+            )
+        return content_type
+
+    def _open_temp(self) -> IO[bytes]:
+        self._temp.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=self._temp, prefix="upload-", delete=False)
+
+    def _commit(self, temp_path: str, digest: str, owner: Optional[str] = None) -> Tuple[Path, bool]:
+        path = self.path(digest)
+        self._add_owner(digest, owner)
+        if path.is_file():
+            os.unlink(temp_path)
+            return path, True
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(temp_path, 0o644)
+        # 같은 내용을 동시에 올려도 rename 은 원자적이고 내용이 같으므로 안전
+        os.replace(temp_path, path)
+        return path, False
+
+def _write(file: IO[bytes], hasher: Any, chunks: List[bytes]) -> None:
+    for chunk in chunks:
+        hasher.update(chunk)
+        file.write(chunk)
+
+def _hash_file(path: str, buffer_size: int) -> Tuple[str, int, bytes]:
+    """(sha256, 크기, 앞부분) - buffer_size 씩 읽으므로 메모리는 파일 크기와 무관"""
+    hasher = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    size = 0
+    with open(path, "rb", buffering=0) as file:
+        head = os.pread(file.fileno(), SNIFF_BYTES, 0)
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+            size += read
+    return hasher.hexdigest(), size, head
+
+def _discard(file: IO[bytes]) -> None:
+    try:
+        file.close()
+        os.unlink(file.name)
+    except OSError:
+        pass
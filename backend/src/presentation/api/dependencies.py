@@ -0,0 +1,68 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import Depends, Request
+from starlette.requests import HTTPConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.common.exceptions import InvalidTokenException
+from infrastructure.audio import AudioProcessor
+from infrastructure.cache import IdentityCache
+from infrastructure.database import Database, IdentityLoaders
+from infrastructure.read_models import OrgChartStore
+from infrastructure.security import PasswordHasher, TokenVerifier
+from infrastructure.storage import ChunkedUploadStore, ContentStore
+from presentation.api.realtime import RealtimeGateway
+
+def get_database(request: Request) -> Database:
+    return request.app.state.database
+
+async def get_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """요청 단위 DB 세션
+
+    응답을 보내기 전에 커밋하고, 엔드포인트에서 예외가 발생하면 롤백합니다.
+    """
+    async with get_database(request).session() as session:
+        yield session
+
+def get_identity_loaders(session: AsyncSession = Depends(get_db_session)) -> IdentityLoaders:
+    """요청 단위 Identity 배치 로더 (FastAPI 가 요청마다 한 번만 생성)"""
+    return IdentityLoaders(session)
+
+def get_org_chart_store(request: Request) -> OrgChartStore:
+    return request.app.state.org_chart_store
+
+def get_identity_cache(request: Request) -> IdentityCache:
+    return request.app.state.identity_cache
+
+def get_password_hasher(request: Request) -> PasswordHasher:
+    return request.app.state.password_hasher
+
+def get_file_store(request: Request) -> ContentStore:
+    return request.app.state.file_store
+
+def get_chunked_upload_store(request: Request) -> ChunkedUploadStore:
+    return request.app.state.chunked_upload_store
+
+def get_audio_processor(request: Request) -> Optional[AudioProcessor]:
+    """음성 후처리 큐 (ENABLE_AUDIO_PROCESSING 이 꺼져 있으면 None)"""
+    return getattr(request.app.state, "audio_processor", None)
+
+def get_token_verifier(request: Request) -> TokenVerifier:
+    return request.app.state.token_verifier
+
+async def get_token_claims(request: Request) -> Dict[str, Any]:
+    """Authorization: Bearer 액세스 토큰의 클레임"""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise InvalidTokenException(reason="missing")
+    return await get_token_verifier(request).verify(token)
+
+def get_file_owner(claims: Dict[str, Any] = Depends(get_token_claims)) -> str:
+    """저장한 파일을 내려받을 수 있는 범위 (회사, 회사가 없으면 사용자)"""
+    if claims.get("company_id"):
+        return f"company:{claims['company_id']}"
+    return f"user:{claims['sub']}"
+
+def get_realtime_gateway(connection: HTTPConnection) -> Optional[RealtimeGateway]:
+    """실시간 알림 연결 (ENABLE_NOTIFICATIONS 가 꺼져 있으면 None)"""
+    return getattr(connection.app.state, "realtime_gateway", None)
@@ -0,0 +1,156 @@
+import asyncio
+import os
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from infrastructure.storage import StoredObject
+
+# ASGI 확장: 파일 디스크립터의 구간을 서버가 sendfile 로 보냄 / 경로의 파일 전체를 서버가 보냄
+ZERO_COPY_SEND = "http.response.zerocopysend"
+PATH_SEND = "http.response.pathsend"
+
+# 내용 주소 파일은 바뀌지 않으므로 오래 캐시 (권한이 필요하므로 private)
+CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Range 헤더의 바이트 범위 (start, end 포함)
+
+    해석할 수 없거나 범위가 여럿이면 None 을 반환합니다 (RFC 9110 에 따라 Range 를 무시하고
+    전체를 보냄).
+
+    Raises:
+        RangeNotSatisfiable: 범위가 파일 밖일 때
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, dash, last = ranges.strip().partition("-")
+    if not dash or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+    if not first:
+        # 끝에서 last 바이트
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """If-None-Match (약한 비교)"""
+    if header is None:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+def content_disposition(filename: str, disposition: str = "attachment") -> str:
+    """한글 파일 이름은 filename* (RFC 6266/5987) 로, 구형 클라이언트용 ASCII 이름도 함께"""
+    fallback = "".join(char for char in filename if char.isascii() and char not in '"\\') or "download"
+    return f"{disposition}; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+class FileRangeResponse(Response):
+    """열린 저장소 파일의 전체 또는 한 범위를 보내는 응답
+
+    서버가 zerocopysend 확장을 지원하면 파일 디스크립터를 넘겨 커널에서 바로 소켓으로
+    복사하고(sendfile), 전체 응답은 pathsend 도 사용합니다. 둘 다 없으면 (uvicorn 등)
+    chunk_size 씩 pread 로 읽으며 다음 조각을 미리 읽어 둡니다. 어느 쪽이든 요청당
+    메모리는 조각 두 개 이하입니다.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(self, stored: StoredObject, byte_range: Optional[Tuple[int, int]], headers: Dict[str, str]):
+        self.stored = stored
+        start, end = byte_range if byte_range is not None else (0, stored.size - 1)
+        self.offset = start
+        self.count = max(end - start + 1, 0)
+        headers = {**headers, "content-length": str(self.count)}
+        if byte_range is not None:
+            headers["content-range"] = f"bytes {start}-{end}/{stored.size}"
+        super().__init__(status_code=206 if byte_range is not None else 200, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            extensions = scope.get("extensions") or {}
+            if scope["method"] == "HEAD" or self.count == 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            elif ZERO_COPY_SEND in extensions:
+                await send({
+                    "type": ZERO_COPY_SEND,
+                    "file": self.stored.file,
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False
+                })
+            elif PATH_SEND in extensions and self.status_code == 200:
+                await send({"type": PATH_SEND, "path": self.stored.file.name})
+            else:
+                await self._send_chunks(send)
+        finally:
+            self.stored.file.close()
+        if self.background is not None:
+            await self.background()
+
+    async def _send_chunks(self, send: Send) -> None:
+        loop = asyncio.get_running_loop()
+        descriptor = self.stored.file.fileno()
+        offset, remaining = self.offset, self.count
+        reading: Optional["asyncio.Future[bytes]"] = loop.run_in_executor(
+            None, os.pread, descriptor, min(self.chunk_size, remaining), offset
+        )
+        try:
+            while remaining > 0:
+                chunk = await reading
+                reading = None
+                if not chunk:
+                    break
+                offset += len(chunk)
+                remaining -= len(chunk)
+                if remaining > 0:
+                    # 보내는 동안 다음 조각을 읽음
+                    reading = loop.run_in_executor(None, os.pread, descriptor, min(self.chunk_size, remaining), offset)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            # send 가 실패해도(연결 끊김) 미리 읽던 조각이 끝난 뒤에 파일을 닫음
+            if reading is not None:
+                await asyncio.wait([reading])
+                if not reading.cancelled():
+                    reading.exception()
+
+def file_response(request: Request, stored: StoredObject, filename: Optional[str] = None) -> Response:
+    """If-None-Match, Range/If-Range 를 반영한 다운로드 응답 (ETag 는 내용의 sha256)"""
+    etag = f'"{stored.digest}"'
+    headers = {"accept-ranges": "bytes", "etag": etag, "cache-control": CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        stored.file.close()
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    # If-Range 가 다르면 (날짜 포함, Last-Modified 를 보내지 않으므로) 전체를 보냄
+    if range_header is not None and request.headers.get("if-range", etag) == etag:
+        try:
+            byte_range = parse_range(range_header, stored.size)
+        except RangeNotSatisfiable:
+            stored.file.close()
+            return Response(status_code=416, headers={**headers, "content-range": f"bytes */{stored.size}"})
+
+    headers["content-type"] = stored.content_type
+    if filename:
+        headers["content-disposition"] = content_disposition(filename)
+    return FileRangeResponse(stored, byte_range, headers)
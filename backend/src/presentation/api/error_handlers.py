@@ -1,53 +1,59 @@
 import logging
+from typing import Optional
 from fastapi import Request, FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from redis.exceptions import RedisError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError as PydanticValidationError
 
 from domain.common.exceptions import DomainException
-from application.common.exceptions import ApplicationException
+from application.common.exceptions import ApplicationException, ServiceUnavailableException
 from application.common.exception_translators import ExceptionTranslator
 from application.common.constants import ResponseCode
+from presentation.api.error_responses import error_response
 
 logger = logging.getLogger(__name__)
 
 def setup_error_handlers(app: FastAPI) -> None:
+    # 운영 환경(debug 아님)에서는 data 가 항상 같으므로 미리 만든 값을 재사용
+    hidden_error = {"error": None}
+
+    def _debug_data(exc: Exception) -> dict:
+        return {"error": str(exc)} if app.debug else hidden_error
+
+    def _respond(request: Request, status_code: int, code: int, data: Optional[dict]) -> Response:
+        # 메트릭 미들웨어가 에러 코드별로 집계할 수 있도록 기록
+        request.state.response_code = code
+        return error_response(status_code, code, data)
+
     @app.exception_handler(ApplicationException)
     async def application_exception_handler(
         request: Request,
         exc: ApplicationException
-    ) -> JSONResponse:
-        response_code = ResponseCode(exc.code)
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "code": exc.code,
-                "message": response_code.format_message(**exc.additional_info) if exc.additional_info else response_code.message,
-                "data": exc.additional_info if exc.additional_info else None
-            }
-        )
+    ) -> Response:
+        exc.log_error(path=request.url.path)
+        response = _respond(request, exc.status_code, exc.code, exc.additional_info)
+        if isinstance(exc, ServiceUnavailableException) and exc.retry_after is not None:
+            response.headers["Retry-After"] = str(exc.retry_after)
+        return response
 
     @app.exception_handler(DomainException)
     async def domain_exception_handler(
         request: Request,
         exc: DomainException
-    ) -> JSONResponse:
+    ) -> Response:
         app_exc = ExceptionTranslator.translate(exc)
-        response_code = ResponseCode(app_exc.code)
-        return JSONResponse(
-            status_code=app_exc.status_code,
-            content={
-                "code": app_exc.code,
-                "message": response_code.format_message(**app_exc.additional_info) if app_exc.additional_info else response_code.message,
-                "data": app_exc.additional_info if app_exc.additional_info else None
-            }
+        app_exc.log_error(
+            path=request.url.path,
+            exception_type=exc.__class__.__name__
         )
+        return _respond(request, app_exc.status_code, app_exc.code, app_exc.additional_info)
 
     @app.exception_handler(PydanticValidationError)
     async def validation_exception_handler(
         request: Request,
         exc: PydanticValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         errors = [
             {
                 "field": ".".join(str(loc) for loc in error["loc"]),
@@ -64,61 +70,58 @@ def setup_error_handlers(app: FastAPI) -> None:
             }
         )
         
-        return JSONResponse(
-            status_code=422,
-            content={
-                "code": ResponseCode.VALIDATION_ERROR,
-                "message": ResponseCode.VALIDATION_ERROR.message,
-                "data": {"errors": errors}
-            }
-        )
+        return _respond(request, 422, ResponseCode.VALIDATION_ERROR, {"errors": errors})
 
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(
         request: Request,
         exc: SQLAlchemyError
-    ) -> JSONResponse:
+    ) -> Response:
         logger.error(
             "Database error",
             exc_info=exc,
             extra={
                 "path": request.url.path,
-                "error": str(exc)
+                "error": str(exc),
+                "error_code": str(ResponseCode.DATABASE_ERROR),
+                "exception_type": exc.__class__.__name__
             }
         )
         
-        return JSONResponse(
-            status_code=500,
-            content={
-                "code": ResponseCode.DATABASE_ERROR,
-                "message": ResponseCode.DATABASE_ERROR.message,
-                "data": {
-                    "error": str(exc) if app.debug else None
-                }
+        return _respond(request, 500, ResponseCode.DATABASE_ERROR, _debug_data(exc))
+
+    @app.exception_handler(RedisError)
+    async def redis_exception_handler(
+        request: Request,
+        exc: RedisError
+    ) -> Response:
+        logger.error(
+            "Redis error",
+            exc_info=exc,
+            extra={
+                "path": request.url.path,
+                "error": str(exc),
+                "error_code": str(ResponseCode.REDIS_ERROR),
+                "exception_type": exc.__class__.__name__
             }
         )
+        
+        return _respond(request, 500, ResponseCode.REDIS_ERROR, _debug_data(exc))
 
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request,
         exc: Exception
-    ) -> JSONResponse:
+    ) -> Response:
         logger.error(
             "Unhandled exception",
             exc_info=exc,
             extra={
                 "path": request.url.path,
-                "error": str(exc)
+                "error": str(exc),
+                "error_code": str(ResponseCode.INTERNAL_SERVER_ERROR),
+                "exception_type": exc.__class__.__name__
             }
         )
         
-        return JSONResponse(
-            status_code=500,
-            content={
-                "code": ResponseCode.INTERNAL_SERVER_ERROR,
-                "message": ResponseCode.INTERNAL_SERVER_ERROR.message,
-                "data": {
-                    "error": str(exc) if app.debug else None
-                }
-            }
-        ) 
\ No newline at end of file
+        return _respond(request, 500, ResponseCode.INTERNAL_SERVER_ERROR, _debug_data(exc)) 
\ No newline at end of file
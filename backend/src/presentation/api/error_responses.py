@@ -0,0 +1,59 @@
+import json
+from typing import Any, Dict, Optional
+
+from starlette.responses import Response
+
+from application.common.constants import ResponseCode
+
+_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    allow_nan=False,
+    indent=None,
+    separators=(",", ":")
+)
+
+def _dumps(value: Any) -> bytes:
+    """JSONResponse.render 와 같은 규칙으로 직렬화"""
+    return _encoder.encode(value).encode("utf-8")
+
+def _build_prefix(code: int, message: str) -> bytes:
+    return b'{"code":%d,"message":%s,"data":' % (code, _dumps(message))
+
+# ResponseCode 값별 사전 직렬화 본문
+#   _PREFIXES: '{"code":...,"message":"...","data":' (data 직렬화 결과만 이어 붙임)
+#   _STATIC_BODIES: data 가 null 인 완성된 본문
+_PREFIXES: Dict[int, bytes] = {}
+_STATIC_BODIES: Dict[int, bytes] = {}
+_TEMPLATED: Dict[int, bool] = {}
+
+for _member in ResponseCode.__members__.values():
+    if int(_member) not in _PREFIXES:
+        _PREFIXES[int(_member)] = _build_prefix(_member, _member.message)
+        _STATIC_BODIES[int(_member)] = _PREFIXES[int(_member)] + b"null}"
+        _TEMPLATED[int(_member)] = "{" in _member.message
+
+def render_error_body(code: int, data: Optional[Dict[str, Any]] = None) -> bytes:
+    """에러 응답 본문을 직렬화합니다.
+
+    데이터가 없으면 미리 만든 본문을 그대로 반환하고, 있으면 미리 만든
+    code/message 부분 뒤에 data 직렬화 결과만 붙입니다. 메시지에 포맷
+    자리표시자가 있는 코드만 format_message 를 호출합니다.
+    """
+    if not data:
+        return _STATIC_BODIES[code]
+    if _TEMPLATED[code]:
+        response_code = ResponseCode(code)
+        return _build_prefix(response_code, response_code.format_message(**data)) + _dumps(data) + b"}"
+    return _PREFIXES[code] + _dumps(data) + b"}"
+
+def error_response(
+    status_code: int,
+    code: int,
+    data: Optional[Dict[str, Any]] = None
+) -> Response:
+    """{"code","message","data"} 형식의 JSON 에러 응답을 생성합니다."""
+    return Response(
+        content=render_error_body(code, data),
+        status_code=status_code,
+        media_type="application/json"
+    )
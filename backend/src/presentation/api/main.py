@@ -1,16 +1,244 @@
+from elasticsearch import AsyncElasticsearch
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
+from config import settings
+from application.common.logging_config import configure_logging, shutdown_logging
+from infrastructure.audio import AudioProcessor
+from infrastructure.cache import IdentityCache, IdentityCacheInvalidator, get_cache_metrics
+from infrastructure.database import Database, get_pool_metrics
+from infrastructure.notifications import InAppChannel, NotificationEngine, RealtimeHub, iter_recipient_batches
+from infrastructure.rate_limit import GcraRateLimiter, RateLimit
+from infrastructure.redis import create_redis, get_redis_metrics
+from infrastructure.search import (
+    BulkIndexer,
+    DirectoryIndex,
+    SearchChangeTracker,
+    elasticsearch_user_search,
+    load_company_directory
+)
+from infrastructure.read_models import OrgChartChangeTracker, OrgChartStore, load_org_chart
+from infrastructure.security import PasswordHasher, RevokedTokenStore, TokenVerifier
+from infrastructure.storage import ChunkedUploadStore, ContentStore
 from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.metrics import PrometheusMiddleware, mark_worker_dead, metrics_endpoint
+from presentation.api.rate_limit import RateLimitMiddleware, token_rate_limit_keys
+from presentation.api.realtime import RealtimeGateway
+from presentation.api.v1.files import router as files_router
+from presentation.api.v1.notifications import router as notifications_router
+from presentation.api.v1.uploads import router as uploads_router
 
 def create_app() -> FastAPI:
+    # 로깅 설정 (파일/Sentry 핸들러는 큐 뒤의 백그라운드 스레드에서 처리)
+    configure_logging(
+        settings.ENVIRONMENT.value,
+        queue_enabled=settings.LOG_QUEUE_ENABLED,
+        queue_max_size=settings.LOG_QUEUE_MAX_SIZE,
+        queue_full_policy=settings.LOG_QUEUE_FULL_POLICY,
+        queue_batch_size=settings.LOG_QUEUE_BATCH_SIZE,
+        queue_flush_interval=settings.LOG_QUEUE_FLUSH_INTERVAL,
+        error_log_burst=settings.ERROR_LOG_BURST,
+        error_log_window=settings.ERROR_LOG_WINDOW_SECONDS,
+        error_log_sample_size=settings.ERROR_LOG_SAMPLE_SIZE,
+        log_dir=settings.LOG_DIR
+    )
+
     app = FastAPI(
         title="TeamOn API",
         description="TeamOn Productivity Platform API",
         version="1.0.0"
     )
 
+    # 에러 핸들러 설정
+    setup_error_handlers(app)
+
+    # 데이터베이스 (요청별 세션은 presentation.api.dependencies.get_db_session)
+    database = Database(
+        settings.DATABASE_URL,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_connections=settings.DATABASE_MAX_CONNECTIONS,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        echo=settings.DATABASE_ECHO,
+        metrics=get_pool_metrics() if settings.ENABLE_METRICS else None
+    )
+    app.state.database = database
+
+    # Redis (동시 명령은 파이프라인 하나로 묶어 전송)
+    redis = create_redis(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        pool_timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        command_timeout=settings.REDIS_COMMAND_TIMEOUT_SECONDS,
+        batch_window=settings.REDIS_BATCH_WINDOW_SECONDS,
+        max_batch_size=settings.REDIS_MAX_BATCH_SIZE,
+        metrics=get_redis_metrics() if settings.ENABLE_METRICS else None
+    )
+    app.state.redis = redis
+
+    # 조직도 읽기 모델 (Identity 변경은 커밋 후 변경분만 반영)
+    async def build_org_chart(company_id: str):
+        async with database.session() as session:
+            return await load_org_chart(session, company_id)
+
+    org_chart_store = OrgChartStore(
+        build_org_chart,
+        redis=redis,
+        local_ttl=settings.ORG_CHART_LOCAL_TTL_SECONDS,
+        local_max_entries=settings.ORG_CHART_LOCAL_MAX_ENTRIES,
+        redis_ttl=settings.ORG_CHART_REDIS_TTL_SECONDS
+    )
+    org_chart_tracker = OrgChartChangeTracker(org_chart_store)
+    org_chart_tracker.register(database.sync_session_class)
+    app.state.org_chart_store = org_chart_store
+
+    # 사용자/회사 조회 캐시 (User/Company 변경은 커밋 후 무효화)
+    identity_cache = IdentityCache(
+        database.session,
+        redis=redis,
+        local_ttl=settings.IDENTITY_CACHE_LOCAL_TTL_SECONDS,
+        local_max_entries=settings.IDENTITY_CACHE_LOCAL_MAX_ENTRIES,
+        redis_ttl=settings.IDENTITY_CACHE_REDIS_TTL_SECONDS,
+        metrics=get_cache_metrics() if settings.ENABLE_METRICS else None
+    )
+    identity_cache_invalidator = IdentityCacheInvalidator(identity_cache)
+    identity_cache_invalidator.register(database.sync_session_class)
+    app.state.identity_cache = identity_cache
+
+    # 검색 색인 (User/Company/CompanyUser/Team 변경은 커밋 후 큐에 넣고 백그라운드에서 bulk 전송)
+    elasticsearch = AsyncElasticsearch(
+        settings.ELASTICSEARCH_URL,
+        basic_auth=(
+            (settings.ELASTICSEARCH_USERNAME, settings.ELASTICSEARCH_PASSWORD)
+            if settings.ELASTICSEARCH_USERNAME else None
+        ),
+        verify_certs=settings.ELASTICSEARCH_VERIFY_CERTS
+    )
+    search_indexer = BulkIndexer(
+        elasticsearch,
+        index_prefix=settings.ELASTICSEARCH_INDEX_PREFIX,
+        batch_size=settings.SEARCH_INDEX_BATCH_SIZE,
+        flush_interval=settings.SEARCH_INDEX_FLUSH_INTERVAL_SECONDS,
+        max_pending=settings.SEARCH_INDEX_MAX_PENDING,
+        max_retries=settings.SEARCH_INDEX_MAX_RETRIES,
+        dead_letter_path=settings.SEARCH_INDEX_DEAD_LETTER_PATH
+    )
+
+    # 직원 자동완성 (워커 메모리 접두어 색인, 오타는 Elasticsearch 로 fallback)
+    async def build_directory(company_id: str):
+        async with database.session() as session:
+            return await load_company_directory(session, company_id)
+
+    directory_index = DirectoryIndex(
+        build_directory,
+        fallback=elasticsearch_user_search(elasticsearch, settings.ELASTICSEARCH_INDEX_PREFIX),
+        ttl=settings.DIRECTORY_INDEX_TTL_SECONDS,
+        max_companies=settings.DIRECTORY_INDEX_MAX_COMPANIES,
+        rebuild_threshold=settings.DIRECTORY_INDEX_REBUILD_THRESHOLD
+    )
+    search_change_tracker = SearchChangeTracker(search_indexer, directory_index)
+    search_change_tracker.register(database.sync_session_class)
+    app.state.elasticsearch = elasticsearch
+    app.state.search_indexer = search_indexer
+    app.state.directory_index = directory_index
+
+    # 업로드 파일 저장소 (본문을 받는 대로 검사/해시하며 저장, 같은 내용은 한 번만 저장)
+    file_store = ContentStore(
+        settings.UPLOAD_DIRECTORY,
+        max_size=settings.MAX_UPLOAD_SIZE,
+        allowed_extensions=settings.ALLOWED_UPLOAD_EXTENSIONS,
+        write_buffer_size=settings.UPLOAD_WRITE_BUFFER_SIZE
+    )
+    app.state.file_store = file_store
+
+    # 분할 업로드 (조각별 sha256 확인, 이어 올리기, 다 받으면 복사 없이 file_store 로 이동)
+    app.state.chunked_upload_store = ChunkedUploadStore(
+        file_store,
+        max_size=settings.CHUNKED_UPLOAD_MAX_SIZE,
+        allowed_extensions=settings.CHUNKED_UPLOAD_EXTENSIONS,
+        chunk_size=settings.CHUNKED_UPLOAD_CHUNK_SIZE,
+        expires_after=settings.CHUNKED_UPLOAD_EXPIRE_SECONDS
+    )
+
+    # 음성 후처리 (파형, 변환은 프로세스 풀에서 동시 처리 수를 제한해 실행)
+    audio_processor = None
+    if settings.ENABLE_AUDIO_PROCESSING:
+        audio_processor = AudioProcessor(file_store, max_workers=settings.AUDIO_PROCESSING_WORKERS)
+    app.state.audio_processor = audio_processor
+
+    # 알림 (대상을 묶음으로 펼쳐 채널별 스트림으로 전송, 푸시/이메일은 발송 transport 를 붙이면 channels 에 추가)
+    notification_engine = None
+    if settings.ENABLE_NOTIFICATIONS:
+        notification_engine = NotificationEngine(
+            redis,
+            recipients=lambda company_id, audience, batch_size: iter_recipient_batches(
+                database.session, company_id, audience, batch_size
+            ),
+            channels=[InAppChannel(redis, inbox_size=settings.NOTIFICATION_INBOX_SIZE)],
+            fanout_batch_size=settings.NOTIFICATION_FANOUT_BATCH_SIZE,
+            coalesce_window=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS,
+            channel_concurrency=settings.NOTIFICATION_CHANNEL_CONCURRENCY,
+            max_retries=settings.NOTIFICATION_MAX_RETRIES,
+            max_stream_length=settings.NOTIFICATION_STREAM_MAX_LENGTH
+        )
+    app.state.notification_engine = notification_engine
+
+    # 비밀번호 해시 (이벤트 루프를 막지 않도록 프로세스 풀에서 실행)
+    password_hasher = PasswordHasher(
+        settings.PASSWORD_HASH_ALGORITHM,
+        rounds=settings.PASSWORD_SALT_ROUNDS,
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING
+    )
+    app.state.password_hasher = password_hasher
+
+    # 토큰 검증 (폐기 여부는 블룸 필터에 걸린 토큰만 Redis 에서 확인)
+    token_verifier = TokenVerifier(
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+        revocations=RevokedTokenStore(redis),
+        cache_max_entries=settings.TOKEN_CLAIMS_CACHE_MAX_ENTRIES,
+        bloom_capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+        bloom_error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+        resync_interval=settings.TOKEN_REVOCATION_RESYNC_SECONDS
+    )
+    app.state.token_verifier = token_verifier
+
+    # 실시간 알림 (WebSocket/SSE 연결은 워커당 pub/sub 구독 하나로 받아 사용자/회사별로 분배)
+    realtime_hub = None
+    if settings.ENABLE_NOTIFICATIONS:
+        realtime_hub = RealtimeHub(
+            redis,
+            max_connections=settings.REALTIME_MAX_CONNECTIONS,
+            max_pending=settings.REALTIME_MAX_PENDING_MESSAGES
+        )
+        app.state.realtime_gateway = RealtimeGateway(
+            realtime_hub,
+            token_verifier,
+            heartbeat_interval=settings.REALTIME_HEARTBEAT_SECONDS,
+            heartbeat_timeout=settings.REALTIME_HEARTBEAT_TIMEOUT_SECONDS,
+            send_timeout=settings.REALTIME_SEND_TIMEOUT_SECONDS
+        )
+
+    # 레이트 리밋 (미들웨어는 나중에 추가한 것이 바깥쪽이므로 CORS/메트릭보다 먼저 추가)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=GcraRateLimiter(
+                redis,
+                max_lease=settings.RATE_LIMIT_MAX_LEASE,
+                lease_ttl=settings.RATE_LIMIT_LEASE_TTL_SECONDS
+            ),
+            keys=token_rate_limit_keys(
+                token_verifier,
+                user_quota=RateLimit(settings.RATE_LIMIT_REQUESTS_PER_MINUTE),
+                company_quota=RateLimit(settings.RATE_LIMIT_COMPANY_REQUESTS_PER_MINUTE)
+            ),
+            exclude_paths=("/health", settings.PROMETHEUS_METRICS_PATH)
+        )
+
     # CORS 설정
     app.add_middleware(
         CORSMiddleware,
@@ -26,8 +254,55 @@ def create_app() -> FastAPI:
         allowed_hosts=["*"]  # 프로덕션에서는 실제 도메인으로 변경
     )
 
-    # 에러 핸들러 설정
-    setup_error_handlers(app)
+    # 메트릭 설정 (멀티 워커 실행 시 PROMETHEUS_MULTIPROC_DIR 환경 변수 필요)
+    if settings.ENABLE_METRICS:
+        app.add_middleware(
+            PrometheusMiddleware,
+            exclude_paths=(settings.PROMETHEUS_METRICS_PATH,)
+        )
+        app.add_route(settings.PROMETHEUS_METRICS_PATH, metrics_endpoint, include_in_schema=False)
+
+    @app.on_event("startup")
+    async def warmup_database() -> None:
+        if settings.DATABASE_POOL_WARMUP:
+            await database.warmup()
+        await password_hasher.warmup()
+        await token_verifier.start()
+        search_indexer.start()
+        if audio_processor is not None:
+            await audio_processor.start()
+        if notification_engine is not None:
+            await notification_engine.start()
+        if realtime_hub is not None:
+            await realtime_hub.start()
+
+    @app.on_event("shutdown")
+    async def dispose_database() -> None:
+        org_chart_tracker.unregister()
+        await org_chart_tracker.drain()
+        identity_cache_invalidator.unregister()
+        await identity_cache_invalidator.drain()
+        await token_verifier.stop()
+        search_change_tracker.unregister()
+        await search_indexer.stop()
+        if audio_processor is not None:
+            await audio_processor.stop()
+        if notification_engine is not None:
+            await notification_engine.stop()
+        if realtime_hub is not None:
+            await realtime_hub.stop()
+        await elasticsearch.close()
+        await database.dispose()
+        await redis.aclose()
+        password_hasher.shutdown()
+
+    @app.on_event("shutdown")
+    async def flush_logs() -> None:
+        shutdown_logging()
+
+    @app.on_event("shutdown")
+    async def release_metrics() -> None:
+        mark_worker_dead()
 
     # 헬스체크
     @app.get("/health")
@@ -39,6 +314,9 @@ def create_app() -> FastAPI:
     # from presentation.api.v1.users import router as users_router
     # app.include_router(auth_router, prefix="/api/v1/auth", tags=["Auth"])
     # app.include_router(users_router, prefix="/api/v1/users", tags=["Users"])
+    app.include_router(files_router, prefix="/api/v1/files", tags=["Files"])
+    app.include_router(uploads_router, prefix="/api/v1/uploads", tags=["Uploads"])
+    app.include_router(notifications_router, prefix="/api/v1/notifications", tags=["Notifications"])
 
     return app
 
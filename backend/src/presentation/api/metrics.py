@@ -0,0 +1,180 @@
+import os
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.common.constants import ResponseCode
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# 라우트에 매칭되지 않은 요청(404 스캔 등)은 한 라벨로 모아 카디널리티를 제한
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class HttpMetrics:
+    """HTTP 요청/에러 메트릭 모음
+
+    라벨 조합별 자식 메트릭을 캐시해 요청마다 labels() 조회(락 포함)를 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        self.requests = Counter(
+            "http_requests_total",
+            "HTTP 요청 수",
+            ["method", "route", "status"],
+            registry=registry
+        )
+        self.latency = Histogram(
+            "http_request_duration_seconds",
+            "HTTP 요청 처리 시간(초)",
+            ["method", "route"],
+            buckets=tuple(buckets),
+            registry=registry
+        )
+        self.in_progress = Gauge(
+            "http_requests_in_progress",
+            "처리 중인 HTTP 요청 수",
+            ["method"],
+            multiprocess_mode="livesum",
+            registry=registry
+        )
+        self.errors = Counter(
+            "http_errors_total",
+            "ResponseCode별 에러 응답 수",
+            ["route", "code"],
+            registry=registry
+        )
+        self._children: Dict[Tuple[Any, ...], Any] = {}
+
+    def _child(self, metric: Any, *labels: str) -> Any:
+        key = (id(metric),) + labels
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*labels)
+        return child
+
+    def in_progress_for(self, method: str) -> Any:
+        return self._child(self.in_progress, method)
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        response_code: Optional[int] = None
+    ) -> None:
+        """요청 하나의 결과를 기록합니다."""
+        self._child(self.requests, method, route, str(status_code)).inc()
+        self._child(self.latency, method, route).observe(duration)
+        if status_code >= 400:
+            code = str(int(response_code)) if response_code is not None else "-"
+            self._child(self.errors, route, code).inc()
+
+class PrometheusMiddleware:
+    """요청 수, 라우트 템플릿별 지연 시간, 처리 중 요청 수, 에러 코드를 기록하는 ASGI 미들웨어
+
+    라우트 라벨은 실제 경로가 아니라 라우트 템플릿(/users/{user_id})을 사용합니다.
+    에러 핸들러가 request.state.response_code 에 남긴 ResponseCode를 에러 라벨로 씁니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: Optional[HttpMetrics] = None,
+        exclude_paths: Iterable[str] = ("/metrics",)
+    ):
+        self.app = app
+        self.metrics = metrics or get_http_metrics()
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = self.metrics.in_progress_for(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # 일반 예외 핸들러는 이 미들웨어 바깥(ServerErrorMiddleware)에서 응답
+            status_code = 500
+            response_code = ResponseCode.INTERNAL_SERVER_ERROR
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            in_progress.dec()
+            if response_code is None:
+                response_code = scope.get("state", {}).get("response_code")
+            self.metrics.observe(method, _route_template(scope), status_code, duration, response_code)
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_ROUTE)
+
+_http_metrics: Optional[HttpMetrics] = None
+
+def get_http_metrics() -> HttpMetrics:
+    """기본 레지스트리에 등록된 HttpMetrics 인스턴스를 반환합니다."""
+    global _http_metrics
+    if _http_metrics is None:
+        _http_metrics = HttpMetrics()
+    return _http_metrics
+
+def is_multiprocess_mode() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+def render_metrics() -> bytes:
+    """노출할 메트릭을 직렬화합니다.
+
+    멀티 프로세스 모드(PROMETHEUS_MULTIPROC_DIR 설정)에서는 모든 워커가 남긴
+    파일을 합산합니다.
+    """
+    if is_multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus 스크레이프 엔드포인트 (파일 읽기는 스레드 풀에서 처리)"""
+    body = await run_in_threadpool(render_metrics)
+    return Response(content=body, media_type=CONTENT_TYPE_LATEST)
+
+def mark_worker_dead() -> None:
+    """워커 종료 시 livesum 게이지에서 현재 프로세스 값을 제거합니다."""
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,117 @@
+import math
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.common.constants import ResponseCode
+from application.common.exceptions import AuthenticationException
+from infrastructure.rate_limit import GcraRateLimiter, RateLimit, RateLimitDecision
+from infrastructure.security import TokenVerifier
+from presentation.api.error_responses import error_response
+
+# 요청마다 적용할 (키, 한도) 목록
+RateLimitKeys = Callable[[Scope], Awaitable[List[Tuple[str, RateLimit]]]]
+
+def _seconds(value: float) -> bytes:
+    return str(max(0, math.ceil(value))).encode()
+
+def rate_limit_headers(decision: RateLimitDecision) -> List[Tuple[bytes, bytes]]:
+    """RateLimit-Limit / RateLimit-Remaining / RateLimit-Reset (+ 거절 시 Retry-After)"""
+    headers = [
+        (b"ratelimit-limit", str(decision.limit).encode()),
+        (b"ratelimit-remaining", str(max(0, decision.remaining)).encode()),
+        (b"ratelimit-reset", _seconds(decision.reset_after))
+    ]
+    if not decision.allowed:
+        headers.append((b"retry-after", _seconds(decision.retry_after)))
+    return headers
+
+def _bearer_token(scope: Scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token if scheme.lower() == "bearer" and token else None
+    return None
+
+def token_rate_limit_keys(
+    verifier: TokenVerifier,
+    user_quota: RateLimit,
+    company_quota: Optional[RateLimit] = None,
+    anonymous_quota: Optional[RateLimit] = None
+) -> RateLimitKeys:
+    """액세스 토큰의 사용자(sub)와 회사(company_id)별 키를 만듭니다.
+
+    토큰이 없거나 유효하지 않으면 클라이언트 IP 로 제한하고, 인증 오류는
+    엔드포인트에서 응답하도록 그대로 통과시킵니다.
+    """
+    anonymous_quota = anonymous_quota or user_quota
+
+    async def keys(scope: Scope) -> List[Tuple[str, RateLimit]]:
+        token = _bearer_token(scope)
+        if token is not None:
+            try:
+                claims = await verifier.verify(token)
+            except AuthenticationException:
+                pass
+            else:
+                result = [(f"user:{claims['sub']}", user_quota)]
+                if company_quota is not None and claims.get("company_id"):
+                    result.append((f"company:{claims['company_id']}", company_quota))
+                return result
+        client = scope.get("client")
+        return [(f"ip:{client[0] if client else '-'}", anonymous_quota)]
+
+    return keys
+
+class RateLimitMiddleware:
+    """요청을 키별 한도로 제한하는 ASGI 미들웨어
+
+    허용된 응답에는 RateLimit-* 헤더를 붙이고, 한도를 넘으면 429
+    RATE_LIMIT_EXCEEDED 와 Retry-After 로 응답합니다. 키가 여러 개면
+    가장 빡빡한 결과를 헤더로 씁니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: GcraRateLimiter,
+        keys: RateLimitKeys,
+        exclude_paths: Iterable[str] = ()
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.keys = keys
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        limits = await self.keys(scope)
+        if not limits:
+            await self.app(scope, receive, send)
+            return
+
+        # 한 키에서 거절되면 다른 키(사용자 한도 등)의 토큰도 쓰지 않음
+        decision = await self.limiter.acquire_all(limits)
+
+        headers = rate_limit_headers(decision)
+        if not decision.allowed:
+            # 메트릭 미들웨어가 에러 코드별로 집계할 수 있도록 기록
+            scope.setdefault("state", {})["response_code"] = ResponseCode.RATE_LIMIT_EXCEEDED
+            response = error_response(
+                429,
+                ResponseCode.RATE_LIMIT_EXCEEDED,
+                {"retry_after": math.ceil(decision.retry_after)}
+            )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+from starlette.requests import HTTPConnection
+from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+
+from application.common.exceptions import InvalidTokenException, ServiceUnavailableException
+from infrastructure.notifications import LocalConnection, RealtimeHub
+from infrastructure.security import TokenVerifier
+
+# WebSocket 종료 코드
+CLOSE_GOING_AWAY = 1001  # 서버 종료
+CLOSE_POLICY_VIOLATION = 1008  # 인증 실패
+CLOSE_TRY_AGAIN_LATER = 1013  # 워커 연결 수 초과, 느린 소비자
+CLOSE_TOKEN_EXPIRED = 4401  # 연결 중 토큰 만료/폐기 (새 토큰으로 다시 연결)
+CLOSE_HEARTBEAT_TIMEOUT = 4408  # 클라이언트 응답 없음
+
+_CLOSE_CODES = {
+    "shutdown": CLOSE_GOING_AWAY,
+    "slow_consumer": CLOSE_TRY_AGAIN_LATER,
+    "token_expired": CLOSE_TOKEN_EXPIRED,
+    "token_revoked": CLOSE_TOKEN_EXPIRED,
+    "heartbeat_timeout": CLOSE_HEARTBEAT_TIMEOUT
+}
+
+PING_FRAME = '{"type":"ping"}'
+
+def notification_frame(message: str) -> str:
+    """hub 메시지(JSON)를 다시 직렬화하지 않고 감쌉니다."""
+    return '{"type":"notification","data":' + message + '}'
+
+def stream_token(connection: HTTPConnection) -> Optional[str]:
+    """Authorization: Bearer 또는 access_token 쿼리 (브라우저 WebSocket/EventSource 는 헤더를 못 붙임)"""
+    scheme, _, token = connection.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return token
+    return connection.query_params.get("access_token") or None
+
+class RealtimeGateway:
+    """실시간 알림 WebSocket/SSE 연결 처리
+
+    - 연결마다 구독을 만들지 않고 워커의 RealtimeHub 에 등록만 합니다.
+    - 보낼 것이 없으면 heartbeat_interval 마다 ping 을 보내고, WebSocket 은
+      heartbeat_timeout 동안 클라이언트 프레임(pong 등)이 없으면 끊습니다.
+    - 쌓인 메시지가 hub 의 max_pending 을 넘거나, WebSocket 에서 한 번 보내는 데
+      send_timeout 초를 넘기면 느린 소비자로 끊습니다.
+    - 토큰은 연결할 때 한 번 검증하고, 만료 시각(exp)이 되거나 폐기되면 끊습니다.
+      폐기는 메시지를 보내기 전과 ping 마다 확인합니다 (최대 heartbeat_interval 늦음).
+    """
+
+    def __init__(
+        self,
+        hub: RealtimeHub,
+        verifier: TokenVerifier,
+        heartbeat_interval: float = 25.0,
+        heartbeat_timeout: float = 60.0,
+        send_timeout: float = 10.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.hub = hub
+        self.verifier = verifier
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.send_timeout = send_timeout
+        self._clock = clock
+
+    async def authenticate(self, connection: HTTPConnection) -> Dict[str, Any]:
+        token = stream_token(connection)
+        if token is None:
+            raise InvalidTokenException(reason="missing")
+        return await self.verifier.verify(token)
+
+    def _wait_timeout(self, claims: Dict[str, Any]) -> float:
+        """다음 메시지를 기다릴 시간 (토큰 만료 시각을 넘기지 않음)"""
+        return max(min(self.heartbeat_interval, float(claims["exp"]) - self._clock()), 0.0)
+
+    async def _token_invalid(self, claims: Dict[str, Any]) -> Optional[str]:
+        """연결 중 토큰이 만료/폐기되었으면 끊는 이유"""
+        if self._clock() >= float(claims["exp"]):
+            return "token_expired"
+        if await self.verifier.is_revoked(claims):
+            return "token_revoked"
+        return None
+
+    async def serve_websocket(self, websocket: WebSocket, claims: Dict[str, Any]) -> None:
+        connection = await self.hub.connect(claims["sub"], claims.get("company_id"))
+        if connection is None:
+            await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+            return
+        await websocket.accept()
+        loop = asyncio.get_running_loop()
+        last_seen = loop.time()
+
+        async def receive() -> None:
+            nonlocal last_seen
+            try:
+                while True:
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        return
+                    last_seen = loop.time()
+            finally:
+                self.hub.disconnect(connection)
+
+        receiver = loop.create_task(receive())
+        try:
+            while True:
+                message = await connection.get(self._wait_timeout(claims))
+                if connection.closed:
+                    break
+                reason = await self._token_invalid(claims)
+                if reason is not None:
+                    self.hub.disconnect(connection, reason)
+                    break
+                if message is None:
+                    if loop.time() - last_seen > self.heartbeat_timeout:
+                        self.hub.disconnect(connection, "heartbeat_timeout")
+                        break
+                    frame = PING_FRAME
+                else:
+                    frame = notification_frame(message)
+                try:
+                    await asyncio.wait_for(websocket.send_text(frame), self.send_timeout)
+                except asyncio.TimeoutError:
+                    self.hub.disconnect(connection, "slow_consumer")
+                    break
+        except (WebSocketDisconnect, RuntimeError, OSError):
+            pass
+        finally:
+            receiver.cancel()
+            await asyncio.gather(receiver, return_exceptions=True)
+            self.hub.disconnect(connection)
+            await self._close(websocket, connection)
+
+    async def _close(self, websocket: WebSocket, connection: LocalConnection) -> None:
+        code = _CLOSE_CODES.get(connection.close_reason)
+        if code is None or websocket.application_state != WebSocketState.CONNECTED:
+            return
+        try:
+            await websocket.close(code=code)
+        except (RuntimeError, OSError):
+            pass
+
+    async def event_stream(self, claims: Dict[str, Any]) -> StreamingResponse:
+        connection = await self.hub.connect(claims["sub"], claims.get("company_id"))
+        if connection is None:
+            raise ServiceUnavailableException("realtime_connections", retry_after=5)
+        return StreamingResponse(
+            self._events(connection, claims),
+            media_type="text/event-stream",
+            headers={"cache-control": "no-cache", "x-accel-buffering": "no"}
+        )
+
+    async def _events(self, connection: LocalConnection, claims: Dict[str, Any]) -> AsyncIterator[str]:
+        try:
+            # 끊긴 뒤(느린 소비자, 서버 종료) EventSource 가 다시 연결하기까지 기다리는 시간(ms)
+            yield "retry: 3000\n\n"
+            while True:
+                message = await connection.get(self._wait_timeout(claims))
+                if connection.closed:
+                    return
+                reason = await self._token_invalid(claims)
+                if reason is not None:
+                    self.hub.disconnect(connection, reason)
+                    return
+                yield ": ping\n\n" if message is None else f"event: notification\ndata: {message}\n\n"
+        finally:
+            self.hub.disconnect(connection)
@@ -0,0 +1,162 @@
+import base64
+import binascii
+from typing import AsyncIterator, Dict, List, Optional
+
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import Request
+
+from application.common.exceptions import FileSizeExceededException, ValidationFailedException
+from infrastructure.storage import ChunkedUploadStore, ContentStore, StoredFile, UploadSession
+
+# multipart 본문에서 파일이 아닌 부분(경계, 헤더, 다른 필드)에 허용하는 크기
+MULTIPART_OVERHEAD = 64 * 1024
+
+class _MultipartFile:
+    """multipart/form-data 본문을 받는 대로 파싱해 field 파일 파트의 데이터만 꺼냅니다."""
+
+    def __init__(self, boundary: bytes, field: str):
+        self.field = field
+        self.filename: Optional[str] = None
+        self.done = False
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._target = False
+        self._data: List[bytes] = []
+        self._parser = MultipartParser(boundary, callbacks={
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end
+        })
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """본문 조각을 파싱하고 그 안에 있던 파일 데이터를 반환합니다."""
+        self._parser.write(chunk)
+        data, self._data = self._data, []
+        return data
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._target = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name, filename = options.get(b"name"), options.get(b"filename")
+        if self.filename is None and name == self.field.encode() and filename is not None:
+            self.filename = filename.decode("utf-8", "replace")
+            self._target = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._target:
+            self._data.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._target:
+            self._target = False
+            self.done = True
+
+def _check_content_length(request: Request, limit: int, max_size: int) -> None:
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+        raise FileSizeExceededException(max_size, {"content_length": int(content_length)})
+
+async def receive_upload(
+    request: Request,
+    store: ContentStore,
+    field: str = "file",
+    filename: Optional[str] = None,
+    owner: Optional[str] = None
+) -> StoredFile:
+    """요청 본문을 메모리나 임시 파일에 모아 두지 않고 받는 대로 저장소에 저장합니다.
+
+    multipart/form-data 이면 field 파일 파트를, 아니면 본문 전체를 filename 으로 저장합니다.
+    owner 는 저장소에 기록되어 내려받을 때 확인합니다.
+    Content-Length 가 제한을 넘으면 본문을 읽기 전에 거절합니다.
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data":
+        if not filename:
+            raise ValidationFailedException("파일 이름이 필요합니다.", field="filename")
+        store.check_extension(filename)
+        _check_content_length(request, store.max_size, store.max_size)
+        return await store.save(request.stream(), filename, owner)
+
+    _check_content_length(request, store.max_size + MULTIPART_OVERHEAD, store.max_size)
+    boundary = options.get(b"boundary")
+    if not boundary:
+        raise ValidationFailedException("multipart boundary 가 없습니다.", field="content-type")
+    multipart = _MultipartFile(boundary, field)
+    body = request.stream()
+    # 파일 파트의 헤더(파일 이름)가 나올 때까지만 읽음
+    pending: List[bytes] = []
+    async for chunk in body:
+        pending.extend(multipart.feed(chunk))
+        if multipart.filename is not None:
+            break
+    if multipart.filename is None:
+        raise ValidationFailedException("업로드할 파일이 없습니다.", field=field)
+
+    async def file_data() -> AsyncIterator[bytes]:
+        for data in pending:
+            yield data
+        pending.clear()
+        if multipart.done:
+            return
+        async for chunk in body:
+            for data in multipart.feed(chunk):
+                yield data
+            if multipart.done:
+                return
+
+    return await store.save(file_data(), multipart.filename, owner)
+
+def parse_content_digest(header: Optional[str]) -> Optional[bytes]:
+    """Content-Digest 헤더(RFC 9530)의 sha-256 값. 없거나 형식이 틀리면 None"""
+    for member in (header or "").split(","):
+        algorithm, _, value = member.strip().partition("=")
+        if algorithm.strip().lower() != "sha-256":
+            continue
+        value = value.strip()
+        if len(value) < 2 or value[0] != ":" or value[-1] != ":":
+            return None
+        try:
+            digest = base64.b64decode(value[1:-1], validate=True)
+        except binascii.Error:
+            return None
+        return digest if len(digest) == 32 else None
+    return None
+
+async def receive_chunk(request: Request, uploads: ChunkedUploadStore, session: UploadSession, index: int) -> None:
+    """분할 업로드의 조각 하나를 본문에서 받아 씁니다.
+
+    조각의 sha256 은 Content-Digest: sha-256=:<base64>: 헤더로 받습니다.
+    Content-Length 가 조각 길이와 다르면 본문을 읽기 전에 거절합니다.
+    """
+    checksum = parse_content_digest(request.headers.get("content-digest"))
+    if checksum is None:
+        raise ValidationFailedException("조각의 sha-256 Content-Digest 헤더가 필요합니다.", field="content-digest")
+    content_length = request.headers.get("content-length")
+    if 0 <= index < session.chunk_count and content_length is not None and content_length.isdigit():
+        _, length = session.chunk_range(index)
+        if int(content_length) != length:
+            raise ValidationFailedException(
+                "조각 길이가 올바르지 않습니다.",
+                field="content-length",
+                value=int(content_length),
+                additional_info={"length": length}
+            )
+    await uploads.write_chunk(session, index, request.stream(), checksum)
@@ -0,0 +1,5 @@
+"""
+API v1 라우터
+
+- 파일 업로드/다운로드 (/api/v1/files)
+"""
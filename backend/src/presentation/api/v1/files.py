@@ -0,0 +1,48 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
+
+from application.common.response import ApiResponse
+from infrastructure.storage import ContentStore
+from presentation.api.dependencies import get_file_owner, get_file_store, get_token_claims
+from presentation.api.downloads import file_response
+from presentation.api.uploads import receive_upload
+
+router = APIRouter(dependencies=[Depends(get_token_claims)])
+
+@router.post("")
+async def upload_file(
+    request: Request,
+    filename: Optional[str] = None,
+    store: ContentStore = Depends(get_file_store),
+    owner: str = Depends(get_file_owner)
+) -> ApiResponse:
+    """multipart/form-data 의 file 파트 또는 본문 전체(filename 쿼리 필요)를 저장합니다."""
+    stored = await receive_upload(request, store, filename=filename, owner=owner)
+    return ApiResponse.success({
+        "digest": stored.digest,
+        "size": stored.size,
+        "content_type": stored.content_type
+    })
+
+@router.api_route("/{digest}", methods=["GET", "HEAD"])
+async def download_file(
+    digest: str,
+    request: Request,
+    store: ContentStore = Depends(get_file_store),
+    owner: str = Depends(get_file_owner)
+) -> Response:
+    """같은 회사(회사가 없으면 본인)가 저장한 파일만 내려받습니다."""
+    return file_response(request, await store.open(digest, owner))
+
+@router.api_route("/{digest}/{filename}", methods=["GET", "HEAD"])
+async def download_file_as(
+    digest: str,
+    filename: str,
+    request: Request,
+    store: ContentStore = Depends(get_file_store),
+    owner: str = Depends(get_file_owner)
+) -> Response:
+    """filename 으로 내려받기 (Content-Disposition: attachment)"""
+    return file_response(request, await store.open(digest, owner), filename=filename)
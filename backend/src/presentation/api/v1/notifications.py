@@ -0,0 +1,40 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, WebSocket
+from fastapi.responses import StreamingResponse
+
+from application.common.exceptions import AuthenticationException, ServiceUnavailableException
+from presentation.api.dependencies import get_realtime_gateway
+from presentation.api.realtime import CLOSE_POLICY_VIOLATION, CLOSE_TRY_AGAIN_LATER, RealtimeGateway
+
+router = APIRouter()
+
+@router.websocket("/ws")
+async def notification_socket(
+    websocket: WebSocket,
+    gateway: Optional[RealtimeGateway] = Depends(get_realtime_gateway)
+) -> None:
+    """실시간 알림 WebSocket
+
+    서버는 {"type":"notification","data":...} 와 {"type":"ping"} 을 보내며,
+    클라이언트는 ping 에 {"type":"pong"} (또는 아무 메시지)으로 답해야 합니다.
+    """
+    if gateway is None:
+        await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+        return
+    try:
+        claims = await gateway.authenticate(websocket)
+    except AuthenticationException:
+        await websocket.close(code=CLOSE_POLICY_VIOLATION)
+        return
+    await gateway.serve_websocket(websocket, claims)
+
+@router.get("/stream")
+async def notification_stream(
+    request: Request,
+    gateway: Optional[RealtimeGateway] = Depends(get_realtime_gateway)
+) -> StreamingResponse:
+    """실시간 알림 SSE (event: notification, 보낼 것이 없으면 주석 ping)"""
+    if gateway is None:
+        raise ServiceUnavailableException("realtime_connections")
+    return await gateway.event_stream(await gateway.authenticate(request))
@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel
+
+from application.common.exceptions import FileNotFoundException
+from application.common.response import ApiResponse
+from infrastructure.audio import AudioProcessor
+from infrastructure.storage import ChunkedUploadStore, ContentStore, UploadSession
+from presentation.api.dependencies import (
+    get_audio_processor,
+    get_chunked_upload_store,
+    get_file_owner,
+    get_file_store,
+    get_token_claims
+)
+from presentation.api.uploads import receive_chunk
+
+router = APIRouter()
+
+class CreateUploadRequest(BaseModel):
+    filename: str
+    size: int
+    chunk_size: Optional[int] = None
+
+def _session_data(session: UploadSession, received: List[int]) -> Dict[str, Any]:
+    return {
+        "upload_id": session.id,
+        "filename": session.filename,
+        "size": session.size,
+        "chunk_size": session.chunk_size,
+        "chunk_count": session.chunk_count,
+        "received_chunks": received
+    }
+
+@router.post("", status_code=201)
+async def create_upload(
+    body: CreateUploadRequest,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    uploads: ChunkedUploadStore = Depends(get_chunked_upload_store)
+) -> ApiResponse:
+    """분할 업로드를 시작합니다. 조각 i 는 [i * chunk_size, (i + 1) * chunk_size) 구간입니다."""
+    session = await uploads.create(body.filename, body.size, owner=claims["sub"], chunk_size=body.chunk_size)
+    return ApiResponse.success(_session_data(session, []))
+
+@router.get("/{upload_id}")
+async def get_upload(
+    upload_id: str,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    uploads: ChunkedUploadStore = Depends(get_chunked_upload_store)
+) -> ApiResponse:
+    """이어 올릴 때 받은 조각을 확인합니다."""
+    session = await uploads.get(upload_id, claims["sub"])
+    return ApiResponse.success(_session_data(session, await uploads.received_chunks(session)))
+
+@router.put("/{upload_id}/chunks/{index}")
+async def upload_chunk(
+    upload_id: str,
+    index: int,
+    request: Request,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    uploads: ChunkedUploadStore = Depends(get_chunked_upload_store)
+) -> ApiResponse:
+    """조각 하나를 올립니다 (Content-Digest: sha-256=:<base64>: 필요). 조각끼리는 동시에 올려도 됩니다."""
+    session = await uploads.get(upload_id, claims["sub"])
+    await receive_chunk(request, uploads, session, index)
+    return ApiResponse.success({"upload_id": session.id, "index": index})
+
+@router.post("/{upload_id}/complete")
+async def complete_upload(
+    upload_id: str,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    owner: str = Depends(get_file_owner),
+    uploads: ChunkedUploadStore = Depends(get_chunked_upload_store),
+    processor: Optional[AudioProcessor] = Depends(get_audio_processor)
+) -> ApiResponse:
+    """모든 조각을 받았으면 파일을 저장하고, 음성 파일은 후처리 큐에 넣습니다."""
+    session = await uploads.get(upload_id, claims["sub"])
+    stored = await uploads.complete(session, owner)
+    processing = None
+    if processor is not None and stored.content_type.startswith("audio/"):
+        processing = (await processor.submit(stored.digest))["state"]
+    return ApiResponse.success({
+        "digest": stored.digest,
+        "size": stored.size,
+        "content_type": stored.content_type,
+        "processing": processing
+    })
+
+@router.delete("/{upload_id}")
+async def abort_upload(
+    upload_id: str,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    uploads: ChunkedUploadStore = Depends(get_chunked_upload_store)
+) -> ApiResponse:
+    await uploads.abort(await uploads.get(upload_id, claims["sub"]))
+    return ApiResponse.success()
+
+@router.get("/processing/{digest}")
+async def get_processing_status(
+    digest: str,
+    owner: str = Depends(get_file_owner),
+    store: ContentStore = Depends(get_file_store),
+    processor: Optional[AudioProcessor] = Depends(get_audio_processor)
+) -> ApiResponse:
+    """음성 후처리 상태 (파형, 변환된 파일의 digest 등). 파일을 올린 회사(또는 사용자)만 조회합니다."""
+    status = await processor.status(digest) if processor is not None and await store.is_owner(digest, owner) else None
+    if status is None:
+        raise FileNotFoundException(digest)
+    return ApiResponse.success(status)
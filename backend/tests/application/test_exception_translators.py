@@ -123,4 +123,60 @@ def test_complex_value_serialization():
     assert isinstance(response["data"]["value"]["datetime"], str)
     assert isinstance(response["data"]["value"]["uuid"], str)
     assert str(now) in response["data"]["value"]["datetime"]
-    assert str(uuid) in response["data"]["value"]["uuid"] 
\ No newline at end of file
+    assert str(uuid) in response["data"]["value"]["uuid"]
+
+def test_registered_translator_resolves_along_mro():
+    """등록된 변환 함수가 하위 예외 타입에도 적용되는지 테스트"""
+    class TaskException(DomainException):
+        pass
+
+    class TaskAlreadyAssignedException(TaskException):
+        pass
+
+    @ExceptionTranslator.register(TaskException)
+    def translate_task_exception(exc):
+        return ApplicationException(
+            code=ResponseCode.TASK_ALREADY_ASSIGNED,
+            message=exc.message,
+            status_code=status.HTTP_409_CONFLICT
+        )
+
+    try:
+        app_exc = ExceptionTranslator.translate(TaskAlreadyAssignedException("이미 할당됨"))
+        assert app_exc.code == ResponseCode.TASK_ALREADY_ASSIGNED
+        assert app_exc.status_code == status.HTTP_409_CONFLICT
+    finally:
+        ExceptionTranslator.unregister(TaskException)
+
+    # 등록 해제 후에는 DomainException 기본 변환으로 돌아감
+    app_exc = ExceptionTranslator.translate(TaskAlreadyAssignedException("이미 할당됨"))
+    assert app_exc.code == ResponseCode.INTERNAL_SERVER_ERROR
+
+def test_registration_invalidates_cached_resolution():
+    """최초 조회 이후 등록된 더 구체적인 변환 함수가 적용되는지 테스트"""
+    class DuplicateEmailException(ValidationException):
+        pass
+
+    exc = DuplicateEmailException("email", "중복된 이메일", "a@b.com")
+    assert isinstance(ExceptionTranslator.translate(exc), ValidationFailedException)
+
+    ExceptionTranslator.register(
+        DuplicateEmailException,
+        lambda e: ApplicationException(code=ResponseCode.USER_ALREADY_EXISTS, message=e.message)
+    )
+    try:
+        assert ExceptionTranslator.translate(exc).code == ResponseCode.USER_ALREADY_EXISTS
+    finally:
+        ExceptionTranslator.unregister(DuplicateEmailException)
+
+def test_non_domain_object_with_to_dict_translation():
+    """DomainException이 아니어도 to_dict가 있으면 알 수 없는 도메인 예외로 변환"""
+    class ExternalError(Exception):
+        def to_dict(self):
+            return {"message": "외부 에러", "provider": "payment"}
+
+    app_exc = ExceptionTranslator.translate(ExternalError())
+
+    assert app_exc.code == ResponseCode.INTERNAL_SERVER_ERROR
+    assert app_exc.detail == "외부 에러"
+    assert app_exc.additional_info["provider"] == "payment"
@@ -236,10 +236,18 @@ def test_error_id_and_logging(caplog):
             message="에러 ID 테스트"
         )
         
+        # 생성만으로는 로그가 남지 않음
+        assert len(caplog.records) == 0
+        
         # 에러 ID 검증
         assert exc.error_id is not None
         assert isinstance(exc.error_id, str)
         assert len(exc.error_id) == 36  # UUID 길이
+        assert exc.error_id == exc.error_id
+        
+        # 같은 예외는 한 번만 기록
+        exc.log_error()
+        exc.log_error()
         
         # 로그 메시지 검증
         assert len(caplog.records) == 1
@@ -252,3 +260,14 @@ def test_error_id_and_logging(caplog):
         assert log_record.__dict__["error_code"] == str(exc.code)
         assert log_record.__dict__["error_message"] == exc.message
         assert log_record.__dict__["error_id"] == exc.error_id
+
+def test_explicit_error_id():
+    """지정한 error_id 사용 테스트"""
+    exc = ApplicationException(
+        code=ResponseCode.INTERNAL_SERVER_ERROR,
+        message="에러 ID 지정",
+        error_id="fixed-id"
+    )
+    
+    assert exc.error_id == "fixed-id"
+    assert exc.to_response_dict()["error_id"] == "fixed-id"
@@ -0,0 +1,102 @@
+import logging
+
+import pytest
+
+from application.common.constants import ResponseCode
+from application.common.logging_filters import ErrorRateLimitFilter, QueryParamRedactionFilter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def rate_limit(clock):
+    return ErrorRateLimitFilter(burst=3, window=60.0, sample_size=2, clock=clock)
+
+def _error_record(error_id, code=ResponseCode.DATABASE_ERROR, path="/api/v1/users"):
+    record = logging.LogRecord("application", logging.ERROR, __file__, 1, "error", None, None)
+    record.error_code = str(code)
+    record.error_id = error_id
+    record.exception_type = "OperationalError"
+    record.path = path
+    return record
+
+def _summaries(caplog):
+    return [r for r in caplog.records if getattr(r, "aggregated", False)]
+
+def test_first_burst_logged_then_suppressed(rate_limit):
+    """처음 burst 건만 통과하고 이후는 버려지는지 테스트"""
+    results = [rate_limit.filter(_error_record(f"id-{i}")) for i in range(10)]
+    assert results == [True] * 3 + [False] * 7
+
+def test_keys_are_independent(rate_limit):
+    """(code, exception type, path) 키별로 따로 집계되는지 테스트"""
+    for i in range(5):
+        rate_limit.filter(_error_record(f"db-{i}"))
+
+    assert rate_limit.filter(_error_record("other-path", path="/api/v1/teams"))
+    assert rate_limit.filter(_error_record("other-code", code=ResponseCode.AUTH_INVALID_TOKEN))
+
+def test_summary_emitted_after_window(rate_limit, clock, caplog):
+    """window 경과 후 건수와 샘플 error_id가 담긴 요약이 기록되는지 테스트"""
+    with caplog.at_level(logging.ERROR):
+        for i in range(10):
+            rate_limit.filter(_error_record(f"id-{i}"))
+        assert _summaries(caplog) == []
+
+        clock.now = 61.0
+        assert rate_limit.filter(_error_record("id-next"))
+
+    summaries = _summaries(caplog)
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary.count == 10
+    assert summary.suppressed == 7
+    assert summary.sample_error_ids == ["id-3", "id-4"]
+    assert summary.error_code == str(ResponseCode.DATABASE_ERROR)
+
+def test_flush_emits_pending_summaries(rate_limit, caplog):
+    """flush 시 남은 집계가 기록되는지 테스트"""
+    with caplog.at_level(logging.ERROR):
+        for i in range(5):
+            rate_limit.filter(_error_record(f"id-{i}"))
+        rate_limit.flush()
+        rate_limit.flush()
+
+    summaries = _summaries(caplog)
+    assert len(summaries) == 1
+    assert summaries[0].suppressed == 2
+
+def test_decision_shared_across_handlers(rate_limit):
+    """같은 레코드가 여러 핸들러를 거쳐도 한 번만 집계되는지 테스트"""
+    record = _error_record("id-0")
+    for _ in range(5):
+        assert rate_limit.filter(record)
+
+    for i in range(1, 3):
+        assert rate_limit.filter(_error_record(f"id-{i}"))
+    assert not rate_limit.filter(_error_record("id-3"))
+
+def test_records_without_error_code_pass(rate_limit):
+    """에러 코드가 없는 일반 로그는 항상 통과하는지 테스트"""
+    for _ in range(10):
+        record = logging.LogRecord("application", logging.ERROR, __file__, 1, "plain", None, None)
+        assert rate_limit.filter(record)
+
+def test_query_param_redaction():
+    """uvicorn 접근 로그의 access_token 쿼리 값을 가리는지 테스트"""
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:5000", "GET", "/api/v1/notifications/stream?access_token=a.b-c&page=2", "1.1", 200), None
+    )
+    assert QueryParamRedactionFilter().filter(record)
+    assert record.getMessage() == (
+        '127.0.0.1:5000 - "GET /api/v1/notifications/stream?access_token=[REDACTED]&page=2 HTTP/1.1" 200'
+    )
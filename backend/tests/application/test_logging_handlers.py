@@ -0,0 +1,166 @@
+import logging
+import sys
+import threading
+import time
+
+import pytest
+
+from application.common.logging_config import (
+    configure_logging,
+    get_logging_stats,
+    shutdown_logging
+)
+from application.common.logging_filters import QueryParamRedactionFilter
+from application.common.logging_handlers import (
+    BatchingRotatingFileHandler,
+    BoundedQueueHandler,
+    QueueLoggingPipeline
+)
+
+class CollectingHandler(logging.Handler):
+    """테스트용: 처리된 레코드와 처리 스레드를 모으는 핸들러"""
+
+    def __init__(self, gate: threading.Event = None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+def _make_record(message, *args, level=logging.ERROR):
+    return logging.LogRecord("application", level, __file__, 1, message, args, None)
+
+def test_pipeline_flushes_all_records_on_stop():
+    """stop 시 큐에 남은 레코드가 모두 처리되는지 테스트"""
+    target = CollectingHandler()
+    pipeline = QueueLoggingPipeline([target], max_size=1000, batch_size=10)
+    pipeline.start()
+
+    for i in range(250):
+        pipeline.handler.handle(_make_record("message %d", i))
+    pipeline.stop()
+
+    assert [r.getMessage() for r in target.records] == [f"message {i}" for i in range(250)]
+    assert target.threads == {"log-queue-listener"}
+    stats = pipeline.stats()
+    assert stats["enqueued"] == 250
+    assert stats["processed"] == 250
+    assert stats["dropped"] == 0
+
+def test_file_handler_flushes_once_per_batch(tmp_path):
+    """파일 핸들러는 레코드마다가 아니라 배치마다 한 번 flush 하는지 테스트"""
+    target = BatchingRotatingFileHandler(str(tmp_path / "app.log"))
+    flushes = []
+    stream_flush = target.stream.flush
+    target.stream.flush = lambda: (flushes.append(1), stream_flush())
+    pipeline = QueueLoggingPipeline([target], max_size=1000, batch_size=100)
+    for i in range(50):
+        pipeline.handler.handle(_make_record("message %d", i))
+    pipeline.start()
+    pipeline.listener.stop()
+
+    assert len(flushes) == 1
+    assert not target.batching
+    pipeline.stop()
+    assert (tmp_path / "app.log").read_text().splitlines() == [f"message {i}" for i in range(50)]
+
+def test_drop_policy_counts_dropped_records():
+    """큐가 가득 찼을 때 drop 정책이 레코드를 버리고 집계하는지 테스트"""
+    release = threading.Event()
+    target = CollectingHandler(release)
+    pipeline = QueueLoggingPipeline([target], max_size=5, batch_size=1)
+    pipeline.start()
+
+    for i in range(50):
+        pipeline.handler.handle(_make_record("message %d", i))
+
+    assert pipeline.stats()["dropped"] > 0
+    release.set()
+    pipeline.stop()
+
+    stats = pipeline.stats()
+    assert stats["enqueued"] + stats["dropped"] == 50
+    assert len(target.records) == stats["enqueued"]
+
+def test_unknown_full_policy_rejected():
+    """알 수 없는 정책 지정 시 예외 발생 테스트"""
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(None, full_policy="wait")
+
+def test_exc_info_preserved_for_downstream_handlers():
+    """하위 핸들러(Sentry 등)를 위해 exc_info가 유지되는지 테스트"""
+    target = CollectingHandler()
+    pipeline = QueueLoggingPipeline([target])
+    pipeline.start()
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "application", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+        )
+    pipeline.handler.handle(record)
+    pipeline.stop()
+
+    assert target.records[0].exc_info[0] is RuntimeError
+
+def test_configure_logging_moves_handlers_behind_queue(tmp_path):
+    """configure_logging 이 로그 디렉터리를 만들고 application 로거에 QueueHandler만 남기는지 테스트"""
+    log_dir = tmp_path / "var" / "logs"
+
+    configure_logging("testing", log_dir=str(log_dir))
+    try:
+        app_logger = logging.getLogger("application")
+        assert len(app_logger.handlers) == 1
+        assert isinstance(app_logger.handlers[0], BoundedQueueHandler)
+        for name in ("uvicorn.access", "uvicorn.error"):
+            filters = logging.getLogger(name).filters
+            assert [type(f) for f in filters].count(QueryParamRedactionFilter) == 1
+
+        app_logger.error("큐 로깅 테스트", extra={"error_id": "e1", "error_code": "9708"})
+    finally:
+        shutdown_logging()
+        # 다른 테스트의 caplog 캡처를 위해 로거 상태 복원
+        app_logger.propagate = True
+        app_logger.setLevel(logging.NOTSET)
+
+    assert get_logging_stats() == {}
+    assert "큐 로깅 테스트" in (log_dir / "errors.log").read_text(encoding="utf-8")
+
+def test_listener_runs_periodic_without_records():
+    """로그가 없어도 리스너가 periodic 함수를 주기적으로 호출하는지 테스트"""
+    ticks = threading.Semaphore(0)
+    pipeline = QueueLoggingPipeline([CollectingHandler()], periodic=[ticks.release], periodic_interval=0.01)
+    pipeline.start()
+    try:
+        assert all(ticks.acquire(timeout=2) for _ in range(3))
+    finally:
+        pipeline.stop()
+
+def test_configure_logging_rate_limits_before_queue(tmp_path):
+    """에러 폭주를 큐에 넣기 전에 거르고, 요약은 종료 전에도 주기적으로 기록되는지 테스트"""
+    log_dir = tmp_path / "logs"
+    configure_logging("testing", log_dir=str(log_dir), error_log_burst=2, error_log_window=0.1)
+    app_logger = logging.getLogger("application")
+    try:
+        extra = {"error_id": "e1", "error_code": "9708", "exception_type": "OperationalError", "path": "/x"}
+        for _ in range(50):
+            app_logger.error("에러 폭주", extra=extra)
+        assert get_logging_stats()["application"]["enqueued"] == 2
+
+        deadline = time.monotonic() + 5
+        while "50 occurrences, 48 suppressed" not in _read(log_dir / "errors.log"):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        shutdown_logging()
+        app_logger.propagate = True
+        app_logger.setLevel(logging.NOTSET)
+
+def _read(path):
+    return path.read_text(encoding="utf-8") if path.exists() else ""
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from domain.common import identifiers
+from domain.common.base import IdMixin
+from domain.common.identifiers import uuid7, uuid7_timestamp_ms
+
+def test_uuid7_version_and_variant():
+    """UUIDv7 버전/변형 비트 테스트"""
+    value = uuid7()
+
+    assert isinstance(value, UUID)
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+def test_uuid7_embeds_current_time():
+    """타임스탬프 부분이 현재 시각인지 테스트"""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= uuid7_timestamp_ms(value) <= after
+
+def test_uuid7_monotonic_within_process():
+    """같은 밀리초 안에서도 단조 증가하는지 테스트"""
+    values = [uuid7() for _ in range(10000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+def test_uuid7_monotonic_when_clock_goes_back(monkeypatch):
+    """시계가 뒤로 가도 순서가 유지되는지 테스트"""
+    first = uuid7()
+    monkeypatch.setattr(identifiers.time, "time_ns", lambda: 0)
+
+    assert uuid7() > first
+
+def test_uuid7_counter_overflow_advances_timestamp(monkeypatch):
+    """카운터가 넘치면 타임스탬프를 하나 올리는지 테스트"""
+    first = uuid7()
+    monkeypatch.setattr(identifiers, "_last_rand", identifiers._RAND_LIMIT - 1)
+
+    second = uuid7()
+    assert second > first
+    assert uuid7_timestamp_ms(second) == uuid7_timestamp_ms(first) + 1
+
+def test_uuid7_unique_across_threads():
+    """여러 스레드에서 생성해도 중복이 없는지 테스트"""
+    results = []
+
+    def generate():
+        results.extend(uuid7() for _ in range(2000))
+
+    threads = [threading.Thread(target=generate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == len(results) == 16000
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원")
+def test_uuid7_reseeded_after_fork():
+    """fork 된 자식이 부모와 같은 값을 만들지 않는지 테스트"""
+    uuid7()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, uuid7().bytes)
+        os._exit(0)
+    os.close(write_fd)
+    child_value = UUID(bytes=os.read(read_fd, 16))
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert child_value != uuid7()
+
+class _SampleBase(DeclarativeBase):
+    # 애플리케이션 메타데이터(마이그레이션 비교 대상)와 분리
+    pass
+
+class _Sample(_SampleBase, IdMixin):
+    __tablename__ = "identifier_sample"
+
+def test_id_mixin_defaults_to_uuid7():
+    """IdMixin 기본키가 UUIDv7로 채워지는지 테스트"""
+    engine = create_engine("sqlite://")
+    _SampleBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        samples = [_Sample() for _ in range(3)]
+        session.add_all(samples)
+        session.flush()
+
+        ids = [sample.id for sample in samples]
+        assert all(value.version == 7 for value in ids)
+        assert ids == sorted(ids)
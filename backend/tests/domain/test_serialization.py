@@ -0,0 +1,102 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+from domain.common.serialization import (
+    CIRCULAR_REFERENCE,
+    MAX_DEPTH_EXCEEDED,
+    TRUNCATED_SUFFIX,
+    to_serializable
+)
+from application.common.constants import ResponseCode
+
+class Color(Enum):
+    RED = "red"
+
+def test_scalars_and_stringified_types():
+    """기본 타입 유지 및 datetime/UUID 등 문자열 변환 테스트"""
+    now = datetime.now()
+    uuid = UUID("12345678-1234-5678-1234-567812345678")
+
+    assert to_serializable(None) is None
+    assert to_serializable(True) is True
+    assert to_serializable(3) == 3
+    assert to_serializable(1.5) == 1.5
+    assert to_serializable("text") == "text"
+    assert to_serializable(now) == str(now)
+    assert to_serializable(uuid) == str(uuid)
+    assert to_serializable(Decimal("1.10")) == "1.10"
+    assert to_serializable(Color.RED) == str(Color.RED)
+    assert to_serializable(ResponseCode.NOT_FOUND) == ResponseCode.NOT_FOUND
+
+def test_containers_converted():
+    """중첩 컨테이너 변환 및 비문자열 키 처리 테스트"""
+    value = {"list": [1, (2, 3)], 10: {"set": {"a"}}}
+
+    assert to_serializable(value) == {
+        "list": [1, [2, 3]],
+        "10": {"set": ["a"]}
+    }
+
+def test_circular_reference_detected():
+    """순환 참조 감지 테스트"""
+    data = {"name": "root", "children": []}
+    data["children"].append(data)
+
+    result = to_serializable(data)
+
+    assert result["children"] == [CIRCULAR_REFERENCE]
+    json.dumps(result)
+
+def test_shared_reference_is_not_circular():
+    """같은 객체를 여러 번 참조하는 것은 순환 참조가 아님"""
+    shared = {"k": "v"}
+    assert to_serializable([shared, shared]) == [{"k": "v"}, {"k": "v"}]
+
+def test_max_depth_limit():
+    """최대 깊이 제한 테스트"""
+    data = current = {}
+    for _ in range(50):
+        current["next"] = {}
+        current = current["next"]
+
+    result = to_serializable(data, max_depth=3)
+
+    assert result == {"next": {"next": {"next": MAX_DEPTH_EXCEEDED}}}
+
+def test_deep_nesting_does_not_recurse():
+    """재귀 한도를 넘는 깊이도 처리되는지 테스트"""
+    data = []
+    for _ in range(5000):
+        data = [data]
+
+    result = to_serializable(data, max_depth=10000, max_items=10000)
+
+    depth = 0
+    while result:
+        result = result[0]
+        depth += 1
+    assert depth == 5000
+
+def test_max_items_limit():
+    """전체 원소 수 제한 테스트"""
+    result = to_serializable({"items": list(range(100))}, max_items=11)
+
+    assert result["items"][:10] == list(range(10))
+    assert result["items"][10] == "...(90 more items)"
+
+def test_max_string_length_limit():
+    """문자열 길이 제한 테스트"""
+    result = to_serializable({"body": "x" * 100}, max_string_length=10)
+
+    assert result["body"] == "x" * 10 + TRUNCATED_SUFFIX
+
+def test_unprintable_object():
+    """str() 실패 객체 처리 테스트"""
+    class Broken:
+        def __str__(self):
+            raise RuntimeError("boom")
+
+    assert to_serializable(Broken()) == "<unprintable Broken>"
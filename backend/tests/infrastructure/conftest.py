@@ -0,0 +1,81 @@
+import pytest
+import pytest_asyncio
+
+from domain.common.base import Base
+from domain.identity.entities import (
+    Company,
+    CompanyDepartment,
+    CompanyPosition,
+    CompanyResponsibility,
+    CompanyTeam,
+    CompanyUser,
+    Department,
+    Position,
+    Responsibility,
+    Team,
+    User
+)
+from infrastructure.database import Database
+
+@pytest_asyncio.fixture
+async def database(tmp_path):
+    database = Database(f"sqlite:///{tmp_path / 'test.db'}")
+    async with database.engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield database
+    await database.dispose()
+
+@pytest.fixture
+def seed_company():
+    return _seed_company
+
+async def _seed_company(database, employees):
+    """부서/팀/직위/직책이 모두 다른 직원 employees 명을 가진 회사를 만듭니다.
+
+    직원 E<n> 은 부서<n>/팀<n>/직위<n>/직책<n> 에 속합니다.
+    """
+    async with database.session() as session:
+        company = Company(
+            business_registration_number=f"123-45-{employees:05d}",
+            name="팀온",
+            eng_name="TeamOn",
+            address="서울",
+            phone="02-0000-0000",
+            ceo_name="대표"
+        )
+        session.add(company)
+        await session.flush()
+        for index in range(employees):
+            user = User(
+                emp_no=f"E{index}",
+                email=f"user{index}@{company.id}.example.com",
+                password="hashed",
+                name=f"직원{index}",
+                role="USER",
+                company_id=company.id
+            )
+            organization = [
+                Department(name=f"부서{index}"),
+                Team(name=f"팀{index}"),
+                Position(name=f"직위{index}"),
+                Responsibility(name=f"직책{index}")
+            ]
+            session.add_all([user, *organization])
+            await session.flush()
+            session.add_all([
+                CompanyDepartment(company_id=company.id, department_id=organization[0].id),
+                CompanyTeam(company_id=company.id, team_id=organization[1].id),
+                CompanyPosition(company_id=company.id, position_id=organization[2].id),
+                CompanyResponsibility(company_id=company.id, responsibility_id=organization[3].id)
+            ])
+            session.add(CompanyUser(
+                company_id=company.id,
+                user_id=user.id,
+                emp_no=user.emp_no,
+                department_id=organization[0].id,
+                team_id=organization[1].id,
+                position_id=organization[2].id,
+                responsibility_id=organization[3].id
+            ))
+        return company.id
+
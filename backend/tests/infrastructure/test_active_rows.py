@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select
+
+from domain.identity.entities import CompanyDepartment, CompanyUser, Department, User
+from infrastructure.database import INCLUDE_INACTIVE, Database, QueryCounter, explain
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+def _alembic_config(url):
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+@pytest.fixture
+def migrated_url(tmp_path):
+    """마이그레이션으로 스키마를 만든 sqlite DB"""
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    command.upgrade(_alembic_config(url), "head")
+    return url
+
+@pytest_asyncio.fixture
+async def migrated_database(migrated_url):
+    database = Database(migrated_url)
+    yield database
+    await database.dispose()
+
+async def _deactivate_first_user(database, company_id):
+    """직원0 의 company_user 는 삭제, user 는 사용 중지 처리합니다."""
+    async with database.session() as session:
+        company_user = (await session.execute(
+            select(CompanyUser).where(CompanyUser.company_id == company_id, CompanyUser.emp_no == "E0")
+        )).scalar_one()
+        company_user.mark_deleted(company_user.user_id)
+        user = await session.get(User, company_user.user_id)
+        user.use_yn = "N"
+        return user.id
+
+def test_migrations_match_models(migrated_url):
+    """마이그레이션 결과가 엔티티 정의(인덱스 포함)와 같고 되돌릴 수 있는지 테스트"""
+    config = _alembic_config(migrated_url)
+    command.check(config)
+    command.downgrade(config, "base")
+    command.upgrade(config, "head")
+
+@pytest.mark.asyncio
+async def test_active_filter_hides_inactive_rows(database, seed_company):
+    """비활성/삭제된 행이 조회와 관계 로드에서 빠지는지 테스트"""
+    company_id = await seed_company(database, 3)
+    user_id = await _deactivate_first_user(database, company_id)
+
+    async with database.session() as session:
+        emp_nos = (await session.execute(
+            select(CompanyUser.emp_no).where(CompanyUser.company_id == company_id).order_by(CompanyUser.emp_no)
+        )).scalars().all()
+        assert emp_nos == ["E1", "E2"]
+        assert await session.get(User, user_id) is None
+
+        # 조인한 엔티티에도 적용
+        names = (await session.execute(
+            select(User.name).join(CompanyUser, CompanyUser.user_id == User.id).order_by(User.name)
+        )).scalars().all()
+        assert names == ["직원1", "직원2"]
+
+    async with database.session() as session:
+        everyone = (await session.execute(
+            select(CompanyUser).where(CompanyUser.company_id == company_id),
+            execution_options={INCLUDE_INACTIVE: True}
+        )).scalars().all()
+        assert len(everyone) == 3
+
+    unfiltered = Database(str(database.engine.url), active_filter=False)
+    try:
+        async with unfiltered.session() as session:
+            assert (await session.get(User, user_id)).use_yn == "N"
+    finally:
+        await unfiltered.dispose()
+
+# 자주 쓰는 조회와 사용해야 하는 인덱스
+HOT_LOOKUPS = (
+    (
+        lambda company_id, user_id: select(CompanyUser).where(
+            CompanyUser.company_id == company_id, CompanyUser.user_id == user_id
+        ),
+        "ix_company_user_company_id_user_id_active"
+    ),
+    (
+        lambda company_id, user_id: select(CompanyUser).where(CompanyUser.user_id == user_id),
+        "ix_company_user_user_id_active"
+    ),
+    (
+        lambda company_id, user_id: select(User).where(User.company_id == company_id),
+        "ix_user_company_id_active"
+    ),
+    (
+        lambda company_id, user_id: select(Department)
+        .join(CompanyDepartment, CompanyDepartment.department_id == Department.id)
+        .where(CompanyDepartment.company_id == company_id),
+        "ix_company_department_company_id_department_id_active"
+    )
+)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("build, index", HOT_LOOKUPS, ids=[index for _, index in HOT_LOOKUPS])
+async def test_hot_lookups_use_active_indexes(migrated_database, seed_company, build, index):
+    """활성 행 조건이 붙은 조회가 부분 인덱스를 사용하는지 실행 계획으로 테스트"""
+    company_id = await seed_company(migrated_database, 3)
+    async with migrated_database.session() as session:
+        user_id = (await session.execute(select(User.id).limit(1))).scalar_one()
+
+    async def plan(**execution_options):
+        with QueryCounter(migrated_database.engine) as counter:
+            async with migrated_database.session() as session:
+                await session.execute(build(company_id, user_id), execution_options=execution_options)
+        statement, parameters = counter.executions[0]
+        async with migrated_database.engine.connect() as connection:
+            return "\n".join(await explain(connection, statement, parameters))
+
+    assert index in await plan()
+    # 활성 행 조건이 없으면 부분 인덱스를 쓸 수 없음
+    assert index not in await plan(**{INCLUDE_INACTIVE: True})
@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import io
+import math
+import os
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_asyncio
+
+from infrastructure.audio import AudioProcessor, AudioToolNotFound, generate_waveform
+from infrastructure.storage import ContentStore
+
+def _wav(seconds=2, rate=8000):
+    """앞 절반은 진폭 0.5, 뒤 절반은 0.25 인 사인파"""
+    frames = bytearray()
+    for index in range(seconds * rate):
+        amplitude = 0.5 if index < seconds * rate // 2 else 0.25
+        frames += int(amplitude * 32767 * math.sin(2 * math.pi * 440 * index / rate)).to_bytes(2, "little", signed=True)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+WAV = _wav()
+DIGEST = hashlib.sha256(WAV).hexdigest()
+
+async def _chunks(data):
+    yield data
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    store = ContentStore(tmp_path, max_size=1024 * 1024, allowed_extensions=["wav"])
+    await store.save(_chunks(WAV), "meeting.wav")
+    return store
+
+def test_generate_waveform(tmp_path):
+    path = tmp_path / "a.wav"
+    path.write_bytes(_wav(seconds=200))
+
+    result = generate_waveform(str(path), str(tmp_path))
+
+    assert result["duration"] == 200
+    assert len(result["peaks"]) == 1000
+    assert result["peaks"][0] == pytest.approx(0.5, abs=0.01)
+    assert result["peaks"][-1] == pytest.approx(0.25, abs=0.01)
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_default_steps(store):
+    """기본 단계를 프로세스 풀에서 실행하고 결과를 상태 파일에 남기는지 테스트"""
+    processor = AudioProcessor(store, max_workers=1)
+    await processor.start()
+    try:
+        assert (await processor.submit(DIGEST))["state"] == "queued"
+        await processor.join()
+    finally:
+        await processor.stop()
+
+    status = await processor.status(DIGEST)
+    assert status["state"] == "completed"
+    assert status["steps"]["waveform"]["status"] == "completed"
+    assert status["steps"]["waveform"]["duration"] == 2
+    # ffmpeg 가 없는 환경에서는 변환을 건너뜀
+    assert status["steps"]["transcode"]["status"] in ("completed", "skipped")
+
+_calls = []
+_running = 0
+_max_running = 0
+_lock = threading.Lock()
+
+def _copy_step(source, work_dir):
+    global _running, _max_running
+    with _lock:
+        _calls.append(source)
+        _running += 1
+        _max_running = max(_max_running, _running)
+    try:
+        with open(source, "rb") as file:
+            data = file.read()
+        output = os.path.join(work_dir, "copy.wav")
+        with open(output, "wb") as file:
+            file.write(data[:-2] + b"\x00\x00")
+        threading.Event().wait(0.05)
+        return {"path": output, "note": "복사"}
+    finally:
+        with _lock:
+            _running -= 1
+
+def _missing_tool_step(source, work_dir):
+    raise AudioToolNotFound("ffmpeg not found")
+
+def _failing_step(source, work_dir):
+    raise ValueError("손상된 파일")
+
+@pytest.mark.asyncio
+async def test_steps_results_and_bounded_concurrency(tmp_path):
+    global _max_running
+    store = ContentStore(tmp_path, max_size=1024 * 1024, allowed_extensions=["wav"])
+    digests = []
+    for index in range(5):
+        stored = await store.save(_chunks(_wav(seconds=1, rate=8000 + index)), "a.wav", owner="company:a")
+        digests.append(stored.digest)
+    _calls.clear()
+    _max_running = 0
+
+    processor = AudioProcessor(
+        store,
+        steps=[("copy", _copy_step), ("tool", _missing_tool_step), ("broken", _failing_step)],
+        max_workers=2,
+        executor=ThreadPoolExecutor(max_workers=8)
+    )
+    await processor.start()
+    try:
+        await asyncio.gather(*(processor.submit(digest) for digest in digests))
+        # 대기 중인 파일을 다시 넣어도 한 번만 처리
+        await processor.submit(digests[-1])
+        await processor.join()
+
+        assert len(_calls) == 5
+        assert _max_running == 2
+        status = await processor.status(digests[0])
+        copy = status["steps"]["copy"]
+        assert (copy["status"], copy["note"], copy["content_type"]) == ("completed", "복사", "audio/wav")
+        assert store.exists(copy["digest"])
+        # 원본을 올린 회사가 결과 파일도 내려받을 수 있음
+        assert await store.is_owner(copy["digest"], "company:a")
+        assert not await store.is_owner(copy["digest"], "company:b")
+        assert status["steps"]["tool"] == {"status": "skipped", "reason": "ffmpeg not found"}
+        assert status["steps"]["broken"] == {"status": "failed", "error": "손상된 파일"}
+        assert list((tmp_path / "tmp").iterdir()) == []
+
+        # 다시 넣으면 끝나지 않은 단계만 다시 실행
+        await processor.submit(digests[0])
+        await processor.join()
+        assert len(_calls) == 5
+    finally:
+        await processor.stop()
+
+    assert await processor.status("0" * 64) is None
+
+@pytest.mark.asyncio
+async def test_start_resumes_unfinished_work(store):
+    """재시작 전에 큐에 있던(또는 처리 중이던) 파일을 start() 에서 다시 처리하는지 테스트"""
+    _calls.clear()
+    stopped = AudioProcessor(store, steps=[("copy", _copy_step)], executor=ThreadPoolExecutor(1))
+    assert (await stopped.submit(DIGEST))["state"] == "queued"
+    # 소비자가 시작되기 전에 프로세스가 끝난 경우
+    await stopped.stop()
+
+    processor = AudioProcessor(store, steps=[("copy", _copy_step)], executor=ThreadPoolExecutor(1))
+    await processor.start()
+    try:
+        await processor.join()
+    finally:
+        await processor.stop()
+
+    assert len(_calls) == 1
+    assert (await processor.status(DIGEST))["state"] == "completed"
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from domain.identity.entities import CompanyUser, Team, User
+from infrastructure.search import (
+    INDEX,
+    UPDATE,
+    CompanyDirectory,
+    DirectoryEntry,
+    DirectoryIndex,
+    SearchAction,
+    SearchChangeTracker,
+    decompose,
+    initials,
+    load_company_directory
+)
+
+def test_jamo_decomposition():
+    assert decompose("김민") == "ㄱㅣㅁㅁㅣㄴ"
+    assert decompose("과닭") == "ㄱㅗㅏㄷㅏㄹㄱ"
+    assert decompose("ㅘ a1") == "ㅗㅏ a1"
+    assert initials("김 민수A") == "ㄱㅁㅅ"
+
+@pytest.fixture
+def directory():
+    teams = {"t1": "플랫폼 개발팀", "t2": "인사팀"}
+    return CompanyDirectory("c1", [
+        DirectoryEntry("m1", "u1", "김민수", "minsu.kim@teamon.kr", "A-001", "t1"),
+        DirectoryEntry("m2", "u2", "김민지", "minji@teamon.kr", "A-002", "t2"),
+        DirectoryEntry("m3", "u3", "Jane Doe", "jane@teamon.kr", "B-100", None),
+        DirectoryEntry("m4", "u4", "곽두리", "dr@teamon.kr", "B-200", "t2")
+    ], teams)
+
+def _ids(entries):
+    return sorted(entry.id for entry in entries)
+
+def test_prefix_search(directory):
+    """음절/입력 중 음절/초성/이름/이메일/사번/팀 이름으로 찾는지 테스트"""
+    assert _ids(directory.search("김민")) == ["m1", "m2"]
+    assert _ids(directory.search("김밋")) == []
+    assert _ids(directory.search("김ㅁ")) == ["m1", "m2"]
+    assert _ids(directory.search("김민ㅅ")) == ["m1"]
+    assert _ids(directory.search("ㄱㅁㅅ")) == ["m1"]
+    assert _ids(directory.search("ㄱ")) == ["m1", "m2", "m4"]
+    assert _ids(directory.search("고")) == ["m4"]  # "곽" 입력 중
+    assert _ids(directory.search("민수")) == ["m1"]
+    assert _ids(directory.search("DOE")) == ["m3"]
+    assert _ids(directory.search("minji@")) == ["m2"]
+    assert _ids(directory.search("b-1")) == ["m3"]
+    assert _ids(directory.search("개발")) == ["m1"]
+    assert _ids(directory.search("인사팀")) == ["m2", "m4"]
+    assert len(directory.search("ㄱ", limit=2)) == 2
+    assert directory.search("  ") == []
+
+def test_incremental_updates(directory):
+    directory.put(DirectoryEntry("m1", "u1", "박민수", "minsu.kim@teamon.kr", "A-001", "t2"))
+    assert _ids(directory.search("김민")) == ["m2"]
+    assert _ids(directory.search("ㅂㅁㅅ")) == ["m1"]
+    assert _ids(directory.search("인사")) == ["m1", "m2", "m4"]
+
+    directory.team_names["t2"] = "피플팀"
+    directory.reindex_team("t2")
+    assert directory.search("인사") == []
+    assert _ids(directory.search("피플")) == ["m1", "m2", "m4"]
+
+    directory.remove("m2")
+    assert _ids(directory.search("피플")) == ["m1", "m4"]
+    assert directory.members_of_user("u2") == []
+
+@pytest_asyncio.fixture
+async def directory_index(database):
+    async def load(company_id):
+        async with database.session() as session:
+            return await load_company_directory(session, company_id)
+
+    index = DirectoryIndex(load)
+    tracker = SearchChangeTracker(index)
+    tracker.register(database.sync_session_class)
+    yield index
+    tracker.unregister()
+
+@pytest.mark.asyncio
+async def test_committed_changes_update_index(database, seed_company, directory_index):
+    """DB에서 만든 색인에 커밋된 이름/팀/구성원 변경이 바로 반영되는지 테스트"""
+    company_id = await seed_company(database, 3)
+    assert [entry["emp_no"] for entry in await directory_index.search(company_id, "ㅈㅇ")] == ["E0", "E1", "E2"]
+    assert (await directory_index.search(company_id, "팀1"))[0]["team_name"] == "팀1"
+
+    async with database.session() as session:
+        user = (await session.execute(select(User).where(User.emp_no == "E0"))).scalar_one()
+        user.name = "홍길동"
+        team = (await session.execute(select(Team).where(Team.name == "팀1"))).scalar_one()
+        team.name = "디자인팀"
+        member = (await session.execute(select(CompanyUser).where(CompanyUser.emp_no == "E2"))).scalar_one()
+        member.mark_deleted(user.id)
+        new_user = User(emp_no="E3", email="new@example.com", password="hashed", name="신입",
+                        role="USER", company_id=company_id)
+        session.add(new_user)
+        await session.flush()
+        session.add(CompanyUser(company_id=company_id, user_id=new_user.id, emp_no="E3", team_id=team.id))
+
+    assert [entry["emp_no"] for entry in await directory_index.search(company_id, "ㅎㄱㄷ")] == ["E0"]
+    assert [entry["emp_no"] for entry in await directory_index.search(company_id, "직원")] == ["E1"]
+    assert [entry["emp_no"] for entry in await directory_index.search(company_id, "디자인")] == ["E1", "E3"]
+    assert await directory_index.search(company_id, "팀1") == []
+    assert directory_index.stats["loads"] == 1
+
+@pytest.mark.asyncio
+async def test_large_batches_rebuild_and_changes_during_build_are_replayed():
+    loaded = asyncio.Event()
+    release = asyncio.Event()
+
+    async def load(company_id):
+        loaded.set()
+        await release.wait()
+        return [DirectoryEntry("m1", "u1", "김민수", "minsu@teamon.kr", "A-1")], {}
+
+    index = DirectoryIndex(load, rebuild_threshold=2)
+    searching = asyncio.ensure_future(index.search("c1", "김"))
+    await loaded.wait()
+    # 만드는 동안 커밋된 변경
+    index.submit([SearchAction(UPDATE, "users", "u1", {"name": "이민수"})])
+    release.set()
+    assert await searching == []
+    assert [entry["name"] for entry in await index.search("c1", "ㅇㅁㅅ")] == ["이민수"]
+
+    index.submit([
+        SearchAction(INDEX, "company_users", f"m{number}", {"company_id": "c1", "user_id": "u1", "emp_no": "X"})
+        for number in range(2, 5)
+    ])
+    assert index.stats["loads"] == 1
+    await index.search("c1", "이")
+    assert index.stats["loads"] == 2
+
+@pytest.mark.asyncio
+async def test_fallback_for_unmatched_queries():
+    """접두어로 찾지 못하면 fallback 결과 중 활성 구성원만 돌려주는지 테스트"""
+    calls = []
+
+    async def load(company_id):
+        return [DirectoryEntry("m1", "u1", "김민수", "minsu@teamon.kr", "A-1")], {}
+
+    async def fallback(company_id, query, limit):
+        calls.append(query)
+        return ["u1", "u-deleted"]
+
+    index = DirectoryIndex(load, fallback=fallback)
+    assert [entry["id"] for entry in await index.search("c1", "김민")] == ["m1"]
+    assert [entry["id"] for entry in await index.search("c1", "김밈수")] == ["m1"]
+    assert await index.search("c1", "x") == []
+    assert calls == ["김밈수"]
@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from application.common.exceptions import (
+    ChunkChecksumMismatchException,
+    FileNotFoundException,
+    FileSizeExceededException,
+    FileTypeNotAllowedException,
+    UploadIncompleteException,
+    ValidationFailedException
+)
+from infrastructure.storage import ChunkedUploadStore, ContentStore
+
+CHUNK = 1024
+WAV = b"RIFF\x00\x00\x00\x00WAVEfmt " + bytes(range(256)) * 20  # 5136 바이트 = 조각 6개
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+@pytest.fixture
+def uploads(tmp_path, clock):
+    store = ContentStore(tmp_path, max_size=1024, allowed_extensions=["pdf"], write_buffer_size=300)
+    return ChunkedUploadStore(
+        store,
+        max_size=100 * 1024,
+        allowed_extensions=["wav", "mp3"],
+        chunk_size=CHUNK,
+        min_chunk_size=CHUNK,
+        max_chunk_size=4 * CHUNK,
+        expires_after=60,
+        clock=clock
+    )
+
+def _chunk(session, index):
+    offset, length = session.chunk_range(index)
+    return WAV[offset:offset + length]
+
+async def _body(data, size=100):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def _put(uploads, session, index):
+    chunk = _chunk(session, index)
+    await uploads.write_chunk(session, index, _body(chunk), hashlib.sha256(chunk).digest())
+
+@pytest.mark.asyncio
+async def test_parallel_chunks_are_assembled_in_place(uploads):
+    """조각을 순서와 무관하게 동시에 올리면 제자리에 써서 그대로 저장소로 옮기는지 테스트"""
+    session = await uploads.create("회의.wav", len(WAV), owner="user")
+    assert (session.chunk_count, session.chunk_range(5)) == (6, (5 * CHUNK, len(WAV) - 5 * CHUNK))
+
+    await asyncio.gather(*(_put(uploads, session, index) for index in (5, 3, 1, 0, 4, 2)))
+    assert await uploads.received_chunks(session) == [0, 1, 2, 3, 4, 5]
+
+    stored = await uploads.complete(session)
+    assert stored.digest == hashlib.sha256(WAV).hexdigest()
+    assert (stored.size, stored.content_type, stored.extension) == (len(WAV), "audio/wav", "wav")
+    assert stored.path.read_bytes() == WAV
+    # 조각을 다시 읽어 합치지 않고 세션의 data 파일을 옮김
+    assert list(uploads.root.iterdir()) == []
+    with pytest.raises(FileNotFoundException):
+        await uploads.get(session.id, "user")
+
+@pytest.mark.asyncio
+async def test_resume_after_failed_chunks(uploads):
+    session = await uploads.create("a.wav", len(WAV), owner="user", chunk_size=2 * CHUNK)
+    await _put(uploads, session, 0)
+    with pytest.raises(ChunkChecksumMismatchException):
+        await uploads.write_chunk(session, 1, _body(_chunk(session, 1)), hashlib.sha256(b"other").digest())
+    too_long = _chunk(session, 2) + b"extra"
+    with pytest.raises(ValidationFailedException):
+        await uploads.write_chunk(session, 2, _body(too_long), hashlib.sha256(too_long).digest())
+
+    with pytest.raises(UploadIncompleteException) as error:
+        await uploads.complete(session)
+    assert error.value.additional_info["missing_chunks"] == [1, 2]
+
+    # 이어 올리기: 다른 요청(워커)에서 세션을 다시 찾아 나머지만 올림
+    resumed = await uploads.get(session.id, "user")
+    assert await uploads.received_chunks(resumed) == [0]
+    await _put(uploads, resumed, 1)
+    await _put(uploads, resumed, 2)
+    assert (await uploads.complete(resumed)).path.read_bytes() == WAV
+
+@pytest.mark.asyncio
+async def test_resent_chunk_failing_checksum_is_unmarked(uploads):
+    session = await uploads.create("a.wav", len(WAV), owner="user")
+    await _put(uploads, session, 3)
+    with pytest.raises(ChunkChecksumMismatchException):
+        await uploads.write_chunk(session, 3, _body(b"x" * CHUNK), hashlib.sha256(_chunk(session, 3)).digest())
+    assert await uploads.received_chunks(session) == []
+
+@pytest.mark.asyncio
+async def test_rejects_invalid_sessions_and_chunks(uploads):
+    with pytest.raises(FileTypeNotAllowedException):
+        await uploads.create("a.pdf", 100, owner="user")
+    with pytest.raises(FileSizeExceededException):
+        await uploads.create("a.wav", 100 * 1024 + 1, owner="user")
+    with pytest.raises(ValidationFailedException):
+        await uploads.create("a.wav", 100, owner="user", chunk_size=CHUNK // 2)
+
+    session = await uploads.create("a.mp3", len(WAV), owner="user")
+    with pytest.raises(ValidationFailedException):
+        await _put(uploads, session, 6)
+    # 첫 조각은 매직 바이트를 검사
+    with pytest.raises(FileTypeNotAllowedException) as error:
+        await _put(uploads, session, 0)
+    assert error.value.additional_info["detected_type"] == "audio/wav"
+
+    for upload_id, owner in ((session.id, "other"), ("../" + session.id[3:], "user"), ("0" * 32, "user")):
+        with pytest.raises(FileNotFoundException):
+            await uploads.get(upload_id, owner)
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_purged(uploads, clock):
+    expired = await uploads.create("a.wav", len(WAV), owner="user")
+    clock.now += 30
+    live = await uploads.create("b.wav", len(WAV), owner="user")
+    clock.now += 40
+    with pytest.raises(FileNotFoundException):
+        await uploads.get(expired.id, "user")
+
+    # 정리는 create 에서 일정 간격으로
+    clock.now += 600
+    await uploads.create("c.wav", len(WAV), owner="user")
+    assert expired.id not in {path.name for path in uploads.root.iterdir()}
+    assert live.id not in {path.name for path in uploads.root.iterdir()}
+    assert len(list(uploads.root.iterdir())) == 1
+
+@pytest.mark.asyncio
+async def test_abort_removes_session(uploads):
+    session = await uploads.create("a.wav", len(WAV), owner="user")
+    await uploads.abort(session)
+    with pytest.raises(FileNotFoundException):
+        await _put(uploads, session, 0)
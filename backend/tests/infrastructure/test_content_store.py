@@ -0,0 +1,119 @@
+import hashlib
+import tracemalloc
+
+import pytest
+
+from application.common.exceptions import (
+    FileNotFoundException,
+    FileSizeExceededException,
+    FileTypeNotAllowedException,
+    FileUploadFailedException
+)
+from infrastructure.storage import ContentStore, file_extension
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(tmp_path, max_size=1024 * 1024, allowed_extensions=["png", "PDF", "jpg"], write_buffer_size=4096)
+
+async def _chunks(data, size=7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def _leftovers(store):
+    return list((store.root / "tmp").iterdir())
+
+@pytest.mark.asyncio
+async def test_content_addressed_and_deduplicated(store):
+    """내용의 sha256 경로에 저장하고 같은 내용은 한 번만 저장하는지 테스트"""
+    first = await store.save(_chunks(PNG), "C:\\사진\\profile.PNG")
+    digest = hashlib.sha256(PNG).hexdigest()
+
+    assert first.digest == digest
+    assert (first.size, first.content_type, first.extension, first.deduplicated) == (len(PNG), "image/png", "png", False)
+    assert first.path == store.root / "objects" / digest[:2] / digest[2:4] / digest
+    assert first.path.read_bytes() == PNG
+
+    second = await store.save(_chunks(PNG, size=1000), "copy.png")
+    assert second.deduplicated and second.path == first.path
+    assert _leftovers(store) == []
+
+@pytest.mark.asyncio
+async def test_owners(store):
+    """owner 를 주면 그 owner 가 저장했거나 공유받은 파일만 여는지 테스트"""
+    stored = await store.save(_chunks(PNG), "a.png", owner="company:a")
+    assert await store.is_owner(stored.digest, "company:a")
+    assert not await store.is_owner(stored.digest, "company:b")
+    (await store.open(stored.digest, "company:a")).file.close()
+    with pytest.raises(FileNotFoundException):
+        await store.open(stored.digest, "company:b")
+
+    # 중복 저장도 owner 를 기록함
+    await store.save(_chunks(PNG), "b.png", owner="../company:b")
+    (await store.open(stored.digest, "../company:b")).file.close()
+
+    derived = await store.save(_chunks(PNG + b"\x00"), "c.png")
+    await store.share(stored.digest, derived.digest)
+    assert await store.is_owner(derived.digest, "company:a")
+    assert await store.is_owner(derived.digest, "../company:b")
+    assert not await store.is_owner("not-a-digest", "company:a")
+
+@pytest.mark.asyncio
+async def test_rejects_disallowed_or_mismatched_types(store):
+    with pytest.raises(FileTypeNotAllowedException):
+        await store.save(_chunks(PNG), "script.exe")
+    with pytest.raises(FileTypeNotAllowedException) as error:
+        await store.save(_chunks(PNG), "report.pdf")
+    assert error.value.additional_info["detected_type"] == "image/png"
+    with pytest.raises(FileTypeNotAllowedException):
+        await store.save(_chunks(b""), "empty.png")
+    assert _leftovers(store) == []
+
+@pytest.mark.asyncio
+async def test_size_limit_stops_reading(store):
+    """제한을 넘는 순간 읽기를 멈추고 임시 파일을 지우는지 테스트"""
+    read = 0
+
+    async def endless():
+        nonlocal read
+        yield PNG
+        while True:
+            read += 1
+            yield b"\x00" * 65536
+
+    with pytest.raises(FileSizeExceededException):
+        await store.save(endless(), "big.png")
+    assert read == 16
+    assert _leftovers(store) == []
+
+@pytest.mark.asyncio
+async def test_memory_stays_flat(tmp_path):
+    store = ContentStore(tmp_path, max_size=64 * 1024 * 1024, allowed_extensions=["png"])
+
+    async def large():
+        yield PNG
+        chunk = b"\x01" * 65536
+        for _ in range(512):  # 32MB
+            yield chunk
+
+    tracemalloc.start()
+    try:
+        stored = await store.save(large(), "large.png")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert stored.size == len(PNG) + 32 * 1024 * 1024
+    assert peak < 4 * 1024 * 1024
+
+@pytest.mark.asyncio
+async def test_disk_errors(tmp_path):
+    (tmp_path / "tmp").write_text("디렉터리 자리에 파일")
+    store = ContentStore(tmp_path, max_size=1024, allowed_extensions=["png"])
+    with pytest.raises(FileUploadFailedException):
+        await store.save(_chunks(PNG), "a.png")
+
+def test_file_extension():
+    assert file_extension("a/b/photo.JPG") == "jpg"
+    assert file_extension("archive.tar.gz") == "gz"
+    assert file_extension("noext") == ""
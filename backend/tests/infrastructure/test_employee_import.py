@@ -0,0 +1,165 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+from sqlalchemy import func, select
+
+from application.common.exceptions import ApplicationException, ValidationFailedException
+from domain.identity.entities import CompanyUser, Department, Team, User
+from infrastructure.database import expect_max_queries
+from infrastructure.imports import EmployeeImporter, detect_format, parse_employee_row
+
+HEADER = "사번,이메일,이름,부서,팀,권한\n"
+
+def _csv(text, encoding="utf-8"):
+    return io.BytesIO((HEADER + text).encode(encoding))
+
+async def _import(database, company_id, stream, file_format="csv", **options):
+    async with database.session() as session:
+        importer = EmployeeImporter(session, company_id, **options)
+        return await importer.run(stream, file_format)
+
+async def _company_users(database, company_id):
+    async with database.session() as session:
+        result = await session.execute(
+            select(User.email, CompanyUser.emp_no, Department.name, Team.name)
+            .join(User, User.id == CompanyUser.user_id)
+            .outerjoin(Department, Department.id == CompanyUser.department_id)
+            .outerjoin(Team, Team.id == CompanyUser.team_id)
+            .where(CompanyUser.company_id == company_id)
+            .order_by(CompanyUser.emp_no)
+        )
+        return [tuple(row) for row in result.all()]
+
+def test_detect_format():
+    """확장자로 형식을 판별하고 지원하지 않는 형식은 거부하는지 테스트"""
+    assert detect_format("직원.CSV") == "csv"
+    assert detect_format("employees.xlsx") == "xlsx"
+    with pytest.raises(ApplicationException) as exc_info:
+        detect_format("employees.xls")
+    assert exc_info.value.additional_info["extension"] == "xls"
+
+def test_parse_employee_row():
+    """행 검증 규칙 테스트"""
+    employee, errors = parse_employee_row(2, {"emp_no": " E1 ", "email": "Kim@Example.com", "name": "김"})
+    assert errors == []
+    assert (employee.emp_no, employee.email, employee.role, employee.team) == ("E1", "kim@example.com", "USER", None)
+
+    employee, errors = parse_employee_row(3, {"emp_no": "E2", "email": "wrong", "name": "", "role": "SYS_ADMIN"})
+    assert employee is None
+    assert [field for field, _, _ in errors] == ["name", "email", "role"]
+
+@pytest.mark.asyncio
+async def test_import_creates_users_and_units(database, seed_company):
+    """사용자, 회사 매핑, 없는 조직 단위를 만드는지 테스트"""
+    company_id = await seed_company(database, 1)
+    progress = []
+
+    result = await _import(
+        database,
+        company_id,
+        _csv("N1,n1@example.com,신입1,부서0,새팀,\nN2,n2@example.com,신입2,새부서,새팀,TEAM_MANAGER\n"),
+        on_progress=lambda result: progress.append(result.processed)
+    )
+
+    assert (result.processed, result.inserted, result.updated, result.failed) == (2, 2, 0, 0)
+    assert progress == [2]
+    assert await _company_users(database, company_id) == [
+        ("user0@%s.example.com" % company_id, "E0", "부서0", "팀0"),
+        ("n1@example.com", "N1", "부서0", "새팀"),
+        ("n2@example.com", "N2", "새부서", "새팀")
+    ]
+    async with database.session() as session:
+        manager = (await session.execute(select(User).where(User.email == "n2@example.com"))).scalar_one()
+        assert (manager.role, manager.company_id) == ("TEAM_MANAGER", company_id)
+        # 같은 이름의 팀은 하나만 생성
+        assert await session.scalar(select(func.count()).select_from(Team).where(Team.name == "새팀")) == 1
+
+@pytest.mark.asyncio
+async def test_import_upserts_on_email(database, seed_company):
+    """이미 있는 이메일은 새로 만들지 않고 갱신하는지 테스트"""
+    company_id = await seed_company(database, 1)
+    email = f"user0@{company_id}.example.com"
+
+    result = await _import(database, company_id, _csv(f"E100,{email.upper()},개명,부서0,,ORG_ADMIN\n"))
+
+    assert (result.inserted, result.updated, result.failed) == (0, 1, 0)
+    assert await _company_users(database, company_id) == [(email, "E100", "부서0", None)]
+    async with database.session() as session:
+        user = (await session.execute(select(User).where(User.email == email))).scalar_one()
+        # 기존 사용자의 비밀번호/권한은 바꾸지 않음
+        assert (user.emp_no, user.name, user.password, user.role) == ("E100", "개명", "hashed", "USER")
+
+@pytest.mark.asyncio
+async def test_import_collects_row_errors(database, seed_company):
+    """오류 행은 건너뛰고 ValidationFailedException 정보로 모으는지 테스트"""
+    company_id = await seed_company(database, 1)
+    other_company_id = await seed_company(database, 2)
+    rows = (
+        "N1,n1@example.com,신입1,,,\n"
+        ",n2@example.com,사번없음,,,\n"
+        "N3,n1@example.com,중복,,,\n"
+        f"N4,user0@{other_company_id}.example.com,다른회사,,,\n"
+        "N5,n5@example.com,없는팀,,없는팀,\n"
+    )
+
+    result = await _import(database, company_id, _csv(rows), create_missing_units=False)
+
+    assert (result.processed, result.inserted, result.failed) == (5, 1, 4)
+    assert [(error["row"], error["field"]) for error in result.errors] == [
+        (3, "emp_no"), (4, "email"), (6, "team"), (5, "email")
+    ]
+    with pytest.raises(ValidationFailedException) as exc_info:
+        result.raise_for_errors()
+    info = exc_info.value.additional_info
+    assert info["field"] == "rows"
+    assert info["additional_info"]["failed"] == 4
+    assert info["additional_info"]["errors"][0]["message"] == "필수 값입니다."
+
+@pytest.mark.asyncio
+async def test_import_rejects_missing_columns(database, seed_company):
+    """필수 컬럼이 없으면 가져오지 않는지 테스트"""
+    company_id = await seed_company(database, 1)
+
+    with pytest.raises(ValidationFailedException) as exc_info:
+        await _import(database, company_id, io.BytesIO("사번,이름\nN1,신입\n".encode()))
+
+    assert exc_info.value.additional_info["value"] == ["email"]
+
+@pytest.mark.asyncio
+async def test_import_queries_per_chunk(database, seed_company):
+    """청크 단위로 일정한 수의 쿼리만 실행하는지 테스트"""
+    company_id = await seed_company(database, 1)
+    rows = "".join(f"N{i},n{i}@example.com,신입{i},부서{i % 3},팀{i % 2},\n" for i in range(100))
+
+    # 청크마다 조직 단위 조회/생성 (2종 x 최대 3) + user 조회/upsert 2 + company_user 조회/insert 2
+    with expect_max_queries(database.engine, 2 * 10):
+        result = await _import(database, company_id, _csv(rows), chunk_size=50)
+
+    assert (result.inserted, result.failed) == (100, 0)
+    assert len(await _company_users(database, company_id)) == 101
+
+@pytest.mark.asyncio
+async def test_import_cp949_csv_and_xlsx(database, seed_company):
+    """cp949 CSV 와 XLSX 를 읽는지 테스트"""
+    company_id = await seed_company(database, 1)
+    await _import(database, company_id, _csv("N1,n1@example.com,홍길동,영업부,,\n", encoding="cp949"))
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["사번", "이메일", "이름", "부서"])
+    sheet.append(["N2", "n2@example.com", "김철수", "영업부"])
+    sheet.append([None, None, None, None])
+    sheet.append([3, "n3@example.com", "이영희", None])
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+    result = await _import(database, company_id, stream, "xlsx")
+
+    assert (result.processed, result.inserted) == (2, 2)
+    assert await _company_users(database, company_id) == [
+        ("n3@example.com", "3", None, None),
+        (f"user0@{company_id}.example.com", "E0", "부서0", "팀0"),
+        ("n1@example.com", "N1", "영업부", None),
+        ("n2@example.com", "N2", "영업부", None)
+    ]
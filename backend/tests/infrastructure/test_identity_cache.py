@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis, FakeServer
+from prometheus_client import CollectorRegistry
+from sqlalchemy import select
+
+from domain.identity.entities import Company, User
+from infrastructure.cache import CacheMetrics, IdentityCache, IdentityCacheInvalidator, TwoTierCache
+from infrastructure.database import expect_max_queries
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis(server=FakeServer())
+
+def _counting_loader(value="value", gate=None):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        if gate is not None:
+            await gate.wait()
+        return value
+
+    return loader, calls
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(redis):
+    """같은 키의 동시 미스가 로더를 한 번만 호출하는지 테스트"""
+    cache = TwoTierCache(redis)
+    gate = asyncio.Event()
+    loader, calls = _counting_loader(gate=gate)
+
+    pending = [asyncio.ensure_future(cache.get("key", loader)) for _ in range(50)]
+    await asyncio.sleep(0.01)
+    gate.set()
+
+    assert await asyncio.gather(*pending) == ["value"] * 50
+    assert len(calls) == 1
+    assert cache.stats["coalesced"] == 49
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_followers(redis):
+    """먼저 요청한 쪽이 취소되어도 합류한 조회는 결과를 받는지 테스트"""
+    cache = TwoTierCache(redis)
+    gate = asyncio.Event()
+    loader, calls = _counting_loader(gate=gate)
+
+    leader = asyncio.ensure_future(cache.get("key", loader))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(cache.get("key", loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+    gate.set()
+
+    assert await follower == "value"
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_tiers_and_hit_ratio(redis):
+    """로컬 -> Redis -> 로더 순으로 읽고 적중률 메트릭을 남기는지 테스트"""
+    registry = CollectorRegistry()
+    metrics = CacheMetrics(registry)
+    clock = _Clock()
+    cache = TwoTierCache(redis, name="sample", local_ttl=5, metrics=metrics, clock=clock)
+    loader, calls = _counting_loader({"name": "팀온"})
+
+    assert await cache.get("key", loader) == {"name": "팀온"}
+    assert await cache.get("key", loader) == {"name": "팀온"}
+    clock.now = 10  # 로컬 만료 -> Redis
+    assert await cache.get("key", loader) == {"name": "팀온"}
+    other_worker = TwoTierCache(redis, name="sample", metrics=metrics)
+    assert await other_worker.get("key", loader) == {"name": "팀온"}
+
+    assert len(calls) == 1
+    assert cache.stats == {"local_hit": 1, "redis_hit": 1, "miss": 1, "coalesced": 0}
+    assert cache.hit_ratio == pytest.approx(2 / 3)
+    sample = lambda result: registry.get_sample_value(
+        "cache_lookups_total", {"cache": "sample", "result": result}
+    )
+    assert (sample("local_hit"), sample("redis_hit"), sample("miss")) == (1, 2, 1)
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded():
+    """로컬 캐시가 최근 사용 순으로 최대 개수를 유지하는지 테스트"""
+    cache = TwoTierCache(local_max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        await cache.get(key, _counting_loader(key)[0])
+
+    assert list(cache._local) == ["a", "c"]
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_discards_stale_value(redis):
+    """로드 중에 무효화되면 오래된 값을 저장하지 않는지 테스트"""
+    cache = TwoTierCache(redis)
+    gate = asyncio.Event()
+    stale_loader, _ = _counting_loader("old", gate=gate)
+
+    pending = asyncio.ensure_future(cache.get("key", stale_loader))
+    await asyncio.sleep(0.01)
+    await cache.invalidate(["key"])
+    gate.set()
+    assert await pending == "old"
+
+    fresh_loader, calls = _counting_loader("new")
+    assert await cache.get("key", fresh_loader) == "new"
+    assert await TwoTierCache(redis).get("key", fresh_loader) == "new"
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_loader():
+    """Redis 오류 시 로더로 읽는지 테스트"""
+    server = FakeServer()
+    server.connected = False
+    cache = TwoTierCache(FakeAsyncRedis(server=server))
+    loader, calls = _counting_loader()
+
+    assert await cache.get("key", loader) == "value"
+    assert len(calls) == 1
+
+@pytest_asyncio.fixture
+async def identity_cache(database, redis):
+    cache = IdentityCache(database.session, redis=redis)
+    invalidator = IdentityCacheInvalidator(cache)
+    invalidator.register(database.sync_session_class)
+    yield cache, invalidator
+    invalidator.unregister()
+
+async def _first_user(database):
+    async with database.session() as session:
+        return (await session.execute(select(User).order_by(User.emp_no).limit(1))).scalar_one()
+
+@pytest.mark.asyncio
+async def test_identity_lookups_are_cached(database, seed_company, identity_cache):
+    """사용자/회사 조회가 첫 조회 후 DB를 거치지 않는지 테스트"""
+    cache, _ = identity_cache
+    company_id = await seed_company(database, 2)
+    user = await _first_user(database)
+
+    by_email = await cache.get_user_by_email(user.email)
+    company = await cache.get_company(company_id)
+    assert (by_email.id, by_email.company_id, by_email.name) == (user.id, company_id, "직원0")
+    assert await cache.get_company_by_registration_number(company.business_registration_number) == company
+
+    with expect_max_queries(database.engine, 0):
+        assert await cache.get_user(user.id) == by_email
+        assert await cache.get_user_by_email(user.email) == by_email
+        assert await cache.get_company(str(company_id)) == company
+
+    assert await cache.get_user_by_email("nobody@example.com") is None
+
+@pytest.mark.asyncio
+async def test_updates_invalidate_after_commit(database, seed_company, identity_cache):
+    """update_audit_fields/mark_deleted 후 커밋되면 캐시가 무효화되는지 테스트"""
+    cache, invalidator = identity_cache
+    company_id = await seed_company(database, 1)
+    user = await _first_user(database)
+    old_email = user.email
+    await cache.get_user_by_email(old_email)
+
+    async with database.session() as session:
+        loaded = await session.get(User, user.id)
+        loaded.name = "개명"
+        loaded.email = "renamed@example.com"
+        loaded.update_audit_fields(user.id)
+    await invalidator.drain()
+
+    assert (await cache.get_user(user.id)).name == "개명"
+    assert await cache.get_user_by_email(old_email) is None
+    assert (await cache.get_user_by_email("renamed@example.com")).id == user.id
+
+    await cache.get_company(company_id)
+    async with database.session() as session:
+        (await session.get(Company, company_id)).mark_deleted(user.id)
+    await invalidator.drain()
+
+    assert await cache.get_company(company_id) is None
+
+@pytest.mark.asyncio
+async def test_rollback_keeps_cache(database, seed_company, identity_cache):
+    """롤백된 변경은 캐시를 무효화하지 않는지 테스트"""
+    cache, invalidator = identity_cache
+    await seed_company(database, 1)
+    user = await _first_user(database)
+    await cache.get_user(user.id)
+
+    with pytest.raises(RuntimeError):
+        async with database.session() as session:
+            (await session.get(User, user.id)).name = "롤백"
+            await session.flush()
+            raise RuntimeError
+    await invalidator.drain()
+
+    with expect_max_queries(database.engine, 0):
+        assert (await cache.get_user(user.id)).name == "직원0"
@@ -0,0 +1,155 @@
+import asyncio
+from uuid import UUID
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+
+from domain.identity.entities import (
+    CompanyUser,
+    Department,
+    Position,
+    Responsibility,
+    Team,
+    User
+)
+from infrastructure.database import BatchLoader, IdentityLoaders, expect_max_queries
+from presentation.api.dependencies import get_db_session, get_identity_loaders
+
+def _employee(company_user, user, department, team, position, responsibility):
+    return {
+        "emp_no": company_user.emp_no,
+        "name": user.name,
+        "department": department.name,
+        "team": team.name,
+        "position": position.name,
+        "responsibility": responsibility.name
+    }
+
+def _build_app(database):
+    app = FastAPI()
+    app.state.database = database
+
+    async def _company_users(session, company_id):
+        result = await session.execute(
+            select(CompanyUser).where(CompanyUser.company_id == company_id).order_by(CompanyUser.emp_no)
+        )
+        return result.scalars().all()
+
+    @app.get("/companies/{company_id}/employees")
+    async def list_employees(company_id: UUID, loaders: IdentityLoaders = Depends(get_identity_loaders)):
+        company_users = await _company_users(loaders.session, company_id)
+        await loaders.load_company_user_relations(company_users)
+        return [
+            _employee(cu, cu.user, cu.department, cu.team, cu.position, cu.responsibility)
+            for cu in company_users
+        ]
+
+    @app.get("/naive/companies/{company_id}/employees")
+    async def list_employees_naive(company_id: UUID, session=Depends(get_db_session)):
+        # 관계마다 개별 조회 (N+1)
+        employees = []
+        for cu in await _company_users(session, company_id):
+            employees.append(_employee(
+                cu,
+                await session.get(User, cu.user_id),
+                await session.get(Department, cu.department_id),
+                await session.get(Team, cu.team_id),
+                await session.get(Position, cu.position_id),
+                await session.get(Responsibility, cu.responsibility_id)
+            ))
+        return employees
+
+    return app
+
+async def _get(database, path):
+    transport = httpx.ASGITransport(app=_build_app(database))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(path)
+    assert response.status_code == 200
+    return response.json()
+
+@pytest.mark.asyncio
+async def test_batch_loader_coalesces_keys():
+    """한 턴에 요청된 키를 중복 없이 한 번에 조회하는지 테스트"""
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(keys)
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader(batch_fn)
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3), loader.load(None))
+
+    assert values == [10, 20, 10, None, None]
+    assert calls == [[1, 2, 3]]
+
+    assert await loader.load(2) == 20
+    assert calls == [[1, 2, 3]]
+
+@pytest.mark.asyncio
+async def test_batch_loader_splits_large_batches():
+    """max_batch_size 단위로 나누어 조회하는지 테스트"""
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(len(keys))
+        return {key: key for key in keys}
+
+    loader = BatchLoader(batch_fn, max_batch_size=4)
+    assert await loader.load_many(range(10)) == list(range(10))
+    assert calls == [4, 4, 2]
+
+@pytest.mark.asyncio
+async def test_batch_loader_failure_not_cached():
+    """조회 실패가 캐시되지 않고 다시 시도되는지 테스트"""
+    attempts = []
+
+    async def batch_fn(keys):
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return {key: key for key in keys}
+
+    loader = BatchLoader(batch_fn)
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+
+    assert await loader.load(1) == 1
+    assert len(attempts) == 2
+
+@pytest.mark.asyncio
+async def test_listing_query_count_independent_of_size(database, seed_company):
+    """직원 수와 관계없이 엔티티 종류별 한 번씩만 조회하는지 테스트"""
+    small = await seed_company(database, 3)
+    large = await seed_company(database, 60)
+
+    # CompanyUser 목록 1 + user/department/team/position/responsibility 5
+    with expect_max_queries(database.engine, 6) as small_queries:
+        small_employees = await _get(database, f"/companies/{small}/employees")
+    with expect_max_queries(database.engine, 6) as large_queries:
+        large_employees = await _get(database, f"/companies/{large}/employees")
+
+    assert len(small_employees) == 3
+    assert len(large_employees) == 60
+    assert small_queries.count == large_queries.count
+    assert large_employees[0] == {
+        "emp_no": "E0",
+        "name": "직원0",
+        "department": "부서0",
+        "team": "팀0",
+        "position": "직위0",
+        "responsibility": "직책0"
+    }
+
+@pytest.mark.asyncio
+async def test_harness_detects_n_plus_one(database, seed_company):
+    """N+1 목록 조회가 쿼리 수 검사에 걸리는지 테스트"""
+    company_id = await seed_company(database, 20)
+
+    with pytest.raises(AssertionError, match="허용 6개"):
+        with expect_max_queries(database.engine, 6):
+            naive = await _get(database, f"/naive/companies/{company_id}/employees")
+
+    assert naive == await _get(database, f"/companies/{company_id}/employees")
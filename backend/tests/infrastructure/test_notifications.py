@@ -0,0 +1,262 @@
+import asyncio
+import json
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from sqlalchemy import select, update
+
+from domain.identity.entities import CompanyUser, User, UserPushToken
+from infrastructure.notifications import (
+    INVALID,
+    RETRY,
+    SENT,
+    Audience,
+    InAppChannel,
+    Notification,
+    NotificationEngine,
+    PartialDelivery,
+    PushChannel,
+    PushTokenStore,
+    TransportChannel,
+    email_resolver,
+    iter_recipient_batches
+)
+
+class PollingRedis(FakeAsyncRedis):
+    """fakeredis 는 동시에 기다리는 blocking 읽기를 깨우지 못하므로 짧게 폴링"""
+
+    async def xreadgroup(self, *args, block=None, **kwargs):
+        response = await super().xreadgroup(*args, **kwargs)
+        if not response and block:
+            await asyncio.sleep(0.01)
+        return response
+
+@pytest.fixture
+def redis():
+    return PollingRedis(server=FakeServer())
+
+async def _user_ids(database, company_id):
+    async with database.session() as session:
+        rows = (await session.execute(
+            select(User.emp_no, User.id).where(User.company_id == company_id)
+        )).all()
+    return {emp_no: str(user_id) for emp_no, user_id in rows}
+
+async def _collect(batches):
+    return [batch async for batch in batches]
+
+def _engine(redis, database, channels, **options):
+    return NotificationEngine(
+        redis,
+        recipients=lambda company_id, audience, batch_size: iter_recipient_batches(
+            database.session, company_id, audience, batch_size
+        ),
+        channels=channels,
+        **{"fanout_batch_size": 3, "retry_backoff": 0.01, "block": 0.05, **options}
+    )
+
+async def _wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+@pytest.mark.asyncio
+async def test_recipient_batches(database, seed_company):
+    company_id = await seed_company(database, 7)
+    users = await _user_ids(database, company_id)
+    async with database.session() as session:
+        team_id = (await session.execute(
+            select(CompanyUser.team_id).join(User, User.id == CompanyUser.user_id).where(User.emp_no == "E1")
+        )).scalar_one()
+        await session.execute(update(User).where(User.emp_no == "E6").values(use_yn="N"))
+
+    everyone = await _collect(iter_recipient_batches(database.session, company_id, Audience(everyone=True), 3))
+    assert [len(batch) for batch in everyone] == [3, 3]
+    assert users["E6"] not in sum(everyone, [])
+
+    targeted = await _collect(iter_recipient_batches(
+        database.session, company_id, Audience(user_ids=(users["E5"],), team_ids=(str(team_id),)), 3
+    ))
+    assert sorted(targeted[0]) == sorted([users["E1"], users["E5"]])
+    assert await _collect(iter_recipient_batches(database.session, company_id, Audience(), 3)) == []
+
+    addresses = await email_resolver(database.session)([users["E0"], users["E6"]])
+    assert addresses == {users["E0"]: [f"user0@{company_id}.example.com"]}
+
+@pytest.mark.asyncio
+async def test_push_tokens_register_and_prune(database, seed_company):
+    company_id = await seed_company(database, 2)
+    users = await _user_ids(database, company_id)
+    tokens = PushTokenStore(database.session)
+    await tokens.register(users["E0"], "a", "ios")
+    await tokens.register(users["E0"], "b", "android")
+    await tokens.register(users["E1"], "c", "web")
+
+    assert await tokens.prune(["a", "c", "unknown"]) == 2
+    assert await tokens.tokens_for([users["E0"], users["E1"]]) == {users["E0"]: ["b"]}
+
+    # 정리된 토큰을 다른 사용자가 등록하면 다시 활성화
+    await tokens.register(users["E1"], "a", "ios")
+    assert await tokens.tokens_for([users["E0"], users["E1"]]) == {users["E0"]: ["b"], users["E1"]: ["a"]}
+    async with database.session() as session:
+        rows = (await session.execute(select(UserPushToken).execution_options(include_inactive=True))).scalars().all()
+    assert len(rows) == 3
+
+@pytest.mark.asyncio
+async def test_fan_out_batches_and_coalesces(database, seed_company, redis):
+    company_id = await seed_company(database, 7)
+    engine = _engine(redis, database, [InAppChannel(redis)])
+
+    def notification():
+        return Notification.create(
+            company_id, "task.assigned", "할 일", "새 할 일이 있습니다.",
+            Audience(everyone=True), ("in_app", "sms"), coalesce_key="task:1"
+        )
+
+    assert await engine.fan_out(notification()) == 7
+    entries = await redis.xrange(engine.channel_stream("in_app"))
+    assert [len(fields[b"recipients"].split(b",")) for _, fields in entries] == [3, 3, 1]
+    assert Notification.from_json(entries[0][1][b"notification"]).audience == Audience()
+    # 없는 채널(sms)은 건너뜀
+    assert not await redis.exists(engine.channel_stream("sms"))
+
+    # 같은 coalesce_key 는 시간 안에 다시 보내지 않음
+    assert await engine.fan_out(notification()) == 0
+    assert engine.stats["coalesced"] == 7
+    assert await redis.xlen(engine.channel_stream("in_app")) == 3
+
+class FlakyChannel:
+    name = "flaky"
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.received = []
+
+    async def send(self, notification, user_ids):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("provider unavailable")
+        self.received.extend(user_ids)
+
+@pytest.mark.asyncio
+async def test_engine_delivers_through_channels(database, seed_company, redis):
+    """요청 하나가 채널별로 전달되고, 실패한 전송은 다시 보내며 무효 토큰은 한 번에 정리되는지 테스트"""
+    company_id = await seed_company(database, 5)
+    users = await _user_ids(database, company_id)
+    tokens = PushTokenStore(database.session)
+    for index in range(5):
+        await tokens.register(users[f"E{index}"], f"token-{index}", "ios")
+    await tokens.register(users["E0"], "expired", "android")
+
+    calls = []
+
+    async def transport(payload, batch):
+        calls.append(list(batch))
+        outcomes = {token: SENT for token in batch}
+        outcomes["expired"] = INVALID
+        if len(calls) == 1:
+            outcomes["token-1"] = RETRY
+        return {token: outcome for token, outcome in outcomes.items() if token in batch}
+
+    pruned = []
+    prune = tokens.prune
+
+    async def record_prune(batch):
+        pruned.append(sorted(batch))
+        return await prune(batch)
+
+    tokens.prune = record_prune
+    in_app = InAppChannel(redis)
+    flaky = FlakyChannel(failures=1)
+    push = PushChannel(tokens, transport, batch_size=10, retry_backoff=0.01)
+    engine = _engine(redis, database, [in_app, flaky, push], fanout_batch_size=10)
+
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(in_app.user_channel(users["E2"]))
+    await engine.start()
+    try:
+        notification = Notification.create(
+            company_id, "announcement", "공지", "전체 공지입니다.",
+            Audience(everyone=True), ("in_app", "flaky", "push"), data={"id": 1}
+        )
+        await engine.publish(notification)
+        await _wait_for(lambda: len(flaky.received) == 5 and engine.stats["delivered"] == 15)
+    finally:
+        await engine.stop()
+
+    inbox = await in_app.inbox(users["E2"])
+    assert inbox == [notification.payload()]
+    messages = [await pubsub.get_message(timeout=1) for _ in range(2)]
+    assert [message["type"] for message in messages] == ["subscribe", "message"]
+    assert json.loads(messages[1]["data"]) == notification.payload()
+    await pubsub.aclose()
+
+    assert engine.stats["retried"] == 1
+    assert calls[1] == ["token-1"]
+    assert push.stats == {"sent": 5, "invalid": 1, "retried": 1, "failed": 0}
+    assert pruned == [["expired"]]
+    assert await tokens.tokens_for([users["E0"]]) == {users["E0"]: ["token-0"]}
+    # 처리한 항목은 모두 ACK
+    for stream, group in [(engine.requests_stream, "fanout")] + [
+        (engine.channel_stream(name), "deliver") for name in engine.channels
+    ]:
+        assert (await redis.xpending(stream, group))["pending"] == 0
+
+@pytest.mark.asyncio
+async def test_retries_skip_delivered_recipients(redis):
+    """정리(prune)가 실패해도 다시 보내지 않고, 일부만 보낸 채 실패하면 나머지에게만 다시 보내는지 테스트"""
+    calls = []
+
+    async def resolve(user_ids):
+        return {user_id: [f"token-{user_id}"] for user_id in user_ids}
+
+    async def transport(payload, batch):
+        calls.append(list(batch))
+        return {token: INVALID if token == "token-c" else SENT for token in batch}
+
+    async def prune(addresses):
+        raise ConnectionError("database unavailable")
+
+    push = TransportChannel("push", resolve, transport, prune=prune)
+    engine = _engine(redis, None, [push], max_retries=3)
+    notification = Notification.create("company", "announcement", "공지", "내용", Audience(everyone=True), ("push",))
+
+    assert await engine.deliver(push, notification, ["a", "b", "c"])
+    assert calls == [["token-a", "token-b", "token-c"]]
+    assert push.stats["sent"] == 2
+    assert engine.stats["delivered"] == 3
+
+    class PartialChannel(FlakyChannel):
+        async def send(self, notification, user_ids):
+            self.received.append(list(user_ids))
+            if self.failures:
+                self.failures -= 1
+                raise PartialDelivery(user_ids[1:])
+
+    partial = PartialChannel(failures=1)
+    assert await engine.deliver(partial, notification, ["a", "b", "c"])
+    assert partial.received == [["a", "b", "c"], ["b", "c"]]
+    assert (engine.stats["delivered"], engine.stats["retried"]) == (6, 1)
+
+@pytest.mark.asyncio
+async def test_reclaims_entries_from_stopped_consumer(database, seed_company, redis):
+    company_id = await seed_company(database, 2)
+    flaky = FlakyChannel(failures=0)
+    crashed = _engine(redis, database, [flaky], consumer="crashed")
+    await crashed.start()
+    await crashed.stop()
+    await crashed.publish(Notification.create(
+        company_id, "announcement", "공지", "내용", Audience(everyone=True), ("flaky",)
+    ))
+    # 읽고 처리하지 못한 채 멈춤
+    await redis.xreadgroup("fanout", "crashed", {crashed.requests_stream: ">"})
+    await asyncio.sleep(0.2)
+
+    engine = _engine(redis, database, [flaky], consumer="alive", reclaim_idle=0.2)
+    await engine.start()
+    try:
+        await _wait_for(lambda: len(flaky.received) == 2)
+    finally:
+        await engine.stop()
+    assert (await redis.xpending(engine.requests_stream, "fanout"))["pending"] == 0
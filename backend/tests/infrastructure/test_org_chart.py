@@ -0,0 +1,215 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import select
+
+from domain.identity.entities import CompanyTeam, CompanyUser, Department, Team, User
+from infrastructure.database import expect_max_queries
+from infrastructure.read_models import OrgChartChangeTracker, OrgChartStore, load_org_chart
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis()
+
+@pytest.fixture
+def make_store(database, redis):
+    async def loader(company_id):
+        async with database.session() as session:
+            return await load_org_chart(session, company_id)
+
+    def make_store(**options):
+        return OrgChartStore(loader, redis=redis, **options)
+
+    return make_store
+
+@pytest_asyncio.fixture
+async def tracked(database, make_store):
+    """변경 추적기가 연결된 저장소"""
+    store = make_store()
+    tracker = OrgChartChangeTracker(store)
+    tracker.register(database.sync_session_class)
+    yield store, tracker
+    tracker.unregister()
+
+def _names(chart):
+    return sorted(chart.users[member.user_id] for member in chart.members.values())
+
+@pytest.mark.asyncio
+async def test_load_org_chart(database, seed_company):
+    """DB에서 조직도 전체를 두 번의 쿼리로 만드는지 테스트"""
+    company_id = await seed_company(database, 3)
+
+    with expect_max_queries(database.engine, 2):
+        async with database.session() as session:
+            chart = await load_org_chart(session, company_id)
+
+    assert _names(chart) == ["직원0", "직원1", "직원2"]
+    assert sorted(chart.units["d"].values()) == ["부서0", "부서1", "부서2"]
+    department_id = next(unit_id for unit_id, name in chart.units["d"].items() if name == "부서1")
+    assert [member.emp_no for member in chart.members_of("department", department_id)] == ["E1"]
+
+@pytest.mark.asyncio
+async def test_reads_hit_local_then_redis(database, seed_company, make_store):
+    """첫 조회 후에는 DB를 거치지 않고, 다른 워커는 Redis 에서 읽는지 테스트"""
+    company_id = await seed_company(database, 3)
+    store = make_store()
+    first = await store.get(company_id)
+
+    with expect_max_queries(database.engine, 0):
+        assert await store.get(company_id) is first
+        other_worker = make_store()
+        assert (await other_worker.get(company_id)).to_dict() == first.to_dict()
+
+    assert store.stats == {"local_hits": 1, "redis_hits": 0, "misses": 1}
+    assert other_worker.stats["redis_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_local_copy_expires(database, seed_company, make_store):
+    """로컬 캐시는 TTL 이 지나면 Redis 에서 다시 읽는지 테스트"""
+    company_id = await seed_company(database, 1)
+    now = [0.0]
+    store = make_store(local_ttl=5.0, clock=lambda: now[0])
+    await store.get(company_id)
+
+    now[0] = 6.0
+    await store.get(company_id)
+
+    assert store.stats == {"local_hits": 0, "redis_hits": 1, "misses": 1}
+
+@pytest.mark.asyncio
+async def test_new_member_applied_incrementally(database, seed_company, make_store, tracked):
+    """직원 추가가 조직도 재생성 없이 반영되는지 테스트"""
+    store, tracker = tracked
+    company_id = await seed_company(database, 2)
+    await tracker.drain()
+    chart = await store.get(company_id)
+    version = chart.version
+
+    async with database.session() as session:
+        department_id = (await session.execute(
+            select(Department.id).where(Department.name == "부서0")
+        )).scalar_one()
+        user = User(emp_no="E9", email="new@example.com", password="hashed", name="신입", role="USER",
+                    company_id=company_id)
+        session.add(user)
+        await session.flush()
+        session.add(CompanyUser(company_id=company_id, user_id=user.id, emp_no="E9", department_id=department_id))
+    await tracker.drain()
+
+    with expect_max_queries(database.engine, 0):
+        assert await store.get(company_id) is chart
+        other_worker = await make_store().get(company_id)
+
+    assert _names(chart) == ["신입", "직원0", "직원1"]
+    assert chart.version == version + 1
+    assert other_worker.to_dict() == chart.to_dict()
+    assert sorted(member.emp_no for member in chart.members_of("department", str(department_id))) == ["E0", "E9"]
+
+@pytest.mark.asyncio
+async def test_rename_and_soft_delete_applied(database, seed_company, make_store, tracked):
+    """부서 이름 변경, 사용자 이름 변경, 직원 삭제가 반영되는지 테스트"""
+    store, tracker = tracked
+    company_id = await seed_company(database, 2)
+    await tracker.drain()
+    await store.get(company_id)
+    # 다른 워커는 로컬 캐시 없이 Redis 만 사용
+    other_worker = make_store(local_ttl=0)
+
+    async with database.session() as session:
+        department = (await session.execute(select(Department).where(Department.name == "부서0"))).scalar_one()
+        department.name = "개발팀"
+        user = (await session.execute(select(User).where(User.name == "직원1"))).scalar_one()
+        user.name = "김직원"
+        company_user = (await session.execute(select(CompanyUser).where(CompanyUser.emp_no == "E0"))).scalar_one()
+        company_user.mark_deleted(user.id)
+    await tracker.drain()
+
+    for chart in (await store.get(company_id), await other_worker.get(company_id)):
+        assert "개발팀" in chart.units["d"].values()
+        assert _names(chart) == ["김직원"]
+    assert store.stats["misses"] == 1
+    assert other_worker.stats["misses"] == 0
+
+@pytest.mark.asyncio
+async def test_shared_unit_rename_applied_to_every_company(database, seed_company, make_store, tracked):
+    """여러 회사가 함께 쓰는 팀의 이름 변경이 모든 회사 조직도에 반영되는지 테스트"""
+    store, tracker = tracked
+    first = await seed_company(database, 2)
+    second = await seed_company(database, 1)
+    async with database.session() as session:
+        team_id = (await session.execute(
+            select(Team.id).join(CompanyTeam, CompanyTeam.team_id == Team.id)
+            .where(CompanyTeam.company_id == first, Team.name == "팀0")
+        )).scalar_one()
+        session.add(CompanyTeam(company_id=second, team_id=team_id))
+    await tracker.drain()
+    for company_id in (first, second):
+        await store.get(company_id)
+    # 다른 워커는 로컬 캐시 없이 Redis 만 사용
+    other_worker = make_store(local_ttl=0)
+
+    async with database.session() as session:
+        (await session.get(Team, team_id)).name = "공용팀"
+    await tracker.drain()
+
+    for company_id in (first, second):
+        for chart in (await store.get(company_id), await other_worker.get(company_id)):
+            assert chart.units["t"][str(team_id)] == "공용팀"
+    assert (store.stats["misses"], other_worker.stats["misses"]) == (2, 0)
+
+@pytest.mark.asyncio
+async def test_rolled_back_changes_ignored(database, seed_company, tracked):
+    """롤백된 변경은 반영되지 않는지 테스트"""
+    store, tracker = tracked
+    company_id = await seed_company(database, 1)
+    await tracker.drain()
+    chart = await store.get(company_id)
+    version = chart.version
+
+    with pytest.raises(RuntimeError):
+        async with database.session() as session:
+            user = (await session.execute(select(User))).scalar_one()
+            user.name = "롤백"
+            await session.flush()
+            raise RuntimeError("boom")
+    await tracker.drain()
+
+    assert _names(await store.get(company_id)) == ["직원0"]
+    assert chart.version == version
+
+@pytest.mark.asyncio
+async def test_unknown_user_invalidates(database, seed_company, tracked):
+    """세션에 사용자 정보가 없으면 조직도를 다시 만드는지 테스트"""
+    store, tracker = tracked
+    company_id = await seed_company(database, 1)
+    await tracker.drain()
+    async with database.session() as session:
+        user = User(emp_no="E5", email="other@example.com", password="hashed", name="기존", role="USER")
+        session.add(user)
+    await store.get(company_id)
+
+    async with database.session() as session:
+        session.add(CompanyUser(company_id=company_id, user_id=user.id, emp_no="E5"))
+    await tracker.drain()
+
+    assert _names(await store.get(company_id)) == ["기존", "직원0"]
+    assert store.stats["misses"] == 2
+
+@pytest.mark.asyncio
+async def test_stale_rebuild_not_cached(database, seed_company, redis):
+    """DB에서 만드는 동안 변경분이 반영되면 만든 조직도를 저장하지 않는지 테스트"""
+    company_id = await seed_company(database, 1)
+
+    async def loader(company_id):
+        async with database.session() as session:
+            chart = await load_org_chart(session, company_id)
+        await store._redis_apply(company_id, [("u:late", "늦은 변경")])
+        return chart
+
+    store = OrgChartStore(loader, redis=redis)
+    await store.get(company_id)
+
+    assert await redis.hget(f"org_chart:{company_id}", "_built") is None
+    assert store.stats["misses"] == 1
+    await store.get(company_id)
+    assert store.stats["misses"] == 2
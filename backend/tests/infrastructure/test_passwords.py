@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from application.common.exceptions import ServiceUnavailableException
+from infrastructure.security import PasswordHasher
+
+@pytest_asyncio.fixture
+async def hasher():
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    yield hasher
+    hasher.shutdown()
+
+def _user(password_hash):
+    user = SimpleNamespace(id="user-1", password=password_hash, updated_by=None)
+    user.update_audit_fields = lambda updated_by: setattr(user, "updated_by", updated_by)
+    return user
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher):
+    """프로세스 풀에서 해시/검증하는지 테스트"""
+    hashed = await hasher.hash("비밀번호123")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("비밀번호123", hashed)
+    assert not await hasher.verify("틀림", hashed)
+    # 비밀번호 미설정 표시 등 해시가 아닌 값은 실패로 처리
+    assert not await hasher.verify("비밀번호123", "!")
+    assert hasher.pending == 0
+
+@pytest.mark.asyncio
+async def test_rehash_when_rounds_change(hasher):
+    """rounds 가 바뀌면 로그인 시 새 해시로 교체하는지 테스트"""
+    previous = PasswordHasher(rounds=5, max_workers=1)
+    try:
+        old_hash = await previous.hash("pw")
+    finally:
+        previous.shutdown()
+    user = _user(old_hash)
+
+    assert await hasher.verify_user(user, "pw")
+    assert user.password.startswith("$2b$04$")
+    assert user.updated_by == "user-1"
+
+    current_hash = user.password
+    assert await hasher.verify_user(user, "pw")
+    assert user.password == current_hash
+    assert not await hasher.verify_user(_user(old_hash), "wrong")
+
+@pytest.mark.asyncio
+async def test_overflow_fails_fast():
+    """대기 작업이 한도를 넘으면 바로 SERVICE_UNAVAILABLE 을 발생시키는지 테스트"""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_pending=1)
+    try:
+        first = asyncio.ensure_future(hasher.hash("pw"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await hasher.hash("pw")
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.additional_info["pending"] == 1
+        assert (await first).startswith("$2b$")
+        assert hasher.pending == 0
+    finally:
+        hasher.shutdown()
+
+def test_unsupported_algorithm():
+    """bcrypt 외의 알고리즘은 거부하는지 테스트"""
+    with pytest.raises(ValueError):
+        PasswordHasher("md5_crypt")
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from infrastructure.notifications import Audience, InAppChannel, Notification, RealtimeHub
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(server=FakeServer())
+    yield redis
+    await redis.aclose()
+
+@pytest_asyncio.fixture
+async def hub(redis):
+    hub = RealtimeHub(redis, max_connections=4, max_pending=2, sweep_interval=0.05)
+    await hub.start()
+    yield hub
+    await hub.stop()
+
+async def _channels(redis):
+    return sorted(channel.decode() for channel in await redis.pubsub_channels())
+
+@pytest.mark.asyncio
+async def test_demultiplexes_one_subscription(hub, redis):
+    """연결이 여러 개여도 구독은 하나이며, 사용자/회사/전체 채널로 나눠 보내는지 테스트"""
+    first = await hub.connect("u1", "c1")
+    second = await hub.connect("u1", "c1")
+    other = await hub.connect("u2", "c2")
+    assert await _channels(redis) == [
+        hub.broadcast_channel, hub.company_channel("c1"), hub.company_channel("c2"),
+        hub.user_channel("u1"), hub.user_channel("u2")
+    ]
+    assert (await redis.pubsub_numsub(hub.user_channel("u1")))[0][1] == 1
+
+    # 알림 엔진의 앱 안 채널이 발행한 메시지를 그대로 받음
+    notification = Notification.create("c1", "task.assigned", "할 일", "내용", Audience(user_ids=("u1",)), ("in_app",))
+    await InAppChannel(redis).send(notification, ["u1"])
+    assert await hub.publish("회사", company_id="c2") == 1
+    assert await hub.publish("전체") == 1
+
+    assert [await first.get(1) for _ in range(2)] == [await second.get(1) for _ in range(2)]
+    assert (await second.get(0.05), await first.get(0.05)) == (None, None)
+    assert [await other.get(1), await other.get(1)] == ["회사", "전체"]
+
+    hub.disconnect(first)
+    hub.disconnect(first)
+    hub.disconnect(other)
+    assert hub.connections == 1
+    await asyncio.sleep(0.2)
+    assert await _channels(redis) == [hub.broadcast_channel, hub.company_channel("c1"), hub.user_channel("u1")]
+
+@pytest.mark.asyncio
+async def test_disconnects_slow_consumer(hub):
+    slow = await hub.connect("slow")
+    fast = await hub.connect("fast")
+    for index in range(3):
+        await hub.publish(str(index))
+        assert await fast.get(1) == str(index)
+    await asyncio.sleep(0.05)
+
+    assert slow.close_reason == "slow_consumer"
+    assert await slow.get(1) is None
+    assert fast.close_reason is None
+    assert (hub.connections, hub.stats["slow_consumers"]) == (1, 1)
+
+@pytest.mark.asyncio
+async def test_connection_limit_and_shutdown(hub):
+    connections = [await hub.connect(f"u{index}") for index in range(4)]
+    assert await hub.connect("u5") is None
+
+    hub.disconnect(connections[0])
+    assert await hub.connect("u5") is not None
+
+    await hub.stop()
+    assert all(connection.close_reason == "shutdown" for connection in connections[1:])
+    assert hub.connections == 0
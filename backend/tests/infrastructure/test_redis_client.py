@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from prometheus_client import CollectorRegistry
+from redis.exceptions import ResponseError, TimeoutError as RedisTimeoutError
+
+from infrastructure.redis import BatchingRedis, InstrumentedConnectionPool, RedisMetrics
+
+@pytest.fixture
+def registry():
+    return CollectorRegistry()
+
+@pytest.fixture
+def make_client(registry):
+    """fakeredis 커넥션을 쓰는 BatchingRedis"""
+    server = FakeServer()
+    metrics = RedisMetrics(registry)
+
+    def make(**options):
+        pool = InstrumentedConnectionPool(
+            connection_class=FakeConnection, server=server, max_connections=2, timeout=1
+        )
+        pool.pool_metrics = metrics
+        return BatchingRedis(connection_pool=pool, metrics=metrics, **options)
+
+    return make
+
+def _value(registry, name):
+    return registry.get_sample_value(name, {"client": "default"}) or 0
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_share_roundtrips(make_client, registry):
+    """동시 명령이 파이프라인으로 묶이고 결과/오류가 각 호출에 전달되는지 테스트"""
+    redis = make_client()
+    await asyncio.gather(*(redis.set(f"key:{index}", index) for index in range(100)))
+    script = redis.register_script("return tonumber(ARGV[1]) * 2")
+
+    results = await asyncio.gather(
+        redis.get("key:7"),
+        redis.hget("key:7", "field"),  # 타입 오류는 이 명령에만
+        script(args=[21]),
+        redis.incr("key:8"),
+        return_exceptions=True
+    )
+
+    assert results[0] == b"7"
+    assert isinstance(results[1], ResponseError)
+    assert results[2:] == [42, 9]
+    # 스크립트 첫 호출은 EVALSHA 실패 -> SCRIPT LOAD -> EVALSHA
+    assert redis.stats["commands"] == 106
+    assert redis.stats["roundtrips"] <= 6
+    assert _value(registry, "redis_commands_total") == 106
+    assert _value(registry, "redis_roundtrips_total") == redis.stats["roundtrips"]
+    assert _value(registry, "redis_pool_connections_in_use") == 0
+    await redis.aclose()
+
+@pytest.mark.asyncio
+async def test_command_timeout(make_client, registry):
+    """시간 초과된 명령은 TimeoutError 를 발생시키고 아직 보내지 않았다면 실행되지 않는지 테스트"""
+    redis = make_client(batch_window=0.2, command_timeout=0.01)
+
+    with pytest.raises(RedisTimeoutError):
+        await redis.set("late", 1)
+    await asyncio.sleep(0.3)
+
+    redis.command_timeout = 1.0
+    assert await redis.get("late") is None
+    assert _value(registry, "redis_command_timeouts_total") == 1
+    await redis.aclose()
+
+@pytest.mark.asyncio
+async def test_blocking_commands_are_not_batched(make_client):
+    redis = make_client()
+    waiting = asyncio.ensure_future(redis.blpop(["queue"], timeout=1))
+    await asyncio.sleep(0.05)
+
+    # 대기 중인 BLPOP 과 상관없이 다른 명령은 바로 처리
+    await asyncio.wait_for(redis.rpush("queue", "job"), 0.5)
+    assert await waiting == (b"queue", b"job")
+    assert redis.stats["roundtrips"] == 1
+    await redis.aclose()
@@ -0,0 +1,165 @@
+import asyncio
+import io
+import json
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from domain.identity.entities import Company, CompanyUser, User
+from infrastructure.imports import EmployeeImporter
+from infrastructure.search import (
+    DELETE,
+    INDEX,
+    UPDATE,
+    BulkIndexer,
+    SearchAction,
+    SearchChangeTracker,
+    load_dead_letters
+)
+
+class _FakeElasticsearch:
+    """bulk 요청을 기록하고 지정한 상태 코드/예외로 응답"""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []  # 요청별 항목 상태 코드 (없으면 200)
+        self.failures = 0  # 남은 요청 실패 횟수
+
+    async def bulk(self, operations):
+        self.requests.append(operations)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("elasticsearch down")
+        statuses = self.statuses.pop(0) if self.statuses else []
+        items = []
+        for operation in operations:
+            if len(operation) == 1 and next(iter(operation)) in (INDEX, UPDATE, DELETE):
+                status = statuses[len(items)] if len(items) < len(statuses) else 200
+                error = {"type": "error"} if status >= 300 else None
+                items.append({next(iter(operation)): {"status": status, "error": error}})
+        return {"errors": any(status >= 300 for status in statuses), "items": items}
+
+def _action(op=INDEX, index="users", id="1", **doc):
+    return SearchAction(op, index, id, doc or ({"name": "직원"} if op != DELETE else None))
+
+@pytest_asyncio.fixture
+async def tracked(database):
+    indexer = BulkIndexer(_FakeElasticsearch())
+    tracker = SearchChangeTracker(indexer)
+    tracker.register(database.sync_session_class)
+    yield indexer
+    tracker.unregister()
+
+def _pending(indexer):
+    return {(action.index, action.op): action for action in indexer._pending.values()}
+
+@pytest.mark.asyncio
+async def test_session_changes_become_document_deltas(database, seed_company, tracked):
+    """커밋된 추가/변경/삭제가 문서 전체/변경 필드/삭제로 큐에 들어가는지 테스트"""
+    company_id = await seed_company(database, 1)
+    pending = _pending(tracked)
+    assert set(pending) == {("companies", INDEX), ("users", INDEX), ("company_users", INDEX), ("teams", INDEX)}
+    assert pending[("users", INDEX)].doc["name"] == "직원0"
+    tracked._pending.clear()
+
+    async with database.session() as session:
+        user = (await session.execute(select(User))).scalar_one()
+        user.name = "개명"
+        user.update_audit_fields(user.id)
+        company_user = (await session.execute(select(CompanyUser))).scalar_one()
+        company_user.mark_deleted(user.id)
+    pending = _pending(tracked)
+    assert pending[("users", UPDATE)].doc == {"name": "개명"}
+    assert pending[("users", UPDATE)].upsert["email"] == user.email
+    assert ("company_users", DELETE) in pending
+
+    with pytest.raises(RuntimeError):
+        async with database.session() as session:
+            (await session.get(Company, company_id)).name = "롤백"
+            await session.flush()
+            raise RuntimeError
+    assert ("companies", UPDATE) not in _pending(tracked)
+
+@pytest.mark.asyncio
+async def test_bulk_import_records_documents(database, seed_company, tracked):
+    """ORM 을 거치지 않는 직원 가져오기도 색인 대상이 되는지 테스트"""
+    company_id = await seed_company(database, 1)
+    tracked._pending.clear()
+    user_email = f"user0@{company_id}.example.com"
+    csv = f"사번,이메일,이름\nE0,{user_email},새이름\nE9,new@example.com,신규\n"
+
+    async with database.session() as session:
+        await EmployeeImporter(session, company_id).run(io.BytesIO(csv.encode()), "csv")
+
+    actions = list(tracked._pending.values())
+    users = {action.op: action for action in actions if action.index == "users"}
+    assert users[UPDATE].doc["name"] == "새이름" and "role" not in users[UPDATE].doc
+    assert users[INDEX].doc["email"] == "new@example.com"
+    assert {action.op for action in actions if action.index == "company_users"} == {INDEX, UPDATE}
+
+@pytest.mark.asyncio
+async def test_size_and_time_based_batching():
+    """batch_size 가 차면 바로, 덜 찬 배치는 flush_interval 후에 보내는지 테스트"""
+    client = _FakeElasticsearch()
+    indexer = BulkIndexer(client, index_prefix="teamon-", batch_size=3, flush_interval=0.2)
+    indexer.start()
+    try:
+        indexer.submit([_action(id=str(index)) for index in range(4)])
+        await asyncio.sleep(0.05)
+        assert [len(request) for request in client.requests] == [6]
+        assert client.requests[0][0] == {INDEX: {"_index": "teamon-users", "_id": "0"}}
+
+        await asyncio.sleep(0.3)
+        assert [len(request) for request in client.requests] == [6, 2]
+        assert indexer.stats["indexed"] == 4
+    finally:
+        await indexer.stop()
+
+@pytest.mark.asyncio
+async def test_changes_to_same_document_are_coalesced():
+    indexer = BulkIndexer(_FakeElasticsearch())
+    indexer.submit([_action(INDEX, name="a", email="a@example.com")])
+    indexer.submit([_action(UPDATE, name="b")])
+    assert list(indexer._pending.values()) == [_action(INDEX, name="b", email="a@example.com")]
+
+    indexer.submit([_action(DELETE)])
+    assert list(indexer._pending.values()) == [_action(DELETE)]
+
+@pytest.mark.asyncio
+async def test_retries_then_dead_letters(tmp_path):
+    """일시 오류는 재시도하고, 영구 오류와 재시도 초과는 dead letter 로 남기는지 테스트"""
+    client = _FakeElasticsearch()
+    dead_letters = tmp_path / "dead.jsonl"
+    indexer = BulkIndexer(client, max_retries=2, dead_letter_path=dead_letters)
+
+    client.failures = 1
+    indexer.submit([_action(id="retry"), _action(id="mapping"), _action(id="throttled")])
+    assert not await indexer.flush()
+    client.statuses = [[200, 400, 429]]
+    assert not await indexer.flush()
+    client.statuses = [[429]]
+    assert not await indexer.flush()
+
+    assert indexer.stats["indexed"] == 1
+    assert indexer.pending == 0
+    assert [action.id for action in load_dead_letters(dead_letters)] == ["mapping", "throttled"]
+    assert json.loads(dead_letters.read_text().splitlines()[0])["error"] == '{"type": "error"}'
+
+@pytest.mark.asyncio
+async def test_backpressure(tmp_path):
+    """큐가 가득 차면 submit 은 기다리지 않고 넘치는 문서를 dead letter 로 보내는지 테스트"""
+    indexer = BulkIndexer(_FakeElasticsearch(), max_pending=2, dead_letter_path=tmp_path / "dead.jsonl")
+    indexer.submit([_action(id=str(index)) for index in range(3)])
+
+    assert indexer.pending == 2
+    assert indexer.stats["dead_lettered"] == 1
+    # 요청 경로(submit)에서는 파일을 쓰지 않음
+    assert not (tmp_path / "dead.jsonl").exists()
+    waiter = asyncio.ensure_future(indexer.wait_for_capacity())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await indexer.flush()
+    await asyncio.wait_for(waiter, 1)
+    assert [action.id for action in load_dead_letters(tmp_path / "dead.jsonl")] == ["2"]
@@ -0,0 +1,116 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from jose import jwt
+
+from application.common.exceptions import InvalidTokenException, TokenExpiredException
+from infrastructure.security import BloomFilter, RevokedTokenStore, TokenVerifier
+
+SECRET = "test-secret-key-at-least-32-characters"
+
+def _token(expires_in=60, secret=SECRET, **claims):
+    payload = {"sub": "user", "jti": uuid.uuid4().hex, "exp": int(time.time()) + expires_in, **claims}
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+class _CountingStore(RevokedTokenStore):
+    def __init__(self, redis):
+        super().__init__(redis)
+        self.lookups = 0
+
+    async def is_revoked(self, token_id):
+        self.lookups += 1
+        return await super().is_revoked(token_id)
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis(server=FakeServer())
+
+def test_bloom_filter_has_no_false_negatives():
+    """추가한 값은 항상 포함되고 거짓 양성률이 설정 근처인지 테스트"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"id-{index}" for index in range(1000)]
+    for value in added:
+        bloom.add(value)
+
+    assert all(value in bloom for value in added)
+    false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+    assert false_positives < 300
+
+@pytest.mark.asyncio
+async def test_decoded_claims_are_cached_until_expiry():
+    """같은 토큰은 한 번만 디코드하고 만료 후에는 TokenExpiredException 인지 테스트"""
+    now = [time.time()]
+    verifier = TokenVerifier(SECRET, clock=lambda: now[0])
+    token = _token(expires_in=60)
+
+    first = await verifier.verify(token)
+    assert await verifier.verify(token) == first
+    assert verifier.stats["decoded"] == 1 and verifier.stats["cache_hit"] == 1
+
+    now[0] += 120
+    with pytest.raises(TokenExpiredException):
+        await verifier.verify(token)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token, expected", [
+    (lambda: _token(expires_in=-10), TokenExpiredException),
+    (lambda: _token(secret="another-secret-key-at-least-32-chars"), InvalidTokenException),
+    (lambda: "not-a-token", InvalidTokenException),
+    (lambda: _token(type="refresh"), InvalidTokenException)
+], ids=["expired", "signature", "malformed", "token_type"])
+async def test_rejected_tokens(token, expected):
+    verifier = TokenVerifier(SECRET)
+    with pytest.raises(expected):
+        await verifier.verify(token())
+
+@pytest.mark.asyncio
+async def test_revocation_checks_store_only_on_bloom_hit(redis):
+    """폐기는 모든 워커에 전파되고, 원본 저장소는 블룸 필터에 걸린 경우에만 조회하는지 테스트"""
+    store = _CountingStore(redis)
+    verifier = TokenVerifier(SECRET, revocations=store)
+    other_worker = TokenVerifier(SECRET, revocations=store)
+    await verifier.start()
+    await other_worker.start()
+    try:
+        token = _token()
+        claims = await other_worker.verify(token)
+        for _ in range(10):
+            await verifier.verify(token)
+        assert store.lookups == 0
+
+        await verifier.revoke(claims)
+        with pytest.raises(InvalidTokenException):
+            await verifier.verify(token)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if claims["jti"] in other_worker._bloom:
+                break
+        with pytest.raises(InvalidTokenException):
+            await other_worker.verify(token)
+        assert store.lookups == 2
+    finally:
+        await verifier.stop()
+        await other_worker.stop()
+
+@pytest.mark.asyncio
+async def test_start_loads_existing_revocations(redis):
+    """시작 시 만료되지 않은 폐기 목록만 필터에 싣는지 테스트"""
+    store = RevokedTokenStore(redis)
+    token = _token()
+    claims = jwt.get_unverified_claims(token)
+    await store.revoke(claims["jti"], claims["exp"])
+    await store.revoke("expired", time.time() - 1)
+
+    verifier = TokenVerifier(SECRET, revocations=store)
+    await verifier.start()
+    try:
+        with pytest.raises(InvalidTokenException):
+            await verifier.verify(token)
+        assert "expired" not in verifier._bloom
+        assert await redis.zcard(store.key) == 1
+    finally:
+        await verifier.stop()
@@ -0,0 +1,128 @@
+import asyncio
+import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from application.common.constants import ResponseCode
+from infrastructure.audio import AudioProcessor, generate_waveform
+from infrastructure.storage import ChunkedUploadStore, ContentStore
+from presentation.api.dependencies import get_token_claims
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.uploads import parse_content_digest
+from presentation.api.v1.uploads import router
+
+CHUNK = 4096
+WAV = b"RIFF\x24\x40\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00" \
+    b"data\x00\x40\x00\x00" + bytes(range(256)) * 64  # 16kB PCM = 조각 5개
+
+def _digest_header(data):
+    return {"content-digest": f"sha-256=:{base64.b64encode(hashlib.sha256(data).digest()).decode()}:"}
+
+@pytest_asyncio.fixture
+async def app(tmp_path):
+    store = ContentStore(tmp_path, max_size=1024, allowed_extensions=["pdf"])
+    processor = AudioProcessor(store, steps=[("waveform", generate_waveform)], executor=ThreadPoolExecutor(2))
+    app = FastAPI()
+    setup_error_handlers(app)
+    app.state.file_store = store
+    app.state.chunked_upload_store = ChunkedUploadStore(
+        store, max_size=1024 * 1024, allowed_extensions=["wav"], chunk_size=CHUNK, min_chunk_size=CHUNK
+    )
+    app.state.audio_processor = processor
+    app.include_router(router, prefix="/api/v1/uploads")
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "user"}
+    await processor.start()
+    yield app
+    await processor.stop()
+
+@pytest_asyncio.fixture
+async def client(app):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+async def _put_chunk(client, upload_id, index, data=None):
+    chunk = WAV[index * CHUNK:(index + 1) * CHUNK] if data is None else data
+    return await client.put(f"/api/v1/uploads/{upload_id}/chunks/{index}", content=chunk, headers=_digest_header(chunk))
+
+def test_parse_content_digest():
+    digest = hashlib.sha256(b"a").digest()
+    encoded = base64.b64encode(digest).decode()
+    assert parse_content_digest(f"sha-512=:AAAA:, sha-256=:{encoded}:") == digest
+    for invalid in (None, "", "sha-256=abc", "sha-256=:AAAA:", "md5=:AAAA:", "sha-256=:!!:"):
+        assert parse_content_digest(invalid) is None
+
+@pytest.mark.asyncio
+async def test_resumable_upload_and_processing(app, client):
+    """조각을 동시에 올리고, 끊긴 뒤 나머지만 올려 완료하면 후처리까지 되는지 테스트"""
+    created = await client.post("/api/v1/uploads", json={"filename": "회의 녹음.wav", "size": len(WAV)})
+    assert created.status_code == 201
+    upload = created.json()["data"]
+    assert (upload["chunk_size"], upload["chunk_count"], upload["received_chunks"]) == (CHUNK, 5, [])
+    upload_id = upload["upload_id"]
+
+    responses = await asyncio.gather(*(_put_chunk(client, upload_id, index) for index in (4, 0, 2)))
+    assert [response.status_code for response in responses] == [200, 200, 200]
+
+    incomplete = await client.post(f"/api/v1/uploads/{upload_id}/complete")
+    assert (incomplete.status_code, incomplete.json()["code"]) == (409, ResponseCode.UPLOAD_INCOMPLETE)
+    assert incomplete.json()["data"]["missing_chunks"] == [1, 3]
+
+    status = await client.get(f"/api/v1/uploads/{upload_id}")
+    assert status.json()["data"]["received_chunks"] == [0, 2, 4]
+    for index in (1, 3):
+        assert (await _put_chunk(client, upload_id, index)).status_code == 200
+
+    completed = await client.post(f"/api/v1/uploads/{upload_id}/complete")
+    data = completed.json()["data"]
+    assert data["digest"] == hashlib.sha256(WAV).hexdigest()
+    assert (data["size"], data["content_type"], data["processing"]) == (len(WAV), "audio/wav", "queued")
+    assert "deduplicated" not in data
+    assert app.state.file_store.path(data["digest"]).read_bytes() == WAV
+
+    await app.state.audio_processor.join()
+    processing = (await client.get(f"/api/v1/uploads/processing/{data['digest']}")).json()["data"]
+    assert (processing["state"], processing["steps"]["waveform"]["status"]) == ("completed", "completed")
+
+    # 다른 사용자에게는 파일이 없는 것처럼 응답
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "other"}
+    hidden = await client.get(f"/api/v1/uploads/processing/{data['digest']}")
+    assert (hidden.status_code, hidden.json()["code"]) == (404, ResponseCode.FILE_NOT_FOUND)
+
+@pytest.mark.asyncio
+async def test_chunk_errors(app, client):
+    upload_id = (await client.post("/api/v1/uploads", json={"filename": "a.wav", "size": len(WAV)})).json()["data"]["upload_id"]
+    chunk = WAV[:CHUNK]
+    path = f"/api/v1/uploads/{upload_id}/chunks/0"
+
+    no_digest = await client.put(path, content=chunk)
+    corrupted = await client.put(path, content=chunk[:-1] + b"\x00", headers=_digest_header(chunk))
+    short = await _put_chunk(client, upload_id, 0, data=chunk[:100])
+    out_of_range = await _put_chunk(client, upload_id, 5)
+
+    assert (no_digest.status_code, no_digest.json()["code"]) == (400, ResponseCode.VALIDATION_ERROR)
+    assert (corrupted.status_code, corrupted.json()["code"]) == (400, ResponseCode.FILE_CHECKSUM_MISMATCH)
+    assert short.json()["code"] == ResponseCode.VALIDATION_ERROR
+    assert out_of_range.json()["code"] == ResponseCode.VALIDATION_ERROR
+
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "other"}
+    stolen = await _put_chunk(client, upload_id, 0)
+    assert (stolen.status_code, stolen.json()["code"]) == (404, ResponseCode.FILE_NOT_FOUND)
+
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "user"}
+    assert (await client.delete(f"/api/v1/uploads/{upload_id}")).status_code == 200
+    assert (await client.get(f"/api/v1/uploads/{upload_id}")).status_code == 404
+
+@pytest.mark.asyncio
+async def test_create_validation(client):
+    too_large = await client.post("/api/v1/uploads", json={"filename": "a.wav", "size": 2 * 1024 * 1024})
+    wrong_type = await client.post("/api/v1/uploads", json={"filename": "a.exe", "size": 100})
+    missing_size = await client.post("/api/v1/uploads", json={"filename": "a.wav"})
+
+    assert (too_large.status_code, too_large.json()["code"]) == (413, ResponseCode.FILE_SIZE_EXCEEDED)
+    assert (wrong_type.status_code, wrong_type.json()["code"]) == (415, ResponseCode.FILE_TYPE_NOT_ALLOWED)
+    assert missing_size.status_code == 422
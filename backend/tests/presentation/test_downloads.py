@@ -0,0 +1,168 @@
+import hashlib
+import os
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from application.common.constants import ResponseCode
+from infrastructure.storage import ContentStore
+from presentation.api.dependencies import get_token_claims
+from presentation.api.downloads import FileRangeResponse, RangeNotSatisfiable, parse_range
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.v1.files import router
+
+PDF = b"%PDF-1.7\n" + bytes(range(256)) * 2000  # 512KB + 9
+DIGEST = hashlib.sha256(PDF).hexdigest()
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(tmp_path, max_size=1024 * 1024, allowed_extensions=["pdf"])
+
+@pytest.fixture
+def app(store):
+    app = FastAPI()
+    setup_error_handlers(app)
+    app.state.file_store = store
+    app.include_router(router, prefix="/api/v1/files")
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "user"}
+    return app
+
+@pytest_asyncio.fixture
+async def client(app):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post("/api/v1/files?filename=a.pdf", content=PDF)
+        assert response.json()["data"]["digest"] == DIGEST
+        # 다른 회사가 같은 파일을 올렸는지 드러나지 않도록 중복 여부는 응답하지 않음
+        assert "deduplicated" not in response.json()["data"]
+        yield client
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=-5000", 1000) == (0, 999)
+    assert parse_range("bytes=990-2000", 1000) == (990, 999)
+    for ignored in ("items=0-1", "bytes=0-1,5-6", "bytes=5-1", "bytes=a-", "bytes=-", "bytes=1"):
+        assert parse_range(ignored, 1000) is None
+    for unsatisfiable in ("bytes=1000-", "bytes=-0"):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(unsatisfiable, 1000)
+
+@pytest.mark.asyncio
+async def test_full_and_ranged_downloads(client):
+    full = await client.get(f"/api/v1/files/{DIGEST}")
+    assert full.status_code == 200
+    assert full.content == PDF
+    assert full.headers["etag"] == f'"{DIGEST}"'
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-type"] == "application/pdf"
+    assert full.headers["content-length"] == str(len(PDF))
+
+    ranged = await client.get(f"/api/v1/files/{DIGEST}", headers={"range": "bytes=300000-300099"})
+    assert ranged.status_code == 206
+    assert ranged.content == PDF[300000:300100]
+    assert ranged.headers["content-range"] == f"bytes 300000-300099/{len(PDF)}"
+
+    tail = await client.get(f"/api/v1/files/{DIGEST}", headers={"range": "bytes=-10", "if-range": f'"{DIGEST}"'})
+    assert (tail.status_code, tail.content) == (206, PDF[-10:])
+
+    head = await client.head(f"/api/v1/files/{DIGEST}", headers={"range": "bytes=0-9"})
+    assert (head.status_code, head.headers["content-length"], head.content) == (206, "10", b"")
+
+@pytest.mark.asyncio
+async def test_conditional_requests(client):
+    """If-None-Match 는 304, 다른 If-Range 는 전체, 범위 밖은 416 인지 테스트"""
+    not_modified = await client.get(f"/api/v1/files/{DIGEST}", headers={"if-none-match": f'W/"{DIGEST}", "x"'})
+    assert (not_modified.status_code, not_modified.content) == (304, b"")
+
+    stale = await client.get(
+        f"/api/v1/files/{DIGEST}",
+        headers={"range": "bytes=0-9", "if-range": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert (stale.status_code, len(stale.content)) == (200, len(PDF))
+
+    unsatisfiable = await client.get(f"/api/v1/files/{DIGEST}", headers={"range": f"bytes={len(PDF)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(PDF)}"
+
+@pytest.mark.asyncio
+async def test_named_download_and_missing_files(client):
+    named = await client.get(f"/api/v1/files/{DIGEST}/회의록 1.pdf")
+    assert named.headers["content-disposition"] == (
+        "attachment; filename=\" 1.pdf\"; filename*=UTF-8''%ED%9A%8C%EC%9D%98%EB%A1%9D%201.pdf"
+    )
+
+    for digest in ("0" * 64, "abc", DIGEST.upper()):
+        missing = await client.get(f"/api/v1/files/{digest}")
+        assert (missing.status_code, missing.json()["code"]) == (404, ResponseCode.FILE_NOT_FOUND)
+    # 경로 조작은 라우트에 맞지 않음
+    traversal = await client.get("/api/v1/files/..%2F..%2Fetc%2Fpasswd")
+    assert traversal.status_code == 404
+
+@pytest.mark.asyncio
+async def test_authentication_required(app, client):
+    del app.dependency_overrides[get_token_claims]
+    response = await client.get(f"/api/v1/files/{DIGEST}")
+    assert response.json()["code"] == ResponseCode.AUTH_INVALID_TOKEN
+
+@pytest.mark.asyncio
+async def test_other_owners_cannot_download(app, client):
+    """다른 회사/사용자에게는 파일이 없는 것처럼 응답하고, 같은 파일을 올리면 받을 수 있는지 테스트"""
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "other", "company_id": "company-b"}
+    for path in (f"/api/v1/files/{DIGEST}", f"/api/v1/files/{DIGEST}/a.pdf"):
+        response = await client.get(path)
+        assert (response.status_code, response.json()["code"]) == (404, ResponseCode.FILE_NOT_FOUND)
+
+    assert (await client.post("/api/v1/files?filename=b.pdf", content=PDF)).json()["data"]["digest"] == DIGEST
+    assert (await client.get(f"/api/v1/files/{DIGEST}")).content == PDF
+    # 같은 회사의 다른 사용자도 받을 수 있음
+    app.dependency_overrides[get_token_claims] = lambda: {"sub": "colleague", "company_id": "company-b"}
+    assert (await client.get(f"/api/v1/files/{DIGEST}")).status_code == 200
+
+@pytest.mark.asyncio
+async def test_zero_copy_send(client, store):
+    """서버가 zerocopysend 를 지원하면 파일 디스크립터와 구간만 넘기는지 테스트"""
+    stored = await store.open(DIGEST)
+    response = FileRangeResponse(stored, (100, 199), {"content-type": stored.content_type})
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "extensions": {"http.response.zerocopysend": {}}}
+    await response(scope, None, send)
+
+    assert messages[0]["status"] == 206
+    assert {key: messages[1][key] for key in ("type", "offset", "count")} == {
+        "type": "http.response.zerocopysend", "offset": 100, "count": 100
+    }
+    assert messages[1]["file"] is stored.file
+    assert stored.file.closed
+
+@pytest.mark.asyncio
+async def test_disconnect_waits_for_pending_read(client, store, monkeypatch):
+    """보내다 연결이 끊기면 미리 읽던 조각이 끝난 뒤에 파일을 닫는지 테스트"""
+    stored = await store.open(DIGEST)
+    response = FileRangeResponse(stored, None, {"content-type": stored.content_type})
+    response.chunk_size = 1024
+    pread = os.pread
+    reads = []
+
+    def slow_pread(descriptor, size, offset):
+        time.sleep(0.05)
+        reads.append((offset, stored.file.closed))
+        return pread(descriptor, size, offset)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("client disconnected")
+
+    monkeypatch.setattr(os, "pread", slow_pread)
+    with pytest.raises(OSError):
+        await response({"type": "http", "method": "GET"}, None, send)
+
+    assert reads == [(0, False), (1024, False)]
+    assert stored.file.closed
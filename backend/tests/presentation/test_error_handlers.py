@@ -1 +1,152 @@
- 
\ No newline at end of file
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from domain.common.exceptions import EntityNotFoundException
+from application.common.constants import ResponseCode
+from application.common.exceptions import ApplicationException, ServiceUnavailableException
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.error_responses import render_error_body
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    setup_error_handlers(app)
+
+    @app.get("/application-error")
+    async def raise_application_error():
+        raise ApplicationException(
+            code=ResponseCode.NOT_FOUND,
+            message="리소스 없음"
+        )
+
+    @app.get("/retried-error")
+    async def raise_after_retry():
+        # 잡혀서 재시도된 예외는 기록되지 않아야 함
+        for _ in range(3):
+            try:
+                raise ApplicationException(
+                    code=ResponseCode.SERVICE_UNAVAILABLE,
+                    message="재시도"
+                )
+            except ApplicationException:
+                pass
+        raise ApplicationException(
+            code=ResponseCode.SERVICE_UNAVAILABLE,
+            message="최종 실패"
+        )
+
+    @app.get("/domain-error")
+    async def raise_domain_error():
+        raise EntityNotFoundException("User", "user123")
+
+    @app.get("/redis-timeout")
+    async def raise_redis_timeout():
+        raise RedisTimeoutError("Redis 명령 시간 초과")
+
+    @app.get("/overloaded")
+    async def raise_overloaded():
+        raise ServiceUnavailableException("password_hasher", retry_after=2)
+
+    return TestClient(app)
+
+def _error_records(caplog):
+    return [r for r in caplog.records if r.name == "application.common.exceptions"]
+
+def test_application_exception_logged_once(client, caplog):
+    """에러 핸들러에서 한 번만 로그를 기록하는지 테스트"""
+    with caplog.at_level(logging.ERROR):
+        response = client.get("/application-error")
+
+    assert response.status_code == 400
+    assert response.json()["code"] == ResponseCode.NOT_FOUND
+
+    records = _error_records(caplog)
+    assert len(records) == 1
+    assert records[0].path == "/application-error"
+
+def test_caught_exceptions_not_logged(client, caplog):
+    """처리되지 않고 잡힌 예외는 로그가 남지 않는지 테스트"""
+    with caplog.at_level(logging.ERROR):
+        client.get("/retried-error")
+
+    records = _error_records(caplog)
+    assert len(records) == 1
+    assert records[0].error_message == "최종 실패"
+
+def test_domain_exception_logged_once_with_type(client, caplog):
+    """도메인 예외가 변환 후 한 번만 기록되는지 테스트"""
+    with caplog.at_level(logging.ERROR):
+        response = client.get("/domain-error")
+
+    assert response.status_code == 404
+    records = _error_records(caplog)
+    assert len(records) == 1
+    assert records[0].exception_type == "EntityNotFoundException"
+
+def _legacy_body(code, data):
+    """이전 JSONResponse 기반 본문"""
+    response_code = ResponseCode(code)
+    return JSONResponse(
+        content={
+            "code": code,
+            "message": response_code.format_message(**data) if data else response_code.message,
+            "data": data if data else None
+        }
+    ).body
+
+@pytest.mark.parametrize("code", list(ResponseCode.__members__.values()))
+def test_prerendered_bodies_match_json_response(code):
+    """사전 직렬화 본문이 JSONResponse 결과와 같은지 테스트"""
+    assert render_error_body(code) == _legacy_body(code, None)
+    assert render_error_body(code, {}) == _legacy_body(code, {})
+
+    data = {"entity_type": "User", "resource_id": "사용자1", "nested": {"values": [1, 2.5, None]}}
+    assert render_error_body(code, data) == _legacy_body(code, data)
+
+def test_static_error_body_is_reused():
+    """data 없는 응답은 미리 만든 본문 객체를 그대로 쓰는지 테스트"""
+    assert render_error_body(ResponseCode.AUTH_INVALID_TOKEN) is render_error_body(ResponseCode.AUTH_INVALID_TOKEN)
+
+def test_error_response_headers(client):
+    """에러 응답의 Content-Type/Content-Length 테스트"""
+    response = client.get("/application-error")
+
+    assert response.headers["content-type"] == "application/json"
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert response.json() == {
+        "code": ResponseCode.NOT_FOUND,
+        "message": ResponseCode.NOT_FOUND.message,
+        "data": None
+    }
+
+def test_service_unavailable_sets_retry_after(client):
+    """과부하 예외가 503 과 Retry-After 헤더로 응답되는지 테스트"""
+    response = client.get("/overloaded")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    assert response.json()["code"] == ResponseCode.SERVICE_UNAVAILABLE
+    assert response.json()["data"]["resource"] == "password_hasher"
+
+def test_templated_message_formatted(monkeypatch):
+    """포맷 자리표시자가 있는 메시지는 data로 포맷되는지 테스트"""
+    from presentation.api import error_responses
+
+    monkeypatch.setattr(ResponseCode.USER_NOT_FOUND, "message", "{entity_type}을(를) 찾을 수 없습니다.")
+    monkeypatch.setitem(error_responses._TEMPLATED, int(ResponseCode.USER_NOT_FOUND), True)
+
+    data = {"entity_type": "User"}
+    assert render_error_body(ResponseCode.USER_NOT_FOUND, data) == _legacy_body(ResponseCode.USER_NOT_FOUND, data)
+    assert b"User\xec\x9d\x84" in render_error_body(ResponseCode.USER_NOT_FOUND, data)
+
+def test_redis_error_maps_to_redis_error_code(client):
+    """Redis 오류(명령 시간 초과 포함)가 REDIS_ERROR 로 응답되는지 테스트"""
+    response = client.get("/redis-timeout")
+
+    assert response.status_code == 500
+    assert response.json()["code"] == ResponseCode.REDIS_ERROR
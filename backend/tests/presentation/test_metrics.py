@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+
+from application.common.constants import ResponseCode
+from application.common.exceptions import ResourceNotFoundException
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.metrics import HttpMetrics, PrometheusMiddleware, UNMATCHED_ROUTE
+
+SRC_PATH = str(Path(__file__).resolve().parent.parent.parent / "src")
+
+@pytest.fixture
+def registry():
+    return CollectorRegistry()
+
+@pytest.fixture
+def client(registry):
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware, metrics=HttpMetrics(registry=registry))
+    setup_error_handlers(app)
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: str):
+        if user_id == "missing":
+            raise ResourceNotFoundException(message="없음", resource_type="User", resource_id=user_id)
+        return {"id": user_id}
+
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+def _value(registry, name, **labels):
+    return registry.get_sample_value(name, labels) or 0
+
+def test_requests_recorded_per_route_template(client, registry):
+    """실제 경로가 아닌 라우트 템플릿으로 집계되는지 테스트"""
+    client.get("/users/1")
+    client.get("/users/2")
+
+    labels = {"method": "GET", "route": "/users/{user_id}", "status": "200"}
+    assert _value(registry, "http_requests_total", **labels) == 2
+    assert _value(
+        registry, "http_request_duration_seconds_count", method="GET", route="/users/{user_id}"
+    ) == 2
+    assert _value(registry, "http_requests_in_progress", method="GET") == 0
+
+def test_error_counted_by_response_code(client, registry):
+    """에러 응답이 ResponseCode별로 집계되는지 테스트"""
+    client.get("/users/missing")
+
+    assert _value(
+        registry, "http_errors_total", route="/users/{user_id}", code=str(int(ResponseCode.NOT_FOUND))
+    ) == 1
+
+def test_unhandled_exception_counted_as_internal_error(client, registry):
+    """처리되지 않은 예외가 500/INTERNAL_SERVER_ERROR로 집계되는지 테스트"""
+    response = client.get("/crash")
+
+    assert response.status_code == 500
+    assert _value(registry, "http_requests_total", method="GET", route="/crash", status="500") == 1
+    assert _value(
+        registry, "http_errors_total", route="/crash", code=str(int(ResponseCode.INTERNAL_SERVER_ERROR))
+    ) == 1
+
+def test_unmatched_paths_share_one_label(client, registry):
+    """매칭되지 않은 경로가 하나의 라벨로 모이는지 테스트"""
+    for path in ("/wp-admin", "/.env", "/random/123"):
+        client.get(path)
+
+    assert _value(
+        registry, "http_requests_total", method="GET", route=UNMATCHED_ROUTE, status="404"
+    ) == 3
+
+def test_multiprocess_aggregation(tmp_path):
+    """여러 워커 프로세스의 메트릭이 합산되는지 테스트"""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": SRC_PATH}
+    worker = textwrap.dedent("""
+        from presentation.api.metrics import get_http_metrics
+        metrics = get_http_metrics()
+        for _ in range(3):
+            metrics.observe("GET", "/users/{user_id}", 200, 0.01)
+    """)
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], env=env, check=True)
+
+    scrape = textwrap.dedent("""
+        from presentation.api.metrics import render_metrics
+        print(render_metrics().decode())
+    """)
+    output = subprocess.run(
+        [sys.executable, "-c", scrape], env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+    assert 'http_requests_total{method="GET",route="/users/{user_id}",status="200"} 6.0' in output
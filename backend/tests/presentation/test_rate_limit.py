@@ -0,0 +1,162 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from fastapi import FastAPI
+from httpx import AsyncClient
+from jose import jwt
+
+from application.common.constants import ResponseCode
+from infrastructure.rate_limit import GcraRateLimiter, RateLimit
+from infrastructure.security import TokenVerifier
+from presentation.api.rate_limit import RateLimitMiddleware, token_rate_limit_keys
+
+SECRET = "test-secret-key-at-least-32-characters"
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis(server=FakeServer())
+
+def _token(user_id, company_id):
+    return jwt.encode(
+        {"sub": user_id, "company_id": company_id, "jti": uuid.uuid4().hex, "exp": int(time.time()) + 60},
+        SECRET,
+        algorithm="HS256"
+    )
+
+@pytest.mark.asyncio
+async def test_limit_is_shared_across_workers(redis):
+    """여러 워커가 임대를 받아도 전체 허용량이 한도를 넘지 않는지 테스트"""
+    quota = RateLimit(20, period=60)
+    workers = [GcraRateLimiter(redis, max_lease=8) for _ in range(3)]
+
+    allowed = 0
+    for _ in range(20):
+        for worker in workers:
+            allowed += (await worker.acquire("user:1", quota)).allowed
+    assert allowed == 20
+
+    rejected = await workers[0].acquire("user:1", quota)
+    assert not rejected.allowed
+    assert 0 < rejected.retry_after <= 3
+    assert (await workers[0].acquire("user:2", quota)).allowed
+
+@pytest.mark.asyncio
+async def test_hot_keys_are_served_from_local_leases(redis):
+    """요청이 잦은 키는 임대 크기가 늘어 Redis 호출이 줄어드는지 테스트"""
+    limiter = GcraRateLimiter(redis, max_lease=8)
+    quota = RateLimit(6000, period=60)
+
+    for _ in range(200):
+        assert (await limiter.acquire("company:1", quota)).allowed
+
+    assert limiter.stats["redis"] < 40
+    assert limiter.stats["local"] == 200 - limiter.stats["redis"]
+
+@pytest.mark.asyncio
+async def test_rejected_keys_do_not_hit_redis_until_retry(redis):
+    limiter = GcraRateLimiter(redis)
+    quota = RateLimit(1, period=60)
+
+    await limiter.acquire("ip:1", quota)
+    for _ in range(10):
+        assert not (await limiter.acquire("ip:1", quota)).allowed
+    assert limiter.stats["redis"] == 2
+
+@pytest.mark.asyncio
+async def test_rejected_request_uses_no_tokens(redis):
+    """회사 한도로 거절된 요청이 사용자 한도를 쓰지 않는지 테스트"""
+    limiter = GcraRateLimiter(redis, max_lease=1)
+    limits = [("user:1", RateLimit(3)), ("company:1", RateLimit(1))]
+
+    assert (await limiter.acquire_all(limits)).allowed
+    for _ in range(5):
+        rejected = await limiter.acquire_all(limits)
+        assert (rejected.allowed, rejected.limit) == (False, 1)
+
+    other_worker = await GcraRateLimiter(redis).acquire("user:1", RateLimit(3))
+    assert (other_worker.allowed, other_worker.remaining) == (True, 1)
+
+@pytest.mark.asyncio
+async def test_concurrent_refills_never_exceed_shared_burst(redis):
+    """사용자 임대를 받는 동안 다른 요청이 회사 임대를 써도 회사 버스트를 넘지 않는지 테스트"""
+    limiter = GcraRateLimiter(redis, max_lease=8, lease_ttl=60)
+    company = ("company:1", RateLimit(100, period=3600, burst=10))
+    for _ in range(4):
+        # 회사 임대를 미리 받아 둠 (임대 크기 1, 2, 4, 8)
+        assert (await limiter.acquire_all([("user:warm", RateLimit(100)), company])).allowed
+
+    decisions = await asyncio.gather(*(
+        limiter.acquire_all([(f"user:{index}", RateLimit(100)), company]) for index in range(50)
+    ))
+
+    assert sum(decision.allowed for decision in decisions) + 4 <= 10
+    assert limiter._leases["company:1"].tokens >= 0
+
+@pytest.mark.asyncio
+async def test_redis_failure_allows_requests():
+    server = FakeServer()
+    server.connected = False
+    limiter = GcraRateLimiter(FakeAsyncRedis(server=server))
+
+    assert (await limiter.acquire("user:1", RateLimit(1))).allowed
+    assert limiter.stats["errors"] == 1
+
+def _app(redis, user_limit=3, company_limit=100):
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=GcraRateLimiter(redis, max_lease=1),
+        keys=token_rate_limit_keys(
+            TokenVerifier(SECRET),
+            user_quota=RateLimit(user_limit),
+            company_quota=RateLimit(company_limit)
+        ),
+        exclude_paths=("/health",)
+    )
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    return app
+
+@pytest.mark.asyncio
+async def test_middleware_headers_and_rejection(redis):
+    """RateLimit-* 헤더를 붙이고 한도 초과 시 429 와 Retry-After 로 응답하는지 테스트"""
+    async with AsyncClient(app=_app(redis), base_url="http://test") as client:
+        headers = {"Authorization": f"Bearer {_token('u1', 'c1')}"}
+        responses = [await client.get("/ping", headers=headers) for _ in range(4)]
+
+        assert [response.status_code for response in responses] == [200, 200, 200, 429]
+        assert [response.headers["ratelimit-remaining"] for response in responses[:3]] == ["2", "1", "0"]
+        assert responses[0].headers["ratelimit-limit"] == "3"
+
+        rejected = responses[3]
+        assert int(rejected.headers["retry-after"]) > 0
+        assert rejected.json()["code"] == ResponseCode.RATE_LIMIT_EXCEEDED
+
+        # 다른 사용자, 제외 경로는 영향 없음
+        other = await client.get("/ping", headers={"Authorization": f"Bearer {_token('u2', 'c1')}"})
+        assert other.status_code == 200
+        health = await client.get("/health", headers=headers)
+        assert health.status_code == 200 and "ratelimit-limit" not in health.headers
+
+@pytest.mark.asyncio
+async def test_company_limit_applies_across_users(redis):
+    """같은 회사의 사용자들이 회사 한도를 함께 쓰는지 테스트"""
+    async with AsyncClient(app=_app(redis, user_limit=100, company_limit=2), base_url="http://test") as client:
+        statuses = [
+            (await client.get("/ping", headers={"Authorization": f"Bearer {_token(f'u{index}', 'c1')}"})).status_code
+            for index in range(3)
+        ]
+        assert statuses == [200, 200, 429]
+
+        anonymous = await client.get("/ping")
+        assert anonymous.status_code == 200 and anonymous.headers["ratelimit-limit"] == "100"
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import time
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from jose import jwt
+from starlette.websockets import WebSocketDisconnect
+
+from application.common.constants import ResponseCode
+from infrastructure.notifications import RealtimeHub
+from infrastructure.security import RevokedTokenStore, TokenVerifier
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.realtime import (
+    CLOSE_HEARTBEAT_TIMEOUT,
+    CLOSE_POLICY_VIOLATION,
+    CLOSE_TOKEN_EXPIRED,
+    CLOSE_TRY_AGAIN_LATER,
+    RealtimeGateway
+)
+from presentation.api.v1.notifications import router
+
+SECRET = "test-secret-key-at-least-32-characters"
+PATH = "/api/v1/notifications"
+
+def _token(user_id, company_id="c1"):
+    return jwt.encode(
+        {"sub": user_id, "company_id": company_id, "jti": uuid.uuid4().hex, "exp": int(time.time()) + 60},
+        SECRET,
+        algorithm="HS256"
+    )
+
+def _app(verifier=None, **options):
+    hub = RealtimeHub(FakeAsyncRedis(server=FakeServer()), max_connections=2, sweep_interval=0.05)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await hub.start()
+        yield
+        await hub.stop()
+
+    app = FastAPI(lifespan=lifespan)
+    setup_error_handlers(app)
+    app.state.realtime_gateway = RealtimeGateway(hub, verifier or TokenVerifier(SECRET), **options)
+    app.include_router(router, prefix=PATH)
+    return app, hub
+
+def test_websocket_delivers_and_pings():
+    app, hub = _app(heartbeat_interval=0.05, heartbeat_timeout=5)
+    with TestClient(app) as client:
+        with client.websocket_connect(f"{PATH}/ws?access_token={_token('u1')}") as socket:
+            client.portal.call(hub.publish, json.dumps({"title": "공지"}), None, "c1")
+            assert socket.receive_json() == {"type": "notification", "data": {"title": "공지"}}
+            assert socket.receive_json() == {"type": "ping"}
+            socket.send_json({"type": "pong"})
+        assert hub.connections == 0
+
+def test_websocket_rejections():
+    app, hub = _app()
+    with TestClient(app) as client:
+        with pytest.raises(WebSocketDisconnect) as unauthenticated:
+            with client.websocket_connect(f"{PATH}/ws"):
+                pass
+        assert unauthenticated.value.code == CLOSE_POLICY_VIOLATION
+
+        headers = {"authorization": f"Bearer {_token('u1')}"}
+        with client.websocket_connect(f"{PATH}/ws", headers=headers), \
+                client.websocket_connect(f"{PATH}/ws", headers=headers):
+            with pytest.raises(WebSocketDisconnect) as full:
+                with client.websocket_connect(f"{PATH}/ws", headers=headers):
+                    pass
+        assert full.value.code == CLOSE_TRY_AGAIN_LATER
+
+def test_websocket_heartbeat_timeout():
+    app, hub = _app(heartbeat_interval=0.05, heartbeat_timeout=0.2)
+    with TestClient(app) as client:
+        with client.websocket_connect(f"{PATH}/ws?access_token={_token('u1')}") as socket:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                while True:
+                    assert socket.receive_json() == {"type": "ping"}
+        assert closed.value.code == CLOSE_HEARTBEAT_TIMEOUT
+        assert hub.connections == 0
+
+def test_websocket_closes_when_token_expires_or_is_revoked():
+    """연결 뒤 토큰 만료 시각이 지나거나 토큰이 폐기되면 끊는지 테스트"""
+    now = [time.time()]
+    verifier = TokenVerifier(SECRET, revocations=RevokedTokenStore(FakeAsyncRedis(server=FakeServer())))
+    app, hub = _app(verifier, heartbeat_interval=0.05, heartbeat_timeout=5, clock=lambda: now[0])
+    with TestClient(app) as client:
+        with client.websocket_connect(f"{PATH}/ws?access_token={_token('u1')}") as socket:
+            assert socket.receive_json() == {"type": "ping"}
+            now[0] += 120
+            with pytest.raises(WebSocketDisconnect) as expired:
+                while True:
+                    socket.receive_json()
+        assert expired.value.code == CLOSE_TOKEN_EXPIRED
+
+        now[0] -= 120
+        token = _token("u1")
+        with client.websocket_connect(f"{PATH}/ws?access_token={token}") as socket:
+            assert socket.receive_json() == {"type": "ping"}
+            client.portal.call(verifier.revoke, jwt.get_unverified_claims(token))
+            with pytest.raises(WebSocketDisconnect) as revoked:
+                while True:
+                    socket.receive_json()
+        assert revoked.value.code == CLOSE_TOKEN_EXPIRED
+        assert hub.connections == 0
+
+async def _collect(events):
+    return [event async for event in events]
+
+@pytest.mark.asyncio
+async def test_event_stream():
+    app, hub = _app(heartbeat_interval=0.05)
+    gateway = app.state.realtime_gateway
+    await hub.start()
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            unauthenticated = await client.get(f"{PATH}/stream")
+        assert (unauthenticated.status_code, unauthenticated.json()["code"]) == (401, ResponseCode.AUTH_INVALID_TOKEN)
+
+        claims = {"sub": "u1", "company_id": "c1", "jti": "t1", "exp": time.time() + 60}
+        response = await gateway.event_stream(claims)
+        assert response.media_type == "text/event-stream"
+        events = response.body_iterator
+        assert await events.__anext__() == "retry: 3000\n\n"
+        await hub.publish('{"title":"공지"}', user_id="u1")
+        assert await events.__anext__() == 'event: notification\ndata: {"title":"공지"}\n\n'
+        assert await events.__anext__() == ": ping\n\n"
+
+        # 토큰 만료 시각이 되면 스트림을 끝냄
+        expiring = (await gateway.event_stream({**claims, "exp": time.time() + 0.1})).body_iterator
+        frames = await asyncio.wait_for(_collect(expiring), 1)
+        assert frames[0] == "retry: 3000\n\n" and set(frames[1:]) <= {": ping\n\n"}
+    finally:
+        await hub.stop()
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
+    assert hub.connections == 0
@@ -0,0 +1,62 @@
+import pytest
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+
+from application.common.constants import ResponseCode
+from infrastructure.storage import ContentStore
+from presentation.api.error_handlers import setup_error_handlers
+from presentation.api.uploads import receive_upload
+
+PDF = b"%PDF-1.7\n" + b"x" * 5000
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(tmp_path, max_size=10000, allowed_extensions=["pdf", "png"])
+
+@pytest.fixture
+def client(store):
+    app = FastAPI()
+    setup_error_handlers(app)
+
+    @app.post("/files")
+    async def upload(request: Request):
+        stored = await receive_upload(request, store, filename=request.query_params.get("filename"))
+        return {"digest": stored.digest, "size": stored.size, "content_type": stored.content_type}
+
+    return AsyncClient(app=app, base_url="http://test")
+
+@pytest.mark.asyncio
+async def test_multipart_file_part_is_streamed(client, store):
+    """다른 필드와 함께 온 multipart 파일 파트만 저장하는지 테스트"""
+    async with client:
+        response = await client.post(
+            "/files",
+            data={"title": "보고서"},
+            files={"file": ("보고서.pdf", PDF, "application/pdf")}
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["size"], body["content_type"]) == (len(PDF), "application/pdf")
+    assert store.path(body["digest"]).read_bytes() == PDF
+
+@pytest.mark.asyncio
+async def test_raw_body_upload(client, store):
+    async with client:
+        response = await client.post("/files?filename=scan.pdf", content=PDF)
+        missing_name = await client.post("/files", content=PDF)
+    assert store.path(response.json()["digest"]).read_bytes() == PDF
+    assert missing_name.json()["code"] == ResponseCode.VALIDATION_ERROR
+
+@pytest.mark.asyncio
+async def test_upload_errors(client):
+    async with client:
+        too_large = await client.post("/files?filename=big.pdf", content=PDF * 3)
+        # multipart 는 Content-Length 에 여유를 두므로 저장 중에 거절
+        streamed_too_large = await client.post("/files", files={"file": ("big.pdf", PDF * 3, "application/pdf")})
+        wrong_type = await client.post("/files", files={"file": ("fake.png", PDF, "image/png")})
+        no_file = await client.post("/files", data={"title": "파일 없음"}, files={"other": ("a.pdf", PDF)})
+
+    assert (too_large.status_code, too_large.json()["code"]) == (413, ResponseCode.FILE_SIZE_EXCEEDED)
+    assert streamed_too_large.json()["code"] == ResponseCode.FILE_SIZE_EXCEEDED
+    assert (wrong_type.status_code, wrong_type.json()["code"]) == (415, ResponseCode.FILE_TYPE_NOT_ALLOWED)
+    assert no_file.json()["code"] == ResponseCode.VALIDATION_ERROR